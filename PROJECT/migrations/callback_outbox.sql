@@ -0,0 +1,29 @@
+-- 결과 콜백 outbox (CALLBACK_OUTBOX_ENABLED=1)
+-- 판정 결과 콜백을 최종 상태 변경과 같은 트랜잭션에 적재 → 디스패처(API 프로세스·ocr_worker)가 FOR UPDATE SKIP LOCKED로 점유해 전송
+-- 상태: QUEUED(대기) → SENDING(점유) → SENT | 일시 오류(타임아웃·408·429·5xx) 시 지수 백오프+지터 후 QUEUED, 시도 초과·기타 4xx 시 DEAD
+-- 앱 기동 시 create_all로도 생성됨
+
+CREATE TABLE IF NOT EXISTS callback_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    submission_id VARCHAR NOT NULL,
+    url VARCHAR(1000) NOT NULL,
+    purpose VARCHAR(32) NOT NULL,                -- auto | verifying_timeout
+    actor VARCHAR(128) NOT NULL DEFAULT 'system',
+    payload JSONB NOT NULL,                      -- 전송 본문(schemaVersion·receiptId·statusSource 포함)
+    status VARCHAR(16) NOT NULL DEFAULT 'QUEUED',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 8,
+    available_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),  -- 재시도 백오프: 이 시각 이후 점유 가능
+    locked_by VARCHAR(128),
+    locked_until TIMESTAMP WITHOUT TIME ZONE,                         -- 가시성 타임아웃
+    last_status_code INTEGER,
+    last_error VARCHAR(1000),
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+    sent_at TIMESTAMP WITHOUT TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS ix_callback_outbox_submission_id ON callback_outbox (submission_id);
+-- 점유 쿼리용: 대기 건은 available_at 순, 전송 중 건은 locked_until 경과 여부로 조회
+CREATE INDEX IF NOT EXISTS idx_callback_outbox_queued ON callback_outbox (available_at, id) WHERE status = 'QUEUED';
+CREATE INDEX IF NOT EXISTS idx_callback_outbox_sending ON callback_outbox (locked_until) WHERE status = 'SENDING';
@@ -0,0 +1,23 @@
+-- 영수증 분석 작업 큐 (DB 기반, BackgroundTasks 대체)
+-- OCR_JOB_QUEUE_ENABLED=1 시 Complete 요청을 적재하고 ocr_worker.py가 FOR UPDATE SKIP LOCKED로 점유·처리
+-- 상태: QUEUED(대기) → RUNNING(점유) → DONE | 실패 시 백오프 후 QUEUED 재시도, 시도 초과 시 DEAD(dead-letter)
+
+CREATE TABLE IF NOT EXISTS ocr_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    submission_id VARCHAR NOT NULL,
+    payload JSONB NOT NULL,                 -- CompleteRequest
+    status VARCHAR(16) NOT NULL DEFAULT 'QUEUED',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    available_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),  -- 재시도 백오프: 이 시각 이후 점유 가능
+    locked_by VARCHAR(128),
+    locked_until TIMESTAMP WITHOUT TIME ZONE,                         -- 가시성 타임아웃
+    last_error VARCHAR(1000),
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_ocr_jobs_submission_id ON ocr_jobs (submission_id);
+-- 점유 쿼리용: 대기 건은 available_at 순, 실행 건은 locked_until 경과 여부로 조회
+CREATE INDEX IF NOT EXISTS idx_ocr_jobs_queued ON ocr_jobs (available_at, id) WHERE status = 'QUEUED';
+CREATE INDEX IF NOT EXISTS idx_ocr_jobs_running ON ocr_jobs (locked_until) WHERE status = 'RUNNING';
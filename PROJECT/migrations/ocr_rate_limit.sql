@@ -0,0 +1,9 @@
+-- OCR 도메인(STAY/TOUR)별 공유 호출 제한 상태 (워커 프로세스·서버 간 공유)
+-- RPS: GCRA 토큰 버킷. tat(theoretical arrival time)를 원자적 UPDATE로 전진시켜 1건씩 소비
+-- 동시 호출 수는 테이블 없이 pg_try_advisory_xact_lock(72010, 도메인*100+슬롯)으로 제한
+-- 앱 기동 시 create_all로도 생성됨. 수동 적용 시 본 파일 실행
+
+CREATE TABLE IF NOT EXISTS ocr_rate_limit (
+    domain VARCHAR(16) PRIMARY KEY,                 -- STAY | TOUR
+    tat TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
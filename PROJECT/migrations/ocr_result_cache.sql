@@ -0,0 +1,18 @@
+-- OCR 결과 캐시: 전처리(리사이즈·압축) 후 이미지 바이트 SHA-256 + OCR 도메인(STAY/TOUR) → CLOVA 응답 JSON
+-- 동일 사진 재업로드(재시도·새 receiptId) 시 CLOVA 호출 생략. ocr_raw는 JSONB(TOAST 압축 저장)
+-- TTL(OCR_RESULT_CACHE_TTL_DAYS) 경과 항목은 조회 제외 후 정리, 최대 항목 수 초과 시 last_hit_at 오래된 순(LRU) 삭제
+-- 앱 기동 시 create_all로도 생성됨. 수동 적용 시 본 파일 실행
+
+CREATE TABLE IF NOT EXISTS ocr_result_cache (
+    content_hash VARCHAR(64) NOT NULL,
+    domain VARCHAR(16) NOT NULL,                    -- STAY | TOUR
+    ocr_raw JSONB NOT NULL,
+    first_receipt_id VARCHAR,                       -- 최초 OCR 요청 receiptId
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+    last_hit_at TIMESTAMP WITHOUT TIME ZONE,
+    PRIMARY KEY (content_hash, domain)
+);
+
+CREATE INDEX IF NOT EXISTS ix_ocr_result_cache_last_hit_at ON ocr_result_cache (last_hit_at);
+CREATE INDEX IF NOT EXISTS idx_ocr_result_cache_created_at ON ocr_result_cache (created_at);
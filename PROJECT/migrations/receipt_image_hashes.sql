@@ -0,0 +1,14 @@
+-- 영수증 이미지 지각 해시(dHash) 인덱스: 유사 중복(재촬영·재업로드) 탐지용
+-- dhash: 64비트 dHash를 부호 있는 BIGINT로 저장. 검색은 앱 프로세스의 인메모리 BK-tree(해밍 거리)에서 수행하고 본 테이블은 원천 데이터
+-- 앱 기동 시 create_all로도 생성됨. 수동 적용 시 본 파일 실행
+
+CREATE TABLE IF NOT EXISTS receipt_image_hashes (
+    id BIGSERIAL PRIMARY KEY,
+    submission_id VARCHAR NOT NULL,
+    image_key VARCHAR(500) NOT NULL,
+    dhash BIGINT NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+    CONSTRAINT uq_receipt_image_hashes_submission_image UNIQUE (submission_id, image_key)
+);
+
+CREATE INDEX IF NOT EXISTS ix_receipt_image_hashes_submission_id ON receipt_image_hashes (submission_id);
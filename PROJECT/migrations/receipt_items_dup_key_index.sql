@@ -0,0 +1,13 @@
+-- 중복 영수증 체크(_find_duplicate_receipt_keys)용 부분 커버링 인덱스
+-- 조회: (biz_num, pay_date, amount, card_num) IN (...) AND submission_id <> :sid → submissions(PK) 조인 후 status = 'FIT'
+-- biz_num 없는 항목은 중복 체크 대상이 아니므로 인덱스에서 제외. submission_id INCLUDE로 힙 접근 없이 조인 키 확보(PostgreSQL 11+)
+-- FIT 여부는 submissions.status에 있어 부분 인덱스 조건으로 쓸 수 없음(조인 측은 PK 조회)
+-- 운영 중 적용 시 락 최소화를 위해 CONCURRENTLY 사용(트랜잭션 블록 밖에서 한 문장씩 실행)
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_receipt_items_dup_key
+    ON receipt_items (biz_num, pay_date, amount, card_num)
+    INCLUDE (submission_id)
+    WHERE biz_num IS NOT NULL;
+
+-- 기존 전체 인덱스(submissions_receipt_items.sql)는 위 인덱스로 대체
+DROP INDEX CONCURRENTLY IF EXISTS idx_receipt_items_dupcheck;
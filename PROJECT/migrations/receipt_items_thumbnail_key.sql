@@ -0,0 +1,8 @@
+-- 관리자 목록·검수 화면용 썸네일 파생 이미지 키 (main.py ReceiptItem.thumbnail_key와 동기화)
+-- 분석 전처리 시 thumbnails/{장축px}/{원본 image_key}로 업로드 후 기록. NULL이면 미생성(프록시 size=thumb 요청 시 지연 생성)
+-- 적용 DB: gems
+
+ALTER TABLE receipt_items
+ADD COLUMN IF NOT EXISTS thumbnail_key VARCHAR(600);
+
+COMMENT ON COLUMN receipt_items.thumbnail_key IS '썸네일 파생 이미지 MinIO 키. 목록 thumbnail_url·이미지 프록시 size=thumb에 사용';
@@ -0,0 +1,29 @@
+-- 일괄 재처리 작업 (POST /api/v1/admin/submissions/reprocess-jobs)
+-- 저장된 receipt_items.parsed·ocr_raw로 장별 판정을 다시 적용(OCR 미호출). 조건에 맞는 신청을 submission_id 순 청크로 처리하고
+-- 청크 결과와 진행 상황(cursor·건수)을 같은 트랜잭션에 commit → 실행 프로세스가 중단되면 점유 만료(locked_until) 후 resume으로 이어서 처리
+-- 상태: QUEUED → RUNNING → DONE | FAILED | CANCELLED
+-- 앱 기동 시 create_all로도 생성됨
+
+CREATE TABLE IF NOT EXISTS reprocess_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    status VARCHAR(16) NOT NULL DEFAULT 'QUEUED',
+    filters JSONB NOT NULL,                      -- campaignId, campaignScope, statuses, createdFrom, createdBefore
+    total INTEGER NOT NULL DEFAULT 0,            -- 생성 시점 대상 건수(진행률 분모)
+    processed INTEGER NOT NULL DEFAULT 0,
+    changed INTEGER NOT NULL DEFAULT 0,          -- 상태·금액·장 판정 중 하나라도 바뀐 건
+    transitions INTEGER NOT NULL DEFAULT 0,      -- 상태가 바뀐 건(콜백 대상)
+    callbacks INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    cursor VARCHAR,                              -- 마지막 처리 submission_id(keyset)
+    created_by VARCHAR(128) NOT NULL DEFAULT 'system',
+    locked_by VARCHAR(128),
+    locked_until TIMESTAMP WITHOUT TIME ZONE,    -- 점유 만료: 지나면 resume 가능
+    last_error VARCHAR(1000),
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+    started_at TIMESTAMP WITHOUT TIME ZONE,
+    finished_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW()
+);
+
+-- 실행 중 작업 확인용(동시 실행 1건 제한)
+CREATE INDEX IF NOT EXISTS idx_reprocess_jobs_active ON reprocess_jobs (status) WHERE status IN ('QUEUED', 'RUNNING');
@@ -0,0 +1,26 @@
+-- 판정 규칙 변경 시뮬레이션 (POST /api/v1/admin/rules/judgment/simulations)
+-- 규칙 저장(PUT /api/v1/admin/rules/judgment) 전에 조건에 맞는 신청의 저장된 receipt_items.parsed를 현재 규칙과 제안 규칙으로
+-- 각각 재판정(OCR·DB 쓰기 없음)해 FIT/UNFIT/PENDING 전환 건수와 승인 금액 변화를 result에 집계
+-- 상태: QUEUED → RUNNING → DONE | FAILED
+-- 앱 기동 시 create_all로도 생성됨
+
+CREATE TABLE IF NOT EXISTS rule_simulations (
+    id BIGSERIAL PRIMARY KEY,
+    status VARCHAR(16) NOT NULL DEFAULT 'QUEUED',
+    filters JSONB NOT NULL,                      -- campaignId, campaignScope, createdFrom, createdBefore
+    baseline JSONB,                              -- 실행 시점 규칙 값
+    proposed JSONB NOT NULL,                     -- 바꿔 볼 규칙 값(지정한 항목만)
+    total INTEGER NOT NULL DEFAULT 0,            -- 생성 시점 대상 신청 수(진행률 분모)
+    scanned INTEGER NOT NULL DEFAULT 0,
+    scanned_items INTEGER NOT NULL DEFAULT 0,
+    result JSONB,                                -- 집계(진행 중에는 중간 집계)
+    created_by VARCHAR(128) NOT NULL DEFAULT 'system',
+    last_error VARCHAR(1000),
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+    started_at TIMESTAMP WITHOUT TIME ZONE,
+    finished_at TIMESTAMP WITHOUT TIME ZONE,
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW()
+);
+
+-- 실행 중 시뮬레이션 확인용(동시 실행 1건 제한)
+CREATE INDEX IF NOT EXISTS idx_rule_simulations_active ON rule_simulations (status) WHERE status IN ('QUEUED', 'RUNNING');
@@ -0,0 +1,38 @@
+-- 판정 완료 신청 집계 롤업: 일·시(UTC created_at) × 캠페인 × 업종 × 상태 × 시도 × 시군구 × 반려 사유 코드
+-- 상태 변경(판정·override·일괄 반려·VERIFYING 타임아웃·분석 오류) 시 같은 트랜잭션에서 증분 반영(daily_stats.sync_submission_stats)
+-- 분석 진행 중(PENDING/PROCESSING/VERIFYING) 건은 롤업에 넣지 않고 조회 시 submissions에서 직접 집계
+-- 앱 기동 시 create_all로도 생성됨. 수동 적용 시 본 파일 실행 후 백필:
+--   python PROJECT/scripts/rebuild_daily_stats.py
+
+CREATE TABLE IF NOT EXISTS submission_daily_stats (
+    stat_date DATE NOT NULL,
+    stat_hour SMALLINT NOT NULL,                    -- 0~23 (UTC)
+    campaign_id INTEGER NOT NULL,                   -- 미지정은 0
+    project_type VARCHAR(16) NOT NULL,
+    status VARCHAR(32) NOT NULL,
+    sido VARCHAR(64) NOT NULL,                      -- 첫 장 address 첫 토큰(원문), 없으면 ''
+    sigungu VARCHAR(64) NOT NULL,                   -- 첫 장 location 또는 address 둘째 토큰, 없으면 ''
+    reason_code VARCHAR(32) NOT NULL,               -- 표준 반려 사유 코드, FIT은 ''
+    submission_count BIGINT NOT NULL DEFAULT 0,
+    total_amount BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (stat_date, stat_hour, campaign_id, project_type, status, sido, sigungu, reason_code)
+);
+
+-- 신청별 현재 반영 키(상태 변경 시 이전 키 차감) 및 최소금액 달성 건수 집계용
+CREATE TABLE IF NOT EXISTS submission_daily_stats_members (
+    submission_id VARCHAR PRIMARY KEY,
+    stat_date DATE NOT NULL,
+    stat_hour SMALLINT NOT NULL,
+    campaign_id INTEGER NOT NULL,
+    project_type VARCHAR(16) NOT NULL,
+    status VARCHAR(32) NOT NULL,
+    sido VARCHAR(64) NOT NULL,
+    sigungu VARCHAR(64) NOT NULL,
+    reason_code VARCHAR(32) NOT NULL,
+    total_amount BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_submission_daily_stats_members_bucket
+    ON submission_daily_stats_members (stat_date, stat_hour);
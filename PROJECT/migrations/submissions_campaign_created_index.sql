@@ -0,0 +1,7 @@
+-- 대시보드·통계 기간 조회용 (campaign_id, created_at) 인덱스
+-- 조회 조건은 campaign_id 등치 + created_at 범위 비교만 사용(date(created_at)·extract 등 컬럼 가공 없음) → 인덱스 범위 스캔
+-- 일·월·시간대 버킷(요청 타임존)은 필터 후 계산. 효과 확인: PROJECT/scripts/bench_dashboard_buckets.py
+-- 운영 중 적용 시 락 최소화를 위해 CONCURRENTLY 사용(트랜잭션 블록 밖에서 실행)
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_submissions_campaign_created
+    ON submissions (campaign_id, created_at);
@@ -0,0 +1,10 @@
+-- 관리자 신청 목록(/api/v1/admin/submissions) keyset 페이지네이션용 인덱스
+-- 정렬: dateField(created_at|updated_at) DESC, submission_id DESC → 인덱스 역방향 스캔 후 cursor 다음 limit+1건만 읽음
+-- cursor 조건: (dateField, submission_id) < (:d, :id) 행 비교. 캠페인 범위 조회는 idx_submissions_campaign_created 사용
+-- 운영 중 적용 시 락 최소화를 위해 CONCURRENTLY 사용(트랜잭션 블록 밖에서 한 문장씩 실행)
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_submissions_created_keyset
+    ON submissions (created_at, submission_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_submissions_updated_keyset
+    ON submissions (updated_at, submission_id);
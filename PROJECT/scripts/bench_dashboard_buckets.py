@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+대시보드 일자별 버킷 쿼리 실행 계획 벤치마크: (campaign_id, created_at) 인덱스 전/후, 컬럼 가공 필터 vs 범위 필터.
+별도 스키마(gems_bench)에 합성 submissions를 생성(bench_dashboard_stats와 동일)해 EXPLAIN (ANALYZE, BUFFERS)로 비교.
+  - wrapped: WHERE date(created_at) BETWEEN … (UTC 날짜, 컬럼 가공 → 인덱스 사용 불가)
+  - range  : WHERE created_at >= :start AND created_at < :end (현지 날짜 경계를 UTC로 변환), 버킷은 현지 타임존으로 계산
+사용: DATABASE_URL 설정 후
+  python PROJECT/scripts/bench_dashboard_buckets.py
+  python PROJECT/scripts/bench_dashboard_buckets.py --rows 1000000 --range-days 7 --tz Asia/Seoul --keep
+출력: 쿼리·인덱스 유무별 스캔 노드, 실행 시간(ms), 읽은 버퍼 수, 그리고 UTC/현지 버킷이 달라지는 건수.
+"""
+import argparse
+import json
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from bench_dashboard_stats import DATABASE_URL, SCHEMA, _seed
+from sqlalchemy import create_engine, text
+
+_WRAPPED_SQL = (
+    "SELECT date(created_at) AS d, COUNT(*) FROM submissions "
+    "WHERE campaign_id = :cid AND date(created_at) BETWEEN :start_date AND :end_date "
+    "GROUP BY 1 ORDER BY 1"
+)
+_RANGE_SQL = (
+    "SELECT CAST(timezone(:tz, timezone('UTC', created_at)) AS DATE) AS d, COUNT(*) FROM submissions "
+    "WHERE campaign_id = :cid AND created_at >= :start AND created_at < :end "
+    "GROUP BY 1 ORDER BY 1"
+)
+_INDEX_DDL = "CREATE INDEX idx_submissions_campaign_created ON submissions (campaign_id, created_at)"
+
+
+def _scan_nodes(plan: dict) -> list:
+    out = []
+    node = plan.get("Node Type", "")
+    if "Scan" in node:
+        out.append(f"{node}({plan.get('Index Name') or plan.get('Relation Name')})")
+    for child in plan.get("Plans", []) or []:
+        out.extend(_scan_nodes(child))
+    return out
+
+
+def _explain(conn, sql: str, params: dict) -> dict:
+    raw = conn.execute(text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql), params).scalar()
+    doc = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    plan = doc["Plan"]
+    return {
+        "scans": ", ".join(_scan_nodes(plan)) or plan.get("Node Type", ""),
+        "ms": float(doc.get("Execution Time") or 0.0),
+        "buffers": int(plan.get("Shared Hit Blocks", 0)) + int(plan.get("Shared Read Blocks", 0)),
+    }
+
+
+def _report(conn, label: str, params: dict, repeat: int) -> None:
+    for name, sql in (("wrapped", _WRAPPED_SQL), ("range", _RANGE_SQL)):
+        conn.execute(text(sql), params).fetchall()  # 워밍업
+        runs = [_explain(conn, sql, params) for _ in range(repeat)]
+        best = min(runs, key=lambda r: r["ms"])
+        print(f"  [{label:<9}] {name:<7} {best['ms']:9.1f} ms  buffers {best['buffers']:>8,}  {best['scans']}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="대시보드 일자별 버킷 쿼리 실행 계획 벤치마크")
+    ap.add_argument("--rows", type=int, default=1000000)
+    ap.add_argument("--days", type=int, default=180, help="created_at 분포 기간(일)")
+    ap.add_argument("--campaigns", type=int, default=20)
+    ap.add_argument("--campaign-id", type=int, default=1)
+    ap.add_argument("--range-days", type=int, default=7, help="조회 구간(현지 기준 최근 N일)")
+    ap.add_argument("--tz", default="Asia/Seoul")
+    ap.add_argument("--repeat", type=int, default=3, help="EXPLAIN ANALYZE 반복(최소값 출력)")
+    ap.add_argument("--keep", action="store_true", help=f"종료 후 {SCHEMA} 스키마 유지")
+    args = ap.parse_args()
+
+    z = ZoneInfo(args.tz)
+    today_local = datetime.now(z).replace(hour=0, minute=0, second=0, microsecond=0)
+    start_local = today_local - timedelta(days=args.range_days - 1)
+    end_local = today_local + timedelta(days=1)
+    params = {
+        "cid": args.campaign_id,
+        "tz": args.tz,
+        "start_date": start_local.date(),
+        "end_date": today_local.date(),
+        "start": start_local.astimezone(timezone.utc).replace(tzinfo=None),
+        "end": end_local.astimezone(timezone.utc).replace(tzinfo=None),
+    }
+
+    engine = create_engine(DATABASE_URL)
+    try:
+        with engine.begin() as conn:
+            _seed(conn, args.rows, args.days, args.campaigns)
+        print(f"{args.rows:,}건, 캠페인 {args.campaigns}개, 조회: campaign_id={args.campaign_id} 최근 {args.range_days}일({args.tz})")
+        with engine.connect() as conn:
+            conn.execute(text(f"SET search_path TO {SCHEMA}"))
+            _report(conn, "인덱스 전", params, args.repeat)
+            conn.execute(text(_INDEX_DDL))
+            conn.execute(text("ANALYZE submissions"))
+            conn.commit()
+            conn.execute(text(f"SET search_path TO {SCHEMA}"))
+            _report(conn, "인덱스 후", params, args.repeat)
+            shifted = conn.execute(
+                text(
+                    "SELECT COUNT(*) FROM submissions WHERE campaign_id = :cid AND created_at >= :start AND created_at < :end "
+                    "AND date(created_at) <> CAST(timezone(:tz, timezone('UTC', created_at)) AS DATE)"
+                ),
+                params,
+            ).scalar()
+            total = conn.execute(
+                text("SELECT COUNT(*) FROM submissions WHERE campaign_id = :cid AND created_at >= :start AND created_at < :end"),
+                params,
+            ).scalar()
+            print(f"  UTC 날짜 버킷이 현지 날짜와 다른 건: {shifted:,} / {total:,}")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+관리자 대시보드 통계 집계 벤치마크: 기존 방식(submissions 집계별 개별 쿼리 9회) vs 롤업 조회(dashboard_stats.query_dashboard_stats).
+별도 스키마(gems_bench)에 합성 submissions를 생성해 측정하므로 운영 테이블은 건드리지 않음. 운영 DB가 아닌 곳에서 실행 권장.
+
+사용: DATABASE_URL 설정 후
+  python PROJECT/scripts/bench_dashboard_stats.py                       # 100,000 / 1,000,000건
+  python PROJECT/scripts/bench_dashboard_stats.py --rows 100000 --repeat 10 --keep
+출력: 건수별 두 방식의 중앙값·p95 지연(ms)과 결과 일치 여부.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    print("❌ DATABASE_URL 환경 변수가 없습니다.")
+    sys.exit(1)
+
+if DATABASE_URL.startswith("postgres://"):
+    DATABASE_URL = "postgresql+psycopg2://" + DATABASE_URL[11:]
+elif DATABASE_URL.startswith("postgresql://") and "+psycopg2" not in DATABASE_URL:
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://", 1)
+
+from sqlalchemy import create_engine, text
+
+from daily_stats import rebuild_submission_stats
+from dashboard_stats import PENDING_STATUSES, query_dashboard_stats
+
+SCHEMA = "gems_bench"
+STATUSES = ["FIT", "UNFIT", "ERROR", "PENDING_NEW", "PENDING_VERIFICATION", "VERIFYING", "UNFIT_DUPLICATE"]
+
+
+def _seed(conn, rows: int, days: int, campaigns: int) -> None:
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text(f"SET search_path TO {SCHEMA}"))
+    # 운영 submissions와 같은 집계 대상 컬럼·인덱스(submissions_receipt_items.sql)만 재현
+    conn.execute(text(
+        "CREATE TABLE submissions ("
+        " submission_id VARCHAR PRIMARY KEY, user_uuid VARCHAR NOT NULL, project_type VARCHAR NOT NULL,"
+        " campaign_id INTEGER DEFAULT 1, status VARCHAR DEFAULT 'PENDING', total_amount INTEGER DEFAULT 0,"
+        " fail_reason VARCHAR, global_fail_reason VARCHAR,"
+        " created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(), updated_at TIMESTAMP WITHOUT TIME ZONE)"
+    ))
+    conn.execute(text(
+        "CREATE TABLE receipt_items (submission_id VARCHAR NOT NULL, seq_no INTEGER NOT NULL, address VARCHAR, location VARCHAR)"
+    ))
+    conn.execute(
+        text(
+            "INSERT INTO submissions (submission_id, user_uuid, project_type, campaign_id, status, total_amount, created_at) "
+            "SELECT 'bench-' || g, md5(g::text), CASE WHEN random() < 0.4 THEN 'STAY' ELSE 'TOUR' END, "
+            " 1 + (g % :campaigns), (:statuses)[1 + floor(random() * :n_status)::int], "
+            " (30000 + floor(random() * 120000))::int, "
+            " NOW() - (random() * :days) * INTERVAL '1 day' "
+            "FROM generate_series(1, :rows) AS g"
+        ),
+        {"rows": rows, "days": days, "campaigns": campaigns, "statuses": STATUSES, "n_status": len(STATUSES)},
+    )
+    conn.execute(text("CREATE INDEX idx_submissions_user_uuid ON submissions(user_uuid)"))
+    conn.execute(text("CREATE INDEX idx_submissions_status ON submissions(status)"))
+    conn.execute(text("ANALYZE submissions"))
+    conn.exec_driver_sql((ROOT / "PROJECT" / "migrations" / "submission_daily_stats.sql").read_text(encoding="utf-8"))
+    rebuild_submission_stats(conn, lambda reason: "OTHER")
+    conn.execute(text("ANALYZE submission_daily_stats"))
+
+
+def _legacy(conn, campaign_id, range_start, range_end, today_start, yesterday_start) -> dict:
+    """변경 전 admin_dashboard_stats와 같은 9개 개별 쿼리."""
+    scope = "campaign_id = :cid" if campaign_id is not None else "TRUE"
+    rng = f"{scope} AND created_at >= :rs AND created_at < :re"
+    p = {"cid": campaign_id, "rs": range_start, "re": range_end, "ts": today_start, "ys": yesterday_start,
+         "pending": list(PENDING_STATUSES)}
+    out = {
+        "today": conn.execute(text(f"SELECT COUNT(*) FROM submissions WHERE {scope} AND created_at >= :ts"), p).scalar(),
+        "yesterday": conn.execute(
+            text(f"SELECT COUNT(*) FROM submissions WHERE {scope} AND created_at >= :ys AND created_at < :ts"), p
+        ).scalar(),
+        "pending": conn.execute(text(f"SELECT COUNT(*) FROM submissions WHERE {rng} AND status = ANY(:pending)"), p).scalar(),
+        "approved_sum": conn.execute(
+            text(f"SELECT COALESCE(SUM(total_amount), 0) FROM submissions WHERE {rng} AND status = 'FIT'"), p
+        ).scalar(),
+    }
+    out["by_category"] = dict(conn.execute(
+        text(f"SELECT project_type, COUNT(*) FROM submissions WHERE {rng} GROUP BY project_type"), p
+    ).fetchall())
+    out["day_counts"] = {
+        str(r[0]): r[1] for r in conn.execute(
+            text(f"SELECT date(created_at), COUNT(*) FROM submissions WHERE {rng} GROUP BY 1 ORDER BY 1"), p
+        )
+    }
+    out["month_counts"] = {
+        r[0].strftime("%Y-%m"): r[1] for r in conn.execute(
+            text(f"SELECT date_trunc('month', created_at), COUNT(*) FROM submissions WHERE {rng} GROUP BY 1 ORDER BY 1"), p
+        )
+    }
+    out["hour_counts"] = {
+        int(r[0]): r[1] for r in conn.execute(
+            text(f"SELECT extract(hour FROM created_at), COUNT(*) FROM submissions WHERE {rng} GROUP BY 1 ORDER BY 1"), p
+        )
+    }
+    out["by_status"] = dict(conn.execute(
+        text(f"SELECT status, COUNT(*) FROM submissions WHERE {rng} GROUP BY status"), p
+    ).fetchall())
+    return out
+
+
+def _time(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+    return statistics.median(samples), p95, result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="대시보드 통계 집계 벤치마크")
+    ap.add_argument("--rows", default="100000,1000000", help="쉼표 구분 건수 목록")
+    ap.add_argument("--repeat", type=int, default=5, help="방식별 반복 횟수(첫 1회는 워밍업으로 제외)")
+    ap.add_argument("--days", type=int, default=180, help="created_at 분포 기간(일)")
+    ap.add_argument("--campaigns", type=int, default=5)
+    ap.add_argument("--range-days", type=int, default=30, help="from~to 구간(최근 N일)")
+    ap.add_argument("--campaign-id", type=int, default=None, help="캠페인 필터(미지정=전체)")
+    ap.add_argument("--keep", action="store_true", help=f"종료 후 {SCHEMA} 스키마 유지")
+    args = ap.parse_args()
+
+    engine = create_engine(DATABASE_URL)
+    now = datetime.utcnow()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday_start = today_start - timedelta(days=1)
+    range_end = today_start + timedelta(days=1)
+    range_start = range_end - timedelta(days=args.range_days)
+    try:
+        for n in [int(x) for x in args.rows.split(",") if x.strip()]:
+            with engine.begin() as conn:
+                t0 = time.perf_counter()
+                _seed(conn, n, args.days, args.campaigns)
+                print(f"\n[{n:,}건] 생성 {time.perf_counter() - t0:.1f}s")
+            with engine.connect() as conn:
+                conn.execute(text(f"SET search_path TO {SCHEMA}"))
+                legacy_fn = lambda: _legacy(conn, args.campaign_id, range_start, range_end, today_start, yesterday_start)
+                single_fn = lambda: query_dashboard_stats(
+                    conn,
+                    scope_campaign_ids=None,
+                    campaign_id=args.campaign_id,
+                    range_start=range_start,
+                    range_end=range_end,
+                    range_end_inclusive=False,
+                    today_start=today_start,
+                    yesterday_start=yesterday_start,
+                )
+                legacy_fn()
+                single_fn()
+                l_med, l_p95, l_res = _time(legacy_fn, args.repeat)
+                s_med, s_p95, s_res = _time(single_fn, args.repeat)
+                same = all(
+                    l_res[k] == s_res[k]
+                    for k in ("today", "yesterday", "pending", "approved_sum", "by_status", "month_counts", "hour_counts")
+                )
+                print(f"  개별 쿼리 9회 : median {l_med:8.1f} ms  p95 {l_p95:8.1f} ms")
+                print(f"  롤업 조회     : median {s_med:8.1f} ms  p95 {s_p95:8.1f} ms  (x{l_med / s_med if s_med else 0:.1f})")
+                print(f"  결과 일치     : {'OK' if same else 'MISMATCH'}")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
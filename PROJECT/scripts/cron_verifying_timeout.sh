@@ -14,32 +14,41 @@ if [[ -z "$API_BASE_URL" ]]; then
   exit 1
 fi
 
-CURL_EXIT=0
-if [[ -n "$CRON_SECRET" ]]; then
-  RESP=$(curl -s -w "\n%{http_code}" -X POST \
-    -H "X-Cron-Secret: $CRON_SECRET" \
-    -H "Content-Type: application/json" \
-    "$API_BASE_URL/api/v1/admin/jobs/cron/verifying-timeout") || CURL_EXIT=$?
-elif [[ -n "$ADMIN_API_KEY" ]]; then
-  RESP=$(curl -s -w "\n%{http_code}" -X POST \
-    -H "X-Admin-Key: $ADMIN_API_KEY" \
-    -H "Content-Type: application/json" \
-    "$API_BASE_URL/api/v1/admin/jobs/process-verifying-timeout") || CURL_EXIT=$?
-else
-  echo "$(date '+%Y-%m-%dT%H:%M:%S') ERROR: set CRON_SECRET or ADMIN_API_KEY"
-  exit 1
-fi
+# 처리 건이 많으면 서버가 실행 시간 한도에서 끊고 has_more=true 반환 → 최대 MAX_ROUNDS회까지 이어서 호출
+MAX_ROUNDS="${MAX_ROUNDS:-10}"
+ROUND=1
+while :; do
+  CURL_EXIT=0
+  if [[ -n "$CRON_SECRET" ]]; then
+    RESP=$(curl -s -w "\n%{http_code}" -X POST \
+      -H "X-Cron-Secret: $CRON_SECRET" \
+      -H "Content-Type: application/json" \
+      "$API_BASE_URL/api/v1/admin/jobs/cron/verifying-timeout") || CURL_EXIT=$?
+  elif [[ -n "$ADMIN_API_KEY" ]]; then
+    RESP=$(curl -s -w "\n%{http_code}" -X POST \
+      -H "X-Admin-Key: $ADMIN_API_KEY" \
+      -H "Content-Type: application/json" \
+      "$API_BASE_URL/api/v1/admin/jobs/process-verifying-timeout") || CURL_EXIT=$?
+  else
+    echo "$(date '+%Y-%m-%dT%H:%M:%S') ERROR: set CRON_SECRET or ADMIN_API_KEY"
+    exit 1
+  fi
 
-if [[ "$CURL_EXIT" -ne 0 ]]; then
-  echo "$(date '+%Y-%m-%dT%H:%M:%S') ERROR: curl failed exit=$CURL_EXIT (3=URL malformed, 6=unreachable, 7=refused). API_BASE_URL length=${#API_BASE_URL}"
-  exit 1
-fi
+  if [[ "$CURL_EXIT" -ne 0 ]]; then
+    echo "$(date '+%Y-%m-%dT%H:%M:%S') ERROR: curl failed exit=$CURL_EXIT (3=URL malformed, 6=unreachable, 7=refused). API_BASE_URL length=${#API_BASE_URL}"
+    exit 1
+  fi
 
-# 맥(BSD) head는 -n -1 미지원 → sed로 마지막 줄 제외
-BODY=$(echo "$RESP" | sed '$d')
-CODE=$(echo "$RESP" | tail -n 1)
-echo "$(date '+%Y-%m-%dT%H:%M:%S') POST verifying-timeout HTTP $CODE $BODY"
-if [[ "$CODE" -ge 400 ]] || [[ "$CODE" -lt 200 ]]; then
-  exit 1
-fi
+  # 맥(BSD) head는 -n -1 미지원 → sed로 마지막 줄 제외
+  BODY=$(echo "$RESP" | sed '$d')
+  CODE=$(echo "$RESP" | tail -n 1)
+  echo "$(date '+%Y-%m-%dT%H:%M:%S') POST verifying-timeout HTTP $CODE round=$ROUND $BODY"
+  if [[ "$CODE" -ge 400 ]] || [[ "$CODE" -lt 200 ]]; then
+    exit 1
+  fi
+  if [[ "$BODY" != *'"has_more":true'* ]] || [[ "$ROUND" -ge "$MAX_ROUNDS" ]]; then
+    break
+  fi
+  ROUND=$((ROUND + 1))
+done
 exit 0
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+신청 집계 롤업(submission_daily_stats) 재구성. 최초 도입 시 백필, SQL로 직접 상태를 바꾼 뒤(mark_stuck_submissions_error 등) 불일치 복구용.
+재구성 중에는 판정 트랜잭션의 롤업 반영이 잠시 대기함(롤업 테이블 잠금). 대량 백필은 한산한 시간대 권장.
+사용: python PROJECT/scripts/rebuild_daily_stats.py                     # 전체 재구성
+     python PROJECT/scripts/rebuild_daily_stats.py --since 2026-03-01    # 해당 시각 이후 생성분만
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+from dateutil import parser as dateutil_parser
+
+from daily_stats import rebuild_submission_stats
+from main import SessionLocal, _reason_code_for_stats
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="submission_daily_stats 롤업 재구성")
+    ap.add_argument("--since", default=None, help="이 시각(UTC, created_at 기준) 이후 생성분만 재구성. 예: 2026-03-01")
+    args = ap.parse_args()
+    since = dateutil_parser.parse(args.since) if args.since else None
+
+    db = SessionLocal()
+    try:
+        t0 = time.perf_counter()
+        result = rebuild_submission_stats(db, _reason_code_for_stats, since=since)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 재구성 실패: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+    scope = f"{since.isoformat()} 이후" if since else "전체"
+    print(
+        f"✅ 롤업 재구성 완료({scope}): 신청 {result['members']:,}건 → 집계 행 {result['buckets']:,}개 "
+        f"({time.perf_counter() - t0:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
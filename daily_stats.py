@@ -0,0 +1,202 @@
+"""
+신청 집계 롤업(submission_daily_stats) 증분 유지·재구성.
+판정이 끝난 신청(IN_FLIGHT_STATUSES 외 상태)을 (일, 시, 캠페인, 업종, 상태, 시도, 시군구, 반려 사유 코드) 키로 건수·금액 누적.
+신청별로 현재 반영된 키는 submission_daily_stats_members에 두고, 상태 변경 시 이전 키 -1 / 새 키 +1로 반영.
+일·시는 created_at(naive UTC) 기준. 대시보드·행정구역·반려 사유 통계는 롤업 + 진행 중 건(원본)만 읽음(dashboard_stats).
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+# 분석 진행 중(판정 전) 상태. 롤업에 넣지 않고 조회 시 submissions(status 인덱스)에서 직접 집계
+IN_FLIGHT_STATUSES = ("PENDING", "PROCESSING", "VERIFYING")
+
+ROLLUP_KEY_COLUMNS = (
+    "stat_date",
+    "stat_hour",
+    "campaign_id",
+    "project_type",
+    "status",
+    "sido",
+    "sigungu",
+    "reason_code",
+)
+
+# reason_code_fn: fail_reason 텍스트 → 반려 사유 코드(main._reason_text_to_code_label의 코드)
+ReasonCodeFn = Callable[[str], str]
+
+# 신청별 현재 집계 키. 대표 지역은 첫 장(seq_no=1)의 address 첫 토큰(시도)·location 또는 둘째 토큰(시군구)
+_MEMBER_SOURCE_SQL = """
+SELECT
+    s.submission_id,
+    CAST(COALESCE(s.created_at, s.updated_at, timezone('UTC', now())) AS DATE) AS stat_date,
+    CAST(extract(hour FROM COALESCE(s.created_at, s.updated_at, timezone('UTC', now()))) AS SMALLINT) AS stat_hour,
+    COALESCE(s.campaign_id, 0) AS campaign_id,
+    left(COALESCE(s.project_type, ''), 16) AS project_type,
+    left(COALESCE(s.status, ''), 32) AS status,
+    left(COALESCE(split_part(trim(ri.address), ' ', 1), ''), 64) AS sido,
+    left(COALESCE(NULLIF(trim(ri.location), ''), split_part(trim(ri.address), ' ', 2), ''), 64) AS sigungu,
+    COALESCE(s.fail_reason, s.global_fail_reason) AS reason,
+    COALESCE(s.total_amount, 0) AS total_amount
+FROM submissions s
+LEFT JOIN LATERAL (
+    SELECT address, location FROM receipt_items
+    WHERE submission_id = s.submission_id AND seq_no = 1
+    LIMIT 1
+) ri ON TRUE
+WHERE {where}
+"""
+
+_INSERT_MEMBER_SQL = """
+INSERT INTO submission_daily_stats_members
+    (submission_id, stat_date, stat_hour, campaign_id, project_type, status, sido, sigungu, reason_code, total_amount, updated_at)
+VALUES
+    (:submission_id, :stat_date, :stat_hour, :campaign_id, :project_type, :status, :sido, :sigungu, :reason_code, :total_amount,
+     timezone('UTC', now()))
+"""
+
+_APPLY_DELTA_SQL = """
+INSERT INTO submission_daily_stats
+    (stat_date, stat_hour, campaign_id, project_type, status, sido, sigungu, reason_code, submission_count, total_amount, updated_at)
+VALUES
+    (:stat_date, :stat_hour, :campaign_id, :project_type, :status, :sido, :sigungu, :reason_code, :n, :amount,
+     timezone('UTC', now()))
+ON CONFLICT (stat_date, stat_hour, campaign_id, project_type, status, sido, sigungu, reason_code) DO UPDATE SET
+    submission_count = submission_daily_stats.submission_count + EXCLUDED.submission_count,
+    total_amount = submission_daily_stats.total_amount + EXCLUDED.total_amount,
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+def _reason_code(status: str, reason: Optional[str], reason_code_fn: ReasonCodeFn) -> str:
+    """FIT은 사유 없음(''), 그 외는 fail_reason을 표준 사유 코드로."""
+    if status == "FIT":
+        return ""
+    return (reason_code_fn(reason or "") or "OTHER")[:32]
+
+
+def _key(row: Any) -> Tuple:
+    return tuple(row[c] for c in ROLLUP_KEY_COLUMNS)
+
+
+def sync_submission_stats(db: Any, submission_ids: Iterable[str], reason_code_fn: ReasonCodeFn) -> int:
+    """
+    신청 상태 변경 후 롤업 반영(호출부 트랜잭션 안에서 실행, commit은 호출부).
+    현재 상태를 submissions에서 다시 읽어(FOR UPDATE) 이전 반영 키를 빼고 새 키를 더함. 진행 중 상태로 돌아간 건은 제외만.
+    반환: 롤업에 반영된(판정 완료) 신청 수.
+    """
+    ids = sorted({str(s) for s in submission_ids if s})
+    if not ids:
+        return 0
+    current = db.execute(
+        text(_MEMBER_SOURCE_SQL.format(where="s.submission_id = ANY(:ids)") + " FOR UPDATE OF s"),
+        {"ids": ids},
+    ).mappings().all()
+    old = db.execute(
+        text(
+            "DELETE FROM submission_daily_stats_members WHERE submission_id = ANY(:ids) "
+            "RETURNING " + ", ".join(ROLLUP_KEY_COLUMNS) + ", total_amount"
+        ),
+        {"ids": ids},
+    ).mappings().all()
+
+    deltas: Dict[Tuple, List[int]] = {}
+    for r in old:
+        d = deltas.setdefault(_key(r), [0, 0])
+        d[0] -= 1
+        d[1] -= int(r["total_amount"] or 0)
+    members: List[Dict[str, Any]] = []
+    for r in current:
+        if r["status"] in IN_FLIGHT_STATUSES:
+            continue
+        # 원본 조회에는 사유 텍스트(reason)만 있으므로 reason_code는 여기서 계산
+        m = {c: r[c] for c in ROLLUP_KEY_COLUMNS if c != "reason_code"}
+        m["reason_code"] = _reason_code(r["status"], r["reason"], reason_code_fn)
+        m["submission_id"] = r["submission_id"]
+        m["total_amount"] = int(r["total_amount"] or 0)
+        members.append(m)
+        d = deltas.setdefault(_key(m), [0, 0])
+        d[0] += 1
+        d[1] += m["total_amount"]
+    if members:
+        db.execute(text(_INSERT_MEMBER_SQL), members)
+
+    # 키 정렬 순서로 갱신(동시 반영 간 교착 방지). 상태 변화 없는 재반영은 델타 0이라 생략
+    changes = [
+        dict(zip(ROLLUP_KEY_COLUMNS, k), n=v[0], amount=v[1])
+        for k, v in sorted(deltas.items())
+        if v[0] != 0 or v[1] != 0
+    ]
+    if changes:
+        db.execute(text(_APPLY_DELTA_SQL), changes)
+        db.execute(
+            text("DELETE FROM submission_daily_stats WHERE submission_count <= 0 AND stat_date = ANY(:dates)"),
+            {"dates": sorted({c["stat_date"] for c in changes if c["n"] < 0})},
+        )
+    return len(members)
+
+
+def rebuild_submission_stats(
+    db: Any,
+    reason_code_fn: ReasonCodeFn,
+    since: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """
+    롤업 재구성(백필·불일치 복구). since 지정 시 그 시각(시 단위 내림) 이후 생성분만, 없으면 전체.
+    재구성 중 다른 트랜잭션의 sync는 members 테이블 잠금으로 대기. commit은 호출부.
+    반환: {"members": 반영 신청 수, "buckets": 롤업 행 수}
+    """
+    params: Dict[str, Any] = {"in_flight": list(IN_FLIGHT_STATUSES)}
+    db.execute(text("LOCK TABLE submission_daily_stats_members IN EXCLUSIVE MODE"))
+    if since is not None:
+        since = since.replace(minute=0, second=0, microsecond=0)
+        params.update({"since": since, "since_date": since.date(), "since_hour": since.hour})
+        bucket_cond = "(stat_date, stat_hour) >= (:since_date, :since_hour)"
+        source_cond = "s.created_at >= :since AND s.status <> ALL(:in_flight)"
+        db.execute(text(f"DELETE FROM submission_daily_stats_members WHERE {bucket_cond}"), params)
+        db.execute(text(f"DELETE FROM submission_daily_stats WHERE {bucket_cond}"), params)
+    else:
+        bucket_cond = "TRUE"
+        source_cond = "s.status <> ALL(:in_flight)"
+        db.execute(text("TRUNCATE submission_daily_stats_members, submission_daily_stats"))
+
+    # 사유 코드 매핑은 Python 규칙이라 distinct 사유 텍스트만 변환해 임시 테이블로 조인
+    reasons = db.execute(
+        text(
+            "SELECT DISTINCT COALESCE(s.fail_reason, s.global_fail_reason) FROM submissions s "
+            f"WHERE {source_cond} AND s.status <> 'FIT' AND COALESCE(s.fail_reason, s.global_fail_reason) IS NOT NULL"
+        ),
+        params,
+    ).scalars().all()
+    db.execute(text("CREATE TEMP TABLE tmp_reason_codes (reason TEXT PRIMARY KEY, reason_code VARCHAR(32)) ON COMMIT DROP"))
+    if reasons:
+        db.execute(
+            text("INSERT INTO tmp_reason_codes (reason, reason_code) VALUES (:reason, :code)"),
+            [{"reason": r, "code": _reason_code("", r, reason_code_fn)} for r in reasons],
+        )
+    no_reason_code = _reason_code("", None, reason_code_fn)
+    params["no_reason_code"] = no_reason_code
+    members = db.execute(
+        text(
+            "INSERT INTO submission_daily_stats_members "
+            "(submission_id, stat_date, stat_hour, campaign_id, project_type, status, sido, sigungu, reason_code, total_amount, updated_at) "
+            "SELECT m.submission_id, m.stat_date, m.stat_hour, m.campaign_id, m.project_type, m.status, m.sido, m.sigungu, "
+            "CASE WHEN m.status = 'FIT' THEN '' ELSE COALESCE(rc.reason_code, :no_reason_code) END, "
+            "m.total_amount, timezone('UTC', now()) "
+            f"FROM ({_MEMBER_SOURCE_SQL.format(where=source_cond)}) m "
+            "LEFT JOIN tmp_reason_codes rc ON rc.reason = m.reason"
+        ),
+        params,
+    ).rowcount
+    buckets = db.execute(
+        text(
+            "INSERT INTO submission_daily_stats "
+            "(stat_date, stat_hour, campaign_id, project_type, status, sido, sigungu, reason_code, submission_count, total_amount, updated_at) "
+            "SELECT " + ", ".join(ROLLUP_KEY_COLUMNS) + ", COUNT(*), COALESCE(SUM(total_amount), 0), timezone('UTC', now()) "
+            f"FROM submission_daily_stats_members WHERE {bucket_cond} "
+            "GROUP BY " + ", ".join(ROLLUP_KEY_COLUMNS)
+        ),
+        params,
+    ).rowcount
+    return {"members": int(members or 0), "buckets": int(buckets or 0)}
@@ -0,0 +1,304 @@
+"""
+관리자 대시보드·행정구역·반려 사유 통계 조회.
+판정 완료 건은 롤업(submission_daily_stats, daily_stats 모듈에서 증분 유지), 분석 진행 중 건(IN_FLIGHT_STATUSES)만
+submissions에서 읽어 합산. 조회 비용은 테이블 크기가 아닌 조회 기간(시간 버킷 수)에 비례.
+기간 경계는 롤업 단위인 시(hour)로 맞춤(시작 내림, 끝 올림). 필터는 저장 컬럼 범위 비교만 사용(인덱스 스캔 가능),
+일·월·시간대 버킷은 필터 후 요청 타임존으로 변환해 계산. 롤업 행은 UTC 시 단위라 정시 단위가 아닌 오프셋(예: +05:30)은 시 시작 기준 근사.
+main 모듈과 분리해 벤치마크 스크립트(PROJECT/scripts/bench_dashboard_stats.py)에서 DB 연결만으로 재사용 가능.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+from daily_stats import IN_FLIGHT_STATUSES
+
+# 검수 대기: FE 대시보드 "대기중"에 대응 (백엔드_요청사항_정리 §2.2, §2.3)
+PENDING_STATUSES = ("MANUAL_REVIEW", "PENDING_VERIFICATION", "PENDING_NEW", "VERIFYING")
+
+_DASHBOARD_STATS_SQL = """
+WITH base AS (
+    SELECT
+        status,
+        project_type,
+        submission_count AS n,
+        total_amount,
+        stat_date + stat_hour * INTERVAL '1 hour' AS bucket
+    FROM submission_daily_stats
+    WHERE {scope_cond} AND (({rollup_range_cond}) OR (stat_date, stat_hour) >= (:yesterday_date, :yesterday_hour))
+    UNION ALL
+    SELECT
+        status,
+        project_type,
+        1,
+        COALESCE(total_amount, 0),
+        created_at
+    FROM submissions
+    WHERE status = ANY(:in_flight) AND {scope_cond} AND (({raw_range_cond}) OR created_at >= :yesterday_start)
+),
+localized AS (
+    SELECT *, ({bucket_range_cond}) AS in_range, timezone(:tz, timezone('UTC', bucket)) AS local_at FROM base
+),
+flagged AS (
+    SELECT
+        *,
+        CAST(local_at AS DATE) AS d,
+        date_trunc('month', local_at) AS m,
+        CAST(extract(hour FROM local_at) AS INTEGER) AS h
+    FROM localized
+)
+SELECT
+    CASE
+        WHEN GROUPING(d) = 0 THEN 'day'
+        WHEN GROUPING(m) = 0 THEN 'month'
+        WHEN GROUPING(h) = 0 THEN 'hour'
+        WHEN GROUPING(project_type) = 0 THEN 'category'
+        WHEN GROUPING(status) = 0 THEN 'status'
+        ELSE 'total'
+    END AS grp,
+    d, m, h, project_type, status,
+    COALESCE(SUM(n) FILTER (WHERE in_range), 0) AS cnt,
+    COALESCE(SUM(n) FILTER (WHERE bucket >= :today_start), 0) AS today_cnt,
+    COALESCE(SUM(n) FILTER (WHERE bucket >= :yesterday_start AND bucket < :today_start), 0) AS yesterday_cnt,
+    COALESCE(SUM(n) FILTER (WHERE in_range AND status = ANY(:pending_statuses)), 0) AS pending_cnt,
+    COALESCE(SUM(total_amount) FILTER (WHERE in_range AND status = 'FIT'), 0) AS approved_sum
+FROM flagged
+GROUP BY GROUPING SETS ((), (d), (m), (h), (project_type), (status))
+"""
+
+
+def _floor_hour(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(dt: datetime) -> datetime:
+    floored = _floor_hour(dt)
+    return floored if floored == dt else floored + timedelta(hours=1)
+
+
+def _scope_cond(
+    scope_campaign_ids: Optional[List[int]],
+    campaign_ids: Sequence[Optional[int]],
+    params: Dict[str, Any],
+) -> str:
+    """관리자 권한 캠페인(None=전체) + 요청 캠페인 필터(None 항목은 무시). submissions·롤업 공통 컬럼(campaign_id)."""
+    scope: List[str] = []
+    if scope_campaign_ids is not None:
+        scope.append("campaign_id = ANY(:scope_cids)")
+        params["scope_cids"] = [int(c) for c in scope_campaign_ids]
+    for i, cid in enumerate(campaign_ids):
+        if cid is not None:
+            scope.append(f"campaign_id = :campaign_id_{i}")
+            params[f"campaign_id_{i}"] = int(cid)
+    return " AND ".join(scope) or "TRUE"
+
+
+def _hour_range(
+    range_start: Optional[datetime],
+    range_end: Optional[datetime],
+    range_end_inclusive: bool,
+    params: Dict[str, Any],
+) -> Dict[str, str]:
+    """
+    기간을 시 단위 [시작, 끝)으로 맞춰 조건식 3종 반환.
+    rollup: 롤업 (stat_date, stat_hour) 비교(PK 범위 스캔), raw: submissions.created_at 비교, bucket: 합친 뒤 시 버킷 비교.
+    """
+    rollup: List[str] = []
+    raw: List[str] = []
+    bucket: List[str] = []
+    if range_start is not None:
+        start = _floor_hour(range_start)
+        params.update({"range_start": start, "range_start_date": start.date(), "range_start_hour": start.hour})
+        rollup.append("(stat_date, stat_hour) >= (:range_start_date, :range_start_hour)")
+        raw.append("created_at >= :range_start")
+        bucket.append("bucket >= :range_start")
+    if range_end is not None:
+        end = _floor_hour(range_end) + timedelta(hours=1) if range_end_inclusive else _ceil_hour(range_end)
+        params.update({"range_end": end, "range_end_date": end.date(), "range_end_hour": end.hour})
+        rollup.append("(stat_date, stat_hour) < (:range_end_date, :range_end_hour)")
+        raw.append("created_at < :range_end")
+        bucket.append("bucket < :range_end")
+    return {
+        "rollup_range_cond": " AND ".join(rollup) or "TRUE",
+        "raw_range_cond": " AND ".join(raw) or "TRUE",
+        "bucket_range_cond": " AND ".join(bucket) or "TRUE",
+    }
+
+
+def query_dashboard_stats(
+    db: Any,
+    *,
+    scope_campaign_ids: Optional[List[int]],
+    campaign_id: Optional[int],
+    range_start: Optional[datetime],
+    range_end: Optional[datetime],
+    range_end_inclusive: bool,
+    today_start: datetime,
+    yesterday_start: datetime,
+    tz: str = "UTC",
+) -> Dict[str, Any]:
+    """
+    대시보드 통계 1회 집계(롤업 + 진행 중 건). db: Session 또는 Connection.
+    scope_campaign_ids: 관리자 권한 캠페인 목록(None=전체, []=조회 불가). campaign_id: 요청 필터.
+    range_*·today_start·yesterday_start: naive UTC 시각(호출부에서 요청 타임존 경계를 UTC로 변환).
+    range_*: from/to 구간(금일·전일은 구간과 무관하게 캠페인 범위 전체에서 집계).
+    tz: 일·월·시간대 버킷 타임존(IANA 이름).
+    반환: today/yesterday/pending/approved_sum 및 일(YYYY-MM-DD)·월(YYYY-MM)·시간대(0~23)·업종·상태별 건수 dict.
+    """
+    params: Dict[str, Any] = {}
+    scope_cond = _scope_cond(scope_campaign_ids, [campaign_id], params)
+    conds = _hour_range(range_start, range_end, range_end_inclusive, params)
+    today_start = _floor_hour(today_start)
+    yesterday_start = _floor_hour(yesterday_start)
+    sql = text(_DASHBOARD_STATS_SQL.format(scope_cond=scope_cond, **conds))
+    params.update(
+        {
+            "today_start": today_start,
+            "yesterday_start": yesterday_start,
+            "yesterday_date": yesterday_start.date(),
+            "yesterday_hour": yesterday_start.hour,
+            "in_flight": list(IN_FLIGHT_STATUSES),
+            "pending_statuses": list(PENDING_STATUSES),
+            "tz": tz,
+        }
+    )
+    out: Dict[str, Any] = {
+        "today": 0,
+        "yesterday": 0,
+        "pending": 0,
+        "approved_sum": 0,
+        "day_counts": {},
+        "month_counts": {},
+        "hour_counts": {},
+        "by_category": {},
+        "by_status": {},
+    }
+    for row in db.execute(sql, params).mappings():
+        grp = row["grp"]
+        cnt = int(row["cnt"] or 0)
+        if grp == "total":
+            out["today"] = int(row["today_cnt"] or 0)
+            out["yesterday"] = int(row["yesterday_cnt"] or 0)
+            out["pending"] = int(row["pending_cnt"] or 0)
+            out["approved_sum"] = int(row["approved_sum"] or 0)
+            continue
+        # 금일·전일 집계용으로만 포함된(구간 밖) 행은 구간 집계에서 제외
+        if cnt <= 0:
+            continue
+        if grp == "day" and row["d"] is not None:
+            d = row["d"]
+            out["day_counts"][d.isoformat() if hasattr(d, "isoformat") else str(d)[:10]] = cnt
+        elif grp == "month" and row["m"] is not None:
+            m = row["m"]
+            out["month_counts"][m.strftime("%Y-%m") if hasattr(m, "strftime") else str(m)[:7]] = cnt
+        elif grp == "hour" and row["h"] is not None:
+            out["hour_counts"][int(row["h"])] = cnt
+        elif grp == "category":
+            key = row["project_type"] or ""
+            out["by_category"][key] = out["by_category"].get(key, 0) + cnt
+        elif grp == "status":
+            key = (row["status"] or "UNKNOWN").strip() or "UNKNOWN"
+            out["by_status"][key] = out["by_status"].get(key, 0) + cnt
+    return out
+
+
+def query_status_breakdown(
+    db: Any,
+    *,
+    scope_campaign_ids: Optional[List[int]],
+    campaign_ids: Sequence[Optional[int]] = (),
+) -> List[Tuple[str, str, int]]:
+    """상태·업종별 전체 건수 (status, project_type, count). 대시보드 breakdown용."""
+    params: Dict[str, Any] = {"in_flight": list(IN_FLIGHT_STATUSES)}
+    scope_cond = _scope_cond(scope_campaign_ids, campaign_ids, params)
+    rows = db.execute(
+        text(
+            "SELECT status, project_type, SUM(n) FROM ("
+            f" SELECT status, project_type, submission_count AS n FROM submission_daily_stats WHERE {scope_cond}"
+            " UNION ALL"
+            f" SELECT status, project_type, 1 FROM submissions WHERE status = ANY(:in_flight) AND {scope_cond}"
+            ") u GROUP BY status, project_type"
+        ),
+        params,
+    ).fetchall()
+    return [(r[0] or "", r[1] or "", int(r[2] or 0)) for r in rows]
+
+
+def query_region_stats(
+    db: Any,
+    *,
+    level_column: str,
+    range_start: Optional[datetime],
+    range_end: Optional[datetime],
+    range_end_inclusive: bool,
+    project_type: Optional[str],
+    sido_in: Optional[List[str]] = None,
+    sigungu_eq: Optional[str] = None,
+    min_amount_stay: int = 60000,
+    min_amount_tour: int = 50000,
+) -> Dict[str, Any]:
+    """
+    행정구역별 (지역 원문, 제출 수, FIT 수, 금액 합) 목록(제출 수 내림차순)과 최소금액 달성 FIT 건수.
+    level_column: sido | sigungu (롤업의 대표 지역 원문 컬럼). 지역 코드 매핑은 호출부.
+    최소금액 달성 건수는 기준값이 정책 설정이라 신청별 반영 행(submission_daily_stats_members)에서 기간 범위로 계산.
+    """
+    if level_column not in ("sido", "sigungu"):
+        raise ValueError("level_column must be sido or sigungu")
+    params: Dict[str, Any] = {}
+    conds = [_hour_range(range_start, range_end, range_end_inclusive, params)["rollup_range_cond"]]
+    if project_type:
+        conds.append("project_type = :project_type")
+        params["project_type"] = project_type
+    if sido_in:
+        conds.append("sido = ANY(:sido_in)")
+        params["sido_in"] = list(sido_in)
+    if sigungu_eq:
+        conds.append("sigungu = :sigungu_eq")
+        params["sigungu_eq"] = sigungu_eq
+    where = " AND ".join(conds)
+    rows = db.execute(
+        text(
+            f"SELECT {level_column}, SUM(submission_count) AS cnt, "
+            "COALESCE(SUM(submission_count) FILTER (WHERE status = 'FIT'), 0), COALESCE(SUM(total_amount), 0) "
+            f"FROM submission_daily_stats WHERE {where} AND {level_column} <> '' "
+            f"GROUP BY {level_column} ORDER BY cnt DESC"
+        ),
+        params,
+    ).fetchall()
+    params.update({"min_stay": int(min_amount_stay), "min_tour": int(min_amount_tour)})
+    achieve = db.execute(
+        text(
+            f"SELECT COUNT(*) FROM submission_daily_stats_members WHERE {where} AND status = 'FIT' "
+            "AND total_amount >= CASE WHEN project_type = 'STAY' THEN :min_stay ELSE :min_tour END"
+        ),
+        params,
+    ).scalar()
+    return {
+        "rows": [(r[0], int(r[1] or 0), int(r[2] or 0), int(r[3] or 0)) for r in rows],
+        "min_amount_achieve_count": int(achieve or 0),
+    }
+
+
+def query_reject_reason_counts(
+    db: Any,
+    *,
+    scope_campaign_ids: Optional[List[int]],
+    campaign_id: Optional[int],
+    range_start: Optional[datetime],
+    range_end: Optional[datetime],
+    range_end_inclusive: bool,
+    limit: int,
+) -> List[Tuple[str, int]]:
+    """반려(판정 완료·FIT 외) 건의 사유 코드별 (reason_code, count) 목록, 건수 내림차순 최대 limit건."""
+    params: Dict[str, Any] = {"limit": int(limit)}
+    scope_cond = _scope_cond(scope_campaign_ids, [campaign_id], params)
+    range_cond = _hour_range(range_start, range_end, range_end_inclusive, params)["rollup_range_cond"]
+    rows = db.execute(
+        text(
+            "SELECT reason_code, SUM(submission_count) AS cnt FROM submission_daily_stats "
+            f"WHERE status <> 'FIT' AND {scope_cond} AND {range_cond} "
+            "GROUP BY reason_code ORDER BY cnt DESC LIMIT :limit"
+        ),
+        params,
+    ).fetchall()
+    return [(r[0] or "OTHER", int(r[1] or 0)) for r in rows]
@@ -0,0 +1,69 @@
+"""
+증빙 팩 ZIP 스트리밍 작성(임시 파일 없음). zipfile을 탐색 불가 스트림에 쓰면 항목마다 데이터 디스크립터로 기록되므로
+항목을 추가할 때마다 drain()으로 완성된 바이트만 꺼내 HTTP 응답 청크로 보냄. 메모리는 현재 항목 크기 수준.
+main 모듈과 분리(DB·S3 비의존).
+"""
+import json
+import zipfile
+from datetime import datetime
+from typing import Any, List, Optional
+
+
+class _ChunkSink:
+    """zipfile 출력 대상. tell/seek 미제공 → zipfile이 비탐색 스트림 모드로 동작."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks = []
+        return out
+
+
+class EvidenceZipWriter:
+    """
+    사용: w = EvidenceZipWriter(); w.add_json(...); yield w.drain(); ...; yield w.close()
+    이미지(이미 압축된 포맷)는 저장(STORED), JSON은 DEFLATE. 4GB 초과 팩 대비 ZIP64 허용.
+    """
+
+    def __init__(self) -> None:
+        self._sink = _ChunkSink()
+        self._zf = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    def _info(self, name: str, compress: bool) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(name, date_time=datetime.utcnow().timetuple()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        info.external_attr = 0o644 << 16
+        return info
+
+    def add_bytes(self, name: str, data: bytes, compress: bool = False) -> None:
+        with self._zf.open(self._info(name, compress), mode="w", force_zip64=len(data) >= (1 << 31)) as f:
+            f.write(data)
+
+    def add_json(self, name: str, obj: Any) -> None:
+        data = json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+        self.add_bytes(name, data, compress=True)
+
+    def drain(self) -> bytes:
+        """지금까지 완성된 바이트(다음 응답 청크)."""
+        return self._sink.take()
+
+    def close(self) -> bytes:
+        """중앙 디렉터리 기록 후 남은 바이트."""
+        self._zf.close()
+        return self._sink.take()
+
+
+def _json_default(v: Any) -> Optional[str]:
+    if isinstance(v, datetime):
+        return v.isoformat()
+    return str(v)
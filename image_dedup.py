@@ -0,0 +1,183 @@
+"""
+영수증 이미지 유사 중복 탐지 (지각 해시 dHash + BK-tree).
+업로드 이미지의 64비트 dHash를 receipt_image_hashes에 저장하고, 프로세스 공용 인메모리 BK-tree로 해밍 거리 검색.
+OCR(CLOVA) 호출 전에 같은 영수증을 재촬영·재업로드한 의심 건을 찾기 위함. 전체 비교 대신 트리 가지치기로 준선형 검색.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 전체 재적재 주기(초). 증분 적재(id 증가분)로 누락될 수 있는 다른 프로세스의 늦은 커밋 반영용. 0이면 재적재 안 함.
+IMAGE_HASH_INDEX_TTL_SEC = max(0, int(os.getenv("IMAGE_HASH_INDEX_TTL_SEC", "600")))
+
+_MASK64 = (1 << 64) - 1
+
+
+def _to_unsigned(h: int) -> int:
+    return h & _MASK64
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(_to_unsigned(a) ^ _to_unsigned(b)).count("1")
+
+
+class BKTree:
+    """
+    해밍 거리 BK-tree. 노드: [해시, 행 id 목록, {거리: 자식 노드}].
+    동일 해시는 한 노드에 id만 추가. 검색은 삼각부등식으로 |d - r| ~ d + r 범위 자식만 방문.
+    """
+
+    def __init__(self) -> None:
+        self._root: Optional[list] = None
+        self.size = 0
+
+    def add(self, h: int, row_id: int) -> None:
+        h = _to_unsigned(h)
+        self.size += 1
+        if self._root is None:
+            self._root = [h, [row_id], {}]
+            return
+        node = self._root
+        while True:
+            d = bin(node[0] ^ h).count("1")
+            if d == 0:
+                node[1].append(row_id)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [h, [row_id], {}]
+                return
+            node = child
+
+    def search(self, h: int, max_distance: int) -> List[Tuple[int, int]]:
+        """해밍 거리 max_distance 이하 항목의 (행 id, 거리) 목록."""
+        if self._root is None:
+            return []
+        h = _to_unsigned(h)
+        out: List[Tuple[int, int]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            d = bin(node[0] ^ h).count("1")
+            if d <= max_distance:
+                out.extend((rid, d) for rid in node[1])
+            lo, hi = d - max_distance, d + max_distance
+            for cd, child in node[2].items():
+                if lo <= cd <= hi:
+                    stack.append(child)
+        return out
+
+
+class _ImageHashIndex:
+    """
+    receipt_image_hashes 인메모리 BK-tree 인덱스 (프로세스 공용).
+    - 최초 조회 시 전체 적재, 이후 조회마다 마지막 적재 id 이후 행만 증분 적재.
+    - IMAGE_HASH_INDEX_TTL_SEC 경과 시 전체 재구성(늦게 커밋된 행·삭제 반영).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tree = BKTree()
+        self._last_id = 0
+        self._loaded_at: Optional[float] = None
+
+    def _needs_full_load(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return IMAGE_HASH_INDEX_TTL_SEC > 0 and (time.monotonic() - self._loaded_at) >= IMAGE_HASH_INDEX_TTL_SEC
+
+    def refresh(self, db: Session) -> None:
+        if self._needs_full_load():
+            rows = db.execute(text("SELECT id, dhash FROM receipt_image_hashes ORDER BY id")).fetchall()
+            tree = BKTree()
+            last_id = 0
+            for row_id, dhash in rows:
+                tree.add(int(dhash), int(row_id))
+                last_id = int(row_id)
+            with self._lock:
+                self._tree = tree
+                self._last_id = last_id
+                self._loaded_at = time.monotonic()
+            logger.info("image hash index loaded: hashes=%s", tree.size)
+            return
+        rows = db.execute(
+            text("SELECT id, dhash FROM receipt_image_hashes WHERE id > :last ORDER BY id"),
+            {"last": self._last_id},
+        ).fetchall()
+        if not rows:
+            return
+        with self._lock:
+            for row_id, dhash in rows:
+                if int(row_id) <= self._last_id:
+                    continue
+                self._tree.add(int(dhash), int(row_id))
+                self._last_id = int(row_id)
+
+    def search(self, h: int, max_distance: int) -> List[Tuple[int, int]]:
+        with self._lock:
+            return self._tree.search(h, max_distance)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": self._tree.size, "last_id": self._last_id}
+
+
+_image_hash_index = _ImageHashIndex()
+
+
+def image_hash_index_snapshot() -> Dict[str, Any]:
+    return _image_hash_index.snapshot()
+
+
+def find_near_duplicate_images(
+    db: Session,
+    dhash: int,
+    exclude_submission_id: str,
+    max_distance: int,
+    limit: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    dHash 해밍 거리 max_distance 이하인 다른 신청건 이미지 목록(거리 오름차순, 최대 limit건).
+    후보는 DB 행으로 재확인(해시 갱신·롤백 반영)하고 신청 상태를 함께 반환.
+    """
+    _image_hash_index.refresh(db)
+    candidates = _image_hash_index.search(dhash, max_distance)
+    if not candidates:
+        return []
+    rows = db.execute(
+        text(
+            "SELECT h.id, h.submission_id, h.image_key, h.dhash, s.status "
+            "FROM receipt_image_hashes h JOIN submissions s ON s.submission_id = h.submission_id "
+            "WHERE h.id = ANY(:ids) AND h.submission_id <> :sid"
+        ),
+        {"ids": [rid for rid, _ in candidates], "sid": exclude_submission_id},
+    ).fetchall()
+    out: List[Dict[str, Any]] = []
+    for row_id, submission_id, image_key, row_hash, status in rows:
+        d = hamming_distance(int(row_hash), dhash)
+        if d > max_distance:
+            continue
+        out.append(
+            {"submissionId": submission_id, "imageKey": image_key, "distance": d, "status": status}
+        )
+    out.sort(key=lambda x: (x["distance"], x["submissionId"]))
+    return out[:limit]
+
+
+def register_image_hash(db: Session, submission_id: str, image_key: str, dhash: int) -> None:
+    """신청건 이미지 해시 저장(재분석 시 갱신). commit은 호출부. 인덱스에는 다음 refresh 때 증분 반영."""
+    db.execute(
+        text(
+            "INSERT INTO receipt_image_hashes (submission_id, image_key, dhash, created_at) "
+            "VALUES (:sid, :key, :h, NOW()) "
+            "ON CONFLICT (submission_id, image_key) DO UPDATE SET dhash = EXCLUDED.dhash"
+        ),
+        {"sid": submission_id, "key": image_key, "h": int(dhash)},
+    )
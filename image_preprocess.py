@@ -0,0 +1,157 @@
+"""
+OCR 전송용 이미지 전처리 (CLOVA Document OCR > 영수증), 중복 이미지 탐지용 지각 해시(dHash), 관리자 목록용 썸네일.
+main 모듈과 분리해 프로세스 풀(ProcessPoolExecutor) 워커에서 DB·S3 초기화 없이 import 가능하도록 함.
+"""
+import io
+import os
+from typing import Optional, Tuple
+
+from PIL import Image, ImageOps, ImageEnhance
+
+# - 공식 권장: 장축 1960px 이하, JPEG 품질은 인식률 위해 90 권장 (PROJECT/네이버_CLOVA_OCR_레퍼런스_및_인식률_검토.md)
+MAX_OCR_DIMENSION = int(os.getenv("OCR_MAX_DIMENSION", "1960"))
+OCR_JPEG_QUALITY = int(os.getenv("OCR_JPEG_QUALITY", "90"))
+# 인식률 향상: 저해상도 업스케일(1=활성), 업스케일 적용 한계(이 값 미만이면 장축 1960까지 확대), 작은 이미지 PNG 전송(1=활성)
+OCR_UPSCALE_SMALL = os.getenv("OCR_UPSCALE_SMALL", "0").strip().lower() in ("1", "true", "yes")
+OCR_UPSCALE_MAX_SIDE = int(os.getenv("OCR_UPSCALE_MAX_SIDE", "1200"))
+OCR_SEND_PNG_WHEN_SMALL = os.getenv("OCR_SEND_PNG_WHEN_SMALL", "0").strip().lower() in ("1", "true", "yes")
+# 관리자 목록·검수 화면 썸네일: 장축 px, 포맷(JPEG|WEBP, WebP 미지원 Pillow면 JPEG), 품질
+THUMBNAIL_MAX_SIDE = max(64, min(1024, int(os.getenv("THUMBNAIL_MAX_SIDE", "320"))))
+THUMBNAIL_FORMAT = "WEBP" if os.getenv("THUMBNAIL_FORMAT", "JPEG").strip().upper() == "WEBP" else "JPEG"
+THUMBNAIL_QUALITY = max(30, min(95, int(os.getenv("THUMBNAIL_QUALITY", "75"))))
+
+
+def compute_dhash(img: "Image.Image") -> int:
+    """
+    64비트 dHash(차분 해시): 회색조 9x8 축소 후 가로 인접 픽셀 밝기 비교.
+    재촬영·재압축·약간의 크기 변화에 강하고 해밍 거리로 유사도 비교. 반환은 부호 있는 64비트(DB BIGINT 저장용).
+    """
+    small = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+    px = list(small.getdata())
+    value = 0
+    for row in range(8):
+        base = row * 9
+        for col in range(8):
+            value = (value << 1) | (1 if px[base + col] > px[base + col + 1] else 0)
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def make_thumbnail(img: "Image.Image", max_side: int = THUMBNAIL_MAX_SIDE) -> Optional[Tuple[bytes, str]]:
+    """
+    방향 보정된 이미지 → 장축 max_side 이하 썸네일(확대 없음). 반환: (바이트, content_type). 실패 시 None.
+    OCR 보정(대비·선명도) 전 원본 기준으로 만들어 검수자가 보는 색감 유지.
+    """
+    try:
+        thumb = img.convert("RGB") if img.mode != "RGB" else img.copy()
+        thumb.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        if THUMBNAIL_FORMAT == "WEBP":
+            try:
+                thumb.save(buf, format="WEBP", quality=THUMBNAIL_QUALITY, method=4)
+                return buf.getvalue(), "image/webp"
+            except Exception:
+                buf = io.BytesIO()
+        thumb.save(buf, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True, progressive=True)
+        return buf.getvalue(), "image/jpeg"
+    except Exception:
+        return None
+
+
+def thumbnail_from_bytes(image_bytes: bytes) -> Optional[Tuple[bytes, str]]:
+    """원본 바이트 → 썸네일. 분석 전 업로드분 등 썸네일 없는 이미지의 지연 생성용."""
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img = ImageOps.exif_transpose(img)
+    except Exception:
+        return None
+    return make_thumbnail(img)
+
+
+def preprocess_for_ocr(
+    image_bytes: bytes, content_type: str
+) -> Tuple[bytes, str, Optional[int]]:
+    """
+    OCR 전송용 전처리 + 지각 해시. 반환: (전송 바이트, content_type, dHash 또는 None).
+    dHash는 보정(대비·선명도) 전 원본 방향 보정 이미지 기준으로 계산.
+    """
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img = ImageOps.exif_transpose(img)
+    except Exception:
+        return image_bytes, content_type, None
+    try:
+        dhash: Optional[int] = compute_dhash(img)
+    except Exception:
+        dhash = None
+    out_bytes, out_type = _resize_and_compress_image(img, image_bytes, content_type)
+    return out_bytes, out_type, dhash
+
+
+def preprocess_for_ocr_with_thumbnail(
+    image_bytes: bytes, content_type: str
+) -> Tuple[bytes, str, Optional[int], Optional[Tuple[bytes, str]]]:
+    """
+    preprocess_for_ocr + 썸네일을 한 번의 디코딩으로. 반환: (전송 바이트, content_type, dHash, (썸네일 바이트, content_type) 또는 None).
+    """
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img = ImageOps.exif_transpose(img)
+    except Exception:
+        return image_bytes, content_type, None, None
+    try:
+        dhash: Optional[int] = compute_dhash(img)
+    except Exception:
+        dhash = None
+    thumb = make_thumbnail(img)
+    out_bytes, out_type = _resize_and_compress_image(img, image_bytes, content_type)
+    return out_bytes, out_type, dhash, thumb
+
+
+def resize_and_compress_for_ocr(
+    image_bytes: bytes, content_type: str
+) -> Tuple[bytes, str]:
+    """
+    리사이징(장축 최대 MAX_OCR_DIMENSION) + 압축. 인식률 향상 옵션:
+    - 저해상도 업스케일(OCR_UPSCALE_SMALL=1): 장축이 OCR_UPSCALE_MAX_SIDE 미만이면 1960까지 확대.
+    - 작은 이미지 PNG 전송(OCR_SEND_PNG_WHEN_SMALL=1): 최종 장축이 작으면 JPEG 대신 PNG로 전송(경계 보존).
+    """
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img = ImageOps.exif_transpose(img)
+    except Exception:
+        return image_bytes, content_type
+    return _resize_and_compress_image(img, image_bytes, content_type)
+
+
+def _resize_and_compress_image(
+    img: "Image.Image", image_bytes: bytes, content_type: str
+) -> Tuple[bytes, str]:
+    """resize_and_compress_for_ocr 본체. 실패 시 원본 바이트 그대로 반환."""
+    try:
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        img = ImageOps.autocontrast(img, cutoff=1)
+        img = ImageEnhance.Sharpness(img).enhance(1.2)
+        w, h = img.size
+        long_side = max(w, h)
+        if w > MAX_OCR_DIMENSION or h > MAX_OCR_DIMENSION:
+            ratio = min(MAX_OCR_DIMENSION / w, MAX_OCR_DIMENSION / h)
+            img = img.resize((int(w * ratio), int(h * ratio)), Image.Resampling.LANCZOS)
+        elif OCR_UPSCALE_SMALL and long_side < OCR_UPSCALE_MAX_SIDE and long_side > 0:
+            ratio = MAX_OCR_DIMENSION / long_side
+            nw, nh = int(w * ratio), int(h * ratio)
+            if nw > 0 and nh > 0:
+                img = img.resize((nw, nh), Image.Resampling.LANCZOS)
+        w, h = img.size
+        long_side = max(w, h)
+        use_png = OCR_SEND_PNG_WHEN_SMALL and long_side <= OCR_UPSCALE_MAX_SIDE
+        buf = io.BytesIO()
+        if use_png:
+            img.save(buf, format="PNG", optimize=True)
+            return buf.getvalue(), "image/png"
+        img.save(buf, format="JPEG", quality=OCR_JPEG_QUALITY, optimize=True)
+        return buf.getvalue(), "image/jpeg"
+    except Exception:
+        return image_bytes, content_type
@@ -1,38 +1,68 @@
-import io
 import os
+import base64
+import hashlib
 import re
 import time
 import uuid
 import json
-from urllib.parse import unquote
+import random
+from urllib.parse import unquote, urlsplit
 import asyncio
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from enum import Enum
 import httpx
 import boto3
-from PIL import Image, ImageOps, ImageEnhance
 from botocore.exceptions import ClientError, BotoCoreError
 from datetime import datetime, date, timedelta, timezone
 from zoneinfo import ZoneInfo
-from typing import Any, Dict, List, Optional, Union, Tuple, Literal
+from functools import partial
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Set, Union, Tuple, Literal
 from dotenv import load_dotenv
 from dateutil import parser as dateutil_parser
-from sqlalchemy import text as sql_text, func
-
-from processor import validate_and_match, validate_campaign_rules, match_store_in_master
+from sqlalchemy import text as sql_text, func, tuple_
+
+from processor import (
+    check_receipt_rules,
+    check_campaign_rules,
+    loaded_campaign_cache,
+    match_stores_batch,
+    register_store_in_index,
+    active_campaign_rows,
+    campaign_candidates,
+    invalidate_campaign_cache,
+)
+from image_preprocess import THUMBNAIL_MAX_SIDE, preprocess_for_ocr_with_thumbnail, thumbnail_from_bytes
+from image_dedup import find_near_duplicate_images, register_image_hash, image_hash_index_snapshot
+from daily_stats import IN_FLIGHT_STATUSES, sync_submission_stats
+from evidence_zip import EvidenceZipWriter
+from dashboard_stats import (
+    query_dashboard_stats,
+    query_region_stats,
+    query_reject_reason_counts,
+    query_status_breakdown,
+)
 from store_classifier import (
     classify_store,
     is_forbidden as _classifier_is_forbidden,
     AUTO_REGISTER_THRESHOLD as CLASSIFIER_AUTO_THRESHOLD,
+    close_http_client as _close_gemini_http_client,
 )
 from fastapi import FastAPI, File, Form, HTTPException, BackgroundTasks, Depends, UploadFile, Header, Query, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 import bcrypt  # type: ignore[reportMissingImports]
 import jwt
 from pydantic import BaseModel, Field, model_validator, UUID4, ConfigDict
-from sqlalchemy import create_engine, Column, String, Integer, BigInteger, Float, DateTime, JSON, Boolean, ARRAY, ForeignKey, update, case, or_
+from sqlalchemy import create_engine, Column, String, Integer, BigInteger, SmallInteger, Float, Date, DateTime, JSON, Boolean, ARRAY, ForeignKey, UniqueConstraint, update, or_
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from sqlalchemy.dialects.postgresql import JSONB
@@ -79,6 +109,30 @@ OCR_CALLBACK_RETRIES = max(0, min(3, int(os.getenv("OCR_CALLBACK_RETRIES", "2"))
 OCR_CALLBACK_SCHEMA_VERSION = 2
 OCR_CALLBACK_MAX_AUDIT_TRAIL_CHARS = int(os.getenv("OCR_CALLBACK_MAX_AUDIT_TRAIL_CHARS", "2000"))
 OCR_CALLBACK_MAX_ERROR_MESSAGE_CHARS = int(os.getenv("OCR_CALLBACK_MAX_ERROR_MESSAGE_CHARS", "200"))
+# 결과 콜백 outbox(callback_outbox): 1이면 판정 결과 콜백을 최종 상태와 같은 트랜잭션에 적재하고 디스패처(API 프로세스·ocr_worker)가 전송
+# 분석 태스크는 수신 서버 응답을 기다리지 않음. 관리자 재전송·검증은 결과를 바로 보여줘야 하므로 기존처럼 즉시 전송
+CALLBACK_OUTBOX_ENABLED = os.getenv("CALLBACK_OUTBOX_ENABLED", "0").strip().lower() in ("1", "true", "yes")
+CALLBACK_DISPATCH_CONCURRENCY = max(1, min(64, int(os.getenv("CALLBACK_DISPATCH_CONCURRENCY", "8"))))
+CALLBACK_DISPATCH_POLL_SEC = max(0.2, min(30.0, float(os.getenv("CALLBACK_DISPATCH_POLL_SEC", "1"))))
+CALLBACK_OUTBOX_MAX_ATTEMPTS = max(1, min(50, int(os.getenv("CALLBACK_OUTBOX_MAX_ATTEMPTS", "8"))))
+CALLBACK_OUTBOX_BACKOFF_BASE_SEC = max(1, min(300, int(os.getenv("CALLBACK_OUTBOX_BACKOFF_BASE_SEC", "5"))))
+CALLBACK_OUTBOX_BACKOFF_MAX_SEC = max(10, min(86400, int(os.getenv("CALLBACK_OUTBOX_BACKOFF_MAX_SEC", "1800"))))
+# 수신 엔드포인트(scheme://host)별 회로 차단: 연속 실패 N회면 OPEN_SEC 동안 전송 보류 후 1건 시험 전송(half-open)
+CALLBACK_CIRCUIT_FAILURE_THRESHOLD = max(1, min(100, int(os.getenv("CALLBACK_CIRCUIT_FAILURE_THRESHOLD", "5"))))
+CALLBACK_CIRCUIT_OPEN_SEC = max(5, min(3600, int(os.getenv("CALLBACK_CIRCUIT_OPEN_SEC", "30"))))
+# VERIFYING 타임아웃 크론: 청크 크기(UPDATE … RETURNING 1회당 건수), 콜백 동시 전송 수, 1회 호출 실행 시간 한도(초, 초과 시 has_more=true로 반환)
+VERIFYING_TIMEOUT_CHUNK_SIZE = max(10, min(5000, int(os.getenv("VERIFYING_TIMEOUT_CHUNK_SIZE", "200"))))
+VERIFYING_TIMEOUT_CALLBACK_CONCURRENCY = max(1, min(64, int(os.getenv("VERIFYING_TIMEOUT_CALLBACK_CONCURRENCY", "8"))))
+VERIFYING_TIMEOUT_MAX_RUN_SEC = max(5, min(600, int(os.getenv("VERIFYING_TIMEOUT_MAX_RUN_SEC", "45"))))
+# 일괄 재처리 작업(reprocess_jobs): 청크 크기(조회·판정·commit 1회당 신청 수), 작업 1건 최대 대상 수(초과 시 400),
+# 점유 만료(초, 실행 프로세스가 죽으면 이 시간 뒤 resume 가능), 상태 전환 콜백 동시 전송 수(outbox 미사용 시)
+REPROCESS_JOB_CHUNK_SIZE = max(10, min(5000, int(os.getenv("REPROCESS_JOB_CHUNK_SIZE", "500"))))
+REPROCESS_JOB_MAX_SUBMISSIONS = max(1, min(2000000, int(os.getenv("REPROCESS_JOB_MAX_SUBMISSIONS", "200000"))))
+REPROCESS_JOB_LEASE_SEC = max(30, min(3600, int(os.getenv("REPROCESS_JOB_LEASE_SEC", "120"))))
+REPROCESS_JOB_CALLBACK_CONCURRENCY = max(1, min(64, int(os.getenv("REPROCESS_JOB_CALLBACK_CONCURRENCY", "8"))))
+# 판정 규칙 시뮬레이션(rule_simulations): 배치 크기(keyset 페이지 조회·사전 조회·재판정 1회당 신청 수), 1건 최대 대상 수(초과 시 400)
+RULE_SIMULATION_BATCH_SIZE = max(100, min(20000, int(os.getenv("RULE_SIMULATION_BATCH_SIZE", "2000"))))
+RULE_SIMULATION_MAX_SUBMISSIONS = max(1, min(5000000, int(os.getenv("RULE_SIMULATION_MAX_SUBMISSIONS", "1000000"))))
 # 영수증 검증 결과 저장 시 DB 컬럼 길이 제한 (StringDataRightTruncation 방지)
 SUBMISSION_FAIL_REASON_MAX_LEN = 255
 SUBMISSION_AUDIT_MAX_LEN = 2000
@@ -139,6 +193,189 @@ s3_client = boto3.client(
     config=Config(signature_version='s3v4')
 )
 
+# 분석 작업 큐(ocr_jobs): 1이면 Complete 시 BackgroundTasks 대신 DB 큐에 적재하고 별도 워커(python ocr_worker.py)가 처리
+OCR_JOB_QUEUE_ENABLED = os.getenv("OCR_JOB_QUEUE_ENABLED", "0").strip().lower() in ("1", "true", "yes")
+# 가시성 타임아웃(초): 점유 후 이 시간 내 완료·heartbeat 없으면(워커 종료 등) 다른 워커가 재점유
+OCR_JOB_VISIBILITY_TIMEOUT_SEC = max(30, min(3600, int(os.getenv("OCR_JOB_VISIBILITY_TIMEOUT_SEC", "300"))))
+OCR_JOB_MAX_ATTEMPTS = max(1, min(10, int(os.getenv("OCR_JOB_MAX_ATTEMPTS", "3"))))
+# 재시도 백오프: base * 2^(attempts-1)초, 최대 OCR_JOB_BACKOFF_MAX_SEC
+OCR_JOB_BACKOFF_BASE_SEC = max(1, min(300, int(os.getenv("OCR_JOB_BACKOFF_BASE_SEC", "10"))))
+OCR_JOB_BACKOFF_MAX_SEC = max(10, min(3600, int(os.getenv("OCR_JOB_BACKOFF_MAX_SEC", "600"))))
+# OCR 결과 캐시(ocr_result_cache): 전처리 후 이미지 SHA-256 + OCR 도메인이 같으면 CLOVA 호출 없이 저장된 응답 재사용
+# TTL(일) 경과 항목은 조회 제외·정리 대상, 항목 수가 OCR_RESULT_CACHE_MAX_ENTRIES 초과 시 마지막 사용 시각 오래된 순(LRU) 삭제
+OCR_RESULT_CACHE_ENABLED = os.getenv("OCR_RESULT_CACHE_ENABLED", "1").strip().lower() in ("1", "true", "yes")
+OCR_RESULT_CACHE_TTL_DAYS = max(1, min(365, int(os.getenv("OCR_RESULT_CACHE_TTL_DAYS", "30"))))
+OCR_RESULT_CACHE_MAX_ENTRIES = max(100, min(10_000_000, int(os.getenv("OCR_RESULT_CACHE_MAX_ENTRIES", "200000"))))
+OCR_RESULT_CACHE_EVICT_INTERVAL_SEC = max(60, min(86400, int(os.getenv("OCR_RESULT_CACHE_EVICT_INTERVAL_SEC", "3600"))))
+# 유사 이미지 중복 탐지(receipt_image_hashes): 전처리 시 dHash 계산 → OCR 전 BK-tree로 해밍 거리 IMAGE_DEDUP_MAX_DISTANCE 이하 다른 신청건 이미지 조회
+# IMAGE_DEDUP_REVIEW=1이면 FIT 신청건과 유사한 이미지 항목을 수동 검증(PENDING_VERIFICATION)으로 보냄. 0이면 판정 근거(audit)에 기록만
+IMAGE_DEDUP_ENABLED = os.getenv("IMAGE_DEDUP_ENABLED", "1").strip().lower() in ("1", "true", "yes")
+IMAGE_DEDUP_MAX_DISTANCE = max(0, min(16, int(os.getenv("IMAGE_DEDUP_MAX_DISTANCE", "6"))))
+IMAGE_DEDUP_REVIEW = os.getenv("IMAGE_DEDUP_REVIEW", "0").strip().lower() in ("1", "true", "yes")
+# 썸네일 파생 이미지: 분석 전처리 시 생성해 thumbnails/{장축}/{원본 키}로 저장(receipt_items.thumbnail_key). 목록 thumbnail_url·프록시 size=thumb에 사용
+# 크기·포맷·품질은 image_preprocess(THUMBNAIL_MAX_SIDE·THUMBNAIL_FORMAT·THUMBNAIL_QUALITY). 브라우저 캐시(Cache-Control max-age, 초)
+THUMBNAIL_ENABLED = os.getenv("THUMBNAIL_ENABLED", "1").strip().lower() in ("1", "true", "yes")
+IMAGE_PROXY_CACHE_MAX_AGE_SEC = max(0, min(604800, int(os.getenv("IMAGE_PROXY_CACHE_MAX_AGE_SEC", "86400"))))
+# 이미지 프록시 스트리밍: 프로세스당 동시 전송 상한, 슬롯 대기 한도(초, 초과 시 503), 청크 크기(바이트)
+IMAGE_PROXY_MAX_CONCURRENCY = max(1, min(512, int(os.getenv("IMAGE_PROXY_MAX_CONCURRENCY", "32"))))
+IMAGE_PROXY_ACQUIRE_TIMEOUT_SEC = max(0.1, min(60.0, float(os.getenv("IMAGE_PROXY_ACQUIRE_TIMEOUT_SEC", "5"))))
+IMAGE_PROXY_CHUNK_BYTES = max(8192, min(4 * 1024 * 1024, int(os.getenv("IMAGE_PROXY_CHUNK_BYTES", "65536"))))
+# 증빙 팩 ZIP 내보내기: 1회 최대 신청 수(초과 시 400, 0이면 무제한), 원본 이미지 동시 조회 수(메모리 상한 = 이 값 × 이미지 크기)
+# ZIP은 항목 단위로 스트리밍되어 메모리는 건수와 무관하고, 상한은 미리 읽는 신청 ID 목록·응답 시간만 제한(20만 건 ≈ ID 수십 MB)
+EVIDENCE_EXPORT_MAX_SUBMISSIONS = max(0, int(os.getenv("EVIDENCE_EXPORT_MAX_SUBMISSIONS", "200000")))
+EVIDENCE_EXPORT_FETCH_CONCURRENCY = max(1, min(32, int(os.getenv("EVIDENCE_EXPORT_FETCH_CONCURRENCY", "4"))))
+
+# 블로킹 작업 실행 풀: 이벤트 루프(uvicorn 워커)를 막지 않도록 분석 태스크의 DB·S3 I/O는 스레드 풀, 이미지 전처리(Pillow)는 프로세스 풀에서 실행
+# IO_THREAD_POOL_SIZE: DB 연결 풀(DB_POOL_SIZE + DB_POOL_OVERFLOW)보다 크게 잡으면 스레드가 연결 대기만 하므로 그 이하 권장
+IO_THREAD_POOL_SIZE = max(2, min(64, int(os.getenv("IO_THREAD_POOL_SIZE", "16"))))
+# IMAGE_PROCESS_POOL_SIZE: 0이면 프로세스 풀 미사용(전처리도 I/O 스레드 풀에서 실행)
+IMAGE_PROCESS_POOL_SIZE = max(0, min(16, int(os.getenv("IMAGE_PROCESS_POOL_SIZE", str(min(4, os.cpu_count() or 1))))))
+_io_executor = ThreadPoolExecutor(max_workers=IO_THREAD_POOL_SIZE, thread_name_prefix="gems-io")
+# 판정 규칙 시뮬레이션 전용 단일 스레드: 수 분 걸리는 전체 재판정이 분석 태스크의 I/O 스레드·DB 연결을 점유하지 않게 분리
+_rule_simulation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gems-rule-sim")
+_image_executor: Optional[ProcessPoolExecutor] = None
+# 풀 포화도 지표: queued(제출 후 대기), running(실행 중), completed, failed. 관리자 ops/metrics에서 조회
+_EXECUTOR_STATS: Dict[str, Dict[str, int]] = {
+    "io": {"queued": 0, "running": 0, "completed": 0, "failed": 0},
+    "image": {"running": 0, "completed": 0, "failed": 0},
+}
+_executor_stats_lock = threading.Lock()
+
+
+def _executor_stat_add(pool: str, **deltas: int) -> None:
+    with _executor_stats_lock:
+        stats = _EXECUTOR_STATS[pool]
+        for k, v in deltas.items():
+            stats[k] = stats.get(k, 0) + v
+
+
+def _executor_stats_snapshot() -> Dict[str, Any]:
+    with _executor_stats_lock:
+        out: Dict[str, Any] = {k: dict(v) for k, v in _EXECUTOR_STATS.items()}
+    out["io"]["max_workers"] = IO_THREAD_POOL_SIZE
+    out["image"]["max_workers"] = IMAGE_PROCESS_POOL_SIZE
+    return out
+
+
+def _get_image_executor() -> Optional[ProcessPoolExecutor]:
+    """이미지 전처리용 프로세스 풀(최초 사용 시 생성). IMAGE_PROCESS_POOL_SIZE=0이면 None."""
+    global _image_executor
+    if IMAGE_PROCESS_POOL_SIZE <= 0:
+        return None
+    if _image_executor is None:
+        _image_executor = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_POOL_SIZE)
+    return _image_executor
+
+
+async def _run_io(fn, *args, **kwargs):
+    """블로킹 I/O(DB·S3 등)를 I/O 스레드 풀에서 실행하고 결과를 await."""
+    loop = asyncio.get_running_loop()
+    _executor_stat_add("io", queued=1)
+
+    def _call():
+        _executor_stat_add("io", queued=-1, running=1)
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            _executor_stat_add("io", running=-1, failed=1)
+            raise
+        _executor_stat_add("io", running=-1, completed=1)
+        return result
+
+    return await loop.run_in_executor(_io_executor, _call)
+
+
+async def _run_image(fn, *args):
+    """
+    CPU 집약 이미지 처리(fn은 모듈 최상위 함수여야 pickle 가능)를 프로세스 풀에서 실행.
+    프로세스 풀 미사용·손상(BrokenProcessPool) 시 I/O 스레드 풀로 대체 실행.
+    """
+    global _image_executor
+    executor = _get_image_executor()
+    if executor is None:
+        return await _run_io(fn, *args)
+    loop = asyncio.get_running_loop()
+    # 프로세스 풀은 워커 내부 시작 시점을 알 수 없으므로 제출~완료를 running으로 집계
+    _executor_stat_add("image", running=1)
+    try:
+        result = await loop.run_in_executor(executor, fn, *args)
+    except BrokenProcessPool:
+        _executor_stat_add("image", running=-1, failed=1)
+        logger.warning("image process pool broken; recreating and falling back to io pool")
+        _image_executor = None
+        return await _run_io(fn, *args)
+    except BaseException:
+        _executor_stat_add("image", running=-1, failed=1)
+        raise
+    _executor_stat_add("image", running=-1, completed=1)
+    return result
+
+
+def _shutdown_executors() -> None:
+    global _image_executor
+    _io_executor.shutdown(wait=False, cancel_futures=True)
+    _rule_simulation_executor.shutdown(wait=False, cancel_futures=True)
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=False, cancel_futures=True)
+        _image_executor = None
+
+
+# 외부 HTTP 클라이언트: 업스트림(ocr=CLOVA OCR, callback=FE 결과 콜백)별 AsyncClient 1개를 수명주기 동안 재사용(keep-alive 연결 풀)
+# 요청마다 클라이언트를 만들면 매번 TCP·TLS 핸드셰이크가 발생하므로 공유. 종료 시 _close_http_clients()로 정리
+HTTP_MAX_CONNECTIONS = max(1, min(500, int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))))
+HTTP_MAX_KEEPALIVE = max(0, min(500, int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))))
+HTTP_KEEPALIVE_EXPIRY_SEC = max(1.0, min(300.0, float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SEC", "30"))))
+HTTP_CONNECT_TIMEOUT_SEC = max(1.0, min(30.0, float(os.getenv("HTTP_CONNECT_TIMEOUT_SEC", "5"))))
+OCR_HTTP_TIMEOUT_SEC = max(5.0, min(120.0, float(os.getenv("OCR_HTTP_TIMEOUT_SEC", "30"))))
+
+
+def _http2_supported() -> bool:
+    """HTTP/2는 h2 패키지(httpx[http2]) 설치 시에만 사용 가능."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# HTTP2_ENABLED=1이어도 h2 미설치면 HTTP/1.1로 동작
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "1").strip().lower() in ("1", "true", "yes") and _http2_supported()
+_HTTP_CLIENT_TIMEOUTS: Dict[str, float] = {
+    "ocr": OCR_HTTP_TIMEOUT_SEC,
+    "callback": float(OCR_CALLBACK_TIMEOUT_SEC),
+}
+_http_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _get_http_client(name: str) -> httpx.AsyncClient:
+    """업스트림별 공유 AsyncClient(최초 사용 시 생성). 이벤트 루프 안에서 호출."""
+    client = _http_clients.get(name)
+    if client is None or client.is_closed:
+        timeout = _HTTP_CLIENT_TIMEOUTS.get(name, 30.0)
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=min(timeout, HTTP_CONNECT_TIMEOUT_SEC)),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SEC,
+            ),
+            http2=HTTP2_ENABLED,
+        )
+        _http_clients[name] = client
+    return client
+
+
+async def _close_http_clients() -> None:
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("http client close failed: %s", e)
+    _close_gemini_http_client()
+
+
 # 3. 데이터베이스 모델 (1:N 상속형 자산화 구조)
 class Submission(Base):
     __tablename__ = "submissions"
@@ -182,6 +419,7 @@ class ReceiptItem(Base):
     confidence_score = Column(Integer)  # 0~100 정수
     ocr_raw = Column(JSONB)
     parsed = Column(JSONB)
+    thumbnail_key = Column(String(600))  # 썸네일 파생 이미지 키(없으면 미생성)
     created_at = Column(DateTime, default=datetime.utcnow)
     submission = relationship("Submission", back_populates="items")
 
@@ -294,6 +532,169 @@ class AdminCampaignAccess(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+
+class OcrJob(Base):
+    """
+    영수증 분석 작업 큐(DB 기반, 재시작에도 유실 없음). OCR_JOB_QUEUE_ENABLED=1이면 Complete 시 적재,
+    ocr_worker.py가 FOR UPDATE SKIP LOCKED로 점유해 처리. 마이그레이션: ocr_jobs.sql
+    """
+    __tablename__ = "ocr_jobs"
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    submission_id = Column(String, nullable=False, index=True)
+    payload = Column(JSONB, nullable=False)  # CompleteRequest(model_dump json)
+    status = Column(String(16), nullable=False, default="QUEUED")  # QUEUED | RUNNING | DONE | DEAD
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # 재시도 백오프: 이 시각 이후 점유 가능
+    locked_by = Column(String(128))
+    locked_until = Column(DateTime)  # 가시성 타임아웃: 지나면 다른 워커가 재점유
+    last_error = Column(String(1000))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class CallbackOutbox(Base):
+    """
+    결과 콜백 outbox. CALLBACK_OUTBOX_ENABLED=1이면 최종 상태 변경과 같은 트랜잭션에 적재(재시작에도 유실 없음),
+    디스패처가 FOR UPDATE SKIP LOCKED로 점유해 전송. 마이그레이션: callback_outbox.sql
+    """
+    __tablename__ = "callback_outbox"
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    submission_id = Column(String, nullable=False, index=True)
+    url = Column(String(1000), nullable=False)
+    purpose = Column(String(32), nullable=False)  # auto | verifying_timeout | ...
+    actor = Column(String(128), nullable=False, default="system")
+    payload = Column(JSONB, nullable=False)  # 전송 본문(schemaVersion·receiptId·statusSource 포함)
+    status = Column(String(16), nullable=False, default="QUEUED")  # QUEUED | SENDING | SENT | DEAD
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=8)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # 재시도 백오프: 이 시각 이후 점유 가능
+    locked_by = Column(String(128))
+    locked_until = Column(DateTime)  # 가시성 타임아웃: 지나면 다른 디스패처가 재점유
+    last_status_code = Column(Integer)
+    last_error = Column(String(1000))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+
+class ReprocessJob(Base):
+    """
+    일괄 재처리 작업(저장된 OCR 결과로 판정만 재적용). 조건(filters)에 맞는 신청을 submission_id 순 청크로 처리하고
+    청크 결과와 진행 상황(cursor·건수)을 같은 트랜잭션에 commit → 중단 후 resume 시 이어서 처리. 마이그레이션: reprocess_jobs.sql
+    """
+    __tablename__ = "reprocess_jobs"
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    status = Column(String(16), nullable=False, default="QUEUED")  # QUEUED | RUNNING | DONE | FAILED | CANCELLED
+    filters = Column(JSONB, nullable=False)  # campaignId, campaignScope, statuses, createdFrom, createdBefore
+    total = Column(Integer, nullable=False, default=0)  # 생성 시점 대상 건수(진행률 분모)
+    processed = Column(Integer, nullable=False, default=0)
+    changed = Column(Integer, nullable=False, default=0)  # 상태·금액·장 판정 중 하나라도 바뀐 건
+    transitions = Column(Integer, nullable=False, default=0)  # 상태가 바뀐 건
+    callbacks = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    cursor = Column(String)  # 마지막 처리 submission_id(keyset)
+    created_by = Column(String(128), nullable=False, default="system")
+    locked_by = Column(String(128))
+    locked_until = Column(DateTime)
+    last_error = Column(String(1000))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RuleSimulation(Base):
+    """
+    판정 규칙 변경 시뮬레이션(읽기 전용). 조건(filters)에 맞는 신청의 저장된 parsed를 현재 규칙(baseline)과
+    제안 규칙(proposed)으로 각각 재판정해 상태 전환·승인 금액 변화를 result에 집계. 마이그레이션: rule_simulations.sql
+    """
+    __tablename__ = "rule_simulations"
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    status = Column(String(16), nullable=False, default="QUEUED")  # QUEUED | RUNNING | DONE | FAILED
+    filters = Column(JSONB, nullable=False)  # campaignId, campaignScope, createdFrom, createdBefore
+    baseline = Column(JSONB)  # 실행 시점 규칙(min_amount_stay, min_amount_tour, auto_register_threshold, unknown_store_policy)
+    proposed = Column(JSONB, nullable=False)  # 바꿔 볼 규칙 값(지정한 항목만)
+    total = Column(Integer, nullable=False, default=0)  # 생성 시점 대상 신청 수(진행률 분모)
+    scanned = Column(Integer, nullable=False, default=0)  # 재판정한 신청 수
+    scanned_items = Column(Integer, nullable=False, default=0)
+    result = Column(JSONB)  # 집계(진행 중에는 중간 집계)
+    created_by = Column(String(128), nullable=False, default="system")
+    last_error = Column(String(1000))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class OcrRateLimit(Base):
+    """OCR 도메인별 공유 토큰 버킷(GCRA) 상태. tat = 다음 호출 이론 도착 시각. 마이그레이션: ocr_rate_limit.sql"""
+    __tablename__ = "ocr_rate_limit"
+    domain = Column(String(16), primary_key=True)  # STAY | TOUR
+    tat = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class OcrResultCache(Base):
+    """
+    OCR 결과 캐시. 키: 전처리(리사이즈·압축) 후 이미지 바이트의 SHA-256 + 도메인(STAY|TOUR).
+    ocr_raw는 JSONB(대용량 값은 Postgres TOAST가 압축 저장). 마이그레이션: ocr_result_cache.sql
+    """
+    __tablename__ = "ocr_result_cache"
+    content_hash = Column(String(64), primary_key=True)
+    domain = Column(String(16), primary_key=True)
+    ocr_raw = Column(JSONB, nullable=False)
+    first_receipt_id = Column(String, nullable=True)  # 최초 OCR 요청 receiptId (동일 이미지 재사용 추적용)
+    hit_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    last_hit_at = Column(DateTime, nullable=True, index=True)
+
+
+class ReceiptImageHash(Base):
+    """신청건 이미지 지각 해시(dHash, 부호 있는 64비트). 유사 중복 탐지용. 마이그레이션: receipt_image_hashes.sql"""
+    __tablename__ = "receipt_image_hashes"
+    __table_args__ = (UniqueConstraint("submission_id", "image_key", name="uq_receipt_image_hashes_submission_image"),)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    submission_id = Column(String, nullable=False, index=True)
+    image_key = Column(String(500), nullable=False)
+    dhash = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+
+
+class SubmissionDailyStats(Base):
+    """
+    판정 완료 신청 집계 롤업 (일·시(UTC created_at) × 캠페인 × 업종 × 상태 × 시도 × 시군구 × 반려 사유 코드).
+    상태 변경 시 daily_stats.sync_submission_stats로 증분 반영. 마이그레이션: submission_daily_stats.sql
+    """
+    __tablename__ = "submission_daily_stats"
+    stat_date = Column(Date, primary_key=True)
+    stat_hour = Column(SmallInteger, primary_key=True)
+    campaign_id = Column(Integer, primary_key=True)
+    project_type = Column(String(16), primary_key=True)
+    status = Column(String(32), primary_key=True)
+    sido = Column(String(64), primary_key=True)  # 첫 장 address 첫 토큰(원문). 코드 매핑은 조회 시
+    sigungu = Column(String(64), primary_key=True)
+    reason_code = Column(String(32), primary_key=True)  # FIT은 ''
+    submission_count = Column(BigInteger, nullable=False, default=0, server_default="0")
+    total_amount = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+
+
+class SubmissionDailyStatsMember(Base):
+    """신청별 현재 롤업 반영 키·금액 (상태 변경 시 이전 키 차감용, 최소금액 달성 건수 집계용)."""
+    __tablename__ = "submission_daily_stats_members"
+    submission_id = Column(String, primary_key=True)
+    stat_date = Column(Date, nullable=False)
+    stat_hour = Column(SmallInteger, nullable=False)
+    campaign_id = Column(Integer, nullable=False)
+    project_type = Column(String(16), nullable=False)
+    status = Column(String(32), nullable=False)
+    sido = Column(String(64), nullable=False)
+    sigungu = Column(String(64), nullable=False)
+    reason_code = Column(String(32), nullable=False)
+    total_amount = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+
+
 Base.metadata.create_all(bind=engine)
 
 # 4. Pydantic 스키마 (1:N + 자산화 지침 반영)
@@ -639,8 +1040,24 @@ def _openapi_filter_by_tags(full_schema: dict, allowed_tags: set) -> dict:
     return out
 
 
+@asynccontextmanager
+async def _app_lifespan(_app: "FastAPI"):
+    """앱 수명주기: CALLBACK_OUTBOX_ENABLED면 콜백 디스패처 실행. 종료 시 디스패처·HTTP 클라이언트·실행 풀 정리."""
+    dispatcher_stop = asyncio.Event()
+    dispatcher = asyncio.create_task(run_callback_dispatcher(dispatcher_stop)) if CALLBACK_OUTBOX_ENABLED else None
+    try:
+        yield
+    finally:
+        if dispatcher is not None:
+            dispatcher_stop.set()
+            await asyncio.gather(dispatcher, return_exceptions=True)
+        await _close_http_clients()
+        _shutdown_executors()
+
+
 # 5-1. FastAPI 앱 (문서 분리: FE 전용 /docs, 관리자 전용 /admin-docs)
 app = FastAPI(
+    lifespan=_app_lifespan,
     title="GEMS OCR API",
     version="1.0.0",
     description="강원 여행 인센티브 영수증 인식 API",
@@ -751,52 +1168,12 @@ def _parse_date_any(raw: Any) -> Optional[date]:
     return None
 
 
-def _city_matches_target(store_city: str, target_city: str) -> bool:
-    store_city = (store_city or "").strip()
-    target_city = (target_city or "").strip()
-    if not target_city:
-        return True
-    if store_city == target_city:
-        return True
-    if target_city in store_city or store_city in target_city:
-        return True
-    target_key = target_city.replace("시", "").replace("군", "").strip()
-    if target_key and (target_key in store_city or store_city.startswith(target_key)):
-        return True
-    return False
-
-
 def _fetch_active_campaign_rows(db: Session) -> List[Dict[str, Any]]:
     """
-    campaigns 테이블에서 활성 캠페인을 조회.
-    - 컬럼 확장(priority, project_type, updated_at) 유무에 따라 안전하게 조회한다.
+    활성 캠페인 조회(프로세스 캐시, processor._CampaignCache).
+    - 컬럼 확장(priority, project_type) 유무와 무관하게 동일 키로 반환. 반환 dict는 수정 금지(캐시 공유).
     """
-    try:
-        rows = db.execute(
-            sql_text(
-                "SELECT campaign_id, campaign_name, is_active, target_city_county, start_date, end_date, created_at, "
-                "COALESCE(priority, 100) AS priority, project_type "
-                "FROM campaigns WHERE is_active = true"
-            )
-        ).mappings().all()
-        return [dict(r) for r in rows]
-    except Exception:
-        try:
-            rows = db.execute(
-                sql_text(
-                    "SELECT campaign_id, campaign_name, is_active, target_city_county, start_date, end_date, created_at "
-                    "FROM campaigns WHERE is_active = true"
-                )
-            ).mappings().all()
-            items: List[Dict[str, Any]] = []
-            for r in rows:
-                d = dict(r)
-                d["priority"] = 100
-                d["project_type"] = None
-                items.append(d)
-            return items
-        except Exception:
-            return []
+    return active_campaign_rows(db)
 
 
 def _resolve_campaign_id_for_presigned(db: Session, user_uuid: str, project_type: ProjectType) -> int:
@@ -809,12 +1186,8 @@ def _resolve_campaign_id_for_presigned(db: Session, user_uuid: str, project_type
     today = datetime.utcnow().date()
     pt = project_type.value if isinstance(project_type, ProjectType) else str(project_type)
     candidates = []
-    for c in _fetch_active_campaign_rows(db):
-        if c.get("project_type") and str(c.get("project_type")).strip() != pt:
-            continue
-        target = (c.get("target_city_county") or "").strip()
-        if target:
-            continue
+    # 유형 일치(또는 NULL) + 지역 무제한 캠페인만 캐시에서 조회
+    for c in campaign_candidates(db, pt):
         sd = _parse_date_any(c.get("start_date"))
         ed = _parse_date_any(c.get("end_date"))
         if sd and ed and not (sd <= today <= ed):
@@ -826,28 +1199,20 @@ def _resolve_campaign_id_for_presigned(db: Session, user_uuid: str, project_type
     return int(candidates[0].get("campaign_id") or DEFAULT_CAMPAIGN_ID)
 
 
-def _resolve_campaign_id_for_receipt(
-    db: Session, project_type: ProjectType, store_city: str, pay_date: str
-) -> int:
+def _pick_campaign_for_receipt(candidates: List[Dict[str, Any]], pay_date: str) -> int:
     """
     OCR 결과(location/pay_date)가 확보된 이후 캠페인 선택(확장 핵심).
-    - 활성 캠페인 중 (project_type 일치/NULL) + (기간 포함) + (target_city_county 매칭/NULL) 조건을 만족하는 후보 선택
-    - 우선순위: (1) priority 낮은 값 (2) target_city_county가 있는 캠페인(지역 특화) (3) campaign_id 작은 값
+    - candidates: 활성 캠페인 중 (project_type 일치/NULL) + (target_city_county 매칭/NULL) 후보(캠페인 캐시 색인 조회분)
+    - 기간 포함 후보 중 우선순위: (1) priority 낮은 값 (2) target_city_county가 있는 캠페인(지역 특화) (3) campaign_id 작은 값
     - 후보 없으면 DEFAULT_CAMPAIGN_ID
     """
     receipt_date = _parse_date_any(pay_date)
-    pt = project_type.value if isinstance(project_type, ProjectType) else str(project_type)
     matches: List[Dict[str, Any]] = []
-    for c in _fetch_active_campaign_rows(db):
-        if c.get("project_type") and str(c.get("project_type")).strip() != pt:
-            continue
+    for c in candidates:
         sd = _parse_date_any(c.get("start_date"))
         ed = _parse_date_any(c.get("end_date"))
         if receipt_date and sd and ed and not (sd <= receipt_date <= ed):
             continue
-        target = (c.get("target_city_county") or "").strip()
-        if not _city_matches_target(store_city, target):
-            continue
         matches.append(c)
     if not matches:
         return DEFAULT_CAMPAIGN_ID
@@ -1236,13 +1601,17 @@ async def _submit_receipt_common(req: CompleteRequest, background_tasks: Backgro
         .values(**values)
     )
     result = db.execute(stmt)
+    if result.rowcount and OCR_JOB_QUEUE_ENABLED:
+        # PROCESSING 전환과 같은 트랜잭션에서 적재 → 전환됐는데 작업이 없는 상태 방지
+        _enqueue_ocr_job(db, req)
     db.commit()
     if result.rowcount == 0:
         # 이미 다른 요청이 PROCESSING/VERIFYING으로 전환함 → 현재 상태 반환
         refetched = db.query(Submission).filter(Submission.submission_id == req.receiptId).first()
         return {"status": (refetched.status if refetched else "PROCESSING"), "receiptId": req.receiptId}
 
-    background_tasks.add_task(analyze_receipt_task, req)
+    if not OCR_JOB_QUEUE_ENABLED:
+        background_tasks.add_task(analyze_receipt_task, req)
     return {"status": "PROCESSING", "receiptId": req.receiptId}
 
 
@@ -1420,6 +1789,94 @@ def _get_judgment_rule_config(db: Session) -> JudgmentRuleConfig:
     return cfg
 
 
+class JudgmentRuleSnapshot(BaseModel):
+    """
+    판정 규칙 읽기 전용 스냅샷(불변). JudgmentRuleConfig와 같은 속성명이라 읽기 코드는 그대로 사용 가능.
+    version: updated_at 기반. 분석 태스크는 시작 시 받은 스냅샷 하나로 끝까지 판정(도중 규칙 변경 영향 없음).
+    """
+    model_config = ConfigDict(frozen=True)
+
+    version: str
+    unknown_store_policy: str
+    auto_register_threshold: float
+    enable_gemini_classifier: bool
+    min_amount_stay: int
+    min_amount_tour: int
+    orphan_object_days: Optional[int] = None
+    expired_candidate_days: Optional[int] = None
+    orphan_object_minutes: Optional[int] = None
+    expired_candidate_minutes: Optional[int] = None
+    verifying_timeout_minutes: int = 0
+    verifying_timeout_action: str = "UNFIT"
+    override_callback_policy: str = "AUTO"
+    updated_at: Optional[datetime] = None
+
+
+# 판정 규칙 스냅샷 프로세스 캐시: JUDGMENT_RULE_CHECK_SEC마다 updated_at(버전)만 조회해 변경 시 재적재.
+# 같은 프로세스의 규칙 수정은 _invalidate_judgment_rules()로 즉시 반영, 다른 워커 프로세스는 확인 주기 내 반영
+JUDGMENT_RULE_CHECK_SEC = max(0, min(300, int(os.getenv("JUDGMENT_RULE_CHECK_SEC", "5"))))
+_judgment_rules_lock = threading.Lock()
+_judgment_rules_cache: Dict[str, Any] = {"snapshot": None, "checked_at": 0.0}
+
+
+def _judgment_rule_version(updated_at: Optional[datetime]) -> str:
+    return updated_at.isoformat() if updated_at else ""
+
+
+def _judgment_rule_snapshot_from_row(cfg: JudgmentRuleConfig) -> JudgmentRuleSnapshot:
+    return JudgmentRuleSnapshot(
+        version=_judgment_rule_version(cfg.updated_at),
+        unknown_store_policy=_normalize_unknown_store_policy(cfg.unknown_store_policy),
+        auto_register_threshold=float(cfg.auto_register_threshold if cfg.auto_register_threshold is not None else 0.90),
+        enable_gemini_classifier=bool(cfg.enable_gemini_classifier),
+        min_amount_stay=int(cfg.min_amount_stay or 60000),
+        min_amount_tour=int(cfg.min_amount_tour or 50000),
+        orphan_object_days=cfg.orphan_object_days,
+        expired_candidate_days=cfg.expired_candidate_days,
+        orphan_object_minutes=cfg.orphan_object_minutes,
+        expired_candidate_minutes=cfg.expired_candidate_minutes,
+        verifying_timeout_minutes=int(getattr(cfg, "verifying_timeout_minutes", None) or 0),
+        verifying_timeout_action=(getattr(cfg, "verifying_timeout_action", None) or "UNFIT"),
+        override_callback_policy=(getattr(cfg, "override_callback_policy", None) or "AUTO"),
+        updated_at=cfg.updated_at,
+    )
+
+
+def _get_judgment_rules(db: Session) -> JudgmentRuleSnapshot:
+    """
+    판정 규칙 스냅샷(읽기 전용 경로용). 캐시가 유효하면 DB 조회 없이 반환,
+    확인 주기 경과 시 버전(updated_at)만 조회해 바뀐 경우에만 전체 재적재. 수정은 _get_judgment_rule_config(ORM) 사용.
+    """
+    now = time.monotonic()
+    with _judgment_rules_lock:
+        snap: Optional[JudgmentRuleSnapshot] = _judgment_rules_cache["snapshot"]
+        checked_at = _judgment_rules_cache["checked_at"]
+    if snap is not None and now - checked_at < JUDGMENT_RULE_CHECK_SEC:
+        return snap
+    if snap is not None:
+        try:
+            current = db.execute(sql_text("SELECT updated_at FROM judgment_rule_config WHERE id = 1")).scalar()
+        except Exception as e:
+            logger.warning("judgment rule version check failed: %s", e)
+            db.rollback()
+            return snap
+        if current is not None and _judgment_rule_version(current) == snap.version:
+            with _judgment_rules_lock:
+                _judgment_rules_cache["checked_at"] = now
+            return snap
+    snap = _judgment_rule_snapshot_from_row(_get_judgment_rule_config(db))
+    with _judgment_rules_lock:
+        _judgment_rules_cache["snapshot"] = snap
+        _judgment_rules_cache["checked_at"] = now
+    return snap
+
+
+def _invalidate_judgment_rules() -> None:
+    """판정 규칙 수정 commit 후 호출. 다음 _get_judgment_rules에서 재적재."""
+    with _judgment_rules_lock:
+        _judgment_rules_cache["snapshot"] = None
+
+
 def _cfg_orphan_minutes(cfg: JudgmentRuleConfig) -> int:
     """고아 객체 유효기간(분). 분 컬럼 우선, 없으면 일*1440."""
     m = getattr(cfg, "orphan_object_minutes", None)
@@ -1741,19 +2198,14 @@ def _is_callback_retryable_error(e: Exception) -> bool:
     return "timeout" in err_str or "connection" in err_str or "refused" in err_str
 
 
-async def _send_result_callback(
-    receipt_id: str,
-    payload: Dict[str, Any],
-    target_url: Optional[str] = None,
-    *,
-    purpose: str = "auto",  # auto | resend
-    actor: str = "system",
-) -> Dict[str, Any]:
-    """분석 완료 시 FE 지정 URL로 결과 POST. 연결/타임아웃 시 OCR_CALLBACK_RETRIES 만큼 재시도. 성공/실패를 로그 + AdminAuditLog에 기록."""
+def _prepare_result_callback(
+    receipt_id: str, payload: Dict[str, Any], target_url: Optional[str], purpose: str
+) -> Tuple[Optional[str], Dict[str, Any], Optional[Dict[str, Any]]]:
+    """콜백 대상 URL·전송 본문 결정. 반환: (url, 본문, 생략 사유 dict 또는 None). 즉시 전송·outbox 적재 공통."""
     url = (target_url or "").strip() if target_url else None
     url = url or OCR_RESULT_CALLBACK_URL
     if not url:
-        return {"skipped": True, "reason": "OCR_RESULT_CALLBACK_URL is not set"}
+        return None, {}, {"skipped": True, "reason": "OCR_RESULT_CALLBACK_URL is not set"}
     # 검증 전까지 오류율 감소: 자동 분석 완료(purpose=auto) 시 FIT일 때만 FE로 콜백 전송. 검수자 수동( MANUAL )은 FIT/UNFIT 모두 전송
     if purpose == "auto":
         status_val = (payload.get("status") or payload.get("overall_status") or "").strip().upper()
@@ -1762,7 +2214,7 @@ async def _send_result_callback(
                 "OCR result callback skipped (FIT only): receiptId=%s purpose=%s status=%s",
                 receipt_id, purpose, status_val or "(empty)",
             )
-            return {"skipped": True, "reason": f"FE callback FIT only; status={status_val or 'empty'}"}
+            return None, {}, {"skipped": True, "reason": f"FE callback FIT only; status={status_val or 'empty'}"}
     # 판정 출처: FE에서 로직(자동) FIT vs 검수자 수동 FIT/UNFIT 구분용 (백엔드_요청사항_정리·콜백 구분)
     status_source = "AUTO" if purpose == "auto" else ("MANUAL" if purpose in ("resend", "verify") else "SYSTEM")
     payload_with_id = {
@@ -1772,17 +2224,31 @@ async def _send_result_callback(
         "statusSource": status_source,
         **payload,
     }
+    return url, payload_with_id, None
+
+
+async def _send_result_callback(
+    receipt_id: str,
+    payload: Dict[str, Any],
+    target_url: Optional[str] = None,
+    *,
+    purpose: str = "auto",  # auto | resend
+    actor: str = "system",
+) -> Dict[str, Any]:
+    """분석 완료 시 FE 지정 URL로 결과 POST. 연결/타임아웃 시 OCR_CALLBACK_RETRIES 만큼 재시도. 성공/실패를 로그 + AdminAuditLog에 기록."""
+    url, payload_with_id, skipped = _prepare_result_callback(receipt_id, payload, target_url, purpose)
+    if skipped is not None:
+        return skipped
     last_exception: Optional[Exception] = None
     max_attempts = 1 + OCR_CALLBACK_RETRIES
     for attempt in range(1, max_attempts + 1):
         try:
             started = time.time()
-            async with httpx.AsyncClient(timeout=OCR_CALLBACK_TIMEOUT_SEC) as client:
-                r = await client.post(
-                    url,
-                    json=payload_with_id,
-                    headers={"Content-Type": "application/json"},
-                )
+            r = await _get_http_client("callback").post(
+                url,
+                json=payload_with_id,
+                headers={"Content-Type": "application/json"},
+            )
             elapsed_ms = int(round((time.time() - started) * 1000.0))
             ok = r.status_code < 400
             if ok:
@@ -1893,73 +2359,415 @@ async def _send_result_callback(
     return {"receiptId": receipt_id, "url": url, "purpose": purpose, "ok": False, "error": "unknown"}
 
 
-async def _process_verifying_timeout_run(db: Session, actor: str = "system") -> Tuple[int, List[str]]:
+# 결과 콜백 outbox(callback_outbox) — 적재는 상태 변경 트랜잭션 안, 전송은 run_callback_dispatcher
+def _enqueue_result_callback(
+    db: Session,
+    receipt_id: str,
+    payload: Dict[str, Any],
+    *,
+    purpose: str = "auto",
+    actor: str = "system",
+    target_url: Optional[str] = None,
+) -> Optional[int]:
     """
-    VERIFYING/PENDING_VERIFICATION 상태로 설정된 지 verifying_timeout_minutes를 초과한 건을
-    UNFIT 또는 ERROR로 변경하고 FE 콜백 URL로 전송. 기관 정책(판정 규칙)에 따라 동작.
+    콜백을 outbox에 적재(commit은 호출부 — 최종 상태와 같은 트랜잭션). 생략 규칙(URL 미설정, auto는 FIT만)은 즉시 전송과 동일.
+    반환: 적재 시 outbox id, 생략 시 None.
     """
-    cfg = _get_judgment_rule_config(db)
-    timeout_min = int(getattr(cfg, "verifying_timeout_minutes", None) or 0)
-    if timeout_min <= 0:
-        return 0, []
-    action = (getattr(cfg, "verifying_timeout_action", None) or "UNFIT").strip().upper()
-    if action not in ("UNFIT", "ERROR"):
-        action = "UNFIT"
-    cutoff_naive = datetime.utcnow() - timedelta(minutes=timeout_min)
-    overdue = (
-        db.query(Submission)
-        .filter(
-            Submission.status.in_(["VERIFYING", "PENDING_VERIFICATION"]),
-            func.coalesce(Submission.updated_at, Submission.created_at) < cutoff_naive,
-        )
-        .all()
+    url, body, skipped = _prepare_result_callback(receipt_id, payload, target_url, purpose)
+    if skipped is not None:
+        return None
+    now = datetime.utcnow()
+    row = CallbackOutbox(
+        submission_id=receipt_id,
+        url=url,
+        purpose=purpose[:32],
+        actor=(actor or "system")[:128],
+        payload=_dict_for_jsonb(body),
+        status="QUEUED",
+        attempts=0,
+        max_attempts=CALLBACK_OUTBOX_MAX_ATTEMPTS,
+        available_at=now,
+        created_at=now,
+        updated_at=now,
     )
-    if not overdue:
-        return 0, []
-    processed: List[str] = []
-    reason = _truncate_submission_reason("VERIFYING_TIMEOUT (대기 시간 초과)")
-    for sub in overdue:
-        try:
-            sub.status = action
-            sub.fail_reason = reason
-            sub.global_fail_reason = reason
-            sub.updated_at = datetime.utcnow()
-            db.commit()
-            item_rows = (
-                db.query(ReceiptItem)
-                .filter(ReceiptItem.submission_id == sub.submission_id)
-                .order_by(ReceiptItem.seq_no.asc())
-                .all()
+    db.add(row)
+    db.flush()
+    return int(row.id)
+
+
+class _CallbackCircuitBreaker:
+    """
+    수신 엔드포인트(scheme://host)별 회로 차단기(프로세스 로컬).
+    CLOSED: 정상 전송 / 연속 실패 CALLBACK_CIRCUIT_FAILURE_THRESHOLD회 → OPEN: CALLBACK_CIRCUIT_OPEN_SEC 동안 전송 보류
+    → HALF_OPEN: 시험 1건만 전송, 성공 시 CLOSED·실패 시 다시 OPEN.
+    """
+
+    def __init__(self) -> None:
+        self._state: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def _entry(self, endpoint: str) -> Dict[str, Any]:
+        return self._state.setdefault(endpoint, {"failures": 0, "open_until": 0.0, "trial": False, "opened": 0})
+
+    def allow(self, url: str) -> Tuple[bool, float]:
+        """전송 가능 여부와, 보류 시 재시도까지 남은 초."""
+        e = self._entry(self.endpoint(url))
+        now = time.monotonic()
+        if e["failures"] < CALLBACK_CIRCUIT_FAILURE_THRESHOLD:
+            return True, 0.0
+        if now < e["open_until"]:
+            return False, e["open_until"] - now
+        if e["trial"]:
+            return False, 1.0
+        e["trial"] = True
+        return True, 0.0
+
+    def record(self, url: str, ok: bool) -> None:
+        endpoint = self.endpoint(url)
+        e = self._entry(endpoint)
+        e["trial"] = False
+        if ok:
+            e["failures"] = 0
+            e["open_until"] = 0.0
+            return
+        e["failures"] += 1
+        if e["failures"] >= CALLBACK_CIRCUIT_FAILURE_THRESHOLD:
+            e["open_until"] = time.monotonic() + CALLBACK_CIRCUIT_OPEN_SEC
+            e["opened"] += 1
+            logger.warning("callback circuit open: endpoint=%s failures=%s", endpoint, e["failures"])
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            ep: {
+                "state": (
+                    "CLOSED" if e["failures"] < CALLBACK_CIRCUIT_FAILURE_THRESHOLD
+                    else ("OPEN" if now < e["open_until"] else "HALF_OPEN")
+                ),
+                "consecutive_failures": e["failures"],
+                "opened_total": e["opened"],
+            }
+            for ep, e in self._state.items()
+        }
+
+
+_callback_circuit = _CallbackCircuitBreaker()
+
+
+def _claim_callbacks(db: Session, worker_id: str, limit: int) -> List[Dict[str, Any]]:
+    """전송할 콜백을 최대 limit건 점유(_claim_ocr_jobs와 같은 방식). 가시성 타임아웃은 콜백 타임아웃 × 4."""
+    now = datetime.utcnow()
+    rows = db.execute(
+        sql_text("""
+        UPDATE callback_outbox
+        SET status = 'SENDING', attempts = attempts + 1, locked_by = :worker,
+            locked_until = :locked_until, updated_at = :now
+        WHERE id IN (
+            SELECT id FROM callback_outbox
+            WHERE (status = 'QUEUED' AND available_at <= :now)
+               OR (status = 'SENDING' AND locked_until < :now)
+            ORDER BY available_at, id
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id, submission_id, url, purpose, actor, payload, attempts, max_attempts
+        """),
+        {
+            "worker": worker_id[:128],
+            "now": now,
+            "locked_until": now + timedelta(seconds=OCR_CALLBACK_TIMEOUT_SEC * 4),
+            "limit": max(1, int(limit)),
+        },
+    ).fetchall()
+    db.commit()
+    return [
+        {
+            "id": int(r[0]), "submission_id": r[1], "url": r[2], "purpose": r[3], "actor": r[4],
+            "payload": r[5], "attempts": int(r[6]), "max_attempts": int(r[7]),
+        }
+        for r in rows
+    ]
+
+
+def _callback_backoff_sec(attempts: int) -> float:
+    """지수 백오프 + 지터(0.5~1.5배): 수신 서버 장애 복구 시 재전송이 한꺼번에 몰리지 않도록."""
+    base = min(CALLBACK_OUTBOX_BACKOFF_MAX_SEC, CALLBACK_OUTBOX_BACKOFF_BASE_SEC * (2 ** max(0, attempts - 1)))
+    return base * random.uniform(0.5, 1.5)
+
+
+async def _deliver_outbox_callback(row: Dict[str, Any]) -> Dict[str, Any]:
+    """점유한 outbox 1건 전송(1회 시도). 반환: 결과 dict(_finish_callback_batch 입력). 재시도는 백오프 후 재점유로."""
+    url = row["url"]
+    allowed, wait_sec = _callback_circuit.allow(url)
+    if not allowed:
+        return {"row": row, "outcome": "deferred", "delay_sec": wait_sec}
+    started = time.time()
+    try:
+        r = await _get_http_client("callback").post(url, json=row["payload"], headers={"Content-Type": "application/json"})
+    except Exception as e:
+        _callback_circuit.record(url, ok=False)
+        err_msg = getattr(e, "message", str(e)) or type(e).__name__
+        return {
+            "row": row, "outcome": "retry", "error": err_msg[:200],
+            "elapsed_ms": int(round((time.time() - started) * 1000.0)),
+        }
+    elapsed_ms = int(round((time.time() - started) * 1000.0))
+    code = int(r.status_code)
+    if code < 400:
+        _callback_circuit.record(url, ok=True)
+        return {"row": row, "outcome": "sent", "status": code, "elapsed_ms": elapsed_ms}
+    body = (r.text or "")[:200]
+    # 408·429·5xx는 일시 장애로 보고 재시도, 그 외 4xx는 요청 자체 문제라 재시도하지 않음(기존 즉시 전송과 동일)
+    if code in (408, 429) or code >= 500:
+        _callback_circuit.record(url, ok=False)
+        return {"row": row, "outcome": "retry", "status": code, "error": body, "elapsed_ms": elapsed_ms}
+    _callback_circuit.record(url, ok=True)
+    return {"row": row, "outcome": "rejected", "status": code, "error": body, "elapsed_ms": elapsed_ms}
+
+
+def _finish_callback_batch(db: Session, worker_id: str, results: List[Dict[str, Any]]) -> None:
+    """전송 결과 일괄 반영: outbox 상태 갱신 + 감사 로그(CALLBACK_SEND)를 한 트랜잭션으로. 회로 차단 보류 건은 시도 횟수 되돌림."""
+    now = datetime.utcnow()
+    for res in results:
+        row = res["row"]
+        outcome = res["outcome"]
+        params: Dict[str, Any] = {
+            "id": row["id"], "worker": worker_id[:128], "now": now,
+            "code": res.get("status"), "err": (res.get("error") or None),
+        }
+        if outcome == "deferred":
+            params["available_at"] = now + timedelta(seconds=res["delay_sec"])
+            db.execute(
+                sql_text(
+                    "UPDATE callback_outbox SET status = 'QUEUED', attempts = GREATEST(attempts - 1, 0), "
+                    "available_at = :available_at, locked_until = NULL, updated_at = :now "
+                    "WHERE id = :id AND locked_by = :worker"
+                ),
+                params,
             )
-            payload = _build_status_payload(sub, item_rows)
-            await _send_result_callback(sub.submission_id, payload, purpose="verifying_timeout", actor=actor)
-            processed.append(sub.submission_id)
-        except Exception as e:
-            logger.warning("verifying_timeout process failed for %s: %s", sub.submission_id, e)
-            db.rollback()
-    return len(processed), processed
+            continue
+        if outcome == "sent":
+            sql = (
+                "UPDATE callback_outbox SET status = 'SENT', sent_at = :now, last_status_code = :code, last_error = NULL, "
+                "locked_until = NULL, updated_at = :now WHERE id = :id AND locked_by = :worker"
+            )
+        elif outcome == "retry" and row["attempts"] < row["max_attempts"]:
+            params["available_at"] = now + timedelta(seconds=_callback_backoff_sec(row["attempts"]))
+            sql = (
+                "UPDATE callback_outbox SET status = 'QUEUED', available_at = :available_at, last_status_code = :code, "
+                "last_error = :err, locked_until = NULL, updated_at = :now WHERE id = :id AND locked_by = :worker"
+            )
+        else:
+            sql = (
+                "UPDATE callback_outbox SET status = 'DEAD', last_status_code = :code, last_error = :err, "
+                "locked_until = NULL, updated_at = :now WHERE id = :id AND locked_by = :worker"
+            )
+        db.execute(sql_text(sql), params)
+        ok = outcome == "sent"
+        meta: Dict[str, Any] = {
+            "purpose": row["purpose"],
+            "url": row["url"],
+            "ok": ok,
+            "elapsed_ms": res.get("elapsed_ms"),
+            "attempt": row["attempts"],
+            "outbox_id": row["id"],
+        }
+        if res.get("status") is not None:
+            meta["status"] = res["status"]
+        if not ok:
+            meta["error" if res.get("status") is None else "response_body"] = res.get("error")
+        _audit_log(
+            db, actor=row["actor"] or "system", action="CALLBACK_SEND",
+            target_type="submission", target_id=row["submission_id"], meta=meta,
+        )
+        log = logger.info if ok else logger.warning
+        log(
+            "OCR result callback %s (outbox): receiptId=%s purpose=%s url=%s status=%s elapsedMs=%s attempt=%s/%s",
+            outcome, row["submission_id"], row["purpose"], row["url"], res.get("status"), res.get("elapsed_ms"),
+            row["attempts"], row["max_attempts"],
+        )
+    db.commit()
 
 
-def _safe_process_status(raw: Optional[str]) -> str:
-    """DB 값이 ProcessStatus enum에 없으면 PENDING 반환 (직렬화 500 방지)."""
-    if not raw or not isinstance(raw, str):
-        return "PENDING"
-    s = raw.strip().upper()
-    if s in (e.value for e in ProcessStatus):
-        return s
-    return "PENDING"
+def _callback_outbox_stats(db: Session) -> Dict[str, Any]:
+    rows = db.execute(sql_text("SELECT status, COUNT(*) FROM callback_outbox GROUP BY status")).fetchall()
+    oldest = db.execute(sql_text("SELECT MIN(available_at) FROM callback_outbox WHERE status = 'QUEUED'")).scalar()
+    lag_sec = max(0, int((datetime.utcnow() - oldest).total_seconds())) if oldest else 0
+    return {
+        "enabled": CALLBACK_OUTBOX_ENABLED,
+        "counts": {str(r[0]): int(r[1]) for r in rows},
+        "oldest_queued_lag_sec": lag_sec,
+        "circuits": _callback_circuit.snapshot(),
+    }
 
 
-def _safe_pay_date_str(raw: Any) -> Optional[str]:
-    """날짜/문자열을 응답용 문자열로. None이면 None, date/datetime이면 isoformat."""
-    if raw is None:
-        return None
-    if hasattr(raw, "isoformat"):
-        return raw.isoformat()
-    return str(raw).strip() or None
+def _callback_db_call(fn, *args):
+    """outbox 조작 1건을 별도 세션에서 실행(디스패처용)."""
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
 
 
-@app.get(
+async def run_callback_dispatcher(stop: asyncio.Event, worker_id: Optional[str] = None) -> None:
+    """
+    callback_outbox 소비 루프. 최대 CALLBACK_DISPATCH_CONCURRENCY건을 점유해 공유 HTTP 클라이언트로 동시 전송,
+    결과·감사 로그는 배치당 1회 commit. 여러 프로세스(API 워커·ocr_worker)에서 동시에 실행해도 SKIP LOCKED로 중복 전송 없음.
+    """
+    worker_id = worker_id or f"callback:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    logger.info("callback dispatcher start id=%s concurrency=%s", worker_id, CALLBACK_DISPATCH_CONCURRENCY)
+    while not stop.is_set():
+        rows: List[Dict[str, Any]] = []
+        try:
+            rows = await _run_io(_callback_db_call, _claim_callbacks, worker_id, CALLBACK_DISPATCH_CONCURRENCY)
+        except Exception as e:
+            logger.warning("callback outbox claim failed (apply migration callback_outbox.sql if needed): %s", e)
+        if rows:
+            results = await asyncio.gather(*[_deliver_outbox_callback(r) for r in rows])
+            try:
+                await _run_io(_callback_db_call, _finish_callback_batch, worker_id, list(results))
+            except Exception as e:
+                # 반영 실패 시 가시성 타임아웃 후 재점유(수신측은 receiptId로 중복 수신 처리)
+                logger.error("callback outbox finish failed: %s", e, exc_info=True)
+            continue
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=CALLBACK_DISPATCH_POLL_SEC)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("callback dispatcher stopped id=%s", worker_id)
+
+
+_VERIFYING_TIMEOUT_CLAIM_SQL = """
+UPDATE submissions
+SET status = :action, fail_reason = :reason, global_fail_reason = :reason, updated_at = :now
+WHERE submission_id IN (
+    SELECT submission_id FROM submissions
+    WHERE status IN ('VERIFYING', 'PENDING_VERIFICATION')
+      AND COALESCE(updated_at, created_at) < :cutoff
+    ORDER BY COALESCE(updated_at, created_at), submission_id
+    LIMIT :limit
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING submission_id
+"""
+
+
+def _verifying_timeout_chunk(
+    db: Session, action: str, reason: str, cutoff: datetime, actor: str
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    초과 건 VERIFYING_TIMEOUT_CHUNK_SIZE개를 UPDATE … RETURNING 1회로 종결, 장은 청크 전체를 1회 조회해 콜백 payload 생성.
+    롤업 반영·(outbox 사용 시) 콜백 적재까지 같은 트랜잭션으로 commit. 반환: [(receiptId, payload)] — 빈 목록이면 남은 건 없음.
+    SKIP LOCKED라 동시에 실행된 다른 크론 요청과 같은 건을 잡지 않음.
+    """
+    ids = [
+        r[0]
+        for r in db.execute(
+            sql_text(_VERIFYING_TIMEOUT_CLAIM_SQL),
+            {"action": action, "reason": reason, "now": datetime.utcnow(), "cutoff": cutoff, "limit": VERIFYING_TIMEOUT_CHUNK_SIZE},
+        ).fetchall()
+    ]
+    if not ids:
+        db.commit()
+        return []
+    subs = db.query(Submission).filter(Submission.submission_id.in_(ids)).populate_existing().all()
+    items_by_sub: Dict[str, List[ReceiptItem]] = {}
+    for it in (
+        db.query(ReceiptItem)
+        .filter(ReceiptItem.submission_id.in_(ids))
+        .order_by(ReceiptItem.submission_id, ReceiptItem.seq_no.asc())
+        .all()
+    ):
+        items_by_sub.setdefault(it.submission_id, []).append(it)
+    _sync_submission_stats(db, ids)
+    out: List[Tuple[str, Dict[str, Any]]] = []
+    for sub in subs:
+        payload = _build_status_payload(sub, items_by_sub.get(sub.submission_id, []))
+        if CALLBACK_OUTBOX_ENABLED:
+            _enqueue_result_callback(db, sub.submission_id, payload, purpose="verifying_timeout", actor=actor)
+        out.append((sub.submission_id, payload))
+    db.commit()
+    return out
+
+
+async def _process_verifying_timeout_run(db: Session, actor: str = "system") -> Tuple[int, List[str], bool]:
+    """
+    VERIFYING/PENDING_VERIFICATION 상태로 설정된 지 verifying_timeout_minutes를 초과한 건을
+    UNFIT 또는 ERROR로 변경하고 FE 콜백 URL로 전송. 기관 정책(판정 규칙)에 따라 동작.
+    청크 단위(VERIFYING_TIMEOUT_CHUNK_SIZE)로 종결·commit 후 콜백을 VERIFYING_TIMEOUT_CALLBACK_CONCURRENCY개까지 동시 전송.
+    실행 시간이 VERIFYING_TIMEOUT_MAX_RUN_SEC를 넘으면 다음 청크를 시작하지 않고 반환(has_more=True) → 다시 호출하면 이어서 처리.
+    반환: (처리 건수, receiptId 목록, 남은 건 존재 여부).
+    """
+    cfg = _get_judgment_rules(db)
+    timeout_min = int(getattr(cfg, "verifying_timeout_minutes", None) or 0)
+    if timeout_min <= 0:
+        return 0, [], False
+    action = (getattr(cfg, "verifying_timeout_action", None) or "UNFIT").strip().upper()
+    if action not in ("UNFIT", "ERROR"):
+        action = "UNFIT"
+    cutoff_naive = datetime.utcnow() - timedelta(minutes=timeout_min)
+    reason = _truncate_submission_reason("VERIFYING_TIMEOUT (대기 시간 초과)")
+    deadline = time.monotonic() + VERIFYING_TIMEOUT_MAX_RUN_SEC
+    sem = asyncio.Semaphore(VERIFYING_TIMEOUT_CALLBACK_CONCURRENCY)
+
+    async def _send(receipt_id: str, payload: Dict[str, Any]) -> None:
+        async with sem:
+            try:
+                await _send_result_callback(receipt_id, payload, purpose="verifying_timeout", actor=actor)
+            except Exception as e:
+                logger.warning("verifying_timeout callback failed for %s: %s", receipt_id, e)
+
+    processed: List[str] = []
+    has_more = False
+    while True:
+        if time.monotonic() >= deadline:
+            has_more = True
+            break
+        try:
+            chunk = await _run_io(_verifying_timeout_chunk, db, action, reason, cutoff_naive, actor)
+        except Exception as e:
+            logger.warning("verifying_timeout chunk failed: %s", e)
+            db.rollback()
+            has_more = True
+            break
+        if not chunk:
+            break
+        processed.extend(rid for rid, _ in chunk)
+        # 종결은 이미 commit됨. outbox 미사용 시 청크 콜백을 동시 전송(요청이 끊기면 이 청크의 미전송분은 관리자 재전송으로 복구)
+        if not CALLBACK_OUTBOX_ENABLED:
+            await asyncio.gather(*[_send(rid, payload) for rid, payload in chunk])
+        if len(chunk) < VERIFYING_TIMEOUT_CHUNK_SIZE:
+            break
+    if processed:
+        logger.info("verifying_timeout processed=%s has_more=%s action=%s", len(processed), has_more, action)
+    return len(processed), processed, has_more
+
+
+def _safe_process_status(raw: Optional[str]) -> str:
+    """DB 값이 ProcessStatus enum에 없으면 PENDING 반환 (직렬화 500 방지)."""
+    if not raw or not isinstance(raw, str):
+        return "PENDING"
+    s = raw.strip().upper()
+    if s in (e.value for e in ProcessStatus):
+        return s
+    return "PENDING"
+
+
+def _safe_pay_date_str(raw: Any) -> Optional[str]:
+    """날짜/문자열을 응답용 문자열로. None이면 None, date/datetime이면 isoformat."""
+    if raw is None:
+        return None
+    if hasattr(raw, "isoformat"):
+        return raw.isoformat()
+    return str(raw).strip() or None
+
+
+@app.get(
     "/api/v1/receipts/{receiptId}/status",
     response_model=StatusResponse,
     responses={404: {"description": "Receipt not found"}},
@@ -2840,7 +3648,7 @@ class AdminCampaignUpsertRequest(BaseModel):
 def _admin_min_amounts_from_config(db: Session) -> tuple:
     """JudgmentRuleConfig에서 min_amount_stay, min_amount_tour 반환. 없으면 60000, 50000."""
     try:
-        cfg = _get_judgment_rule_config(db)
+        cfg = _get_judgment_rules(db)
         return (int(cfg.min_amount_stay or 60000), int(cfg.min_amount_tour or 50000))
     except Exception:
         return (60000, 50000)
@@ -3002,6 +3810,7 @@ async def admin_create_campaign(
     except Exception:
         pass
     db.commit()
+    invalidate_campaign_cache()
 
     _audit_log(
         db,
@@ -3096,6 +3905,7 @@ async def admin_update_campaign(
     except Exception:
         pass
     db.commit()
+    invalidate_campaign_cache()
 
     _audit_log(
         db,
@@ -3194,7 +4004,7 @@ class JudgmentRuleConfigUpdateRequest(BaseModel):
     tags=["Admin - Rules"],
 )
 async def get_judgment_rule_config(db: Session = Depends(get_db), actor: str = Depends(require_admin)):
-    cfg = _get_judgment_rule_config(db)
+    cfg = _get_judgment_rules(db)
     o_min = _cfg_orphan_minutes(cfg)
     e_min = _cfg_expired_minutes(cfg)
     policy = _normalize_unknown_store_policy(cfg.unknown_store_policy)
@@ -3278,6 +4088,7 @@ async def update_judgment_rule_config(
         cfg.override_callback_policy = _normalize_override_callback_policy(cb_policy_in)
     cfg.updated_at = datetime.utcnow()
     db.commit()
+    _invalidate_judgment_rules()
     db.refresh(cfg)
     o_min_after = _cfg_orphan_minutes(cfg)
     e_min_after = _cfg_expired_minutes(cfg)
@@ -3331,6 +4142,7 @@ async def update_judgment_rule_config(
 class ProcessVerifyingTimeoutResponse(BaseModel):
     processed: int = Field(0, description="처리된 건수")
     submission_ids: List[str] = Field(default_factory=list, description="처리된 receiptId 목록")
+    has_more: bool = Field(False, description="실행 시간 한도(VERIFYING_TIMEOUT_MAX_RUN_SEC)로 중단. 다시 호출하면 남은 건을 이어서 처리")
     reason: Optional[str] = Field(None, description="비활성 시 사유")
 
 
@@ -3338,38 +4150,72 @@ class ProcessVerifyingTimeoutResponse(BaseModel):
     "/api/v1/admin/jobs/process-verifying-timeout",
     response_model=ProcessVerifyingTimeoutResponse,
     summary="VERIFYING 대기 시간 초과 처리",
-    description="판정 규칙의 verifying_timeout_minutes를 초과한 VERIFYING/PENDING_VERIFICATION 건을 UNFIT 또는 ERROR로 변경하고 FE 콜백 URL로 전송. cron/스케줄러에서 호출.",
+    description="판정 규칙의 verifying_timeout_minutes를 초과한 VERIFYING/PENDING_VERIFICATION 건을 UNFIT 또는 ERROR로 변경하고 FE 콜백 URL로 전송. cron/스케줄러에서 호출. has_more=true면 다시 호출해 이어서 처리.",
     tags=["Admin - Jobs"],
 )
 async def admin_process_verifying_timeout(
     db: Session = Depends(get_db),
     actor: str = Depends(require_admin),
 ):
-    cfg = _get_judgment_rule_config(db)
+    cfg = _get_judgment_rules(db)
     timeout_min = int(getattr(cfg, "verifying_timeout_minutes", None) or 0)
     if timeout_min <= 0:
         return ProcessVerifyingTimeoutResponse(processed=0, submission_ids=[], reason="verifying_timeout_minutes 비활성(0)")
-    processed, ids = await _process_verifying_timeout_run(db, actor=actor)
-    return ProcessVerifyingTimeoutResponse(processed=processed, submission_ids=ids)
+    processed, ids, has_more = await _process_verifying_timeout_run(db, actor=actor)
+    return ProcessVerifyingTimeoutResponse(processed=processed, submission_ids=ids, has_more=has_more)
 
 
 @app.post(
     "/api/v1/admin/jobs/cron/verifying-timeout",
     response_model=ProcessVerifyingTimeoutResponse,
     summary="[크론] VERIFYING 타임아웃 처리",
-    description="X-Cron-Secret으로 호출. verifying_timeout_minutes 초과 건 UNFIT/ERROR 처리 후 콜백. crontab에서 주기 호출.",
+    description="X-Cron-Secret으로 호출. verifying_timeout_minutes 초과 건 UNFIT/ERROR 처리 후 콜백. crontab에서 주기 호출. has_more=true면 다시 호출해 이어서 처리.",
     tags=["Admin - Jobs"],
 )
 async def cron_process_verifying_timeout(
     db: Session = Depends(get_db),
     actor: str = Depends(require_cron_secret),
 ):
-    cfg = _get_judgment_rule_config(db)
+    cfg = _get_judgment_rules(db)
     timeout_min = int(getattr(cfg, "verifying_timeout_minutes", None) or 0)
     if timeout_min <= 0:
         return ProcessVerifyingTimeoutResponse(processed=0, submission_ids=[], reason="verifying_timeout_minutes 비활성(0)")
-    processed, ids = await _process_verifying_timeout_run(db, actor=actor)
-    return ProcessVerifyingTimeoutResponse(processed=processed, submission_ids=ids)
+    processed, ids, has_more = await _process_verifying_timeout_run(db, actor=actor)
+    return ProcessVerifyingTimeoutResponse(processed=processed, submission_ids=ids, has_more=has_more)
+
+
+@app.get(
+    "/api/v1/admin/ops/metrics",
+    summary="운영 지표(실행 풀 포화도 등)",
+    description="분석 태스크 실행 풀(I/O 스레드 풀·이미지 프로세스 풀)의 대기/실행/완료/실패 건수, OCR 도메인별 호출 제한 대기 시간·OCR 결과 캐시 적중/미스(워커 프로세스별 값), 분석 작업 큐(ocr_jobs) 상태별 건수·대기 지연. 포화 여부 확인용.",
+    tags=["Admin - Jobs"],
+)
+async def admin_ops_metrics(
+    db: Session = Depends(get_db),
+    actor: str = Depends(require_admin),
+):
+    _ = actor
+    out: Dict[str, Any] = {
+        "pid": os.getpid(),
+        "executors": _executor_stats_snapshot(),
+        "ocr_limiter": {d: lim.snapshot() for d, lim in _ocr_domain_limiters.items()},
+        "ocr_result_cache": _ocr_result_cache_stats_snapshot(),
+        "image_hash_index": image_hash_index_snapshot(),
+        "presigned_url_cache": _presigned_url_cache.snapshot(),
+    }
+    try:
+        out["ocr_jobs"] = _ocr_job_queue_stats(db)
+    except Exception as e:
+        logger.warning("ocr_jobs stats failed (apply migration ocr_jobs.sql if needed): %s", e)
+        db.rollback()
+        out["ocr_jobs"] = {"enabled": OCR_JOB_QUEUE_ENABLED, "error": "unavailable"}
+    try:
+        out["callback_outbox"] = _callback_outbox_stats(db)
+    except Exception as e:
+        logger.warning("callback_outbox stats failed (apply migration callback_outbox.sql if needed): %s", e)
+        db.rollback()
+        out["callback_outbox"] = {"enabled": CALLBACK_OUTBOX_ENABLED, "error": "unavailable"}
+    return out
 
 
 # 5-1b. 행정구역(시도/시군구) 및 통계 API (관리자)
@@ -3648,7 +4494,7 @@ class AdminRegionStatsResponse(BaseModel):
         "- query에 아무것도 없으면 시도별 집계\n"
         "- sido가 있으면 해당 시도의 시군구별 집계\n"
         "- sigungu가 있으면 해당 시군구 단일 집계\n"
-        "집계 기준은 submission당 첫 장(seq_no=1)의 address/location을 사용."
+        "집계 기준은 submission당 첫 장(seq_no=1)의 address/location을 사용(판정 완료 건 집계 롤업 submission_daily_stats 기준)."
     ),
     tags=["Admin - Stats"],
 )
@@ -3750,47 +4596,34 @@ async def admin_stats_by_region(
     else:
         level = "SIDO"
 
-    # submission 당 대표 지역: 첫 장(seq_no=1)의 address/location
-    sido_expr = func.split_part(func.trim(ReceiptItem.address), " ", 1)
-    sigungu_expr = func.coalesce(
-        func.nullif(func.trim(ReceiptItem.location), ""),
-        func.split_part(func.trim(ReceiptItem.address), " ", 2),
-    )
-    group_expr = sido_expr if level == "SIDO" else sigungu_expr
-
-    q = (
-        db.query(
-            group_expr.label("region_raw"),
-            func.count(Submission.submission_id).label("submission_count"),
-            func.sum(case((Submission.status == "FIT", 1), else_=0)).label("fit_count"),
-            func.sum(func.coalesce(Submission.total_amount, 0)).label("total_amount"),
-        )
-        .join(
-            ReceiptItem,
-            (ReceiptItem.submission_id == Submission.submission_id) & (ReceiptItem.seq_no == 1),
-        )
-    )
-    if dt_from is not None:
-        q = q.filter(Submission.created_at >= dt_from)
-    if dt_to is not None:
-        q = q.filter(Submission.created_at <= dt_to)
-    if projectType:
-        q = q.filter(Submission.project_type == projectType.strip().upper())
-
+    # submission 당 대표 지역: 첫 장(seq_no=1)의 address/location (롤업 sido·sigungu 컬럼에 원문으로 보관)
+    sido_in: Optional[List[str]] = None
     if level == "SIGUNGU" and sido_name:
         # address 첫 토큰이 alias에 존재하면 sido_name과 매칭되는 코드로 정규화 후 필터 (DB 값이 '강원'처럼 짧을 수 있어 python 후처리 필요)
         # 우선 DB에서 1차 필터: address prefix로 좁힘 (과도한 오탐 방지 위해 exact name이거나 alias만)
-        allowed_aliases = []
-        for k, v in alias_map.items():
-            if v.get("code") == str(sido_code):
-                allowed_aliases.append(k)
-        if allowed_aliases:
-            q = q.filter(sido_expr.in_(allowed_aliases))
-
-    if level == "SINGLE" and sigungu_name:
-        q = q.filter(sigungu_expr == sigungu_name)
-
-    rows = q.group_by(group_expr).order_by(func.count(Submission.submission_id).desc()).all()
+        sido_in = [k for k, v in alias_map.items() if v.get("code") == str(sido_code)] or None
+    # 종료일이 날짜만 오면 당일 전체 포함 (대시보드·반려 사유 통계와 동일)
+    range_end = dt_to
+    range_end_inclusive = True
+    if dt_to is not None and dt_to.hour == 0 and dt_to.minute == 0 and dt_to.second == 0:
+        range_end = dt_to + timedelta(days=1)
+        range_end_inclusive = False
+    cfg = _get_judgment_rules(db)
+    min_stay = int(cfg.min_amount_stay or 60000)
+    min_tour = int(cfg.min_amount_tour or 50000)
+    region = query_region_stats(
+        db,
+        level_column="sido" if level == "SIDO" else "sigungu",
+        range_start=dt_from,
+        range_end=range_end,
+        range_end_inclusive=range_end_inclusive,
+        project_type=projectType.strip().upper() if projectType else None,
+        sido_in=sido_in,
+        sigungu_eq=sigungu_name if level == "SINGLE" else None,
+        min_amount_stay=min_stay,
+        min_amount_tour=min_tour,
+    )
+    rows = region["rows"]
 
     items: List[AdminRegionStatsItem] = []
     for r in rows:
@@ -3839,45 +4672,8 @@ async def admin_stats_by_region(
         )
 
     # 행정구역 통계 고도화 §12: 최소금액 달성 건수, 시도별 금액(히트맵), 정책 기준값
-    cfg = _get_judgment_rule_config(db)
-    min_stay = int(cfg.min_amount_stay or 60000)
-    min_tour = int(cfg.min_amount_tour or 50000)
-    min_amount_achieve_count: Optional[int] = None
+    min_amount_achieve_count: Optional[int] = region["min_amount_achieve_count"]
     amount_by_sido: Optional[Dict[str, int]] = None
-    try:
-        q_achieve = (
-            db.query(Submission)
-            .join(
-                ReceiptItem,
-                (ReceiptItem.submission_id == Submission.submission_id) & (ReceiptItem.seq_no == 1),
-            )
-            .filter(Submission.status == "FIT")
-            .filter(
-                or_(
-                    (Submission.project_type == "STAY") & (Submission.total_amount >= min_stay),
-                    (Submission.project_type == "TOUR") & (Submission.total_amount >= min_tour),
-                    ((Submission.project_type != "STAY") & (Submission.project_type != "TOUR")) & (Submission.total_amount >= min_tour),
-                )
-            )
-        )
-        if dt_from is not None:
-            q_achieve = q_achieve.filter(Submission.created_at >= dt_from)
-        if dt_to is not None:
-            q_achieve = q_achieve.filter(Submission.created_at <= dt_to)
-        if projectType:
-            q_achieve = q_achieve.filter(Submission.project_type == (projectType.strip().upper()))
-        if level == "SIGUNGU" and sido_name and sido_expr is not None:
-            allowed_aliases = []
-            for k, v in alias_map.items():
-                if v.get("code") == str(sido_code):
-                    allowed_aliases.append(k)
-            if allowed_aliases:
-                q_achieve = q_achieve.filter(sido_expr.in_(allowed_aliases))
-        if level == "SINGLE" and sigungu_name and sigungu_expr is not None:
-            q_achieve = q_achieve.filter(sigungu_expr == sigungu_name)
-        min_amount_achieve_count = q_achieve.count()
-    except Exception:
-        min_amount_achieve_count = None
     if level == "SIDO" and items:
         amount_by_sido = {it.regionCode: it.totalAmount for it in items if it.regionCode is not None}
 
@@ -3929,6 +4725,22 @@ class ApproveCandidatesRequest(BaseModel):
     is_premium: bool = Field(False, description="프리미엄 상점 여부 (선택)")
 
 
+# 후보 승인: TEMP_VALID 후보만 APPROVED로 바꾸고 같은 문장에서 master_stores에 다건 INSERT(road_address → 트리거로 city_county 자동)
+_APPROVE_CANDIDATES_SQL = """
+WITH approved AS (
+    UPDATE unregistered_stores
+    SET status = 'APPROVED', updated_at = :now
+    WHERE id = ANY(:ids) AND status = 'TEMP_VALID'
+    RETURNING id, store_name, biz_num, address, predicted_category, recent_receipt_id, source_submission_id
+), inserted AS (
+    INSERT INTO master_stores (store_name, category_large, category_small, road_address)
+    SELECT COALESCE(store_name, ''), :category, :category, COALESCE(address, '')
+    FROM approved
+)
+SELECT * FROM approved
+"""
+
+
 class ApproveCandidatesResponse(BaseModel):
     approved_count: int
     failed_ids: List[str] = Field(default_factory=list, description="승인 실패한 candidate_id")
@@ -3994,62 +4806,46 @@ async def approve_candidate_stores(
     db: Session = Depends(get_db),
     actor: str = Depends(require_admin),
 ):
-    """관리자: 후보 → master_stores 이관 후 status=APPROVED 처리."""
-    approved = 0
-    failed_ids: List[str] = []
-    for cid in body.candidate_ids:
-        cand = db.query(UnregisteredStore).filter(
-            UnregisteredStore.id == cid,
-            UnregisteredStore.status == "TEMP_VALID",
-        ).first()
-        if not cand:
-            failed_ids.append(cid)
-            continue
-        try:
-            before = {
-                "status": cand.status,
-                "store_name": cand.store_name,
-                "biz_num": cand.biz_num,
-                "address": cand.address,
-                "predicted_category": cand.predicted_category,
-            }
-            # master_stores에 삽입 (store_name, category_large, road_address → 트리거로 city_county 자동)
-            db.execute(
-                sql_text(
-                    "INSERT INTO master_stores (store_name, category_large, category_small, road_address) "
-                    "VALUES (:store_name, :category_large, :category_small, :road_address)"
-                ),
-                {
-                    "store_name": cand.store_name or "",
-                    "category_large": body.target_category,
-                    "category_small": body.target_category,
-                    "road_address": cand.address or "",
-                },
-            )
-            cand.status = "APPROVED"
-            cand.updated_at = datetime.utcnow()
-            # meta에 predicted vs target 기록 → 인식률 분석·피드백 루프(Gemini/whitelist 보강) 활용
-            _audit_log(
-                db,
-                actor=actor,
-                action="CANDIDATE_APPROVE",
-                target_type="unregistered_store",
-                target_id=cand.id,
-                before_json=before,
-                after_json={"status": cand.status, "target_category": body.target_category},
-                meta={
-                    "receiptId": cand.recent_receipt_id or cand.source_submission_id,
-                    "predicted_category": cand.predicted_category,
-                    "target_category": body.target_category,
-                    "corrected": cand.predicted_category != body.target_category if cand.predicted_category else None,
-                },
-            )
-            approved += 1
-        except Exception as e:
-            logger.warning("approve candidate %s failed: %s", cid, e)
-            failed_ids.append(cid)
+    """관리자: 후보 → master_stores 이관 후 status=APPROVED 처리. 선택 건 전체를 한 문장(상태 변경 + INSERT … SELECT)으로."""
+    requested = list(dict.fromkeys(c for c in ((x or "").strip() for x in body.candidate_ids) if c))
+    try:
+        rows = db.execute(
+            sql_text(_APPROVE_CANDIDATES_SQL),
+            {"ids": requested, "category": body.target_category, "now": datetime.utcnow()},
+        ).mappings().all()
+    except Exception as e:
+        logger.warning("approve candidates failed (%s ids): %s", len(requested), e)
+        db.rollback()
+        return ApproveCandidatesResponse(approved_count=0, failed_ids=requested)
+    approved_ids = {r["id"] for r in rows}
+    failed_ids = [cid for cid in requested if cid not in approved_ids]
+    # 감사 로그는 세션에 모아 commit 시 한 번에 INSERT. meta에 predicted vs target 기록 → 인식률 분석·피드백 루프(Gemini/whitelist 보강) 활용
+    for r in rows:
+        _audit_log(
+            db,
+            actor=actor,
+            action="CANDIDATE_APPROVE",
+            target_type="unregistered_store",
+            target_id=r["id"],
+            before_json={
+                "status": "TEMP_VALID",
+                "store_name": r["store_name"],
+                "biz_num": r["biz_num"],
+                "address": r["address"],
+                "predicted_category": r["predicted_category"],
+            },
+            after_json={"status": "APPROVED", "target_category": body.target_category},
+            meta={
+                "receiptId": r["recent_receipt_id"] or r["source_submission_id"],
+                "predicted_category": r["predicted_category"],
+                "target_category": body.target_category,
+                "corrected": r["predicted_category"] != body.target_category if r["predicted_category"] else None,
+            },
+        )
     db.commit()
-    return ApproveCandidatesResponse(approved_count=approved, failed_ids=failed_ids)
+    for r in rows:
+        register_store_in_index(r["store_name"] or "", r["address"])
+    return ApproveCandidatesResponse(approved_count=len(rows), failed_ids=failed_ids)
 
 
 # 5-3. Submission 관리 API (관리자) — 검색/상세/override/콜백 재전송/증거 이미지
@@ -4066,7 +4862,7 @@ class AdminSubmissionListItem(BaseModel):
     final_amount: Optional[int] = Field(None, description="최종 확정(교정) 금액. 있으면 목록/집계에 사용, 없으면 total_amount 사용. 방법 A: total_amount와 동일.")
     correctedTotalAmount: Optional[int] = Field(None, description="final_amount와 동일(camelCase). FE getDisplayAmount()용.")
     created_at: Optional[str] = None
-    thumbnail_url: Optional[str] = Field(None, description="목록·호버 썸네일 미리보기용 presigned URL(첫 장)")
+    thumbnail_url: Optional[str] = Field(None, description="목록·호버 썸네일 미리보기용 presigned URL(첫 장, 썸네일 파생 이미지 있으면 그것)")
     confidence: Optional[int] = Field(None, description="신뢰도 0~100, 슬라이더 필터용(첫 장 또는 최소값)")
     integrityCheck: Optional[bool] = Field(None, description="무결성 OK 표시용. FIT이고 반려사유 없으면 True")
     # 부적합(UNFIT/REJECTED) 목록 시 실제 사유 표기용. 최소 하나 포함 권장 (백엔드_요청사항_정리)
@@ -4078,32 +4874,109 @@ class AdminSubmissionListItem(BaseModel):
 
 
 class AdminSubmissionListResponse(BaseModel):
-    total: int
+    total: Optional[int] = Field(None, description="조건 일치 건수. includeTotal=false면 null. totalIsEstimate=true면 실행 계획 추정치")
+    totalIsEstimate: bool = Field(False, description="total이 정확 집계가 아닌 Postgres 실행 계획 추정치인지")
     items: List[AdminSubmissionListItem] = Field(default_factory=list)
     approvedAmountSum: Optional[int] = Field(None, description="aggregate=sum 요청 시 동일 조건·status=FIT인 건의 total_amount 합계")
+    nextCursor: Optional[str] = Field(None, description="다음 페이지 cursor. 마지막 페이지면 null")
+    hasMore: bool = Field(False, description="다음 페이지 존재 여부")
 
 
-@app.get(
-    "/api/v1/admin/submissions",
-    response_model=AdminSubmissionListResponse,
-    summary="신청 목록 검색(관리자)",
-    description="대시보드·검수용. from/to, campaignId, status(또는 statusStage), dateField(created_at|updated_at), limit(최대 10000), offset, regionCode 지원. aggregate=sum 시 응답에 approvedAmountSum(승인 건 금액 합계) 포함.",
-    tags=["Admin - Submissions"],
-)
-async def admin_list_submissions(
+# 목록 total: 0(기본)이면 항상 정확 집계(COUNT). 양수로 설정 시 실행 계획 추정 건수가 이 값을 넘으면 추정치 반환(totalIsEstimate=true)
+ADMIN_LIST_EXACT_COUNT_MAX = max(0, int(os.getenv("ADMIN_LIST_EXACT_COUNT_MAX", "0")))
+
+
+def _encode_list_cursor(date_field_name: str, date_value: Optional[datetime], submission_id: str) -> str:
+    """목록 keyset cursor: (정렬 일시, submission_id)를 base64url JSON으로."""
+    raw = json.dumps(
+        {"f": date_field_name, "d": date_value.isoformat() if date_value else None, "id": submission_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(cursor: str, date_field_name: str) -> Tuple[Optional[datetime], str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        data = json.loads(raw)
+        if data.get("f") != date_field_name or not data.get("id"):
+            raise ValueError("dateField mismatch")
+        d = datetime.fromisoformat(data["d"]) if data.get("d") else None
+        return d, str(data["id"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _list_cursor_filter(date_field: Any, cur_date: Optional[datetime], cur_id: str) -> Any:
+    """
+    cursor 다음 행 조건((dateField, submission_id) 내림차순 기준).
+    DESC 기본 NULLS FIRST라 일시 없는 cursor 뒤에는 같은 NULL 구간의 작은 ID와 일시 있는 행 전체가 옴.
+    """
+    if cur_date is None:
+        return or_(date_field.isnot(None), (date_field.is_(None)) & (Submission.submission_id < cur_id))
+    return tuple_(date_field, Submission.submission_id) < tuple_(cur_date, cur_id)
+
+
+_LIST_ITEM_AGG_SQL = """
+SELECT submission_id, image_key, thumbnail_key, min_confidence, first_amount, amount_sum
+FROM (
+    SELECT
+        submission_id,
+        image_key,
+        thumbnail_key,
+        MIN(LEAST(GREATEST(confidence_score, 0), 100)) OVER w AS min_confidence,
+        COALESCE(amount, 0) AS first_amount,
+        SUM(COALESCE(amount, 0)) OVER w AS amount_sum,
+        ROW_NUMBER() OVER (PARTITION BY submission_id ORDER BY seq_no ASC) AS rn
+    FROM receipt_items
+    WHERE submission_id = ANY(:ids)
+    WINDOW w AS (PARTITION BY submission_id)
+) t
+WHERE rn = 1
+"""
+
+
+def _list_item_aggregates(db: Session, submission_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    목록 행별 장(receipt_items) 집계를 윈도 함수 1회 조회로: 첫 장 image_key·썸네일 키·금액, 신뢰도 최소값(0~100), 금액 합계.
+    반환: submission_id → dict. 장이 없는 신청은 키 없음.
+    """
+    if not submission_ids:
+        return {}
+    rows = db.execute(sql_text(_LIST_ITEM_AGG_SQL), {"ids": list(submission_ids)}).mappings().all()
+    return {
+        r["submission_id"]: {
+            "image_key": r["image_key"],
+            "thumbnail_key": r["thumbnail_key"],
+            "min_confidence": int(r["min_confidence"]) if r["min_confidence"] is not None else None,
+            "first_amount": int(r["first_amount"] or 0),
+            "amount_sum": int(r["amount_sum"] or 0),
+        }
+        for r in rows
+    }
+
+
+def _planner_row_estimate(db: Session, query: Any) -> Optional[int]:
+    """ORM 쿼리의 Postgres 실행 계획 예상 행 수(EXPLAIN만, 실행 안 함). 실패 시 None."""
+    try:
+        stmt = query.statement.with_only_columns(Submission.submission_id).order_by(None)
+        compiled = stmt.compile(dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+        raw = db.connection().exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params).scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        return int(plan.get("Plan Rows") or 0)
+    except Exception as e:
+        logger.debug("planner row estimate failed: %s", e)
+        return None
+
+
+def _parse_admin_submission_filters(
     request: Request,
-    status: Optional[str] = Query(None, description="MANUAL_REVIEW, FIT, UNFIT 등. FE: APPROVED 시 FIT로 매핑 가능"),
-    userUuid: Optional[str] = None,
-    receiptId: Optional[str] = None,
-    dateFrom: Optional[str] = Query(None, description="기간 시작 YYYY-MM-DD (from 과 동일)"),
-    dateTo: Optional[str] = Query(None, description="기간 끝 YYYY-MM-DD (to 와 동일)"),
-    campaignId: Optional[str] = Query(None, description="캠페인 ID로 필터. 기관·검수자: 자신의 캠페인만"),
-    regionCode: Optional[str] = Query(None, description="행정구역 통계 §12: 시군구 코드. 지정 시 해당 지역(첫 장 address/location) 제출만 조회"),
-    limit: Optional[int] = Query(None, description="페이지 크기(기본 50, 최대 10000). 대시보드 집계 시 1000 등"),
-    offset: Optional[int] = Query(None, description="건너뛸 개수(기본 0)"),
-    db: Session = Depends(get_db),
-    ctx: AdminContext = Depends(get_admin_context),
-):
+    status: Optional[str],
+    dateFrom: Optional[str],
+    dateTo: Optional[str],
+    campaignId: Optional[str],
+) -> Tuple[Optional[str], Optional[str], str, Any, Optional[int]]:
+    """관리자 신청 목록 공통 조건 파싱. 반환: (from, to, status, 기준 일시 컬럼, campaign_id)."""
     # from/to 는 예약어·alias 422 방지를 위해 쿼리에서만 읽음 (FE: ?from= &to= 사용)
     qp = getattr(request, "query_params", None)
     from_val = (qp.get("from") if qp else None) or dateFrom
@@ -4114,7 +4987,6 @@ async def admin_list_submissions(
         status_val = (status_val or "").strip()
     date_field_name = (qp.get("dateField") if qp else None) or "created_at"
     date_field = Submission.updated_at if (date_field_name or "").strip().lower() == "updated_at" else Submission.created_at
-    aggregate_sum = ((qp.get("aggregate") or "") if qp else "").strip().lower() == "sum"
 
     cid: Optional[int] = None
     if campaignId not in (None, ""):
@@ -4122,18 +4994,32 @@ async def admin_list_submissions(
             cid = int(str(campaignId).strip())
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid campaignId")
-    limit_val = 50 if limit is None else max(1, min(limit, 10000))
-    offset_val = 0 if offset is None else max(0, offset)
+    return from_val, to_val, status_val, date_field, cid
 
+
+def _admin_submissions_filtered_query(
+    db: Session,
+    ctx: AdminContext,
+    *,
+    status_val: str,
+    receipt_id: Optional[str],
+    user_uuid: Optional[str],
+    cid: Optional[int],
+    from_val: Optional[str],
+    to_val: Optional[str],
+    date_field: Any,
+    region_code: Optional[str],
+) -> Any:
+    """관리자 신청 목록·증빙 내보내기 공통 조건(캠페인 스코프 포함)을 적용한 Submission 쿼리. 정렬·페이지는 호출부."""
     q = db.query(Submission)
     if not ctx.is_super and ctx.campaign_ids:
         q = q.filter(Submission.campaign_id.in_(ctx.campaign_ids))
     elif not ctx.is_super:
         q = q.filter(Submission.campaign_id == -1)
-    if receiptId:
-        q = q.filter(Submission.submission_id == receiptId.strip())
-    if userUuid:
-        q = q.filter(Submission.user_uuid == userUuid.strip())
+    if receipt_id:
+        q = q.filter(Submission.submission_id == receipt_id.strip())
+    if user_uuid:
+        q = q.filter(Submission.user_uuid == user_uuid.strip())
     if status_val:
         s = status_val
         if s.upper() == "APPROVED":
@@ -4152,17 +5038,15 @@ async def admin_list_submissions(
             q = q.filter(Submission.status == s)
     if cid is not None:
         q = q.filter(Submission.campaign_id == cid)
-    start_raw = from_val
-    end_raw = to_val
-    if start_raw:
+    if from_val:
         try:
-            dt = dateutil_parser.parse(start_raw)
+            dt = dateutil_parser.parse(from_val)
             q = q.filter(date_field >= dt)
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid from/dateFrom")
-    if end_raw:
+    if to_val:
         try:
-            to_dt = dateutil_parser.parse(end_raw)
+            to_dt = dateutil_parser.parse(to_val)
             # 종료일 당일 전체 포함: "2026-03-12" → 2026-03-13 00:00:00 미만 (일자별 접수 추이·대시보드 정확 집계)
             if getattr(to_dt, "hour", 0) == 0 and getattr(to_dt, "minute", 0) == 0:
                 to_end = to_dt + timedelta(days=1)
@@ -4171,13 +5055,13 @@ async def admin_list_submissions(
                 q = q.filter(date_field <= to_dt)
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid to/dateTo")
-    if regionCode and (regionCode := regionCode.strip()):
+    if region_code and (region_code := region_code.strip()):
         try:
             rdata = _load_regions_data()
             sigungu_name_for_filter = None
             for _sc, items in (rdata.get("sigungu") or {}).items():
                 for it in items or []:
-                    if str(it.get("code") or "").strip() == regionCode:
+                    if str(it.get("code") or "").strip() == region_code:
                         sigungu_name_for_filter = str(it.get("name") or "").strip()
                         break
                 if sigungu_name_for_filter:
@@ -4197,14 +5081,79 @@ async def admin_list_submissions(
                 q = q.filter(Submission.submission_id.in_(subq))
         except Exception:
             pass
+    return q
 
-    total = q.count()
-    rows = (
-        q.order_by(date_field.desc())
-        .offset(offset_val)
-        .limit(limit_val)
-        .all()
+
+@app.get(
+    "/api/v1/admin/submissions",
+    response_model=AdminSubmissionListResponse,
+    summary="신청 목록 검색(관리자)",
+    description=(
+        "대시보드·검수용. from/to, campaignId, status(또는 statusStage), dateField(created_at|updated_at), limit(최대 10000), offset, regionCode 지원. "
+        "aggregate=sum 시 응답에 approvedAmountSum(승인 건 금액 합계) 포함.\n"
+        "정렬: dateField 내림차순, 동일 시각은 receiptId 내림차순. 대량 페이지 이동은 offset 대신 응답의 nextCursor를 cursor로 전달(페이지 깊이와 무관한 조회 시간). "
+        "includeTotal=false면 건수 집계 생략(total=null). 기본은 정확 집계, ADMIN_LIST_EXACT_COUNT_MAX 설정 시 그보다 큰 조건은 실행 계획 추정치(totalIsEstimate=true)."
+    ),
+    tags=["Admin - Submissions"],
+)
+async def admin_list_submissions(
+    request: Request,
+    status: Optional[str] = Query(None, description="MANUAL_REVIEW, FIT, UNFIT 등. FE: APPROVED 시 FIT로 매핑 가능"),
+    userUuid: Optional[str] = None,
+    receiptId: Optional[str] = None,
+    dateFrom: Optional[str] = Query(None, description="기간 시작 YYYY-MM-DD (from 과 동일)"),
+    dateTo: Optional[str] = Query(None, description="기간 끝 YYYY-MM-DD (to 와 동일)"),
+    campaignId: Optional[str] = Query(None, description="캠페인 ID로 필터. 기관·검수자: 자신의 캠페인만"),
+    regionCode: Optional[str] = Query(None, description="행정구역 통계 §12: 시군구 코드. 지정 시 해당 지역(첫 장 address/location) 제출만 조회"),
+    limit: Optional[int] = Query(None, description="페이지 크기(기본 50, 최대 10000). 대시보드 집계 시 1000 등"),
+    offset: Optional[int] = Query(None, description="건너뛸 개수(기본 0). cursor 지정 시 무시"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor (keyset 페이지네이션, 같은 dateField·조건으로 사용)"),
+    includeTotal: bool = Query(True, description="false면 total 집계 생략(null 반환)"),
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    from_val, to_val, status_val, date_field, cid = _parse_admin_submission_filters(request, status, dateFrom, dateTo, campaignId)
+    qp = getattr(request, "query_params", None)
+    aggregate_sum = ((qp.get("aggregate") or "") if qp else "").strip().lower() == "sum"
+    limit_val = 50 if limit is None else max(1, min(limit, 10000))
+    offset_val = 0 if offset is None else max(0, offset)
+
+    q = _admin_submissions_filtered_query(
+        db, ctx, status_val=status_val, receipt_id=receiptId, user_uuid=userUuid, cid=cid,
+        from_val=from_val, to_val=to_val, date_field=date_field, region_code=regionCode,
     )
+    start_raw = from_val
+    end_raw = to_val
+
+    total: Optional[int] = None
+    total_is_estimate = False
+    if includeTotal:
+        # 결과가 매우 큰 조건은 COUNT(전체 스캔) 대신 실행 계획 추정치. 단건 조회(receiptId/userUuid)는 항상 정확 집계
+        estimate = None
+        if ADMIN_LIST_EXACT_COUNT_MAX > 0 and not receiptId and not userUuid:
+            estimate = _planner_row_estimate(db, q)
+        if estimate is not None and estimate > ADMIN_LIST_EXACT_COUNT_MAX:
+            total = estimate
+            total_is_estimate = True
+        else:
+            total = q.count()
+
+    # keyset: (dateField, submission_id) 내림차순. DESC 기본 NULLS FIRST 순서라 일시 없는 행이 먼저 나옴
+    page_q = q
+    date_field_key = "updated_at" if date_field is Submission.updated_at else "created_at"
+    if cursor:
+        cur_date, cur_id = _decode_list_cursor(cursor.strip(), date_field_key)
+        page_q = page_q.filter(_list_cursor_filter(date_field, cur_date, cur_id))
+    page_q = page_q.order_by(date_field.desc(), Submission.submission_id.desc())
+    if not cursor and offset_val:
+        page_q = page_q.offset(offset_val)
+    rows = page_q.limit(limit_val + 1).all()
+    has_more = len(rows) > limit_val
+    rows = rows[:limit_val]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = _encode_list_cursor(date_field_key, getattr(last, date_field_key), last.submission_id)
 
     approved_amount_sum: Optional[int] = None
     if aggregate_sum:
@@ -4273,49 +5222,19 @@ async def admin_list_submissions(
         return "STAY" if v == "STAY" else "TOUR"
 
     submission_ids = [r.submission_id for r in rows]
-    first_item_per_sub: Dict[str, ReceiptItem] = {}
-    min_confidence_per_sub: Dict[str, Optional[int]] = {}
-    amount_from_items_per_sub: Dict[str, int] = {}  # UNFIT_REGION 등 total_amount 미반영 시 receipt_items 합산으로 표기
-    if submission_ids:
-        receipt_items = (
-            db.query(ReceiptItem)
-            .filter(ReceiptItem.submission_id.in_(submission_ids))
-            .order_by(ReceiptItem.submission_id, ReceiptItem.seq_no.asc())
-            .all()
-        )
-        for it in receipt_items:
-            sid = it.submission_id
-            if sid not in first_item_per_sub:
-                first_item_per_sub[sid] = it
-            c = getattr(it, "confidence_score", None)
-            if c is not None and isinstance(c, (int, float)):
-                ci = int(c) if 0 <= c <= 100 else max(0, min(100, int(c)))
-                if sid not in min_confidence_per_sub or (min_confidence_per_sub[sid] is not None and ci < min_confidence_per_sub[sid]):
-                    min_confidence_per_sub[sid] = ci
-        for sid in submission_ids:
-            if sid not in min_confidence_per_sub and sid in first_item_per_sub:
-                fc = getattr(first_item_per_sub[sid], "confidence_score", None)
-                min_confidence_per_sub[sid] = max(0, min(100, int(fc))) if fc is not None else None
-        # submission.total_amount가 0인 경우(UNFIT_REGION 등)에도 OCR 인식 금액 표기: receipt_items 기준 합산 (§10.5, §10.6 STAY는 첫 장만)
-        sub_to_type: Dict[str, str] = {r.submission_id: (r.project_type or "TOUR") for r in rows}
-        for sid in submission_ids:
-            subs_items = [x for x in receipt_items if x.submission_id == sid]
-            if not subs_items:
-                continue
-            pt = (sub_to_type.get(sid) or "TOUR").strip().upper()
-            if pt == "STAY":
-                amount_from_items_per_sub[sid] = int(subs_items[0].amount or 0)
-            else:
-                amount_from_items_per_sub[sid] = sum(int(x.amount or 0) for x in subs_items)
+    item_agg = _list_item_aggregates(db, submission_ids)
 
     items = []
     for r in rows:
-        first_item = first_item_per_sub.get(r.submission_id)
-        thumb_url = _presigned_get_url_for_key(first_item.image_key) if first_item and (first_item.image_key or "").strip() else None
-        conf = min_confidence_per_sub.get(r.submission_id)
+        agg = item_agg.get(r.submission_id)
+        # 썸네일 파생 이미지가 있으면 그 키로(수 MB 원본 대신 수십 KB), 없으면 원본
+        thumb_key = ((agg["thumbnail_key"] or agg["image_key"] or "").strip()) if agg else ""
+        thumb_url = _presigned_get_url_for_key(thumb_key) if thumb_key else None
+        conf = agg["min_confidence"] if agg else None
         amt = r.total_amount or 0
-        if amt <= 0 and r.submission_id in amount_from_items_per_sub:
-            amt = amount_from_items_per_sub[r.submission_id]
+        if amt <= 0 and agg:
+            # submission.total_amount가 0인 경우(UNFIT_REGION 등)에도 OCR 인식 금액 표기: receipt_items 기준 (§10.5, §10.6 STAY는 첫 장만)
+            amt = agg["first_amount"] if _normalize_project_type_for_response(r.project_type) == "STAY" else agg["amount_sum"]
         fail_text = (r.fail_reason or r.global_fail_reason or "").strip() or None
         code, label = _reason_text_to_code_label(fail_text or "") if fail_text else ("", "")
         reject_reason_val = fail_text if fail_text else (label if code and code != "OTHER" else None)
@@ -4361,7 +5280,43 @@ async def admin_list_submissions(
                 callbackSent=callback_sent_val,
             )
         )
-    return AdminSubmissionListResponse(total=total, items=items, approvedAmountSum=approved_amount_sum)
+    return AdminSubmissionListResponse(
+        total=total,
+        totalIsEstimate=total_is_estimate,
+        items=items,
+        approvedAmountSum=approved_amount_sum,
+        nextCursor=next_cursor,
+        hasMore=has_more,
+    )
+
+
+def _manual_decision_marker(kind: str, actor: Optional[str], at: datetime) -> Dict[str, Any]:
+    """관리자 수동 판정(OVERRIDE·BULK_REJECT) 표식. submission_sidecar.manual_decision에 저장."""
+    return {"type": kind, "actor": actor, "at": at.isoformat() + "Z"}
+
+
+# 일괄 반려: 기존 audit_trail 뒤에 " | " + 반려 기록 추가, SUBMISSION_AUDIT_MAX_LEN 초과 시 _truncate_submission_audit와 같은 규칙으로 자름
+# sidecar manual_decision 기록 → 일괄 재처리에서 제외(_reprocess_job_where)
+_BULK_REJECT_SQL = """
+UPDATE submissions s
+SET status = 'UNFIT', fail_reason = :reason, global_fail_reason = :reason, updated_at = :now,
+    audit_trail = t.trail, audit_log = t.trail,
+    submission_sidecar = COALESCE(s.submission_sidecar, '{}'::jsonb)
+        || jsonb_build_object('manual_decision', CAST(:decision AS jsonb))
+FROM (
+    SELECT submission_id,
+           CASE WHEN length(c) > :max_len THEN left(c, :max_len - 3) || '...' ELSE c END AS trail
+    FROM (
+        SELECT submission_id,
+               CASE WHEN COALESCE(NULLIF(audit_trail, ''), NULLIF(audit_log, '')) IS NULL THEN CAST(:line AS TEXT)
+                    ELSE COALESCE(NULLIF(audit_trail, ''), audit_log) || ' | ' || CAST(:line AS TEXT) END AS c
+        FROM submissions
+        WHERE submission_id = ANY(:ids)
+    ) x
+) t
+WHERE s.submission_id = t.submission_id
+RETURNING s.submission_id
+"""
 
 
 class AdminBulkRejectRequest(BaseModel):
@@ -4396,38 +5351,47 @@ async def admin_bulk_reject(
     forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
         client_ip = forwarded.split(",")[0].strip() or client_ip
-    processed: List[str] = []
-    skipped: List[str] = []
+    requested = list(dict.fromkeys(r for r in ((x or "").strip() for x in body.receiptIds) if r))
+    # 대상 조회 1회(캠페인 스코프 포함) → UPDATE … RETURNING 1회. 행 잠금은 UPDATE 한 문장 동안만
+    scope_q = db.query(Submission.submission_id).filter(Submission.submission_id.in_(requested))
+    if not ctx.is_super and ctx.campaign_ids:
+        scope_q = scope_q.filter(func.coalesce(Submission.campaign_id, 0).in_(ctx.campaign_ids))
+    allowed = {r[0] for r in scope_q.all()} if requested else set()
+    skipped: List[str] = [rid for rid in requested if rid not in allowed]
     failed: List[str] = []
-    for rid in body.receiptIds:
-        rid = (rid or "").strip()
-        if not rid:
-            continue
-        sub = db.query(Submission).filter(Submission.submission_id == rid).first()
-        if not sub:
-            skipped.append(rid)
-            continue
-        if not ctx.is_super and ctx.campaign_ids and (sub.campaign_id or 0) not in ctx.campaign_ids:
-            skipped.append(rid)
-            continue
+    processed: List[str] = []
+    if allowed:
+        now = datetime.utcnow()
+        fail_reason = _truncate_submission_reason(reason_msg)
+        reason_short = fail_reason or (reason_msg[:200] + "..." if reason_msg and len(reason_msg) > 200 else reason_msg) or "-"
+        line = f"BULK_REJECT({now.isoformat()}, actor={ctx.actor}, reasonCode={reason_code or '-'}, tagAsError={body.tagAsError}): {reason_short}"
         try:
-            sub.status = "UNFIT"
-            sub.fail_reason = _truncate_submission_reason(reason_msg)
-            sub.global_fail_reason = sub.fail_reason
-            sub.updated_at = datetime.utcnow()
-            reason_short = _truncate_submission_reason(reason_msg) or (reason_msg[:200] + "..." if reason_msg and len(reason_msg) > 200 else reason_msg) or "-"
-            line = f"BULK_REJECT({datetime.utcnow().isoformat()}, actor={ctx.actor}, reasonCode={reason_code or '-'}, tagAsError={body.tagAsError}): {reason_short}"
-            existing = sub.audit_trail or sub.audit_log or ""
-            combined = (existing + " | " + line).strip(" |") if existing else line
-            sub.audit_trail = _truncate_submission_audit(combined)
-            sub.audit_log = sub.audit_trail
-            processed.append(rid)
-        except Exception:
-            failed.append(rid)
-    if processed:
-        db.commit()
-    _audit_log(
-        db,
+            processed = [
+                r[0]
+                for r in db.execute(
+                    sql_text(_BULK_REJECT_SQL),
+                    {
+                        "ids": sorted(allowed),
+                        "reason": fail_reason,
+                        "now": now,
+                        "line": line,
+                        "max_len": SUBMISSION_AUDIT_MAX_LEN,
+                        "decision": json.dumps(_manual_decision_marker("BULK_REJECT", ctx.actor, now)),
+                    },
+                ).fetchall()
+            ]
+            _sync_submission_stats(db, processed)
+            db.commit()
+        except Exception as e:
+            logger.warning("bulk reject update failed (%s rows): %s", len(allowed), e)
+            db.rollback()
+            processed = []
+            failed = [rid for rid in requested if rid in allowed]
+        # 조회~UPDATE 사이 삭제된 건
+        done = set(processed)
+        skipped.extend(rid for rid in requested if rid in allowed and rid not in done and rid not in failed)
+    _audit_log(
+        db,
         actor=ctx.actor,
         action="BULK_REJECT",
         target_type="submission",
@@ -4463,11 +5427,18 @@ class AdminDashboardStatsResponse(BaseModel):
     lastAggregatedAt: Optional[str] = Field(None, description="마지막 집계 시각(ISO). FE '마지막 집계: MM/dd HH:mm' 표기용")
 
 
+def _local_to_utc_naive(dt: datetime, z: ZoneInfo) -> datetime:
+    """타임존 없는 값은 z 현지 시각으로 보고 naive UTC(created_at 저장 기준)로 변환."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=z)
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 @app.get(
     "/api/v1/admin/dashboard/stats",
     response_model=AdminDashboardStatsResponse,
     summary="대시보드 집계 수치",
-    description="campaignId, from, to, timezone(선택) 기준. 금일/전일 건수, 검수 대기 건수(MANUAL_REVIEW·PENDING_VERIFICATION·VERIFYING 등), 승인 금액 합계, byCategory(STAY/TOUR), 일자별 건수.",
+    description="campaignId, from, to, timezone(선택, 기본 Asia/Seoul) 기준. 금일/전일 건수, 검수 대기 건수(MANUAL_REVIEW·PENDING_VERIFICATION·VERIFYING 등), 승인 금액 합계, byCategory(STAY/TOUR), 일자·월·시간대별 건수. from/to와 일·월·시간대 구분은 모두 timezone 현지 기준.",
     tags=["Admin - Submissions"],
 )
 async def admin_dashboard_stats(
@@ -4475,154 +5446,88 @@ async def admin_dashboard_stats(
     campaignId: Optional[int] = Query(None),
     from_: Optional[str] = Query(None, alias="from", description="YYYY-MM-DD"),
     to: Optional[str] = Query(None, description="YYYY-MM-DD"),
-    timezone_param: Optional[str] = Query(None, alias="timezone", description="금일/전일 집계용 타임존. 미지정 시 Asia/Seoul 적용"),
+    timezone_param: Optional[str] = Query(None, alias="timezone", description="금일/전일·from/to·일/월/시간대 집계 타임존. 미지정 시 Asia/Seoul 적용"),
     db: Session = Depends(get_db),
     ctx: AdminContext = Depends(get_admin_context),
 ):
-    # 캠페인만 적용한 쿼리(금일/전일 집계용). from/to 는 일자별 추이·기타 집계에만 사용
-    q_campaign = db.query(Submission)
-    if not ctx.is_super and ctx.campaign_ids:
-        q_campaign = q_campaign.filter(Submission.campaign_id.in_(ctx.campaign_ids))
-    elif not ctx.is_super:
-        q_campaign = q_campaign.filter(Submission.campaign_id == -1)
-    if campaignId is not None:
-        q_campaign = q_campaign.filter(Submission.campaign_id == campaignId)
-
-    q = q_campaign
+    # 캠페인 범위만 적용한 집계(금일/전일)와 from/to 구간 집계(일자별 추이·기타)를 1회 집계로 계산
+    scope_campaign_ids: Optional[List[int]] = None
+    if not ctx.is_super:
+        scope_campaign_ids = list(ctx.campaign_ids or [])
+    # from/to·금일·전일·일/월/시간대 버킷 모두 요청 타임존 기준. 경계는 UTC로 변환해 created_at 범위 비교로만 필터
+    tz_str = (request.query_params.get("timezone") if request else None) or (timezone_param or "") or "Asia/Seoul"
+    try:
+        z = ZoneInfo(tz_str)
+    except Exception:
+        tz_str, z = "UTC", ZoneInfo("UTC")
+    range_start: Optional[datetime] = None
+    range_end: Optional[datetime] = None
+    range_end_inclusive = False
     if from_:
         try:
-            from_dt = dateutil_parser.parse(from_)
-            q = q.filter(Submission.created_at >= from_dt)
+            range_start = _local_to_utc_naive(dateutil_parser.parse(from_), z)
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid from")
     if to:
         try:
             to_dt = dateutil_parser.parse(to)
-            # 종료일 당일 전체 포함: "2026-03-12" → 2026-03-13 00:00:00 미만
-            if getattr(to_dt, "hour", 0) == 0 and getattr(to_dt, "minute", 0) == 0:
-                to_end = to_dt + timedelta(days=1)
-                q = q.filter(Submission.created_at < to_end)
-            else:
-                q = q.filter(Submission.created_at <= to_dt)
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid to")
-
-    base_q = q
-    tz_str = (request.query_params.get("timezone") if request else None) or (timezone_param or "") or "Asia/Seoul"
-    try:
-        z = ZoneInfo(tz_str)
-        now_local = datetime.now(z)
-        today_start_local = now_local.replace(hour=0, minute=0, second=0, microsecond=0)
-        yesterday_start_local = today_start_local - timedelta(days=1)
-        today_start = today_start_local.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
-        yesterday_start = yesterday_start_local.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
-    except Exception:
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        yesterday_start = today_start - timedelta(days=1)
+        # 종료일 당일 전체 포함: "2026-03-12" → 현지 2026-03-13 00:00:00 미만
+        if getattr(to_dt, "hour", 0) == 0 and getattr(to_dt, "minute", 0) == 0:
+            range_end = _local_to_utc_naive(to_dt + timedelta(days=1), z)
+        else:
+            range_end = _local_to_utc_naive(to_dt, z)
+            range_end_inclusive = True
+
+    now_local = datetime.now(z)
+    today_start_local = now_local.replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday_start_local = today_start_local - timedelta(days=1)
+    today_start = _local_to_utc_naive(today_start_local, z)
+    yesterday_start = _local_to_utc_naive(yesterday_start_local, z)
     # 금일/전일은 from·to 없이 캠페인만 적용해 집계 (FE가 from/to=최근7일 보낼 때도 금일 신규접수가 0이 되지 않도록)
-    today_count = q_campaign.filter(Submission.created_at >= today_start).count()
-    yesterday_count = q_campaign.filter(
-        Submission.created_at >= yesterday_start,
-        Submission.created_at < today_start,
-    ).count()
+    agg = query_dashboard_stats(
+        db,
+        scope_campaign_ids=scope_campaign_ids,
+        campaign_id=campaignId,
+        range_start=range_start,
+        range_end=range_end,
+        range_end_inclusive=range_end_inclusive,
+        today_start=today_start,
+        yesterday_start=yesterday_start,
+        tz=tz_str,
+    )
+    today_count = agg["today"]
+    yesterday_count = agg["yesterday"]
     # 검수 대기: FE 대시보드 "대기중"에 대응 (백엔드_요청사항_정리 §2.2, §2.3)
-    pending_count = base_q.filter(
-        Submission.status.in_(["MANUAL_REVIEW", "PENDING_VERIFICATION", "PENDING_NEW", "VERIFYING"])
-    ).count()
-    try:
-        approved_sum = (
-            base_q.filter(Submission.status == "FIT")
-            .with_entities(func.coalesce(func.sum(Submission.total_amount), 0))
-            .scalar()
-        ) or 0
-    except Exception:
-        approved_sum = 0
+    pending_count = agg["pending"]
+    approved_sum = agg["approved_sum"]
     by_category: Dict[str, int] = {"STAY": 0, "TOUR": 0}
-    for row in (
-        base_q.with_entities(Submission.project_type, func.count(Submission.submission_id))
-        .group_by(Submission.project_type)
-        .all()
-    ):
-        raw_key = (row[0] or "").strip().upper()
-        key = "STAY" if raw_key == "STAY" else "TOUR"
-        by_category[key] = by_category.get(key, 0) + row[1]
+    for raw, cnt in agg["by_category"].items():
+        key = "STAY" if (raw or "").strip().upper() == "STAY" else "TOUR"
+        by_category[key] = by_category.get(key, 0) + cnt
+    day_counts: Dict[str, int] = agg["day_counts"]
     daily: List[Dict[str, Any]] = []
-    try:
-        date_expr = func.date(Submission.created_at)
-        day_counts: Dict[str, int] = {}
-        for row in (
-            base_q.with_entities(date_expr.label("d"), func.count(Submission.submission_id))
-            .group_by(date_expr)
-            .order_by(date_expr.asc())
-            .all()
-        ):
-            d = row[0]
-            key = d.isoformat() if hasattr(d, "isoformat") else str(d)
-            if key:
-                day_counts[key[:10]] = row[1]
-        # 요청 구간(from~to)의 모든 일자를 포함해 0건인 날도 반환 (차트가 빈 날 표시 가능)
-        if from_ and to:
-            try:
-                start = dateutil_parser.parse(from_).date()
-                end = dateutil_parser.parse(to).date()
-                if start <= end:
-                    cur = start
-                    while cur <= end:
-                        key = cur.isoformat()
-                        daily.append({"date": key, "count": day_counts.get(key, 0)})
-                        cur = cur + timedelta(days=1)
-            except Exception:
-                for k, v in sorted(day_counts.items()):
-                    daily.append({"date": k, "count": v})
-        else:
-            for k, v in sorted(day_counts.items()):
-                daily.append({"date": k, "count": v})
-    except Exception:
-        pass
+    # 요청 구간(from~to)의 모든 일자를 포함해 0건인 날도 반환 (차트가 빈 날 표시 가능)
+    if from_ and to:
+        try:
+            start = dateutil_parser.parse(from_).date()
+            end = dateutil_parser.parse(to).date()
+            if start <= end:
+                cur = start
+                while cur <= end:
+                    key = cur.isoformat()
+                    daily.append({"date": key, "count": day_counts.get(key, 0)})
+                    cur = cur + timedelta(days=1)
+        except Exception:
+            daily = [{"date": k, "count": v} for k, v in sorted(day_counts.items())]
+    else:
+        daily = [{"date": k, "count": v} for k, v in sorted(day_counts.items())]
     # 월별 집계 (대시보드_강화_개발_지침 §2.1)
-    monthly: List[Dict[str, Any]] = []
-    try:
-        month_expr = func.date_trunc("month", Submission.created_at)
-        for row in (
-            base_q.with_entities(month_expr.label("m"), func.count(Submission.submission_id))
-            .group_by(month_expr)
-            .order_by(month_expr.asc())
-            .all()
-        ):
-            m = row[0]
-            if m:
-                key = m.strftime("%Y-%m") if hasattr(m, "strftime") else str(m)[:7]
-                monthly.append({"month": key, "count": row[1]})
-    except Exception:
-        pass
-    # 시간대별 집계 0~23 (대시보드_강화_개발_지침 §2.3)
-    hourly: List[Dict[str, Any]] = []
-    try:
-        hour_expr = func.extract("hour", Submission.created_at)
-        for row in (
-            base_q.with_entities(hour_expr.label("h"), func.count(Submission.submission_id))
-            .group_by(hour_expr)
-            .order_by(hour_expr.asc())
-            .all()
-        ):
-            h = int(row[0]) if row[0] is not None else 0
-            hourly.append({"hour": h, "count": row[1]})
-        # 0~23 모두 있도록 빈 시간대는 0으로 채움
-        hour_map = {x["hour"]: x["count"] for x in hourly}
-        hourly = [{"hour": h, "count": hour_map.get(h, 0)} for h in range(24)]
-    except Exception:
-        pass
-    by_status: Dict[str, int] = {}
-    try:
-        for row in (
-            base_q.with_entities(Submission.status, func.count(Submission.submission_id))
-            .group_by(Submission.status)
-            .all()
-        ):
-            key = (row[0] or "UNKNOWN").strip() or "UNKNOWN"
-            by_status[key] = row[1]
-    except Exception:
-        pass
+    monthly = [{"month": k, "count": v} for k, v in sorted(agg["month_counts"].items())]
+    # 시간대별 집계 0~23 (대시보드_강화_개발_지침 §2.3). 빈 시간대는 0
+    hourly = [{"hour": h, "count": agg["hour_counts"].get(h, 0)} for h in range(24)]
+    by_status: Dict[str, int] = agg["by_status"]
     min_stay, min_tour = _admin_min_amounts_from_config(db)
     last_agg = datetime.utcnow().isoformat() + "Z"
     return AdminDashboardStatsResponse(
@@ -4667,38 +5572,28 @@ async def admin_dashboard_breakdown(
     db: Session = Depends(get_db),
     ctx: AdminContext = Depends(get_admin_context),
 ):
-    q = db.query(Submission)
-    if not ctx.is_super and ctx.campaign_ids:
-        q = q.filter(Submission.campaign_id.in_(ctx.campaign_ids))
-    elif not ctx.is_super:
-        q = q.filter(Submission.campaign_id == -1)
-    if campaignId is not None:
-        q = q.filter(Submission.campaign_id == campaignId)
-    if projectId is not None:
-        q = q.filter(Submission.campaign_id == projectId)
-    total = q.count()
-    stay_total = q.filter(Submission.project_type == "STAY").count()
-    tour_total = q.filter(Submission.project_type == "TOUR").count()
-    stay_fit = q.filter(Submission.status == "FIT", Submission.project_type == "STAY").count()
-    tour_fit = q.filter(Submission.status == "FIT", Submission.project_type == "TOUR").count()
+    # 상태·업종별 건수 1회 집계(판정 완료 건은 롤업, 진행 중 건만 submissions)에서 합계 파생
+    scope_campaign_ids: Optional[List[int]] = None if ctx.is_super else list(ctx.campaign_ids or [])
+    total = stay_total = tour_total = stay_fit = tour_fit = 0
     by_status: Dict[str, Dict[str, int]] = {}
-    try:
-        for row in (
-            q.with_entities(Submission.status, Submission.project_type, func.count(Submission.submission_id))
-            .group_by(Submission.status, Submission.project_type)
-            .all()
-        ):
-            st = (row[0] or "UNKNOWN").strip() or "UNKNOWN"
-            pt = (row[1] or "").strip().upper() if row[1] else ""
-            if st not in by_status:
-                by_status[st] = {"stay": 0, "tour": 0}
-            cnt = row[2]
-            if pt == "STAY":
-                by_status[st]["stay"] = by_status[st].get("stay", 0) + cnt
-            else:
-                by_status[st]["tour"] = by_status[st].get("tour", 0) + cnt
-    except Exception:
-        pass
+    for status, project_type, cnt in query_status_breakdown(
+        db, scope_campaign_ids=scope_campaign_ids, campaign_ids=[campaignId, projectId]
+    ):
+        st = (status or "UNKNOWN").strip() or "UNKNOWN"
+        pt = (project_type or "").strip().upper()
+        total += cnt
+        if pt == "STAY":
+            stay_total += cnt
+            stay_fit += cnt if st == "FIT" else 0
+        elif pt == "TOUR":
+            tour_total += cnt
+            tour_fit += cnt if st == "FIT" else 0
+        if st not in by_status:
+            by_status[st] = {"stay": 0, "tour": 0}
+        if pt == "STAY":
+            by_status[st]["stay"] = by_status[st].get("stay", 0) + cnt
+        else:
+            by_status[st]["tour"] = by_status[st].get("tour", 0) + cnt
     return AdminDashboardBreakdownResponse(
         total=total,
         stayTotal=stay_total,
@@ -4813,49 +5708,43 @@ def _query_reject_reasons(
     to_val: Optional[str],
     row_limit: int,
 ) -> List[Tuple[str, int]]:
-    """반려 건을 fail_reason 기준 집계해 (reason_text, count) 목록 반환. stats/dashboard 공용."""
-    q = db.query(Submission).filter(
-        ~Submission.status.in_(["PENDING", "PROCESSING", "VERIFYING", "FIT"]),
-    )
-    if not ctx.is_super and ctx.campaign_ids:
-        q = q.filter(Submission.campaign_id.in_(ctx.campaign_ids))
-    elif not ctx.is_super:
-        q = q.filter(Submission.campaign_id == -1)
-    if campaign_id is not None:
-        q = q.filter(Submission.campaign_id == campaign_id)
+    """반려 건을 사유 코드 기준 집계(집계 롤업)해 (reason_code, count) 목록 반환. stats/dashboard 공용."""
+    range_start: Optional[datetime] = None
+    range_end: Optional[datetime] = None
+    range_end_inclusive = False
     if from_val:
         try:
-            q = q.filter(Submission.created_at >= dateutil_parser.parse(from_val))
+            range_start = dateutil_parser.parse(from_val)
         except Exception:
             pass
     if to_val:
         try:
             to_dt = dateutil_parser.parse(to_val)
             if getattr(to_dt, "hour", 0) == 0 and getattr(to_dt, "minute", 0) == 0:
-                q = q.filter(Submission.created_at < to_dt + timedelta(days=1))
+                range_end = to_dt + timedelta(days=1)
             else:
-                q = q.filter(Submission.created_at <= to_dt)
+                range_end = to_dt
+                range_end_inclusive = True
         except Exception:
             pass
-    reason_col = func.coalesce(Submission.fail_reason, Submission.global_fail_reason, "(기타)")
-    rows = (
-        q.with_entities(reason_col.label("reason"), func.count(Submission.submission_id))
-        .group_by(reason_col)
-        .order_by(func.count(Submission.submission_id).desc())
-        .limit(row_limit)
-        .all()
+    return query_reject_reason_counts(
+        db,
+        scope_campaign_ids=None if ctx.is_super else list(ctx.campaign_ids or []),
+        campaign_id=campaign_id,
+        range_start=range_start,
+        range_end=range_end,
+        range_end_inclusive=range_end_inclusive,
+        limit=row_limit,
     )
-    return [((r[0] or "(기타)").strip(), r[1]) for r in rows]
 
 
 def _reject_reasons_to_stat_response(
     rows: List[Tuple[str, int]], limit: int
 ) -> AdminRejectReasonStatResponse:
-    """(reason_text, count) 목록을 reason_code·reason_label로 묶어 Stat 응답으로 변환."""
+    """(reason_code, count) 목록을 reason_code·reason_label Stat 응답으로 변환."""
     code_agg: Dict[Tuple[str, str], int] = {}
-    for raw, cnt in rows:
-        code, label = _reason_text_to_code_label(raw)
-        key = (code, label)
+    for code, cnt in rows:
+        key = (code, _reject_reason_label(code))
         code_agg[key] = code_agg.get(key, 0) + cnt
     sorted_items = sorted(code_agg.items(), key=lambda x: -x[1])[:limit]
     items = [
@@ -4880,7 +5769,7 @@ async def admin_stats_reject_reasons(
     db: Session = Depends(get_db),
     ctx: AdminContext = Depends(get_admin_context),
 ):
-    """반려 건을 fail_reason 기준 집계 후 reason_code·reason_label로 매핑해 반환."""
+    """반려 건을 reason_code 기준 집계(롤업) 후 reason_label을 붙여 반환."""
     rows = _query_reject_reasons(db, ctx, campaignId, from_, to, limit * 3)
     return _reject_reasons_to_stat_response(rows, limit)
 
@@ -4888,7 +5777,7 @@ async def admin_stats_reject_reasons(
 @app.get(
     "/api/v1/admin/dashboard/reject-reasons",
     summary="반려 사유별 건수(대시보드 Top N용). format=stat 이면 stats/reject-reasons와 동일 형식.",
-    description="fail_reason/global_fail_reason 기준 집계. campaignId, from, to, limit. format=stat 시 reason_code·reason_label·count 반환(404 폴백용).",
+    description="fail_reason/global_fail_reason의 표준 사유 코드 기준 집계(reason=한글 라벨). campaignId, from, to, limit. format=stat 시 reason_code·reason_label·count 반환(404 폴백용).",
     tags=["Admin - Submissions"],
 )
 @app.get(
@@ -4909,7 +5798,7 @@ async def admin_dashboard_reject_reasons(
         rows = _query_reject_reasons(db, ctx, campaignId, from_, to, limit * 3)
         return _reject_reasons_to_stat_response(rows, limit)
     rows = _query_reject_reasons(db, ctx, campaignId, from_, to, limit)
-    return [AdminRejectReasonItem(reason=r, count=c) for r, c in rows]
+    return [AdminRejectReasonItem(reason=_reject_reason_label(code), count=c) for code, c in rows]
 
 
 class AdminSubmissionDetailResponse(BaseModel):
@@ -4978,7 +5867,7 @@ async def admin_get_submission(
         .all()
     )
     status_payload = _build_status_payload_admin(submission, item_rows)
-    cfg = _get_judgment_rule_config(db)
+    cfg = _get_judgment_rules(db)
     policy = _normalize_unknown_store_policy(cfg.unknown_store_policy)
     cb_policy = _normalize_override_callback_policy(getattr(cfg, "override_callback_policy", None))
     judgment_rule = {
@@ -5019,20 +5908,75 @@ def _presigned_response_content_type(image_key: str) -> str:
     return "image/jpeg"  # 기본값: 확장자 없거나 기타일 때도 타입 지정으로 ORB 감소
 
 
+# 목록 썸네일 presigned URL 재사용: 서명 후 유효 시간의 이 비율까지는 같은 URL 반환(남은 유효 시간 ≥ 나머지). 0이면 캐시 안 함
+PRESIGNED_URL_CACHE_REUSE_RATIO = max(0.0, min(0.9, float(os.getenv("PRESIGNED_URL_CACHE_REUSE_RATIO", "0.8"))))
+PRESIGNED_URL_CACHE_MAX_ENTRIES = max(100, min(1000000, int(os.getenv("PRESIGNED_URL_CACHE_MAX_ENTRIES", "50000"))))
+
+
+class _PresignedUrlCache:
+    """
+    기본 유효 시간(PRESIGNED_URL_EXPIRES_SEC) GET presigned URL의 프로세스 공용 LRU 캐시.
+    SigV4 서명(HMAC)을 목록 행마다 반복하지 않기 위함. 캐시된 URL은 유효 시간의 (1 - REUSE_RATIO) 이상 남은 상태로만 반환.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, url: str, reuse_sec: float) -> None:
+        with self._lock:
+            self._entries[key] = (url, time.monotonic() + reuse_sec)
+            self._entries.move_to_end(key)
+            while len(self._entries) > PRESIGNED_URL_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_presigned_url_cache = _PresignedUrlCache()
+
+
 def _presigned_get_url_for_key(image_key: str, expires_sec: Optional[int] = None) -> Optional[str]:
-    """이미지 키에 대한 GET용 presigned URL 생성. 목록 썸네일 등에 사용. §7.1: ResponseContentType 지정으로 ORB 감소."""
+    """
+    이미지 키에 대한 GET용 presigned URL 생성. 목록 썸네일 등에 사용. §7.1: ResponseContentType 지정으로 ORB 감소.
+    기본 유효 시간 요청은 _presigned_url_cache에서 재사용(재서명 생략).
+    """
     key = (image_key or "").strip()
     if not key:
         return None
+    expires = expires_sec or PRESIGNED_URL_EXPIRES_SEC
+    cacheable = PRESIGNED_URL_CACHE_REUSE_RATIO > 0 and expires == PRESIGNED_URL_EXPIRES_SEC
+    if cacheable:
+        cached = _presigned_url_cache.get(key)
+        if cached:
+            return cached
     try:
         params = {"Bucket": S3_BUCKET, "Key": key, "ResponseContentType": _presigned_response_content_type(key)}
-        return s3_client.generate_presigned_url(
+        url = s3_client.generate_presigned_url(
             "get_object",
             Params=params,
-            ExpiresIn=expires_sec or PRESIGNED_URL_EXPIRES_SEC,
+            ExpiresIn=expires,
         )
     except Exception:
         return None
+    if cacheable and url:
+        _presigned_url_cache.put(key, url, expires * PRESIGNED_URL_CACHE_REUSE_RATIO)
+    return url
 
 
 class AdminReceiptImageItem(BaseModel):
@@ -5041,6 +5985,7 @@ class AdminReceiptImageItem(BaseModel):
     image_key: str
     image_url: str
     image_proxy_url: Optional[str] = Field(None, description="§7.1 ORB 회피: 같은 오리진 프록시 URL. 있으면 <img src>에 이 URL 사용 권장.")
+    thumbnail_proxy_url: Optional[str] = Field(None, description="썸네일(장축 THUMBNAIL_MAX_SIDE px) 프록시 URL. 목록·미리보기용")
 
 
 class AdminReceiptImagesResponse(BaseModel):
@@ -5059,6 +6004,8 @@ class AdminReceiptImagesResponse(BaseModel):
 async def admin_receipt_image_bytes(
     receiptId: str,
     itemId: str,
+    request: Request,
+    size: Literal["full", "thumb"] = Query("full", description="full: 원본 | thumb: 썸네일(장축 THUMBNAIL_MAX_SIDE px, 없으면 생성 후 저장)"),
     db: Session = Depends(get_db),
     ctx: AdminContext = Depends(get_admin_context),
 ):
@@ -5075,18 +6022,159 @@ async def admin_receipt_image_bytes(
     )
     if not item or not (item.image_key or "").strip():
         raise HTTPException(status_code=404, detail="Image not found")
+    image_key = (item.image_key or "").strip()
+    object_key = image_key
+    if size == "thumb":
+        if not item.thumbnail_key:
+            return await _lazy_thumbnail_response(db, item, request)
+        object_key = item.thumbnail_key
+    try:
+        return await _stream_s3_object(object_key, request, fallback_content_type=_presigned_response_content_type(image_key))
+    except ClientError as e:
+        if size == "thumb" and _s3_error_code(e) in ("NoSuchKey", "404"):
+            return await _lazy_thumbnail_response(db, item, request)
+        logger.warning("admin_receipt_image_bytes S3 read failed receiptId=%s itemId=%s: %s", rid, itemId, e)
+        raise HTTPException(status_code=502, detail="Failed to load image from storage")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning("admin_receipt_image_bytes S3 read failed receiptId=%s itemId=%s: %s", rid, itemId, e)
+        raise HTTPException(status_code=502, detail="Failed to load image from storage")
+
+
+_image_proxy_semaphore = asyncio.Semaphore(IMAGE_PROXY_MAX_CONCURRENCY)
+
+
+def _s3_error_code(e: ClientError) -> str:
+    return str((e.response.get("Error", {}) or {}).get("Code") or "")
+
+
+def _image_proxy_headers(etag: Optional[str]) -> Dict[str, str]:
+    """이미지 프록시 공통 헤더. 같은 키의 객체는 덮어쓰지 않으므로 ETag 기준 브라우저 캐시 재검증(304)."""
+    headers = {
+        "X-Content-Type-Options": "nosniff",
+        "Cache-Control": f"private, max-age={IMAGE_PROXY_CACHE_MAX_AGE_SEC}",
+        "Accept-Ranges": "bytes",
+    }
+    if etag:
+        headers["ETag"] = etag
+    return headers
+
+
+async def _stream_s3_object(object_key: str, request: Request, fallback_content_type: str) -> Response:
+    """
+    MinIO 객체를 청크 단위로 스트리밍(요청당 메모리 IMAGE_PROXY_CHUNK_BYTES 수준). boto3 호출·읽기는 I/O 스레드 풀에서.
+    If-None-Match·Range는 get_object 조건부 요청으로 전달: 일치 시 304, 범위 요청 시 206(Content-Range), 범위 오류 시 416.
+    동시 전송은 프로세스당 IMAGE_PROXY_MAX_CONCURRENCY로 제한, 슬롯 대기 IMAGE_PROXY_ACQUIRE_TIMEOUT_SEC 초과 시 503.
+    """
+    try:
+        await asyncio.wait_for(_image_proxy_semaphore.acquire(), timeout=IMAGE_PROXY_ACQUIRE_TIMEOUT_SEC)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Too many concurrent image transfers", headers={"Retry-After": "1"})
+    released = False
+    handed_off = False
+
+    def _release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            _image_proxy_semaphore.release()
+
+    async def _release_async() -> None:
+        # 동기 함수면 BackgroundTask가 스레드 풀에서 실행하므로 이벤트 루프에서 해제되도록 async로 둠
+        _release()
+
     try:
-        body, content_type = _get_image_bytes_from_s3((item.image_key or "").strip())
+        params: Dict[str, Any] = {"Bucket": S3_BUCKET, "Key": object_key}
+        if_none_match = (request.headers.get("if-none-match") or "").strip()
+        range_header = (request.headers.get("range") or "").strip()
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
+        if range_header.startswith("bytes="):
+            params["Range"] = range_header
+        try:
+            resp = await _run_io(s3_client.get_object, **params)
+        except ClientError as e:
+            code = _s3_error_code(e)
+            if code in ("304", "NotModified"):
+                etag = (e.response.get("ResponseMetadata", {}).get("HTTPHeaders", {}) or {}).get("etag") or if_none_match
+                return Response(status_code=304, headers=_image_proxy_headers(etag))
+            if code in ("InvalidRange", "416"):
+                return Response(status_code=416, headers={"Content-Range": "bytes */*"})
+            raise
+        body = resp["Body"]
+        content_type = (resp.get("ContentType") or "").lower()
         if not content_type or content_type == "application/octet-stream":
-            content_type = _presigned_response_content_type(item.image_key or "")
-        return Response(
-            content=body,
-            media_type=content_type,
-            headers={"X-Content-Type-Options": "nosniff"},
+            content_type = fallback_content_type
+        headers = _image_proxy_headers(resp.get("ETag"))
+        if resp.get("ContentLength") is not None:
+            headers["Content-Length"] = str(resp["ContentLength"])
+        status_code = 200
+        if resp.get("ContentRange"):
+            headers["Content-Range"] = resp["ContentRange"]
+            status_code = 206
+
+        async def _chunks():
+            try:
+                while True:
+                    chunk = await _run_io(body.read, IMAGE_PROXY_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                body.close()
+                _release()
+
+        # 슬롯 해제는 스트림 종료(_chunks finally) 또는 응답 후 백그라운드(스트림 시작 전 연결 종료 대비) 중 먼저 실행되는 쪽
+        response = StreamingResponse(
+            _chunks(), status_code=status_code, media_type=content_type, headers=headers,
+            background=BackgroundTask(_release_async),
         )
+        handed_off = True
+        return response
+    finally:
+        if not handed_off:
+            _release()
+
+
+async def _lazy_thumbnail_response(db: Session, item: ReceiptItem, request: Request) -> Response:
+    """썸네일 없음 → 원본으로 생성·저장 후 반환(수십 KB라 메모리 응답). If-None-Match 일치 시 304."""
+    try:
+        body, content_type, etag = await _load_item_thumbnail(db, item)
     except Exception as e:
-        logger.warning("admin_receipt_image_bytes S3 read failed receiptId=%s itemId=%s: %s", rid, itemId, e)
+        logger.warning("thumbnail load failed itemId=%s: %s", item.item_id, e)
         raise HTTPException(status_code=502, detail="Failed to load image from storage")
+    headers = _image_proxy_headers(etag)
+    if_none_match = request.headers.get("if-none-match") or ""
+    if etag and etag in [t.strip().removeprefix("W/") for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=content_type, headers=headers)
+
+
+async def _load_item_thumbnail(db: Session, item: ReceiptItem) -> Tuple[bytes, str, str]:
+    """
+    장 썸네일 읽기. 썸네일 키가 없거나 객체가 없으면(분석 전·도입 전 업로드분) 원본으로 생성·업로드 후 thumbnail_key 기록.
+    반환: (bytes, content_type, etag). 생성 실패 시 원본 반환.
+    """
+    if item.thumbnail_key:
+        try:
+            return await _run_io(_get_image_object_from_s3, item.thumbnail_key)
+        except ClientError as e:
+            if _s3_error_code(e) not in ("NoSuchKey", "404"):
+                raise
+    image_key = (item.image_key or "").strip()
+    body, content_type, etag = await _run_io(_get_image_object_from_s3, image_key)
+    thumb = await _run_image(thumbnail_from_bytes, body)
+    if not thumb:
+        return body, content_type, etag
+    if THUMBNAIL_ENABLED:
+        try:
+            item.thumbnail_key = await _run_io(_put_thumbnail_to_s3, image_key, thumb[0], thumb[1])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("thumbnail lazy upload failed itemId=%s: %s", item.item_id, e)
+    return thumb[0], thumb[1], '"%s"' % hashlib.md5(thumb[0]).hexdigest()
 
 
 @app.get(
@@ -5138,11 +6226,202 @@ async def admin_get_receipt_images(
                 image_key=key,
                 image_url=url,
                 image_proxy_url=proxy_path,
+                thumbnail_proxy_url=f"{proxy_path}?size=thumb",
             )
         )
     return AdminReceiptImagesResponse(receiptId=rid, expiresIn=PRESIGNED_URL_EXPIRES_SEC, items=items)
 
 
+_EVIDENCE_EXPORT_BATCH = 100
+
+
+def _load_evidence_batch(submission_ids: List[str]) -> List[Dict[str, Any]]:
+    """증빙 팩용 신청·장 스냅샷(I/O 스레드 풀에서 실행, 자체 세션). 입력 순서 유지."""
+    db = SessionLocal()
+    try:
+        subs = {s.submission_id: s for s in db.query(Submission).filter(Submission.submission_id.in_(submission_ids)).all()}
+        items_by_sub: Dict[str, List[ReceiptItem]] = {}
+        for it in (
+            db.query(ReceiptItem)
+            .filter(ReceiptItem.submission_id.in_(submission_ids))
+            .order_by(ReceiptItem.submission_id, ReceiptItem.seq_no.asc())
+            .all()
+        ):
+            items_by_sub.setdefault(it.submission_id, []).append(it)
+        out: List[Dict[str, Any]] = []
+        for sid in submission_ids:
+            sub = subs.get(sid)
+            if sub is None:
+                continue
+            out.append(
+                {
+                    "submission": {
+                        "receiptId": sub.submission_id,
+                        "userUuid": sub.user_uuid,
+                        "projectType": sub.project_type,
+                        "campaignId": sub.campaign_id,
+                        "status": sub.status,
+                        "totalAmount": sub.total_amount,
+                        "failReason": sub.fail_reason,
+                        "globalFailReason": sub.global_fail_reason,
+                        "auditTrail": sub.audit_trail,
+                        "userInputSnapshot": sub.user_input_snapshot,
+                        "sidecar": sub.submission_sidecar,
+                        "createdAt": sub.created_at,
+                        "updatedAt": sub.updated_at,
+                    },
+                    "items": [
+                        {
+                            "itemId": it.item_id,
+                            "seqNo": it.seq_no,
+                            "docType": it.doc_type,
+                            "imageKey": (it.image_key or "").strip(),
+                            "status": it.status,
+                            "errorCode": it.error_code,
+                            "errorMessage": it.error_message,
+                            "confidenceScore": it.confidence_score,
+                            "parsed": it.parsed,
+                            "ocrRaw": it.ocr_raw,
+                        }
+                        for it in items_by_sub.get(sid, [])
+                    ],
+                }
+            )
+        return out
+    finally:
+        db.close()
+
+
+def _evidence_image_name(item: Dict[str, Any]) -> str:
+    key = item["imageKey"]
+    ext = os.path.splitext(key)[1].lower()
+    if not ext or len(ext) > 6:
+        ext = ".jpg"
+    return f"{int(item['seqNo'] or 0):02d}_{item['itemId']}{ext}"
+
+
+async def _evidence_zip_stream(submission_ids: List[str], manifest_meta: Dict[str, Any]):
+    """
+    증빙 팩 ZIP 청크 생성기. 신청 _EVIDENCE_EXPORT_BATCH건씩 DB 조회, 원본 이미지는 EVIDENCE_EXPORT_FETCH_CONCURRENCY개까지 미리 조회하며 순서대로 기록.
+    구성: {receiptId}/submission.json(상태·사유·사용자 입력·sidecar), {receiptId}/{순번}_{itemId}.{ext}(원본), {receiptId}/{순번}_{itemId}.ocr.json(ocr_raw·parsed),
+    manifest.json(조건·건수·이미지 조회 실패 목록).
+    """
+    writer = EvidenceZipWriter()
+    errors: List[Dict[str, str]] = []
+    image_count = 0
+    pending: List[Tuple[str, str, "asyncio.Future"]] = []
+
+    async def _write_next() -> bytes:
+        nonlocal image_count
+        path, key, fut = pending.pop(0)
+        try:
+            body, _ = await fut
+        except Exception as e:
+            errors.append({"path": path, "imageKey": key, "error": str(e)[:200]})
+            return b""
+        writer.add_bytes(path, body)
+        image_count += 1
+        return writer.drain()
+
+    try:
+        for i in range(0, len(submission_ids), _EVIDENCE_EXPORT_BATCH):
+            batch = await _run_io(_load_evidence_batch, submission_ids[i:i + _EVIDENCE_EXPORT_BATCH])
+            for entry in batch:
+                rid = entry["submission"]["receiptId"]
+                writer.add_json(f"{rid}/submission.json", entry["submission"])
+                for it in entry["items"]:
+                    name = _evidence_image_name(it)
+                    writer.add_json(f"{rid}/{os.path.splitext(name)[0]}.ocr.json", it)
+                    if not it["imageKey"]:
+                        continue
+                    if len(pending) >= EVIDENCE_EXPORT_FETCH_CONCURRENCY:
+                        chunk = await _write_next()
+                        if chunk:
+                            yield chunk
+                    pending.append(
+                        (f"{rid}/{name}", it["imageKey"], asyncio.ensure_future(_run_io(_get_image_bytes_from_s3, it["imageKey"])))
+                    )
+                chunk = writer.drain()
+                if chunk:
+                    yield chunk
+        while pending:
+            chunk = await _write_next()
+            if chunk:
+                yield chunk
+        writer.add_json(
+            "manifest.json",
+            {**manifest_meta, "submissionCount": len(submission_ids), "imageCount": image_count, "imageErrors": errors},
+        )
+        yield writer.close()
+    finally:
+        # 클라이언트 연결 종료 등으로 중단 시 남은 조회 취소
+        for _, _, fut in pending:
+            fut.cancel()
+
+
+@app.get(
+    "/api/v1/admin/submissions/export/evidence",
+    response_class=StreamingResponse,
+    summary="증빙 팩 ZIP 내보내기(관리자)",
+    description=(
+        "신청 목록(GET /api/v1/admin/submissions)과 같은 조건(from/to, status·statusStage, campaignId, dateField, regionCode 등)의 신청별 원본 이미지, "
+        "OCR 원문(ocr_raw)·파싱 결과(parsed), 신청 상태·sidecar를 ZIP으로 스트리밍(임시 파일 없음). "
+        "최대 EVIDENCE_EXPORT_MAX_SUBMISSIONS건(기본 200000, 0이면 무제한), 초과 시 400. 내보내기 1회당 감사 로그(EVIDENCE_EXPORT) 1건."
+    ),
+    tags=["Admin - Submissions"],
+)
+async def admin_export_evidence(
+    request: Request,
+    status: Optional[str] = Query(None, description="MANUAL_REVIEW, FIT, UNFIT 등 (목록과 동일)"),
+    userUuid: Optional[str] = None,
+    receiptId: Optional[str] = None,
+    dateFrom: Optional[str] = Query(None, description="기간 시작 YYYY-MM-DD (from 과 동일)"),
+    dateTo: Optional[str] = Query(None, description="기간 끝 YYYY-MM-DD (to 와 동일)"),
+    campaignId: Optional[str] = Query(None, description="캠페인 ID로 필터. 기관·검수자: 자신의 캠페인만"),
+    regionCode: Optional[str] = Query(None, description="시군구 코드(첫 장 address/location)"),
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    from_val, to_val, status_val, date_field, cid = _parse_admin_submission_filters(request, status, dateFrom, dateTo, campaignId)
+    q = _admin_submissions_filtered_query(
+        db, ctx, status_val=status_val, receipt_id=receiptId, user_uuid=userUuid, cid=cid,
+        from_val=from_val, to_val=to_val, date_field=date_field, region_code=regionCode,
+    )
+    id_q = q.with_entities(Submission.submission_id).order_by(date_field.desc(), Submission.submission_id.desc())
+    if EVIDENCE_EXPORT_MAX_SUBMISSIONS:
+        id_q = id_q.limit(EVIDENCE_EXPORT_MAX_SUBMISSIONS + 1)
+    submission_ids = [r[0] for r in id_q.all()]
+    if EVIDENCE_EXPORT_MAX_SUBMISSIONS and len(submission_ids) > EVIDENCE_EXPORT_MAX_SUBMISSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many submissions for one export (max {EVIDENCE_EXPORT_MAX_SUBMISSIONS}). Narrow the filters.",
+        )
+    filters = {
+        "from": from_val, "to": to_val, "status": status_val or None, "campaignId": cid,
+        "dateField": "updated_at" if date_field is Submission.updated_at else "created_at",
+        "regionCode": regionCode, "userUuid": userUuid, "receiptId": receiptId,
+    }
+    exported_at = datetime.utcnow()
+    _audit_log(
+        db,
+        actor=ctx.actor,
+        action="EVIDENCE_EXPORT",
+        target_type="submission",
+        target_id=f"{len(submission_ids)} submissions",
+        meta={"client_ip": _admin_client_ip(request), "filters": filters, "count": len(submission_ids)},
+    )
+    db.commit()
+    filename = f"evidence_{exported_at.strftime('%Y%m%d_%H%M%S')}.zip"
+    return StreamingResponse(
+        _evidence_zip_stream(
+            submission_ids,
+            {"exportedAt": exported_at.isoformat() + "Z", "exportedBy": ctx.actor, "filters": filters},
+        ),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Content-Type-Options": "nosniff"},
+    )
+
+
 class AdminReceiptTagRequest(BaseModel):
     tag: str = Field(..., description="excellent_sample(AI 학습용 우수 사례) | suspected_fraud(부정수급 의심 사례) 등")
 
@@ -5445,6 +6724,8 @@ def _admin_submission_correction_impl(
         sub.updated_at = at
         if first_item and after.get("address") is not None:
             first_item.address = after["address"]
+    # 금액·첫 장 주소(시도·시군구) 변경을 집계 롤업에 반영(sidecar 저장 실패로 재적용한 경우 포함)
+    _sync_submission_stats(db, [rid])
 
     try:
         db.commit()
@@ -5535,6 +6816,9 @@ async def admin_override_submission(
     combined = (existing + " | " + override_line).strip(" |") if existing else override_line
     submission.audit_trail = _truncate_submission_audit(combined)
     submission.audit_log = submission.audit_trail
+    sidecar = dict(submission.submission_sidecar) if getattr(submission, "submission_sidecar", None) else {}
+    sidecar["manual_decision"] = _manual_decision_marker("OVERRIDE", ctx.actor, submission.updated_at)
+    submission.submission_sidecar = sidecar
     if body.override_reward_amount is not None:
         # rewardAmount는 응답 계산 로직이 있으므로, 필요 시 별도 컬럼 도입이 더 안전함.
         pass
@@ -5545,9 +6829,10 @@ async def admin_override_submission(
         if new_status == "FIT":
             it.error_code = None
             it.error_message = None
+    _sync_submission_stats(db, [rid])
     db.commit()
     db.refresh(submission)
-    rule_cfg = _get_judgment_rule_config(db)
+    rule_cfg = _get_judgment_rules(db)
     cb_policy = _normalize_override_callback_policy(getattr(rule_cfg, "override_callback_policy", None))
     # 자동전송(AUTO): override 시 항상 콜백. 수동전송(MANUAL): resend_callback:true일 때만.
     should_send_callback = (cb_policy == "AUTO") or bool(body.resend_callback)
@@ -5633,7 +6918,7 @@ async def admin_reprocess_submission(
     if not item_rows:
         raise HTTPException(status_code=400, detail="No receipt items to reprocess")
     prev_status = submission.status or ""
-    rule_cfg = _get_judgment_rule_config(db)
+    rule_cfg = _get_judgment_rules(db)
     min_criteria = int(rule_cfg.min_amount_stay or 60000) if submission.project_type == "STAY" else int(rule_cfg.min_amount_tour or 50000)
     total_amount = sum(it.amount or 0 for it in item_rows if it.status == "FIT")
     total_all_amounts = sum(it.amount or 0 for it in item_rows)
@@ -5663,6 +6948,7 @@ async def admin_reprocess_submission(
     existing = submission.audit_trail or submission.audit_log or ""
     submission.audit_trail = _truncate_submission_audit((existing + " | " + reprocess_line).strip(" |"))
     submission.audit_log = submission.audit_trail
+    _sync_submission_stats(db, [rid])
     db.commit()
     db.refresh(submission)
     new_status = submission.status or ""
@@ -5693,1600 +6979,3829 @@ async def admin_reprocess_submission(
         callback_sent=callback_sent,
     )
 
+# 일괄 재처리 작업(reprocess_jobs): 조건에 맞는 신청을 청크로 읽어 저장된 parsed·ocr_raw로 장별 판정을 다시 적용(OCR 미호출)
+_REPROCESS_SUBMISSION_COLUMNS = (
+    "submission_id", "user_uuid", "project_type", "campaign_id", "status", "total_amount",
+    "global_fail_reason", "fail_reason", "audit_trail", "audit_log", "user_input_snapshot", "updated_at",
+)
+_REPROCESS_ITEM_COLUMNS = (
+    "item_id", "submission_id", "seq_no", "doc_type", "image_key", "store_name", "biz_num", "pay_date", "amount",
+    "address", "location", "card_num", "status", "error_code", "error_message", "confidence_score", "ocr_raw",
+    "parsed", "thumbnail_key",
+)
+# 판정으로 바뀔 수 있는 컬럼(변경 비교·일괄 UPDATE 대상)
+_REPROCESS_SUBMISSION_FIELDS = ("status", "total_amount", "global_fail_reason", "fail_reason", "campaign_id")
+_REPROCESS_ITEM_FIELDS = (
+    "doc_type", "store_name", "biz_num", "pay_date", "amount", "address", "location", "card_num",
+    "status", "error_code", "error_message", "confidence_score", "parsed",
+)
+_reprocess_tasks: Set["asyncio.Task[None]"] = set()
 
-class AdminCallbackResendRequest(BaseModel):
-    target_url: Optional[str] = None
 
+def _reprocess_job_where(filters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    작업 조건 → submissions(s) WHERE 절·파라미터. 분석 진행 중 상태는 항상 제외.
+    includeManual이 아니면 관리자 수동 판정 건 제외(재판정 시 override·일괄 반려·교정 금액/주소가 되돌아가고 콜백 나감):
+    sidecar manual_decision·human_correction, 또는 표식 도입 전 건은 audit_trail의 OVERRIDE(/BULK_REJECT( 기록.
+    """
+    conds = ["s.status <> ALL(:in_flight)"]
+    params: Dict[str, Any] = {"in_flight": list(IN_FLIGHT_STATUSES)}
+    if not filters.get("includeManual"):
+        conds.append(
+            "NOT (COALESCE(s.submission_sidecar, '{}'::jsonb) ?| ARRAY['manual_decision', 'human_correction'])"
+        )
+        conds.append("strpos(COALESCE(s.audit_trail, s.audit_log, ''), 'OVERRIDE(') = 0")
+        conds.append("strpos(COALESCE(s.audit_trail, s.audit_log, ''), 'BULK_REJECT(') = 0")
+    if filters.get("campaignScope"):
+        conds.append("s.campaign_id = ANY(:scope)")
+        params["scope"] = [int(c) for c in filters["campaignScope"]]
+    if filters.get("campaignId") is not None:
+        conds.append("s.campaign_id = :cid")
+        params["cid"] = int(filters["campaignId"])
+    if filters.get("statuses"):
+        conds.append("s.status = ANY(:statuses)")
+        params["statuses"] = list(filters["statuses"])
+    if filters.get("createdFrom"):
+        conds.append("s.created_at >= :created_from")
+        params["created_from"] = datetime.fromisoformat(filters["createdFrom"])
+    if filters.get("createdBefore"):
+        conds.append("s.created_at < :created_before")
+        params["created_before"] = datetime.fromisoformat(filters["createdBefore"])
+    return " AND ".join(conds), params
+
+
+def _reprocess_user_data(project_type: str, snapshot: Any) -> Optional[Union[StayData, TourData, DataWithItems]]:
+    """user_input_snapshot → Complete 시와 같은 data 모델(CompleteRequest 검증 규칙과 동일 분기). 복원 불가면 None."""
+    if not isinstance(snapshot, dict):
+        return None
+    try:
+        if isinstance(snapshot.get("items"), list):
+            return DataWithItems.model_validate(snapshot)
+        if project_type == "STAY":
+            return StayData.model_validate(snapshot)
+        if project_type == "TOUR":
+            return TourData.model_validate(snapshot)
+    except Exception:
+        return None
+    return None
 
-class AdminCallbackResendResponse(BaseModel):
-    receiptId: str
-    sent: bool
 
+def _reprocess_assets(item_rows: List[Any], near_by_key: Dict[Tuple[str, str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """저장된 장 → _judge_ocr_results의 ocr_assets와 같은 형태. OCR 실패로 저장된 장(parsed·ocr_raw 없음)은 ERROR_OCR."""
+    assets: List[Dict[str, Any]] = []
+    for it in item_rows:
+        parsed = dict(it.parsed) if isinstance(it.parsed, dict) else {}
+        failed = not parsed and it.ocr_raw is None
+        assets.append(
+            {
+                "imageKey": it.image_key or "",
+                "docType": it.doc_type or "RECEIPT",
+                "parsed": parsed,
+                "ocrRaw": it.ocr_raw,
+                "status": "ERROR_OCR" if failed else "PENDING",
+                "error_code": "OCR_001" if failed else None,
+                "imageNearDuplicates": near_by_key.get((it.submission_id, it.image_key or ""), []),
+            }
+        )
+    return assets
 
-@app.post(
-    "/api/v1/admin/submissions/{receiptId}/callback/resend",
-    response_model=AdminCallbackResendResponse,
-    responses={404: {"description": "Submission not found"}},
-    summary="콜백 재전송(관리자)",
-    description="OCR 결과를 지정 URL(또는 환경변수 OCR_RESULT_CALLBACK_URL)로 재전송. 관리자 검수 완료 후 FE에 결과를 다시 보낼 때 사용.",
-    tags=["Admin - Callback"],
-)
-async def admin_resend_callback(
-    receiptId: str,
-    body: AdminCallbackResendRequest,
-    db: Session = Depends(get_db),
-    actor: str = Depends(require_admin),
-):
-    rid = _sanitize_receipt_id(receiptId)
-    submission = db.query(Submission).filter(Submission.submission_id == rid).first()
-    if not submission:
-        raise HTTPException(status_code=404, detail="Submission not found")
-    item_rows = (
-        db.query(ReceiptItem)
-        .filter(ReceiptItem.submission_id == rid)
-        .order_by(ReceiptItem.seq_no.asc())
-        .all()
-    )
-    payload = _build_status_payload(submission, item_rows)
-    await _send_result_callback(rid, payload, target_url=body.target_url, purpose="resend", actor=actor)
-    _audit_log(
-        db,
-        actor=actor,
-        action="CALLBACK_RESEND",
-        target_type="submission",
-        target_id=rid,
-        meta={"target_url": body.target_url},
-    )
+
+def _reprocess_near_duplicates(db: Session, submission_ids: List[str]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """유사 이미지 재조회(IMAGE_DEDUP_REVIEW=1일 때만 판정에 쓰임). 저장된 dHash로 인메모리 BK-tree 검색, 실패 시 빈 결과."""
+    if not (IMAGE_DEDUP_ENABLED and IMAGE_DEDUP_REVIEW) or not submission_ids:
+        return {}
+    out: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
     try:
-        sidecar = dict(submission.submission_sidecar) if getattr(submission, "submission_sidecar", None) else {}
-        sidecar["callback_sent"] = True
-        sidecar["callback_sent_at"] = datetime.utcnow().isoformat() + "Z"
-        submission.submission_sidecar = sidecar
-    except Exception:
-        pass
+        with db.begin_nested():
+            rows = db.execute(
+                sql_text("SELECT submission_id, image_key, dhash FROM receipt_image_hashes WHERE submission_id = ANY(:ids)"),
+                {"ids": submission_ids},
+            ).fetchall()
+            for sid, image_key, dhash in rows:
+                near = find_near_duplicate_images(db, int(dhash), sid, IMAGE_DEDUP_MAX_DISTANCE)
+                if near:
+                    out[(sid, image_key)] = near
+    except Exception as e:
+        logger.warning("reprocess near-duplicate lookup failed: %s", e)
+        return {}
+    return out
+
+
+def _reprocess_job_chunk(db: Session, job_id: int, worker_id: str) -> Dict[str, Any]:
+    """
+    작업 1청크: 신청·장을 컬럼 조회 각 1회(ORM 미사용)로 읽어 경량 행으로 판정 엔진 일괄 모드 적용
+    (상점 매칭·중복 키는 청크 전체를 한 번에 사전 조회, Gemini 미호출·신규 후보 재등록 없음), 바뀐 행만 일괄 UPDATE.
+    롤업 반영·상태 전환 콜백 적재·진행 상황 갱신까지 같은 트랜잭션으로 commit.
+    반환: {"stop": 작업 종료 여부, "callbacks": outbox 미사용 시 전송할 [(receiptId, payload)]}.
+    """
+    job = db.query(ReprocessJob).filter(ReprocessJob.id == job_id).with_for_update().first()
+    if job is None or job.status != "RUNNING" or job.locked_by != worker_id:
+        db.rollback()
+        return {"stop": True, "callbacks": []}
+    where, params = _reprocess_job_where(job.filters or {})
+    params.update({"cursor": job.cursor or "", "limit": REPROCESS_JOB_CHUNK_SIZE})
+    subs = db.execute(
+        sql_text(
+            "SELECT " + ", ".join(f"s.{c}" for c in _REPROCESS_SUBMISSION_COLUMNS) + " FROM submissions s "
+            f"WHERE {where} AND s.submission_id > :cursor ORDER BY s.submission_id LIMIT :limit FOR UPDATE OF s"
+        ),
+        params,
+    ).mappings().all()
+    ids = [r["submission_id"] for r in subs]
+    items_by_sub: Dict[str, List[Any]] = {}
+    if ids:
+        for r in db.execute(
+            sql_text(
+                "SELECT " + ", ".join(_REPROCESS_ITEM_COLUMNS) + " FROM receipt_items "
+                "WHERE submission_id = ANY(:ids) ORDER BY submission_id, seq_no"
+            ),
+            {"ids": ids},
+        ).mappings():
+            items_by_sub.setdefault(r["submission_id"], []).append(SimpleNamespace(**r))
+    near_by_key = _reprocess_near_duplicates(db, ids)
+    rule_cfg = _get_judgment_rules(db)
+    send_callbacks = _normalize_override_callback_policy(getattr(rule_cfg, "override_callback_policy", None)) == "AUTO"
+    now = datetime.utcnow()
+
+    failed = 0
+    batch: List[Tuple[Any, List[Any], Dict[str, Any], List[Dict[str, Any]], CompleteRequest, List[Dict[str, Any]]]] = []
+    for r in subs:
+        sub = SimpleNamespace(**r)
+        item_rows = items_by_sub.get(sub.submission_id) or []
+        if not item_rows:
+            continue
+        sub_before = {f: getattr(sub, f) for f in _REPROCESS_SUBMISSION_FIELDS}
+        items_before = [{f: getattr(it, f) for f in _REPROCESS_ITEM_FIELDS} for it in item_rows]
+        req = CompleteRequest.model_construct(
+            receiptId=sub.submission_id,
+            userUuid=sub.user_uuid,
+            type=sub.project_type,
+            campaignId=None,
+            data=_reprocess_user_data(sub.project_type, sub.user_input_snapshot),
+            documents=None,
+        )
+        assets = _reprocess_assets(item_rows, near_by_key)
+        documents = [{"imageKey": a["imageKey"], "docType": a["docType"]} for a in assets]
+        try:
+            mapped, _ = map_ocr_to_db(sub.submission_id, assets, documents)
+            _apply_mapped_items(item_rows, mapped)
+        except Exception as e:
+            failed += 1
+            logger.warning("reprocess job=%s receiptId=%s failed: %s", job_id, sub.submission_id, e)
+            continue
+        batch.append((sub, item_rows, sub_before, items_before, req, assets))
+
+    ctx = _build_judgment_context(db, rule_cfg, [(b[4], b[5]) for b in batch])
+    results = _judge_rules_bulk(ctx, [(req, sub.campaign_id, assets, rows) for sub, rows, _, _, req, assets in batch])
+    sub_updates: List[Dict[str, Any]] = []
+    item_updates: List[Dict[str, Any]] = []
+    transitioned: List[Tuple[Any, List[Any]]] = []
+    registered: List[Tuple[str, Optional[str]]] = []
+    for (sub, item_rows, sub_before, items_before, req, _), result in zip(batch, results):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            # 자동 상점 등록(AUTO_REGISTER 정책)은 신청 단위 savepoint
+            with db.begin_nested():
+                stores = _apply_judgment_side_effects(db, sub.submission_id, result, register_candidates=False)
+            registered.extend(stores)
+            _apply_judgment(sub, item_rows, result)
+        except Exception as e:
+            failed += 1
+            logger.warning("reprocess job=%s receiptId=%s failed: %s", job_id, sub.submission_id, e)
+            continue
+        changed_items = [
+            it for it, before in zip(item_rows, items_before)
+            if any(getattr(it, f) != before[f] for f in _REPROCESS_ITEM_FIELDS)
+        ]
+        sub_changed = any(getattr(sub, f) != sub_before[f] for f in _REPROCESS_SUBMISSION_FIELDS)
+        if not sub_changed and not changed_items:
+            continue
+        prev_status = sub_before["status"] or ""
+        line = (
+            f"BULK_REPROCESS({now.isoformat()}, job={job_id}): 정책/로직 반영 재적용(OCR 미호출) "
+            f"{prev_status}→{sub.status}"
+        )
+        existing = sub.audit_trail or sub.audit_log or ""
+        sub.audit_trail = _truncate_submission_audit((existing + " | " + line).strip(" |"))
+        sub.audit_log = sub.audit_trail
+        sub.updated_at = now
+        sub_updates.append(
+            {"submission_id": sub.submission_id, "audit_trail": sub.audit_trail, "audit_log": sub.audit_log, "updated_at": now,
+             **{f: getattr(sub, f) for f in _REPROCESS_SUBMISSION_FIELDS}}
+        )
+        item_updates.extend({"item_id": it.item_id, **{f: getattr(it, f) for f in _REPROCESS_ITEM_FIELDS}} for it in changed_items)
+        if (sub.status or "") != prev_status:
+            transitioned.append((sub, item_rows))
+
+    # ORM 일괄 UPDATE(기본키 기준 executemany) — 바뀐 행만
+    if sub_updates:
+        db.execute(update(Submission), sub_updates)
+    if item_updates:
+        db.execute(update(ReceiptItem), item_updates)
+    # 롤업은 상태뿐 아니라 금액·반려 사유 코드도 키에 포함 → 바뀐 신청 전체 반영
+    _sync_submission_stats(db, [u["submission_id"] for u in sub_updates])
+    callbacks: List[Tuple[str, Dict[str, Any]]] = []
+    if send_callbacks:
+        for sub, item_rows in transitioned:
+            payload = _build_status_payload(sub, item_rows)
+            if CALLBACK_OUTBOX_ENABLED:
+                _enqueue_result_callback(db, sub.submission_id, payload, purpose="reprocess", actor=job.created_by)
+            callbacks.append((sub.submission_id, payload))
+
+    job.processed = (job.processed or 0) + len(subs)
+    job.changed = (job.changed or 0) + len(sub_updates)
+    job.transitions = (job.transitions or 0) + len(transitioned)
+    job.callbacks = (job.callbacks or 0) + len(callbacks)
+    job.failed = (job.failed or 0) + failed
+    job.cursor = ids[-1] if ids else job.cursor
+    job.updated_at = now
+    done = len(subs) < REPROCESS_JOB_CHUNK_SIZE
+    if done:
+        job.status = "DONE"
+        job.finished_at = now
+        job.locked_by = None
+        job.locked_until = None
+        _audit_log(
+            db,
+            actor=job.created_by,
+            action="REPROCESS_JOB_DONE",
+            target_type="reprocess_job",
+            target_id=str(job_id),
+            meta={
+                "processed": job.processed,
+                "changed": job.changed,
+                "transitions": job.transitions,
+                "callbacks": job.callbacks,
+                "failed": job.failed,
+            },
+        )
+    else:
+        job.locked_until = now + timedelta(seconds=REPROCESS_JOB_LEASE_SEC)
     db.commit()
-    return AdminCallbackResendResponse(receiptId=rid, sent=True)
+    _register_stores_in_index(registered)
+    return {"stop": done, "callbacks": [] if CALLBACK_OUTBOX_ENABLED else callbacks}
 
 
-@app.post(
-    "/api/v1/admin/submissions/{receiptId}/callback/verify",
-    responses={404: {"description": "Submission not found"}},
-    summary="콜백 검증(즉시 송출)",
-    description="현재 DB 기준 상태를 콜백 URL로 즉시 전송하고, 전송 결과(성공/실패/스킵)를 응답으로 반환. 콜백 URL 설정 여부 확인 및 수동 재전송 테스트용.",
-    tags=["Admin - Callback"],
-)
-async def admin_verify_callback(
-    receiptId: str,
-    db: Session = Depends(get_db),
-    actor: str = Depends(require_admin),
-):
-    rid = _sanitize_receipt_id(receiptId)
-    submission = db.query(Submission).filter(Submission.submission_id == rid).first()
-    if not submission:
-        raise HTTPException(status_code=404, detail="Submission not found")
-    item_rows = (
-        db.query(ReceiptItem)
-        .filter(ReceiptItem.submission_id == rid)
-        .order_by(ReceiptItem.seq_no.asc())
-        .all()
-    )
-    payload = _build_status_payload(submission, item_rows)
-    result = await _send_result_callback(rid, payload, purpose="verify", actor=actor)
-    _audit_log(
-        db,
-        actor=actor,
-        action="CALLBACK_VERIFY",
-        target_type="submission",
-        target_id=rid,
-        meta={"result": result},
-    )
+def _claim_reprocess_job(db: Session, job_id: int, worker_id: str) -> bool:
+    """QUEUED 작업 또는 점유가 만료된 RUNNING 작업을 점유."""
+    now = datetime.utcnow()
+    row = db.execute(
+        sql_text(
+            "UPDATE reprocess_jobs SET status = 'RUNNING', locked_by = :w, locked_until = :until, "
+            "started_at = COALESCE(started_at, :now), last_error = NULL, updated_at = :now "
+            "WHERE id = :id AND (status = 'QUEUED' OR (status = 'RUNNING' AND (locked_until IS NULL OR locked_until < :now))) "
+            "RETURNING id"
+        ),
+        {"id": job_id, "w": worker_id, "until": now + timedelta(seconds=REPROCESS_JOB_LEASE_SEC), "now": now},
+    ).first()
     db.commit()
-    return result
+    return row is not None
 
 
-@app.get(
-    "/api/v1/admin/submissions/{receiptId}/callback/logs",
-    responses={404: {"description": "Submission not found"}},
-    summary="콜백 전송 로그 조회",
-    description="해당 receiptId에 대한 콜백 전송/재전송/검증 시도 이력을 조회. CALLBACK_SEND, CALLBACK_RESEND, CALLBACK_VERIFY 액션만 포함.",
-    tags=["Admin - Callback"],
-)
-async def admin_get_callback_logs(
-    receiptId: str,
-    limit: int = Query(20, ge=1, le=200),
-    db: Session = Depends(get_db),
-    actor: str = Depends(require_admin),
-):
-    rid = _sanitize_receipt_id(receiptId)
-    rows = (
-        db.query(AdminAuditLog)
-        .filter(
-            AdminAuditLog.target_type == "submission",
-            AdminAuditLog.target_id == rid,
-            AdminAuditLog.action.in_(["CALLBACK_SEND", "CALLBACK_RESEND", "CALLBACK_VERIFY"]),
-        )
-        .order_by(AdminAuditLog.created_at.desc())
-        .limit(limit)
-        .all()
+def _fail_reprocess_job(db: Session, job_id: int, worker_id: str, error: str) -> None:
+    db.execute(
+        sql_text(
+            "UPDATE reprocess_jobs SET status = 'FAILED', locked_by = NULL, locked_until = NULL, last_error = :err, "
+            "finished_at = :now, updated_at = :now WHERE id = :id AND locked_by = :w AND status = 'RUNNING'"
+        ),
+        {"id": job_id, "w": worker_id, "err": (error or "")[:1000], "now": datetime.utcnow()},
     )
-    _ = actor  # 권한 체크용
-    return {
-        "receiptId": rid,
-        "items": [
-            {
-                "id": int(r.id),
-                "action": r.action,
-                "actor": r.actor,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "meta": r.meta,
-            }
-            for r in rows
-        ],
-    }
+    db.commit()
 
 
-class AdminAuditLogItem(BaseModel):
-    id: int
-    action: str
-    target_type: Optional[str] = None
-    target_id: Optional[str] = None
-    actor: Optional[str] = None
-    created_at: Optional[str] = None
-    meta: Optional[Dict[str, Any]] = None
-    before_json: Optional[Dict[str, Any]] = None
-    after_json: Optional[Dict[str, Any]] = None
+async def run_reprocess_job(job_id: int) -> None:
+    """
+    일괄 재처리 실행 루프(API 프로세스 태스크). 청크마다 별도 세션·I/O 스레드 풀에서 처리하고,
+    outbox 미사용 시 청크의 상태 전환 콜백을 REPROCESS_JOB_CALLBACK_CONCURRENCY개까지 동시 전송.
+    """
+    worker_id = f"reprocess:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    try:
+        if not await _run_io(_callback_db_call, _claim_reprocess_job, job_id, worker_id):
+            return
+    except Exception as e:
+        logger.warning("reprocess job claim failed (apply migration reprocess_jobs.sql if needed): %s", e)
+        return
+    sem = asyncio.Semaphore(REPROCESS_JOB_CALLBACK_CONCURRENCY)
 
+    async def _send(receipt_id: str, payload: Dict[str, Any]) -> None:
+        async with sem:
+            try:
+                await _send_result_callback(receipt_id, payload, purpose="reprocess", actor=f"reprocess_job:{job_id}")
+            except Exception as e:
+                logger.warning("reprocess job=%s callback failed for %s: %s", job_id, receipt_id, e)
 
-class AdminAuditLogListResponse(BaseModel):
+    started = time.monotonic()
+    logger.info("reprocess job start id=%s worker=%s", job_id, worker_id)
+    while True:
+        try:
+            result = await _run_io(_callback_db_call, _reprocess_job_chunk, job_id, worker_id)
+        except Exception as e:
+            logger.error("reprocess job=%s chunk failed: %s", job_id, e, exc_info=True)
+            try:
+                await _run_io(_callback_db_call, _fail_reprocess_job, job_id, worker_id, str(e) or type(e).__name__)
+            except Exception:
+                pass
+            return
+        if result["callbacks"]:
+            await asyncio.gather(*[_send(rid, payload) for rid, payload in result["callbacks"]])
+        if result["stop"]:
+            break
+    logger.info("reprocess job end id=%s elapsed=%.1fs", job_id, time.monotonic() - started)
+
+
+def _start_reprocess_job(job_id: int) -> None:
+    task = asyncio.create_task(run_reprocess_job(job_id))
+    _reprocess_tasks.add(task)
+    task.add_done_callback(_reprocess_tasks.discard)
+
+
+class AdminReprocessJobRequest(BaseModel):
+    campaignId: Optional[int] = Field(None, description="대상 캠페인(미지정 시 권한 범위 전체)")
+    dateFrom: Optional[str] = Field(None, description="신청 생성일시 시작(포함). 예: 2026-03-01")
+    dateTo: Optional[str] = Field(None, description="신청 생성일시 끝. 날짜만 주면 당일 전체 포함")
+    statuses: List[str] = Field(default_factory=list, description="대상 상태(비우면 판정 완료 상태 전체). PENDING·PROCESSING·VERIFYING 불가")
+    includeManual: bool = Field(False, description="True면 관리자 수동 판정(override·일괄 반려·교정) 건도 재판정(수동 결정이 되돌아갈 수 있음)")
+
+
+class AdminReprocessJobResponse(BaseModel):
+    jobId: int
+    status: str
+    filters: Dict[str, Any] = Field(default_factory=dict)
     total: int = 0
-    items: List[AdminAuditLogItem] = Field(default_factory=list)
+    processed: int = 0
+    changed: int = Field(0, description="상태·금액·장 판정 중 하나라도 바뀐 신청 수")
+    transitions: int = Field(0, description="상태가 바뀐 신청 수")
+    callbacks: int = Field(0, description="상태 전환으로 적재(또는 전송)한 콜백 수")
+    failed: int = 0
+    progress: float = Field(0.0, description="processed / total (0~1)")
+    ratePerMin: Optional[float] = Field(None, description="시작 이후 분당 처리 건수")
+    createdBy: Optional[str] = None
+    createdAt: Optional[str] = None
+    startedAt: Optional[str] = None
+    finishedAt: Optional[str] = None
+    lastError: Optional[str] = None
+
+
+def _reprocess_job_response(job: ReprocessJob) -> AdminReprocessJobResponse:
+    processed = int(job.processed or 0)
+    total = int(job.total or 0)
+    rate = None
+    if job.started_at and processed:
+        elapsed = ((job.finished_at or datetime.utcnow()) - job.started_at).total_seconds()
+        rate = round(processed * 60.0 / elapsed, 1) if elapsed > 0 else None
+    return AdminReprocessJobResponse(
+        jobId=int(job.id),
+        status=job.status,
+        filters=job.filters or {},
+        total=total,
+        processed=processed,
+        changed=int(job.changed or 0),
+        transitions=int(job.transitions or 0),
+        callbacks=int(job.callbacks or 0),
+        failed=int(job.failed or 0),
+        progress=round(min(1.0, processed / total), 4) if total else (1.0 if job.status == "DONE" else 0.0),
+        ratePerMin=rate,
+        createdBy=job.created_by,
+        createdAt=job.created_at.isoformat() if job.created_at else None,
+        startedAt=job.started_at.isoformat() if job.started_at else None,
+        finishedAt=job.finished_at.isoformat() if job.finished_at else None,
+        lastError=job.last_error,
+    )
 
 
-@app.get(
-    "/api/v1/admin/audit-log",
-    response_model=AdminAuditLogListResponse,
-    summary="감사로그 목록 조회",
-    description=(
-        "관리자 감사로그를 조건별로 조회. 인식률 분석(예: CANDIDATE_APPROVE의 corrected=true 건), "
-        "콜백 실패 추적, 규칙 변경 이력 등에 활용."
-    ),
-    tags=["Admin - Audit"],
-)
-async def admin_list_audit_log(
-    action: Optional[str] = Query(None, description="액션 필터 (예: CANDIDATE_APPROVE, CALLBACK_SEND, RULE_UPDATE)"),
-    target_type: Optional[str] = Query(None, description="대상 타입 (예: submission, unregistered_store)"),
-    from_: Optional[str] = Query(None, alias="from", description="시작일시 ISO8601 또는 YYYY-MM-DD"),
-    to: Optional[str] = Query(None, description="종료일시 ISO8601 또는 YYYY-MM-DD"),
-    include_json: bool = Query(False, description="True면 before_json, after_json 포함 (용량 큼)"),
-    limit: int = Query(50, ge=1, le=500),
-    db: Session = Depends(get_db),
-    actor: str = Depends(require_admin),
-):
-    _ = actor
-    q = db.query(AdminAuditLog)
-    if action:
-        q = q.filter(AdminAuditLog.action == action.strip())
-    if target_type:
-        q = q.filter(AdminAuditLog.target_type == target_type.strip())
-    if from_:
+def _created_range_filters(date_from: Optional[str], date_to: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """dateFrom/dateTo → _reprocess_job_where의 createdFrom(포함)/createdBefore(미포함) ISO 문자열. 형식 오류는 400."""
+    created_from = created_before = None
+    if date_from:
         try:
-            dt_from = dateutil_parser.parse(from_)
-            q = q.filter(AdminAuditLog.created_at >= dt_from)
+            created_from = dateutil_parser.parse(date_from).isoformat()
         except Exception:
-            raise HTTPException(status_code=400, detail="Invalid from date")
-    if to:
+            raise HTTPException(status_code=400, detail="Invalid dateFrom")
+    if date_to:
         try:
-            dt_to = dateutil_parser.parse(to)
-            q = q.filter(AdminAuditLog.created_at <= dt_to)
+            to_dt = dateutil_parser.parse(date_to)
         except Exception:
-            raise HTTPException(status_code=400, detail="Invalid to date")
-    q = q.order_by(AdminAuditLog.created_at.desc())
-    total = q.count()
-    rows = q.limit(limit).all()
-    items = []
-    for r in rows:
-        items.append(
-            AdminAuditLogItem(
-                id=int(r.id),
-                action=r.action or "",
-                target_type=r.target_type,
-                target_id=r.target_id,
-                actor=r.actor,
-                created_at=r.created_at.isoformat() if r.created_at else None,
-                meta=r.meta,
-                before_json=_dict_for_jsonb(r.before_json) if include_json and r.before_json else None,
-                after_json=_dict_for_jsonb(r.after_json) if include_json and r.after_json else None,
-            )
-        )
-    return AdminAuditLogListResponse(total=total, items=items)
+            raise HTTPException(status_code=400, detail="Invalid dateTo")
+        # 종료일 당일 전체 포함(목록 조회와 동일): 자정이면 다음 날 0시 미만, 아니면 해당 시각까지
+        to_end = to_dt + timedelta(days=1) if (to_dt.hour, to_dt.minute) == (0, 0) else to_dt + timedelta(microseconds=1)
+        created_before = to_end.isoformat()
+    return created_from, created_before
 
 
-# 6. Naver 영수증 OCR 연동 (CLOVA Document OCR > 영수증)
-# - 공식 권장: 장축 1960px 이하, JPEG 품질은 인식률 위해 90 권장 (PROJECT/네이버_CLOVA_OCR_레퍼런스_및_인식률_검토.md)
-MAX_OCR_DIMENSION = int(os.getenv("OCR_MAX_DIMENSION", "1960"))
-OCR_JPEG_QUALITY = int(os.getenv("OCR_JPEG_QUALITY", "90"))
-# 인식률 향상: 저해상도 업스케일(1=활성), 업스케일 적용 한계(이 값 미만이면 장축 1960까지 확대), 작은 이미지 PNG 전송(1=활성)
-OCR_UPSCALE_SMALL = os.getenv("OCR_UPSCALE_SMALL", "0").strip().lower() in ("1", "true", "yes")
-OCR_UPSCALE_MAX_SIDE = int(os.getenv("OCR_UPSCALE_MAX_SIDE", "1200"))
-OCR_SEND_PNG_WHEN_SMALL = os.getenv("OCR_SEND_PNG_WHEN_SMALL", "0").strip().lower() in ("1", "true", "yes")
-
+def _get_reprocess_job_for_admin(db: Session, job_id: int, ctx: AdminContext) -> ReprocessJob:
+    job = db.query(ReprocessJob).filter(ReprocessJob.id == job_id).first()
+    if not job or (not ctx.is_super and job.created_by != ctx.actor):
+        raise HTTPException(status_code=404, detail="Reprocess job not found")
+    return job
 
-def _get_image_bytes_from_s3(object_key: str) -> Tuple[bytes, str]:
-    """MinIO에서 이미지 바이너리 직접 읽기. 반환: (bytes, content_type)."""
-    resp = s3_client.get_object(Bucket=S3_BUCKET, Key=object_key)
-    body = resp["Body"].read()
-    content_type = (resp.get("ContentType") or "image/jpeg").lower()
-    return body, content_type
 
+@app.post(
+    "/api/v1/admin/submissions/reprocess-jobs",
+    response_model=AdminReprocessJobResponse,
+    summary="일괄 재처리(판정 로직만 재적용)",
+    description="조건(캠페인·생성일 기간·상태)에 맞는 신청 전체(관리자 수동 판정 건은 includeManual=true일 때만)를 OCR 호출 없이 저장된 OCR 결과로 장별 판정부터 다시 적용. "
+    "백그라운드 작업으로 청크 단위 처리·commit하며 진행 상황은 GET …/reprocess-jobs/{jobId}로 조회. "
+    "상태가 바뀐 건만 콜백(override_callback_policy=AUTO일 때). 동시에 1개 작업만 실행, 최대 REPROCESS_JOB_MAX_SUBMISSIONS건.",
+    tags=["Admin - Submissions"],
+)
+async def admin_create_reprocess_job(
+    body: AdminReprocessJobRequest,
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    if not ctx.is_super and not ctx.campaign_ids:
+        raise HTTPException(status_code=403, detail="No campaign access")
+    if body.campaignId is not None and not ctx.is_super and body.campaignId not in ctx.campaign_ids:
+        raise HTTPException(status_code=403, detail="Campaign not in scope")
+    statuses = list(dict.fromkeys(s.strip().upper() for s in body.statuses if s and s.strip()))
+    statuses = ["FIT" if s == "APPROVED" else s for s in statuses]
+    if any(s in IN_FLIGHT_STATUSES for s in statuses):
+        raise HTTPException(status_code=400, detail="PENDING/PROCESSING/VERIFYING submissions cannot be reprocessed")
+    created_from, created_before = _created_range_filters(body.dateFrom, body.dateTo)
+    filters: Dict[str, Any] = {
+        "campaignId": body.campaignId,
+        "campaignScope": None if ctx.is_super else sorted(ctx.campaign_ids),
+        "statuses": statuses,
+        "createdFrom": created_from,
+        "createdBefore": created_before,
+        "includeManual": body.includeManual,
+    }
 
-def _resize_and_compress_for_ocr(
-    image_bytes: bytes, content_type: str
-) -> Tuple[bytes, str]:
-    """
-    리사이징(장축 최대 MAX_OCR_DIMENSION) + 압축. 인식률 향상 옵션:
-    - 저해상도 업스케일(OCR_UPSCALE_SMALL=1): 장축이 OCR_UPSCALE_MAX_SIDE 미만이면 1960까지 확대.
-    - 작은 이미지 PNG 전송(OCR_SEND_PNG_WHEN_SMALL=1): 최종 장축이 작으면 JPEG 대신 PNG로 전송(경계 보존).
-    """
-    try:
-        img = Image.open(io.BytesIO(image_bytes))
-        img = ImageOps.exif_transpose(img)
-        if img.mode in ("RGBA", "P"):
-            img = img.convert("RGB")
-        elif img.mode != "RGB":
-            img = img.convert("RGB")
-        img = ImageOps.autocontrast(img, cutoff=1)
-        img = ImageEnhance.Sharpness(img).enhance(1.2)
-        w, h = img.size
-        long_side = max(w, h)
-        if w > MAX_OCR_DIMENSION or h > MAX_OCR_DIMENSION:
-            ratio = min(MAX_OCR_DIMENSION / w, MAX_OCR_DIMENSION / h)
-            img = img.resize((int(w * ratio), int(h * ratio)), Image.Resampling.LANCZOS)
-        elif OCR_UPSCALE_SMALL and long_side < OCR_UPSCALE_MAX_SIDE and long_side > 0:
-            ratio = MAX_OCR_DIMENSION / long_side
-            nw, nh = int(w * ratio), int(h * ratio)
-            if nw > 0 and nh > 0:
-                img = img.resize((nw, nh), Image.Resampling.LANCZOS)
-        w, h = img.size
-        long_side = max(w, h)
-        use_png = OCR_SEND_PNG_WHEN_SMALL and long_side <= OCR_UPSCALE_MAX_SIDE
-        buf = io.BytesIO()
-        if use_png:
-            img.save(buf, format="PNG", optimize=True)
-            return buf.getvalue(), "image/png"
-        img.save(buf, format="JPEG", quality=OCR_JPEG_QUALITY, optimize=True)
-        return buf.getvalue(), "image/jpeg"
-    except Exception:
-        return image_bytes, content_type
+    active = (
+        db.query(ReprocessJob.id)
+        .filter(ReprocessJob.status.in_(["QUEUED", "RUNNING"]))
+        .order_by(ReprocessJob.id.asc())
+        .first()
+    )
+    if active:
+        raise HTTPException(status_code=409, detail=f"Reprocess job {active[0]} is already active. Cancel or wait for it.")
+    where, params = _reprocess_job_where(filters)
+    total = int(db.execute(sql_text(f"SELECT COUNT(*) FROM submissions s WHERE {where}"), params).scalar() or 0)
+    if total > REPROCESS_JOB_MAX_SUBMISSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many submissions for one job ({total}, max {REPROCESS_JOB_MAX_SUBMISSIONS}). Narrow the filters.",
+        )
+    now = datetime.utcnow()
+    job = ReprocessJob(status="QUEUED", filters=filters, total=total, created_by=ctx.actor, created_at=now, updated_at=now)
+    db.add(job)
+    db.flush()
+    _audit_log(
+        db,
+        actor=ctx.actor,
+        action="REPROCESS_JOB_CREATE",
+        target_type="reprocess_job",
+        target_id=str(job.id),
+        meta={"filters": filters, "total": total},
+    )
+    db.commit()
+    db.refresh(job)
+    if total:
+        _start_reprocess_job(int(job.id))
+    else:
+        job.status = "DONE"
+        job.finished_at = now
+        db.commit()
+    return _reprocess_job_response(job)
 
 
-def _image_format_from_content_type(content_type: str) -> str:
-    """Content-Type → 네이버 OCR format (jpg|png)."""
-    if "png" in content_type:
-        return "png"
-    return "jpg"
+@app.get(
+    "/api/v1/admin/submissions/reprocess-jobs/{jobId}",
+    response_model=AdminReprocessJobResponse,
+    responses={404: {"description": "Reprocess job not found"}},
+    summary="일괄 재처리 진행 상황",
+    tags=["Admin - Submissions"],
+)
+async def admin_get_reprocess_job(
+    jobId: int,
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    return _reprocess_job_response(_get_reprocess_job_for_admin(db, jobId, ctx))
 
 
-def _strip_trailing_date_junk(s: str) -> str:
-    """
-    날짜 문자열 끝의 괄호·요일 등 비날짜 접미사 제거.
-    예: "26.02.22 (일)" → "26.02.22", "26-02-22-(일)" → "26-02-22"
-    """
-    if not s:
-        return s
-    s = re.sub(r"[(\（].*$", "", s.strip())
-    return s.strip(" -")
-
-
-# 2026년 이벤트 기간: UNFIT_DATE 전제(§10.3). 이 기간 내 유효한 날짜면 FIT 판정을 막지 않음.
-EVENT_YEAR_2026_START = date(2026, 1, 1)
-EVENT_YEAR_2026_END = date(2026, 12, 31)
+@app.post(
+    "/api/v1/admin/submissions/reprocess-jobs/{jobId}/cancel",
+    response_model=AdminReprocessJobResponse,
+    responses={404: {"description": "Reprocess job not found"}},
+    summary="일괄 재처리 취소",
+    description="진행 중인 청크는 끝까지 반영(commit)되고 다음 청크부터 중단.",
+    tags=["Admin - Submissions"],
+)
+async def admin_cancel_reprocess_job(
+    jobId: int,
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    job = _get_reprocess_job_for_admin(db, jobId, ctx)
+    # 실행 중 청크(작업 행 잠금)가 commit될 때까지 대기 후 상태 재확인
+    db.refresh(job, with_for_update=True)
+    if job.status in ("QUEUED", "RUNNING", "FAILED"):
+        now = datetime.utcnow()
+        job.status = "CANCELLED"
+        job.finished_at = now
+        job.locked_by = None
+        job.locked_until = None
+        _audit_log(
+            db,
+            actor=ctx.actor,
+            action="REPROCESS_JOB_CANCEL",
+            target_type="reprocess_job",
+            target_id=str(job.id),
+            meta={"processed": job.processed, "total": job.total},
+        )
+        db.commit()
+        db.refresh(job)
+    return _reprocess_job_response(job)
 
 
-def _normalize_and_validate_2026_date(date_text: str) -> Tuple[bool, Optional[str]]:
-    """
-    OCR 날짜 정규화 후 2026년 이벤트 기간 내 유효성 검사 (§10.3 UNFIT_DATE 전제).
-    - 이벤트 기간 내 유효한 날짜면 True 반환 → 해당 장 FIT 가능, UNFIT_DATE로 전체를 막지 않음.
-    Step1: 괄호·요일 등 비날짜 접미사 제거 (예: "26.02.22 (일)" → "26.02.22")
-    Step2: 구분자(., /, 공백)를 '-'로 치환
-    Step3: 2026 또는 26으로 시작하는지 확인
-    Step4: dateutil.parser로 파싱 후 2026년 이벤트 기간 내인지 검증
-    반환: (2026년 이벤트 기간 내 유효 여부, 정규화된 날짜 문자열 또는 None)
-    """
-    if not date_text or not isinstance(date_text, str):
-        return False, None
-    s = date_text.strip()
-    s = _strip_trailing_date_junk(s)
-    s = re.sub(r"[/.\s]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("- ")
-    if not re.match(r"^(2026|26)", s):
-        return False, None
-    if s.startswith("26") and (len(s) == 2 or s[2] in "-./"):
-        s = "20" + s
-    try:
-        parsed = dateutil_parser.parse(s)
-        d = parsed.date() if hasattr(parsed, "date") else date(parsed.year, parsed.month, parsed.day)
-        if not (EVENT_YEAR_2026_START <= d <= EVENT_YEAR_2026_END):
-            return False, None
-        normalized = d.strftime("%Y/%m/%d")
-        return True, normalized
-    except (ValueError, TypeError):
-        return False, None
+@app.post(
+    "/api/v1/admin/submissions/reprocess-jobs/{jobId}/resume",
+    response_model=AdminReprocessJobResponse,
+    responses={404: {"description": "Reprocess job not found"}, 409: {"description": "Job is running"}},
+    summary="일괄 재처리 재개",
+    description="실패(FAILED)했거나 실행 프로세스 중단으로 점유가 만료된 작업을 마지막 commit 지점부터 이어서 처리.",
+    tags=["Admin - Submissions"],
+)
+async def admin_resume_reprocess_job(
+    jobId: int,
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    job = _get_reprocess_job_for_admin(db, jobId, ctx)
+    now = datetime.utcnow()
+    if job.status == "RUNNING" and job.locked_until and job.locked_until >= now:
+        raise HTTPException(status_code=409, detail="Reprocess job is running")
+    if job.status not in ("RUNNING", "FAILED", "QUEUED"):
+        raise HTTPException(status_code=409, detail=f"Reprocess job is {job.status}")
+    if job.status == "FAILED":
+        job.status = "QUEUED"
+        job.finished_at = None
+        job.updated_at = now
+        db.commit()
+        db.refresh(job)
+    _start_reprocess_job(int(job.id))
+    return _reprocess_job_response(job)
+
+
+# 판정 규칙 시뮬레이션(rule_simulations): 저장된 parsed를 현재 규칙·제안 규칙으로 각각 재판정(판정 엔진 일괄 모드, DB 쓰기 없음)
+_RULE_SIMULATION_FIELDS = ("min_amount_stay", "min_amount_tour", "auto_register_threshold", "unknown_store_policy")
+# 진행 상황 갱신이 이 시간(초) 넘게 없으면 실행 프로세스 중단으로 보고 새 시뮬레이션 허용
+_RULE_SIMULATION_STALE_SEC = 600
+# 신청·장 필요한 컬럼만 추출(ORM 미사용). ocr_raw는 전송하지 않고 DB에서 부적격 업태 키워드 포함 여부만 계산
+# keyset 페이지: 신청 ID 순으로 RULE_SIMULATION_BATCH_SIZE건씩(페이지마다 짧은 트랜잭션, 장기 스냅샷·커서 미유지)
+_RULE_SIMULATION_PAGE_SQL = """
+SELECT s.submission_id FROM submissions s
+WHERE {where} AND s.submission_id > :last
+ORDER BY s.submission_id
+LIMIT :limit
+"""
+_RULE_SIMULATION_SQL = """
+SELECT s.submission_id, s.user_uuid, s.project_type, s.status AS submission_status, s.user_input_snapshot,
+       i.item_id, i.doc_type, i.image_key, i.parsed,
+       i.ocr_raw IS NULL AS ocr_missing,
+       COALESCE(i.ocr_raw::text LIKE ANY(:forbidden), FALSE) AS ocr_forbidden
+FROM submissions s
+JOIN receipt_items i ON i.submission_id = s.submission_id
+WHERE s.submission_id = ANY(:ids)
+ORDER BY s.submission_id, i.seq_no
+"""
+_rule_simulation_tasks: Set["asyncio.Future[None]"] = set()
+
+
+def _rule_simulation_bucket(status: Optional[str]) -> str:
+    """판정 구분: FIT | PENDING(신규상점·수동검증 대기) | UNFIT(그 외 반려·오류)."""
+    if status == "FIT":
+        return "FIT"
+    if status in ("PENDING_NEW", "PENDING_VERIFICATION"):
+        return "PENDING"
+    return "UNFIT"
 
 
-def _normalize_pay_date_canonical(raw: Optional[str]) -> Optional[str]:
-    """
-    결제일자를 YYYY/MM/DD 형식으로 통일. (26/01/10 → 2026/01/10, 26.02.22 (일) → 2026/02/22)
-    파싱 실패 시 원문 반환(또는 None). receipt_item 저장·API 응답에 사용.
-    """
-    if not raw or not isinstance(raw, str):
-        return raw
-    s = raw.strip()
-    if not s:
-        return None
-    s = _strip_trailing_date_junk(s)
-    s = re.sub(r"[/.\s]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("- ")
-    # 26-01-10 → 2026-01-10
-    if len(s) >= 2 and s[:2] == "26" and (len(s) == 2 or s[2] in "-."):
-        s = "20" + s
-    try:
-        parsed = dateutil_parser.parse(s)
-        return parsed.strftime("%Y/%m/%d")
-    except (ValueError, TypeError):
-        return raw if raw.strip() else None
+class _RuleSimulationTally:
+    """시뮬레이션 집계. 구분별 건수·승인(FIT) 금액, 구분 전환(FIT→UNFIT 등) 건수, 전환 예시."""
+
+    __slots__ = ("counts", "approved", "flips", "status_changed", "stored_mismatch", "failed", "samples")
+
+    def __init__(self) -> None:
+        self.counts = {side: {"FIT": 0, "UNFIT": 0, "PENDING": 0} for side in ("baseline", "proposed")}
+        self.approved = {"baseline": 0, "proposed": 0}
+        self.flips: Dict[str, int] = {}
+        self.status_changed = 0
+        self.stored_mismatch = 0
+        self.failed = 0
+        self.samples: List[Dict[str, Any]] = []
+
+    def add(self, submission_id: str, stored_status: Optional[str], base: "JudgmentResult", prop: "JudgmentResult") -> None:
+        b = _rule_simulation_bucket(base.status)
+        p = _rule_simulation_bucket(prop.status)
+        self.counts["baseline"][b] += 1
+        self.counts["proposed"][p] += 1
+        if base.status == "FIT":
+            self.approved["baseline"] += int(base.total_amount or 0)
+        if prop.status == "FIT":
+            self.approved["proposed"] += int(prop.total_amount or 0)
+        if base.status != prop.status:
+            self.status_changed += 1
+        if stored_status != base.status:
+            self.stored_mismatch += 1
+        if b == p:
+            return
+        key = f"{b}→{p}"
+        self.flips[key] = self.flips.get(key, 0) + 1
+        if len(self.samples) < 20:
+            self.samples.append({
+                "receiptId": submission_id,
+                "from": base.status,
+                "to": prop.status,
+                "amountFrom": int(base.total_amount or 0),
+                "amountTo": int(prop.total_amount or 0),
+                "reason": prop.fail_reason,
+            })
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "baseline": {**self.counts["baseline"], "approvedAmount": self.approved["baseline"]},
+            "proposed": {**self.counts["proposed"], "approvedAmount": self.approved["proposed"]},
+            "flips": dict(sorted(self.flips.items())),
+            "flipped": sum(self.flips.values()),
+            "statusChanged": self.status_changed,
+            "approvedAmountDelta": self.approved["proposed"] - self.approved["baseline"],
+            "storedMismatch": self.stored_mismatch,
+            "failed": self.failed,
+            "samples": self.samples,
+        }
 
 
-class NaverOCRInferError(ValueError):
-    """Naver OCR 200 OK이지만 inferResult가 SUCCESS가 아님(예: ERROR). 재시도해도 동일하므로 재시도 생략."""
+def _rule_simulation_asset(row: Any) -> Dict[str, Any]:
+    """스트리밍 행 → 판정 엔진 자산. ocr_raw는 상점 분류가 필요한 장만 나중에 채움, 부적격 업태는 SQL 추출값 사용."""
+    parsed = dict(row.parsed) if isinstance(row.parsed, dict) else {}
+    failed = not parsed and row.ocr_missing
+    return {
+        "imageKey": row.image_key or "",
+        "docType": row.doc_type or "RECEIPT",
+        "parsed": parsed,
+        "ocrRaw": None,
+        "ocrForbidden": bool(row.ocr_forbidden),
+        "status": "ERROR_OCR" if failed else "PENDING",
+        "error_code": "OCR_001" if failed else None,
+        "imageNearDuplicates": [],
+    }
 
 
-def _validate_naver_ocr_response(ocr_data: Any, receipt_id: str) -> None:
+def _simulate_rule_batch(
+    db: Session,
+    baseline_rules: Any,
+    proposed_rules: Any,
+    groups: List[List[Any]],
+    tally: _RuleSimulationTally,
+) -> int:
     """
-    네이버 OCR 응답 검증. 형식 오류 시 ValueError 발생 → 호출부에서 ERROR_OCR 처리.
-    - 200 OK이지만 body에 error 또는 images 누락/비정상 시 분석 불가로 간주.
-    - inferResult가 ERROR 등이면 NaverOCRInferError (재시도 없이 즉시 실패 처리).
+    신청 배치 1회: 상점 매칭·중복 키 사전 조회 1회 → 현재·제안 규칙으로 각각 판정 엔진 일괄 모드. 반환: 장 수.
+    ocr_raw는 마스터 미매칭 상점 장(신규 상점 분류 입력)만 한 번에 조회.
     """
-    if not isinstance(ocr_data, dict):
-        raise ValueError(f"Naver OCR response is not a dict: type={type(ocr_data).__name__}")
-    if ocr_data.get("error"):
-        err = ocr_data["error"]
-        msg = err.get("message", err) if isinstance(err, dict) else str(err)
-        raise ValueError(f"Naver OCR error in response: {msg}")
-    images = ocr_data.get("images")
-    if not isinstance(images, list) or len(images) == 0:
-        raise ValueError("Naver OCR response has no images or empty images array")
-    first = images[0] if isinstance(images[0], dict) else {}
-    infer_result = first.get("inferResult") or first.get("message")
-    if infer_result is not None and isinstance(infer_result, str):
-        if infer_result.upper() not in ("SUCCESS", "SUCCESS_OK"):
-            raise NaverOCRInferError(f"Naver OCR inferResult not success: {infer_result}")
+    memo: Dict[Tuple[Any, ...], Tuple[Optional[str], float, str]] = {}
+
+    def classify(store_name: Optional[str], address: Optional[str], ocr_raw: Optional[Dict[str, Any]]):
+        # 현재·제안 규칙 판정에서 같은 장을 두 번 분류하지 않음(분류 결과는 규칙과 무관)
+        key = (store_name, address, id(ocr_raw))
+        if key not in memo:
+            memo[key] = classify_store(store_name, address, ocr_raw, use_gemini=False)
+        return memo[key]
+
+    inputs: List[Tuple[CompleteRequest, Optional[int], List[Dict[str, Any]], List[Any]]] = []
+    for rows in groups:
+        head = rows[0]
+        req = CompleteRequest.model_construct(
+            receiptId=head.submission_id,
+            userUuid=head.user_uuid,
+            type=head.project_type,
+            campaignId=None,
+            data=_reprocess_user_data(head.project_type, head.user_input_snapshot),
+            documents=None,
+        )
+        assets = [_rule_simulation_asset(r) for r in rows]
+        inputs.append((req, None, assets, [SimpleNamespace(**_mapped_item_fields(a)) for a in assets]))
+    ctx = _build_judgment_context(db, baseline_rules, [(req, assets) for req, _, assets, _ in inputs], classify)
+
+    need: Dict[str, Dict[str, Any]] = {}
+    for rows, (req, _, assets, _) in zip(groups, inputs):
+        for i, store_query, _ in _judgment_lookups(req, assets):
+            if not ctx.store_matches.get(store_query):
+                need[rows[i].item_id] = assets[i]
+    if need:
+        for item_id, ocr_raw in db.execute(
+            sql_text("SELECT item_id, ocr_raw FROM receipt_items WHERE item_id = ANY(:ids)"),
+            {"ids": list(need)},
+        ):
+            need[item_id]["ocrRaw"] = ocr_raw
+
+    # 제안 규칙 컨텍스트는 기준 판정 전에 복사(기준 판정이 갱신한 중복 키 소유 현황을 물려받지 않게)
+    prop_ctx = ctx.with_rules(proposed_rules)
+    base_results = _judge_rules_bulk(ctx, inputs)
+    prop_results = _judge_rules_bulk(prop_ctx, inputs)
+    for rows, base, prop in zip(groups, base_results, prop_results):
+        if isinstance(base, Exception) or isinstance(prop, Exception):
+            tally.failed += 1
+            continue
+        tally.add(rows[0].submission_id, rows[0].submission_status, base, prop)
+    return sum(len(rows) for rows in groups)
 
 
-def _resolve_ocr_domain(image_key: Optional[str], project_type: Optional[str]) -> str:
-    """
-    MinIO 저장 경로 또는 요청 project_type으로 STAY/TOUR 결정.
-    - image_key가 STAY/ 또는 TOUR/ 로 시작하면 해당 도메인
-    - 아니면 project_type (STAY|TOUR), 미있으면 TOUR
-    """
-    key = (image_key or "").strip()
-    if key.upper().startswith("STAY/"):
-        return "STAY"
-    if key.upper().startswith("TOUR/"):
-        return "TOUR"
-    pt = (project_type or "").strip().upper()
-    return "STAY" if pt == "STAY" else "TOUR"
+def _update_rule_simulation(sim_id: int, **fields: Any) -> None:
+    """진행 상황 기록(별도 세션으로 즉시 commit)."""
+    db = SessionLocal()
+    try:
+        fields["updated_at"] = datetime.utcnow()
+        db.query(RuleSimulation).filter(RuleSimulation.id == sim_id).update(fields, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
 
 
-async def _call_naver_ocr_binary(
-    image_binary: bytes, receipt_id: str, image_format: str = "jpg", domain_type: str = "TOUR"
-) -> dict:
+def _run_rule_simulation(sim_id: int) -> None:
     """
-    CLOVA OCR — multipart/form-data(바이너리) 전송.
-    domain_type: STAY(일반 모델·템플릿) | TOUR(영수증 특화). 경로 기반 분기 후 호출.
+    시뮬레이션 실행(전용 단일 스레드). 대상 신청을 submission_id keyset으로 RULE_SIMULATION_BATCH_SIZE건씩 읽어
+    재판정하고, 페이지마다 트랜잭션을 끝내(rollback, 읽기 전용) 중간 집계를 기록.
     """
-    config = OCR_CONFIG.get(domain_type) or OCR_CONFIG["TOUR"]
-    url = config.get("url")
-    secret = config.get("secret")
-    if not url or not secret:
-        raise ValueError(f"OCR config missing for domain={domain_type}")
-    message = {
-        "version": "V2",
-        "requestId": receipt_id,
-        "timestamp": int(time.time() * 1000),
-        "images": [{"format": image_format, "name": "receipt"}],
-    }
-    mime = "image/jpeg" if image_format == "jpg" else "image/png"
-    files = {
-        "file": ("receipt.jpg" if image_format == "jpg" else "receipt.png", image_binary, mime),
-        "message": (None, json.dumps(message), "application/json"),
-    }
-    headers = {"X-OCR-SECRET": secret}
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, files=files)
-        if response.status_code >= 400:
-            try:
-                body = response.text
-                if len(body) > 500:
-                    body = body[:500] + "..."
-                logger.warning(
-                    "Naver OCR %s (domain=%s): status=%s body=%s",
-                    receipt_id, domain_type, response.status_code, body,
-                )
-            except Exception:
-                pass
-        response.raise_for_status()
-        try:
-            ocr_data = response.json()
-        except Exception as e:
-            logger.warning("Naver OCR response is not JSON: %s", e)
-            raise ValueError(f"Naver OCR response is not valid JSON: {e}") from e
-        _validate_naver_ocr_response(ocr_data, receipt_id)
-        return ocr_data
-
+    db = SessionLocal()
+    try:
+        sim = db.query(RuleSimulation).filter(RuleSimulation.id == sim_id).first()
+        if sim is None or sim.status != "QUEUED":
+            return
+        baseline_rules = _get_judgment_rules(db)
+        proposed_rules = baseline_rules.model_copy(update=sim.proposed or {})
+        where, params = _reprocess_job_where(sim.filters or {})
+        params["forbidden"] = [f"%{kw}%" for kw in FORBIDDEN_BUSINESS_KEYWORDS]
+        now = datetime.utcnow()
+        sim.status = "RUNNING"
+        sim.started_at = now
+        sim.updated_at = now
+        sim.baseline = {f: getattr(baseline_rules, f) for f in _RULE_SIMULATION_FIELDS}
+        db.commit()
 
-async def _call_naver_ocr_with_retry(
-    image_binary: bytes, receipt_id: str, image_format: str = "jpg", domain_type: str = "TOUR", retries: int = 2
-) -> dict:
-    """
-    네이버 OCR 호출 재시도 래퍼.
-    - domain_type: STAY | TOUR (저장 경로 기반 분기 후 전달)
-    - inferResult ERROR 등 NaverOCRInferError는 재시도하지 않음 (동일 이미지 재전송 무의미).
-    """
-    last_exc: Optional[Exception] = None
-    for attempt in range(retries + 1):
+        started = time.monotonic()
+        tally = _RuleSimulationTally()
+        scanned = scanned_items = 0
+        page_sql = sql_text(_RULE_SIMULATION_PAGE_SQL.format(where=where))
+        last = ""
+        while True:
+            ids = db.execute(page_sql, {**params, "last": last, "limit": RULE_SIMULATION_BATCH_SIZE}).scalars().all()
+            if not ids:
+                break
+            rows = db.execute(sql_text(_RULE_SIMULATION_SQL), {"ids": list(ids), "forbidden": params["forbidden"]})
+            groups = [list(g) for _, g in groupby(rows, key=lambda r: r.submission_id)]
+            if groups:
+                scanned_items += _simulate_rule_batch(db, baseline_rules, proposed_rules, groups, tally)
+            db.rollback()
+            scanned += len(ids)
+            last = ids[-1]
+            if len(ids) < RULE_SIMULATION_BATCH_SIZE:
+                break
+            _update_rule_simulation(sim_id, scanned=scanned, scanned_items=scanned_items, result=tally.snapshot())
+        _update_rule_simulation(
+            sim_id, status="DONE", finished_at=datetime.utcnow(),
+            scanned=scanned, scanned_items=scanned_items, result=tally.snapshot(),
+        )
+        logger.info(
+            "rule simulation done id=%s submissions=%s items=%s elapsed=%.1fs",
+            sim_id, scanned, scanned_items, time.monotonic() - started,
+        )
+    except Exception as e:
+        logger.error("rule simulation=%s failed: %s", sim_id, e, exc_info=True)
+        db.rollback()
         try:
-            return await _call_naver_ocr_binary(image_binary, receipt_id, image_format, domain_type=domain_type)
-        except NaverOCRInferError as e:
-            logger.warning("Naver OCR inferResult 실패(재시도 없음): %s", e)
-            raise
-        except Exception as e:
-            last_exc = e
-            logger.warning(
-                "Naver OCR call failed (attempt %s/%s): %s",
-                attempt + 1,
-                retries + 1,
-                e,
+            _update_rule_simulation(
+                sim_id, status="FAILED", finished_at=datetime.utcnow(), last_error=(str(e) or type(e).__name__)[:1000]
             )
-            if attempt < retries:
-                await asyncio.sleep(0.4 * (attempt + 1))
-    raise last_exc if last_exc else RuntimeError("Naver OCR failed")
+        except Exception:
+            pass
+    finally:
+        db.close()
 
 
-# Naver OCR: 도메인당 동시 1건 제한(rate limit "1 API calls per domain at the same time" 대응)
-_ocr_domain_locks: Dict[str, asyncio.Lock] = {}
+def _start_rule_simulation(sim_id: int) -> None:
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(loop.run_in_executor(_rule_simulation_executor, _run_rule_simulation, sim_id))
+    _rule_simulation_tasks.add(task)
+    task.add_done_callback(_rule_simulation_tasks.discard)
 
 
-def _get_ocr_domain_lock(domain: str) -> asyncio.Lock:
-    if domain not in _ocr_domain_locks:
-        _ocr_domain_locks[domain] = asyncio.Lock()
-    return _ocr_domain_locks[domain]
+class AdminRuleSimulationRequest(BaseModel):
+    campaignId: Optional[int] = Field(None, description="대상 캠페인(미지정 시 권한 범위 전체)")
+    dateFrom: Optional[str] = Field(None, description="신청 생성일시 시작(포함). 예: 2026-03-01")
+    dateTo: Optional[str] = Field(None, description="신청 생성일시 끝. 날짜만 주면 당일 전체 포함")
+    min_amount_stay: Optional[int] = Field(None, ge=0, description="제안 STAY 최소 금액")
+    min_amount_tour: Optional[int] = Field(None, ge=0, description="제안 TOUR 최소 금액")
+    auto_register_threshold: Optional[float] = Field(None, description="제안 자동 등록 임계값 0.0~1.0")
+    unknown_store_policy: Optional[str] = Field(None, description="제안 신규 상점 정책: AUTO_REGISTER | PENDING_NEW")
+    unknownStorePolicy: Optional[str] = Field(None, description="FE 전송용 camelCase. unknown_store_policy와 동일하게 적용.")
+    includeManual: bool = Field(False, description="True면 관리자 수동 판정(override·일괄 반려·교정) 건도 포함(일괄 재처리와 동일 기준)")
 
 
-# PostgreSQL INTEGER 상한. 금액이 타임스탬프(ms) 등으로 오인되어 저장되는 것 방지.
-MAX_AMOUNT_DB = 2147483647
-# 영수증 금액으로 허용할 상한(원). 그 이상은 타임스탬프/오인식으로 간주.
-MAX_AMOUNT_SANE = 999_999_999
+class AdminRuleSimulationResponse(BaseModel):
+    simulationId: int
+    status: str
+    filters: Dict[str, Any] = Field(default_factory=dict)
+    baseline: Dict[str, Any] = Field(default_factory=dict, description="실행 시점 규칙 값")
+    proposed: Dict[str, Any] = Field(default_factory=dict, description="바꿔 본 규칙 값")
+    total: int = 0
+    scanned: int = 0
+    scannedItems: int = 0
+    progress: float = Field(0.0, description="scanned / total (0~1)")
+    itemsPerSec: Optional[float] = Field(None, description="시작 이후 초당 재판정 장 수")
+    result: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="baseline/proposed: 구분(FIT·UNFIT·PENDING)별 건수·approvedAmount, flips: 구분 전환 건수(예: FIT→UNFIT), "
+        "approvedAmountDelta, statusChanged: 세부 상태가 바뀐 건수, storedMismatch: 현재 규칙 재판정이 저장 상태와 다른 건수, samples",
+    )
+    createdBy: Optional[str] = None
+    createdAt: Optional[str] = None
+    startedAt: Optional[str] = None
+    finishedAt: Optional[str] = None
+    lastError: Optional[str] = None
+
+
+def _rule_simulation_response(sim: RuleSimulation) -> AdminRuleSimulationResponse:
+    scanned = int(sim.scanned or 0)
+    items = int(sim.scanned_items or 0)
+    total = int(sim.total or 0)
+    rate = None
+    if sim.started_at and items:
+        elapsed = ((sim.finished_at or datetime.utcnow()) - sim.started_at).total_seconds()
+        rate = round(items / elapsed, 1) if elapsed > 0 else None
+    return AdminRuleSimulationResponse(
+        simulationId=int(sim.id),
+        status=sim.status,
+        filters=sim.filters or {},
+        baseline=sim.baseline or {},
+        proposed=sim.proposed or {},
+        total=total,
+        scanned=scanned,
+        scannedItems=items,
+        progress=round(min(1.0, scanned / total), 4) if total else (1.0 if sim.status == "DONE" else 0.0),
+        itemsPerSec=rate,
+        result=sim.result or {},
+        createdBy=sim.created_by,
+        createdAt=sim.created_at.isoformat() if sim.created_at else None,
+        startedAt=sim.started_at.isoformat() if sim.started_at else None,
+        finishedAt=sim.finished_at.isoformat() if sim.finished_at else None,
+        lastError=sim.last_error,
+    )
 
-# 영수증 OCR에서 결제/합계 금액으로 쓸 수 있는 라벨(한글). 여러 필드 인식률 향상용.
-_AMOUNT_LABELS = (
-    "합계금액", "결제금액", "공급가액", "합계", "거래금액", "받은금액",
-    "총액", "결제액", "최종결제금액", "총결제금액", "합계액",
+
+@app.post(
+    "/api/v1/admin/rules/judgment/simulations",
+    response_model=AdminRuleSimulationResponse,
+    summary="판정 규칙 변경 시뮬레이션",
+    description="규칙 저장(PUT /api/v1/admin/rules/judgment) 전에 최소 금액·자동 등록 임계값·신규 상점 정책 변경 효과 확인. "
+    "조건(캠페인·생성일 기간)에 맞는 신청의 저장된 OCR 결과를 현재 규칙과 제안 규칙으로 각각 재판정(OCR 호출·DB 변경 없음)해 "
+    "FIT/UNFIT/PENDING 전환 건수와 승인 금액 변화를 집계. 백그라운드 실행, 결과는 GET …/simulations/{simulationId}로 조회. "
+    "신규 상점 분류는 규칙 기반만 사용(Gemini 미호출), 유사 이미지 검토는 반영하지 않음.",
+    tags=["Admin - Rules"],
 )
+async def admin_create_rule_simulation(
+    body: AdminRuleSimulationRequest,
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    if not ctx.is_super and not ctx.campaign_ids:
+        raise HTTPException(status_code=403, detail="No campaign access")
+    if body.campaignId is not None and not ctx.is_super and body.campaignId not in ctx.campaign_ids:
+        raise HTTPException(status_code=403, detail="Campaign not in scope")
+    proposed: Dict[str, Any] = {}
+    policy_in = body.unknown_store_policy if body.unknown_store_policy is not None else body.unknownStorePolicy
+    if policy_in is not None:
+        proposed["unknown_store_policy"] = _normalize_unknown_store_policy(policy_in)
+    if body.auto_register_threshold is not None:
+        proposed["auto_register_threshold"] = max(0.0, min(1.0, float(body.auto_register_threshold)))
+    if body.min_amount_stay is not None:
+        proposed["min_amount_stay"] = int(body.min_amount_stay)
+    if body.min_amount_tour is not None:
+        proposed["min_amount_tour"] = int(body.min_amount_tour)
+    if not proposed:
+        raise HTTPException(status_code=400, detail="No rule values to simulate")
+    created_from, created_before = _created_range_filters(body.dateFrom, body.dateTo)
+    filters: Dict[str, Any] = {
+        "campaignId": body.campaignId,
+        "campaignScope": None if ctx.is_super else sorted(ctx.campaign_ids),
+        "createdFrom": created_from,
+        "createdBefore": created_before,
+        "includeManual": body.includeManual,
+    }
 
+    now = datetime.utcnow()
+    active = (
+        db.query(RuleSimulation.id)
+        .filter(
+            RuleSimulation.status.in_(["QUEUED", "RUNNING"]),
+            RuleSimulation.updated_at >= now - timedelta(seconds=_RULE_SIMULATION_STALE_SEC),
+        )
+        .order_by(RuleSimulation.id.asc())
+        .first()
+    )
+    if active:
+        raise HTTPException(status_code=409, detail=f"Rule simulation {active[0]} is already running. Wait for it.")
+    where, params = _reprocess_job_where(filters)
+    total = int(db.execute(sql_text(f"SELECT COUNT(*) FROM submissions s WHERE {where}"), params).scalar() or 0)
+    if total > RULE_SIMULATION_MAX_SUBMISSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many submissions for one simulation ({total}, max {RULE_SIMULATION_MAX_SUBMISSIONS}). Narrow the filters.",
+        )
+    sim = RuleSimulation(
+        status="QUEUED" if total else "DONE",
+        filters=filters,
+        proposed=proposed,
+        total=total,
+        result=_RuleSimulationTally().snapshot() if not total else None,
+        created_by=ctx.actor,
+        created_at=now,
+        finished_at=None if total else now,
+        updated_at=now,
+    )
+    db.add(sim)
+    db.commit()
+    db.refresh(sim)
+    if total:
+        _start_rule_simulation(int(sim.id))
+    return _rule_simulation_response(sim)
 
-def _parse_int_from_text(raw: Any) -> Optional[int]:
-    """문자열 또는 숫자에서 정수 추출. 쉼표 등 제거."""
-    if raw is None:
-        return None
-    if isinstance(raw, int):
-        return raw if raw >= 0 else None
-    s = re.sub(r"[^0-9]", "", str(raw).strip())
-    return int(s) if s else None
+
+@app.get(
+    "/api/v1/admin/rules/judgment/simulations/{simulationId}",
+    response_model=AdminRuleSimulationResponse,
+    responses={404: {"description": "Rule simulation not found"}},
+    summary="판정 규칙 시뮬레이션 결과",
+    description="진행 중에는 처리한 배치까지의 중간 집계를 반환.",
+    tags=["Admin - Rules"],
+)
+async def admin_get_rule_simulation(
+    simulationId: int,
+    db: Session = Depends(get_db),
+    ctx: AdminContext = Depends(get_admin_context),
+):
+    sim = db.query(RuleSimulation).filter(RuleSimulation.id == simulationId).first()
+    if not sim or (not ctx.is_super and sim.created_by != ctx.actor):
+        raise HTTPException(status_code=404, detail="Rule simulation not found")
+    return _rule_simulation_response(sim)
+
+
+class AdminCallbackResendRequest(BaseModel):
+    target_url: Optional[str] = None
+
+
+class AdminCallbackResendResponse(BaseModel):
+    receiptId: str
+    sent: bool
+
+
+@app.post(
+    "/api/v1/admin/submissions/{receiptId}/callback/resend",
+    response_model=AdminCallbackResendResponse,
+    responses={404: {"description": "Submission not found"}},
+    summary="콜백 재전송(관리자)",
+    description="OCR 결과를 지정 URL(또는 환경변수 OCR_RESULT_CALLBACK_URL)로 재전송. 관리자 검수 완료 후 FE에 결과를 다시 보낼 때 사용.",
+    tags=["Admin - Callback"],
+)
+async def admin_resend_callback(
+    receiptId: str,
+    body: AdminCallbackResendRequest,
+    db: Session = Depends(get_db),
+    actor: str = Depends(require_admin),
+):
+    rid = _sanitize_receipt_id(receiptId)
+    submission = db.query(Submission).filter(Submission.submission_id == rid).first()
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    item_rows = (
+        db.query(ReceiptItem)
+        .filter(ReceiptItem.submission_id == rid)
+        .order_by(ReceiptItem.seq_no.asc())
+        .all()
+    )
+    payload = _build_status_payload(submission, item_rows)
+    await _send_result_callback(rid, payload, target_url=body.target_url, purpose="resend", actor=actor)
+    _audit_log(
+        db,
+        actor=actor,
+        action="CALLBACK_RESEND",
+        target_type="submission",
+        target_id=rid,
+        meta={"target_url": body.target_url},
+    )
+    try:
+        sidecar = dict(submission.submission_sidecar) if getattr(submission, "submission_sidecar", None) else {}
+        sidecar["callback_sent"] = True
+        sidecar["callback_sent_at"] = datetime.utcnow().isoformat() + "Z"
+        submission.submission_sidecar = sidecar
+    except Exception:
+        pass
+    db.commit()
+    return AdminCallbackResendResponse(receiptId=rid, sent=True)
+
+
+@app.post(
+    "/api/v1/admin/submissions/{receiptId}/callback/verify",
+    responses={404: {"description": "Submission not found"}},
+    summary="콜백 검증(즉시 송출)",
+    description="현재 DB 기준 상태를 콜백 URL로 즉시 전송하고, 전송 결과(성공/실패/스킵)를 응답으로 반환. 콜백 URL 설정 여부 확인 및 수동 재전송 테스트용.",
+    tags=["Admin - Callback"],
+)
+async def admin_verify_callback(
+    receiptId: str,
+    db: Session = Depends(get_db),
+    actor: str = Depends(require_admin),
+):
+    rid = _sanitize_receipt_id(receiptId)
+    submission = db.query(Submission).filter(Submission.submission_id == rid).first()
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    item_rows = (
+        db.query(ReceiptItem)
+        .filter(ReceiptItem.submission_id == rid)
+        .order_by(ReceiptItem.seq_no.asc())
+        .all()
+    )
+    payload = _build_status_payload(submission, item_rows)
+    result = await _send_result_callback(rid, payload, purpose="verify", actor=actor)
+    _audit_log(
+        db,
+        actor=actor,
+        action="CALLBACK_VERIFY",
+        target_type="submission",
+        target_id=rid,
+        meta={"result": result},
+    )
+    db.commit()
+    return result
+
+
+@app.get(
+    "/api/v1/admin/submissions/{receiptId}/callback/logs",
+    responses={404: {"description": "Submission not found"}},
+    summary="콜백 전송 로그 조회",
+    description="해당 receiptId에 대한 콜백 전송/재전송/검증 시도 이력을 조회. CALLBACK_SEND, CALLBACK_RESEND, CALLBACK_VERIFY 액션만 포함.",
+    tags=["Admin - Callback"],
+)
+async def admin_get_callback_logs(
+    receiptId: str,
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    actor: str = Depends(require_admin),
+):
+    rid = _sanitize_receipt_id(receiptId)
+    rows = (
+        db.query(AdminAuditLog)
+        .filter(
+            AdminAuditLog.target_type == "submission",
+            AdminAuditLog.target_id == rid,
+            AdminAuditLog.action.in_(["CALLBACK_SEND", "CALLBACK_RESEND", "CALLBACK_VERIFY"]),
+        )
+        .order_by(AdminAuditLog.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+    _ = actor  # 권한 체크용
+    return {
+        "receiptId": rid,
+        "items": [
+            {
+                "id": int(r.id),
+                "action": r.action,
+                "actor": r.actor,
+                "created_at": r.created_at.isoformat() if r.created_at else None,
+                "meta": r.meta,
+            }
+            for r in rows
+        ],
+    }
+
+
+class AdminAuditLogItem(BaseModel):
+    id: int
+    action: str
+    target_type: Optional[str] = None
+    target_id: Optional[str] = None
+    actor: Optional[str] = None
+    created_at: Optional[str] = None
+    meta: Optional[Dict[str, Any]] = None
+    before_json: Optional[Dict[str, Any]] = None
+    after_json: Optional[Dict[str, Any]] = None
+
+
+class AdminAuditLogListResponse(BaseModel):
+    total: int = 0
+    items: List[AdminAuditLogItem] = Field(default_factory=list)
+
+
+@app.get(
+    "/api/v1/admin/audit-log",
+    response_model=AdminAuditLogListResponse,
+    summary="감사로그 목록 조회",
+    description=(
+        "관리자 감사로그를 조건별로 조회. 인식률 분석(예: CANDIDATE_APPROVE의 corrected=true 건), "
+        "콜백 실패 추적, 규칙 변경 이력 등에 활용."
+    ),
+    tags=["Admin - Audit"],
+)
+async def admin_list_audit_log(
+    action: Optional[str] = Query(None, description="액션 필터 (예: CANDIDATE_APPROVE, CALLBACK_SEND, RULE_UPDATE)"),
+    target_type: Optional[str] = Query(None, description="대상 타입 (예: submission, unregistered_store)"),
+    from_: Optional[str] = Query(None, alias="from", description="시작일시 ISO8601 또는 YYYY-MM-DD"),
+    to: Optional[str] = Query(None, description="종료일시 ISO8601 또는 YYYY-MM-DD"),
+    include_json: bool = Query(False, description="True면 before_json, after_json 포함 (용량 큼)"),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    actor: str = Depends(require_admin),
+):
+    _ = actor
+    q = db.query(AdminAuditLog)
+    if action:
+        q = q.filter(AdminAuditLog.action == action.strip())
+    if target_type:
+        q = q.filter(AdminAuditLog.target_type == target_type.strip())
+    if from_:
+        try:
+            dt_from = dateutil_parser.parse(from_)
+            q = q.filter(AdminAuditLog.created_at >= dt_from)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid from date")
+    if to:
+        try:
+            dt_to = dateutil_parser.parse(to)
+            q = q.filter(AdminAuditLog.created_at <= dt_to)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid to date")
+    q = q.order_by(AdminAuditLog.created_at.desc())
+    total = q.count()
+    rows = q.limit(limit).all()
+    items = []
+    for r in rows:
+        items.append(
+            AdminAuditLogItem(
+                id=int(r.id),
+                action=r.action or "",
+                target_type=r.target_type,
+                target_id=r.target_id,
+                actor=r.actor,
+                created_at=r.created_at.isoformat() if r.created_at else None,
+                meta=r.meta,
+                before_json=_dict_for_jsonb(r.before_json) if include_json and r.before_json else None,
+                after_json=_dict_for_jsonb(r.after_json) if include_json and r.after_json else None,
+            )
+        )
+    return AdminAuditLogListResponse(total=total, items=items)
+
+
+# 6. Naver 영수증 OCR 연동 (CLOVA Document OCR > 영수증)
+# - 리사이즈·압축은 image_preprocess 모듈(이미지 프로세스 풀에서 실행)
+
+
+def _get_image_bytes_from_s3(object_key: str) -> Tuple[bytes, str]:
+    """MinIO에서 이미지 바이너리 직접 읽기. 반환: (bytes, content_type)."""
+    body, content_type, _ = _get_image_object_from_s3(object_key)
+    return body, content_type
+
+
+def _get_image_object_from_s3(object_key: str) -> Tuple[bytes, str, str]:
+    """_get_image_bytes_from_s3 + 객체 ETag(따옴표 포함). 반환: (bytes, content_type, etag)."""
+    resp = s3_client.get_object(Bucket=S3_BUCKET, Key=object_key)
+    body = resp["Body"].read()
+    content_type = (resp.get("ContentType") or "image/jpeg").lower()
+    etag = resp.get("ETag") or ('"%s"' % hashlib.md5(body).hexdigest())
+    return body, content_type, etag
+
+
+def _thumbnail_key_for(image_key: str) -> str:
+    """원본 키 → 썸네일 파생 키. 원본 경로(STAY/·TOUR/)를 그대로 이어 붙여 충돌 없음."""
+    return f"thumbnails/{THUMBNAIL_MAX_SIDE}/{image_key.strip().lstrip('/')}"
+
+
+def _put_thumbnail_to_s3(image_key: str, body: bytes, content_type: str) -> str:
+    """썸네일 업로드. 반환: 썸네일 키. 원본 키가 바뀌지 않는 한 내용이 같으므로 immutable 캐시 지정."""
+    key = _thumbnail_key_for(image_key)
+    s3_client.put_object(
+        Bucket=S3_BUCKET,
+        Key=key,
+        Body=body,
+        ContentType=content_type,
+        CacheControl=f"private, max-age={IMAGE_PROXY_CACHE_MAX_AGE_SEC}, immutable",
+    )
+    return key
+
+
+def _image_format_from_content_type(content_type: str) -> str:
+    """Content-Type → 네이버 OCR format (jpg|png)."""
+    if "png" in content_type:
+        return "png"
+    return "jpg"
+
+
+def _strip_trailing_date_junk(s: str) -> str:
+    """
+    날짜 문자열 끝의 괄호·요일 등 비날짜 접미사 제거.
+    예: "26.02.22 (일)" → "26.02.22", "26-02-22-(일)" → "26-02-22"
+    """
+    if not s:
+        return s
+    s = re.sub(r"[(\（].*$", "", s.strip())
+    return s.strip(" -")
+
+
+# 2026년 이벤트 기간: UNFIT_DATE 전제(§10.3). 이 기간 내 유효한 날짜면 FIT 판정을 막지 않음.
+EVENT_YEAR_2026_START = date(2026, 1, 1)
+EVENT_YEAR_2026_END = date(2026, 12, 31)
+
+
+def _normalize_and_validate_2026_date(date_text: str) -> Tuple[bool, Optional[str]]:
+    """
+    OCR 날짜 정규화 후 2026년 이벤트 기간 내 유효성 검사 (§10.3 UNFIT_DATE 전제).
+    - 이벤트 기간 내 유효한 날짜면 True 반환 → 해당 장 FIT 가능, UNFIT_DATE로 전체를 막지 않음.
+    Step1: 괄호·요일 등 비날짜 접미사 제거 (예: "26.02.22 (일)" → "26.02.22")
+    Step2: 구분자(., /, 공백)를 '-'로 치환
+    Step3: 2026 또는 26으로 시작하는지 확인
+    Step4: dateutil.parser로 파싱 후 2026년 이벤트 기간 내인지 검증
+    반환: (2026년 이벤트 기간 내 유효 여부, 정규화된 날짜 문자열 또는 None)
+    """
+    if not date_text or not isinstance(date_text, str):
+        return False, None
+    s = date_text.strip()
+    s = _strip_trailing_date_junk(s)
+    s = re.sub(r"[/.\s]+", "-", s)
+    s = re.sub(r"-+", "-", s).strip("- ")
+    if not re.match(r"^(2026|26)", s):
+        return False, None
+    if s.startswith("26") and (len(s) == 2 or s[2] in "-./"):
+        s = "20" + s
+    try:
+        parsed = dateutil_parser.parse(s)
+        d = parsed.date() if hasattr(parsed, "date") else date(parsed.year, parsed.month, parsed.day)
+        if not (EVENT_YEAR_2026_START <= d <= EVENT_YEAR_2026_END):
+            return False, None
+        normalized = d.strftime("%Y/%m/%d")
+        return True, normalized
+    except (ValueError, TypeError):
+        return False, None
+
+
+def _normalize_pay_date_canonical(raw: Optional[str]) -> Optional[str]:
+    """
+    결제일자를 YYYY/MM/DD 형식으로 통일. (26/01/10 → 2026/01/10, 26.02.22 (일) → 2026/02/22)
+    파싱 실패 시 원문 반환(또는 None). receipt_item 저장·API 응답에 사용.
+    """
+    if not raw or not isinstance(raw, str):
+        return raw
+    s = raw.strip()
+    if not s:
+        return None
+    s = _strip_trailing_date_junk(s)
+    s = re.sub(r"[/.\s]+", "-", s)
+    s = re.sub(r"-+", "-", s).strip("- ")
+    # 26-01-10 → 2026-01-10
+    if len(s) >= 2 and s[:2] == "26" and (len(s) == 2 or s[2] in "-."):
+        s = "20" + s
+    try:
+        parsed = dateutil_parser.parse(s)
+        return parsed.strftime("%Y/%m/%d")
+    except (ValueError, TypeError):
+        return raw if raw.strip() else None
+
+
+class NaverOCRInferError(ValueError):
+    """Naver OCR 200 OK이지만 inferResult가 SUCCESS가 아님(예: ERROR). 재시도해도 동일하므로 재시도 생략."""
+
+
+def _validate_naver_ocr_response(ocr_data: Any, receipt_id: str) -> None:
+    """
+    네이버 OCR 응답 검증. 형식 오류 시 ValueError 발생 → 호출부에서 ERROR_OCR 처리.
+    - 200 OK이지만 body에 error 또는 images 누락/비정상 시 분석 불가로 간주.
+    - inferResult가 ERROR 등이면 NaverOCRInferError (재시도 없이 즉시 실패 처리).
+    """
+    if not isinstance(ocr_data, dict):
+        raise ValueError(f"Naver OCR response is not a dict: type={type(ocr_data).__name__}")
+    if ocr_data.get("error"):
+        err = ocr_data["error"]
+        msg = err.get("message", err) if isinstance(err, dict) else str(err)
+        raise ValueError(f"Naver OCR error in response: {msg}")
+    images = ocr_data.get("images")
+    if not isinstance(images, list) or len(images) == 0:
+        raise ValueError("Naver OCR response has no images or empty images array")
+    first = images[0] if isinstance(images[0], dict) else {}
+    infer_result = first.get("inferResult") or first.get("message")
+    if infer_result is not None and isinstance(infer_result, str):
+        if infer_result.upper() not in ("SUCCESS", "SUCCESS_OK"):
+            raise NaverOCRInferError(f"Naver OCR inferResult not success: {infer_result}")
+
+
+def _resolve_ocr_domain(image_key: Optional[str], project_type: Optional[str]) -> str:
+    """
+    MinIO 저장 경로 또는 요청 project_type으로 STAY/TOUR 결정.
+    - image_key가 STAY/ 또는 TOUR/ 로 시작하면 해당 도메인
+    - 아니면 project_type (STAY|TOUR), 미있으면 TOUR
+    """
+    key = (image_key or "").strip()
+    if key.upper().startswith("STAY/"):
+        return "STAY"
+    if key.upper().startswith("TOUR/"):
+        return "TOUR"
+    pt = (project_type or "").strip().upper()
+    return "STAY" if pt == "STAY" else "TOUR"
+
+
+async def _call_naver_ocr_binary(
+    image_binary: bytes, receipt_id: str, image_format: str = "jpg", domain_type: str = "TOUR"
+) -> dict:
+    """
+    CLOVA OCR — multipart/form-data(바이너리) 전송.
+    domain_type: STAY(일반 모델·템플릿) | TOUR(영수증 특화). 경로 기반 분기 후 호출.
+    """
+    config = OCR_CONFIG.get(domain_type) or OCR_CONFIG["TOUR"]
+    url = config.get("url")
+    secret = config.get("secret")
+    if not url or not secret:
+        raise ValueError(f"OCR config missing for domain={domain_type}")
+    message = {
+        "version": "V2",
+        "requestId": receipt_id,
+        "timestamp": int(time.time() * 1000),
+        "images": [{"format": image_format, "name": "receipt"}],
+    }
+    mime = "image/jpeg" if image_format == "jpg" else "image/png"
+    files = {
+        "file": ("receipt.jpg" if image_format == "jpg" else "receipt.png", image_binary, mime),
+        "message": (None, json.dumps(message), "application/json"),
+    }
+    headers = {"X-OCR-SECRET": secret}
+    response = await _get_http_client("ocr").post(url, headers=headers, files=files)
+    if response.status_code >= 400:
+        try:
+            body = response.text
+            if len(body) > 500:
+                body = body[:500] + "..."
+            logger.warning(
+                "Naver OCR %s (domain=%s): status=%s body=%s",
+                receipt_id, domain_type, response.status_code, body,
+            )
+        except Exception:
+            pass
+    response.raise_for_status()
+    try:
+        ocr_data = response.json()
+    except Exception as e:
+        logger.warning("Naver OCR response is not JSON: %s", e)
+        raise ValueError(f"Naver OCR response is not valid JSON: {e}") from e
+    _validate_naver_ocr_response(ocr_data, receipt_id)
+    return ocr_data
+
+
+async def _call_naver_ocr_with_retry(
+    image_binary: bytes, receipt_id: str, image_format: str = "jpg", domain_type: str = "TOUR", retries: int = 2
+) -> dict:
+    """
+    네이버 OCR 호출 재시도 래퍼.
+    - domain_type: STAY | TOUR (저장 경로 기반 분기 후 전달)
+    - inferResult ERROR 등 NaverOCRInferError는 재시도하지 않음 (동일 이미지 재전송 무의미).
+    """
+    last_exc: Optional[Exception] = None
+    limiter = _get_ocr_domain_limiter(domain_type)
+    for attempt in range(retries + 1):
+        try:
+            # 시도마다 슬롯·토큰 확보(재시도 대기 중에는 슬롯을 점유하지 않음)
+            async with limiter.slot():
+                return await _call_naver_ocr_binary(image_binary, receipt_id, image_format, domain_type=domain_type)
+        except NaverOCRInferError as e:
+            logger.warning("Naver OCR inferResult 실패(재시도 없음): %s", e)
+            raise
+        except Exception as e:
+            last_exc = e
+            logger.warning(
+                "Naver OCR call failed (attempt %s/%s): %s",
+                attempt + 1,
+                retries + 1,
+                e,
+            )
+            if attempt < retries:
+                await asyncio.sleep(0.4 * (attempt + 1))
+    raise last_exc if last_exc else RuntimeError("Naver OCR failed")
+
+
+# Naver OCR 도메인(STAY/TOUR)별 호출 제한: 동시 호출 수 + 초당 호출 수(RPS).
+# - OCR_RATE_LIMIT_SHARED=1(기본): 워커 프로세스 간 공유. 동시 호출 수는 Postgres advisory lock 슬롯, RPS는 ocr_rate_limit 테이블(GCRA 토큰 버킷).
+#   동시 호출 수는 OCR_{DOMAIN}_CONCURRENCY 또는 OCR_DOMAIN_CONCURRENCY를 지정한 경우에만 전체 프로세스 합산(미지정 시 기존처럼 프로세스당 1건).
+#   슬롯 lock은 앱 풀과 분리된 전용 소형 엔진의 세션 lock으로 보유(트랜잭션 열어두지 않음).
+# - DB 장애 시 프로세스 로컬 제한으로 대체. 대기 시간 지표는 GET /api/v1/admin/ops/metrics
+OCR_RATE_LIMIT_SHARED = os.getenv("OCR_RATE_LIMIT_SHARED", "1").strip().lower() in ("1", "true", "yes")
+_OCR_ADVISORY_LOCK_CLASS = 72010  # pg_try_advisory_lock(class, key) 네임스페이스
+_OCR_DOMAIN_LOCK_KEYS = {"STAY": 1, "TOUR": 2}
+
+
+def _ocr_domain_limit_config(domain: str) -> Tuple[int, float, int, bool]:
+    """
+    도메인별 (동시 호출 수, RPS, 버스트, 동시 호출 수 전체 합산 여부). OCR_{DOMAIN}_* 미설정 시 공통 OCR_DOMAIN_* 사용. RPS 0이면 제한 없음.
+    동시 호출 수를 지정하지 않으면 프로세스당 1건(기존 동작) — 공유 모드라도 advisory lock 슬롯 미사용(워커 증설 시 처리량 유지).
+    """
+    def _env(name: str, default: str) -> str:
+        return (os.getenv(f"OCR_{domain}_{name}") or os.getenv(f"OCR_DOMAIN_{name}") or default).strip()
+
+    concurrency_set = bool(_env("CONCURRENCY", ""))
+    concurrency = max(1, min(50, int(_env("CONCURRENCY", "1"))))
+    rps = max(0.0, min(100.0, float(_env("RPS", "0"))))
+    burst = max(1, min(100, int(_env("BURST", "1"))))
+    return concurrency, rps, burst, OCR_RATE_LIMIT_SHARED and concurrency_set
+
+
+_ocr_lock_engine_obj = None
+_ocr_lock_engine_lock = threading.Lock()
+
+
+def _ocr_lock_engine():
+    """
+    OCR 슬롯 advisory lock 전용 엔진(지연 생성). 앱 풀(engine)과 분리해 CLOVA 호출 동안 잡힌 연결이 I/O 풀 DB 작업과 경쟁하지 않음.
+    AUTOCOMMIT이라 lock 보유 중에도 idle in transaction 아님. 풀 크기 = 도메인별 동시 호출 수 합(로컬 세마포어가 상한 보장).
+    """
+    global _ocr_lock_engine_obj
+    with _ocr_lock_engine_lock:
+        if _ocr_lock_engine_obj is None:
+            size = sum(c for c, _, _, shared in map(_ocr_domain_limit_config, _OCR_DOMAIN_LOCK_KEYS) if shared) or 1
+            _ocr_lock_engine_obj = create_engine(
+                DATABASE_URL,
+                pool_size=size,
+                max_overflow=2,
+                pool_pre_ping=True,
+                pool_recycle=300,
+                isolation_level="AUTOCOMMIT",
+            )
+        return _ocr_lock_engine_obj
+
+
+class _OcrDomainLimiter:
+    """
+    도메인 1개의 OCR 호출 제한기. async with limiter.slot(): 안에서 CLOVA 1회 호출.
+    순서: 로컬 세마포어(프로세스 내 동시 수) → 공유 advisory lock 슬롯(전체 동시 수, 동시 호출 수 지정 시) → 토큰 버킷(RPS).
+    """
+
+    def __init__(self, domain: str) -> None:
+        self.domain = domain
+        self.concurrency, self.rps, self.burst, self.shared_slots = _ocr_domain_limit_config(domain)
+        self._sem = asyncio.Semaphore(self.concurrency)
+        self._local_tat = 0.0  # 로컬 GCRA theoretical arrival time(monotonic)
+        self._local_rate_lock = asyncio.Lock()
+        self.stats: Dict[str, Any] = {
+            "acquired": 0, "waiting": 0, "in_flight": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0,
+            "shared_fallbacks": 0,
+        }
+
+    # --- 공유(Postgres) ---
+    def _slot_key(self, slot: int) -> int:
+        return _OCR_DOMAIN_LOCK_KEYS.get(self.domain, 9) * 100 + slot
+
+    def _try_shared_slot(self) -> Optional[Tuple[Any, int]]:
+        """빈 advisory lock 슬롯을 세션 lock으로 점유해 (전용 엔진 연결, 슬롯 키) 반환. 슬롯 없으면 None."""
+        conn = _ocr_lock_engine().connect()
+        try:
+            for slot in range(self.concurrency):
+                got = conn.execute(
+                    sql_text("SELECT pg_try_advisory_lock(:cls, :key)"),
+                    {"cls": _OCR_ADVISORY_LOCK_CLASS, "key": self._slot_key(slot)},
+                ).scalar()
+                if got:
+                    return conn, self._slot_key(slot)
+            conn.close()
+            return None
+        except Exception:
+            conn.invalidate()
+            conn.close()
+            raise
+
+    @staticmethod
+    def _release_shared_slot(held: Tuple[Any, int]) -> None:
+        """세션 lock 해제 후 연결 반납. 해제 실패 시 연결을 폐기(세션 종료로 lock도 해제)."""
+        conn, key = held
+        try:
+            conn.execute(
+                sql_text("SELECT pg_advisory_unlock(:cls, :key)"),
+                {"cls": _OCR_ADVISORY_LOCK_CLASS, "key": key},
+            )
+        except Exception:
+            conn.invalidate()
+            raise
+        finally:
+            conn.close()
+
+    def _take_shared_token(self) -> float:
+        """공유 토큰 버킷(GCRA)에서 1건 소비. 성공 시 0, 부족하면 대기해야 할 초 반환."""
+        interval = 1.0 / self.rps
+        window = interval * self.burst
+        with engine.begin() as conn:
+            conn.execute(
+                sql_text("INSERT INTO ocr_rate_limit (domain, tat) VALUES (:d, clock_timestamp()) ON CONFLICT (domain) DO NOTHING"),
+                {"d": self.domain},
+            )
+            row = conn.execute(
+                sql_text("""
+                UPDATE ocr_rate_limit
+                SET tat = GREATEST(tat, clock_timestamp()) + make_interval(secs => :interval)
+                WHERE domain = :d
+                  AND GREATEST(tat, clock_timestamp()) + make_interval(secs => :interval)
+                      - make_interval(secs => :window) <= clock_timestamp()
+                RETURNING tat
+                """),
+                {"d": self.domain, "interval": interval, "window": window},
+            ).fetchone()
+            if row:
+                return 0.0
+            wait = conn.execute(
+                sql_text("""
+                SELECT EXTRACT(EPOCH FROM (GREATEST(tat, clock_timestamp()) + make_interval(secs => :interval)
+                       - make_interval(secs => :window) - clock_timestamp()))
+                FROM ocr_rate_limit WHERE domain = :d
+                """),
+                {"d": self.domain, "interval": interval, "window": window},
+            ).scalar()
+        return max(0.01, float(wait or interval))
+
+    # --- 로컬 ---
+    async def _take_local_token(self) -> None:
+        interval = 1.0 / self.rps
+        window = interval * self.burst
+        async with self._local_rate_lock:
+            now = time.monotonic()
+            tat = max(self._local_tat, now) + interval
+            wait = tat - window - now
+            self._local_tat = tat
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _acquire(self) -> Optional[Tuple[Any, int]]:
+        """슬롯·토큰 확보. 공유 슬롯 (연결, 키)(또는 None) 반환."""
+        conn = None
+        if OCR_RATE_LIMIT_SHARED:
+            try:
+                delay = 0.05
+                while self.shared_slots and conn is None:
+                    conn = await _run_io(self._try_shared_slot)
+                    if conn is None:
+                        await asyncio.sleep(delay)
+                        delay = min(0.5, delay * 2)
+                if self.rps > 0:
+                    while True:
+                        wait = await _run_io(self._take_shared_token)
+                        if wait <= 0:
+                            break
+                        await asyncio.sleep(min(wait, 5.0))
+                return conn
+            except Exception as e:
+                logger.warning("OCR shared rate limit unavailable (domain=%s), using local limit: %s", self.domain, e)
+                self.stats["shared_fallbacks"] += 1
+                if conn is not None:
+                    await _run_io(self._release_shared_slot, conn)
+                    conn = None
+        if self.rps > 0:
+            await self._take_local_token()
+        return None
+
+    @asynccontextmanager
+    async def slot(self):
+        started = time.monotonic()
+        self.stats["waiting"] += 1
+        conn = None
+        try:
+            await self._sem.acquire()
+            try:
+                conn = await self._acquire()
+            except BaseException:
+                self._sem.release()
+                raise
+        finally:
+            self.stats["waiting"] -= 1
+        wait_ms = (time.monotonic() - started) * 1000.0
+        self.stats["acquired"] += 1
+        self.stats["wait_ms_total"] += wait_ms
+        self.stats["wait_ms_max"] = max(self.stats["wait_ms_max"], wait_ms)
+        self.stats["in_flight"] += 1
+        try:
+            yield
+        finally:
+            self.stats["in_flight"] -= 1
+            if conn is not None:
+                try:
+                    await _run_io(self._release_shared_slot, conn)
+                except Exception as e:
+                    logger.warning("OCR shared slot release failed (domain=%s): %s", self.domain, e)
+            self._sem.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        acquired = self.stats["acquired"]
+        return {
+            "concurrency": self.concurrency,
+            "rps": self.rps,
+            "burst": self.burst,
+            "shared": OCR_RATE_LIMIT_SHARED,
+            "shared_slots": self.shared_slots,
+            **self.stats,
+            "wait_ms_total": round(self.stats["wait_ms_total"], 1),
+            "wait_ms_max": round(self.stats["wait_ms_max"], 1),
+            "wait_ms_avg": round(self.stats["wait_ms_total"] / acquired, 1) if acquired else 0.0,
+        }
+
+
+_ocr_domain_limiters: Dict[str, _OcrDomainLimiter] = {}
+
+
+def _get_ocr_domain_limiter(domain: str) -> _OcrDomainLimiter:
+    if domain not in _ocr_domain_limiters:
+        _ocr_domain_limiters[domain] = _OcrDomainLimiter(domain)
+    return _ocr_domain_limiters[domain]
+
+
+# PostgreSQL INTEGER 상한. 금액이 타임스탬프(ms) 등으로 오인되어 저장되는 것 방지.
+MAX_AMOUNT_DB = 2147483647
+# 영수증 금액으로 허용할 상한(원). 그 이상은 타임스탬프/오인식으로 간주.
+MAX_AMOUNT_SANE = 999_999_999
+
+# 영수증 OCR에서 결제/합계 금액으로 쓸 수 있는 라벨(한글). 여러 필드 인식률 향상용.
+_AMOUNT_LABELS = (
+    "합계금액", "결제금액", "공급가액", "합계", "거래금액", "받은금액",
+    "총액", "결제액", "최종결제금액", "총결제금액", "합계액",
+)
+
+
+def _parse_int_from_text(raw: Any) -> Optional[int]:
+    """문자열 또는 숫자에서 정수 추출. 쉼표 등 제거."""
+    if raw is None:
+        return None
+    if isinstance(raw, int):
+        return raw if raw >= 0 else None
+    s = re.sub(r"[^0-9]", "", str(raw).strip())
+    return int(s) if s else None
 
 
 def _collect_amount_candidates(obj: Any, depth: int, candidates: List[int], seen_keys: Optional[set] = None) -> None:
     """
-    OCR result 내에서 금액 후보 수집. 재귀적으로 dict를 순회하며 text/value 또는
-    name·label이 합계/결제 관련인 경우 값을 수집. depth로 과도한 재귀 방지.
+    OCR result 내에서 금액 후보 수집. 재귀적으로 dict를 순회하며 text/value 또는
+    name·label이 합계/결제 관련인 경우 값을 수집. depth로 과도한 재귀 방지.
+    """
+    if depth > 8 or obj is None:
+        return
+    if seen_keys is None:
+        seen_keys = set()
+    if isinstance(obj, dict):
+        # 동일 객체 중복 방지 (참조 기반이 아니므로 id 사용 안 함)
+        text_val = obj.get("text") or obj.get("value")
+        num = _parse_int_from_text(text_val)
+        if num is not None and 1000 <= num <= 99999999:
+            name = (obj.get("name") or obj.get("label") or "").strip()
+            key_match = any(l in name for l in _AMOUNT_LABELS)
+            if key_match:
+                candidates.append(num)
+        for k, v in obj.items():
+            if k in seen_keys:
+                continue
+            _collect_amount_candidates(v, depth + 1, candidates, seen_keys)
+    elif isinstance(obj, list):
+        for item in obj:
+            _collect_amount_candidates(item, depth + 1, candidates, seen_keys)
+
+
+def _clamp_amount_for_db(value: Optional[int]) -> Optional[int]:
+    """DB 저장 가능 범위(0 ~ MAX_AMOUNT_DB)로 제한. 초과 시 None(타임스탬프 등 오인식 방지)."""
+    if value is None or value < 0:
+        return None
+    if value > MAX_AMOUNT_DB:
+        return None
+    return value
+
+
+def _extract_amount_from_result(result: dict) -> Optional[int]:
+    """
+    result에서 결제/합계 금액 추출. 우선순위:
+    1) totalPrice.price.text
+    2) paymentInfo.totalAmount / totalPrice / amount 등
+    3) 합계금액·결제금액·공급가액·합계·거래금액·받은금액 라벨 매칭
+    4) subTotal 부가세로 추정
+    - 반환값은 MAX_AMOUNT_DB 이하로 제한(타임스탬프 등 오인식 방지).
+    """
+    candidates: List[int] = []
+    # 1) totalPrice (기존)
+    price_text = (result.get("totalPrice") or {}).get("price") or {}
+    raw = (price_text.get("text") or price_text.get("value") or "0").strip()
+    n = _parse_int_from_text(raw)
+    if n is not None and 1000 <= n <= MAX_AMOUNT_SANE:
+        return _clamp_amount_for_db(n)
+    if n is not None and n <= MAX_AMOUNT_SANE:
+        candidates.append(n)
+    # 2) paymentInfo.totalAmount, totalAmount, supplyPrice 등 (금액 상한 적용)
+    for key in ("totalAmount", "totalPrice", "paymentAmount", "supplyPrice", "amount", "합계", "결제금액"):
+        node = result.get(key)
+        if isinstance(node, dict):
+            t = node.get("text") or node.get("value")
+            nn = _parse_int_from_text(t)
+            if nn is not None and 1000 <= nn <= MAX_AMOUNT_SANE:
+                candidates.append(nn)
+        elif isinstance(node, list) and node and isinstance(node[0], dict):
+            t = node[0].get("text") or node[0].get("value")
+            nn = _parse_int_from_text(t)
+            if nn is not None and 1000 <= nn <= MAX_AMOUNT_SANE:
+                candidates.append(nn)
+    # 3) 재귀 수집 (라벨 매칭)
+    _collect_amount_candidates(result, 0, candidates)
+    if candidates:
+        best = max(candidates)
+        if best >= 1000:
+            return _clamp_amount_for_db(best)
+    # 4) subTotal 부가세 추정
+    sub_total = result.get("subTotal") or []
+    if isinstance(sub_total, list) and len(sub_total) > 0:
+        first = sub_total[0]
+        tax_prices = (first.get("taxPrice") or []) if isinstance(first, dict) else []
+        if tax_prices and isinstance(tax_prices[0], dict):
+            tax_text = (tax_prices[0].get("text") or "").strip()
+            tax_num = re.sub(r"[^0-9]", "", tax_text)
+            if tax_num:
+                tax_val = int(tax_num)
+                if 100 <= tax_val <= (MAX_AMOUNT_SANE // 10):
+                    return _clamp_amount_for_db(tax_val * 10)
+    return _clamp_amount_for_db(max(candidates)) if candidates else None
+
+
+def _parse_ocr_result(ocr_data: dict) -> tuple[Optional[int], Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    Naver OCR JSON 파싱. 반환: (amount, pay_date, store_name, address, location_시군).
+    - 금액: totalPrice 우선, 없거나 작으면 합계금액/결제금액/공급가액/합계/거래금액/받은금액 등 여러 필드 후보 수집 후 최대값 사용, 마지막으로 subTotal 부가세 추정.
+    """
+    try:
+        images = ocr_data.get("images") or []
+        if not images:
+            return (None, None, None, None, None)
+        receipt = images[0].get("receipt") or {}
+        result = receipt.get("result")
+        if not result:
+            return (None, None, None, None, None)
+        amount = _extract_amount_from_result(result)
+        # 결제 날짜
+        payment_info = result.get("paymentInfo") or {}
+        date_obj = payment_info.get("date") or {}
+        pay_date = (date_obj.get("text") or "").strip()
+        pay_date = _normalize_pay_date_canonical(pay_date) or pay_date
+        # 상호명
+        store_info = result.get("storeInfo") or {}
+        store_name = (store_info.get("name") or {}).get("text") or ""
+        store_name = re.sub(r"\s+", " ", store_name).strip()
+        # 주소: address 단일 객체 또는 addresses 배열 (CLOVA 형식)
+        addr_obj = store_info.get("address") or {}
+        address = (addr_obj.get("text") or "").strip()
+        if not address:
+            addrs = store_info.get("addresses") or []
+            if isinstance(addrs, list) and len(addrs) > 0:
+                first_addr = addrs[0] if isinstance(addrs[0], dict) else {}
+                address = (first_addr.get("text") or "").strip()
+        address = _normalize_address(address) or address
+        # 시군: 주소에서 두 번째 단어 (속초시, 춘천시 등)
+        location = ""
+        if address:
+            parts = address.split()
+            location = parts[1] if len(parts) >= 2 else ""
+        return (amount, pay_date, store_name, address, location)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return (None, None, None, None, None)
+
+
+def _extract_business_num(ocr_data: dict) -> Optional[str]:
+    """
+    OCR 결과에서 사업자등록번호(bizNum) 텍스트 추출. 실패 시 None.
+    """
+    try:
+        images = ocr_data.get("images") or []
+        if not images:
+            return None
+        receipt = images[0].get("receipt") or {}
+        result = receipt.get("result") or {}
+        store_info = result.get("storeInfo") or {}
+        biz_obj = store_info.get("bizNum") or {}
+        biz = (biz_obj.get("text") or "").strip()
+        return _normalize_biz_num(biz) or None
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+# 카드번호 구분: 현금=0000, 카드번호 없음/마스킹(****)=1000, 유효한 번호=마지막 4자리
+CARD_NUM_CASH = "0000"
+CARD_NUM_NO_CARD = "1000"
+
+
+def _normalize_card_num(raw: Optional[str]) -> str:
+    """
+    카드번호 정규화 (§10.3: 앞 4자리 저장·반영).
+    - 4자리만 추출된 경우: 앞 4자리로 해석해 저장 (영수증 마스킹이 앞 4자리 노출인 경우가 많음).
+    - 5자리 이상: 마지막 4자리 저장 (전체 번호에서 뒷 4자리만 노출된 경우).
+    - 비어 있거나 **** 등 마스킹/미표시면 '1000'(카드번호 없음).
+    - 현금 여부는 _extract_card_num에서 OCR 전체로 판별 → '0000'.
+    """
+    text = (raw or "").strip()
+    if not text or re.match(r"^[\s*\-]+$", text):
+        return CARD_NUM_NO_CARD
+    digits = re.sub(r"[^0-9]", "", text)
+    if len(digits) == 4:
+        return digits  # 앞 4자리로 해석
+    if len(digits) > 4:
+        return digits[-4:]
+    return CARD_NUM_NO_CARD
+
+
+def _digits_only(raw: Optional[str]) -> str:
+    return re.sub(r"[^0-9]", "", (raw or "").strip())
+
+
+def _normalize_biz_num(raw: Optional[str]) -> Optional[str]:
+    """
+    사업자등록번호 정규화:
+    - 숫자만 추출 후 길이 10이면 000-00-00000 포맷으로 통일
+    - 그 외는 원문/None
+    """
+    s = (raw or "").strip()
+    if not s:
+        return None
+    d = _digits_only(s)
+    if len(d) == 10:
+        return f"{d[:3]}-{d[3:5]}-{d[5:]}"
+    return s
+
+
+def _normalize_tel(raw: Optional[str]) -> Optional[str]:
+    """
+    전화번호 정규화:
+    - 숫자만 추출 후 02/지역번호/휴대폰 기준으로 하이픈 포맷
+    - 국제코드 82로 시작하면 0으로 치환
+    """
+    s = (raw or "").strip()
+    if not s:
+        return None
+    d = _digits_only(s)
+    if d.startswith("82") and len(d) >= 10:
+        d = "0" + d[2:]
+    if len(d) == 8:
+        return f"{d[:4]}-{d[4:]}"
+    if d.startswith("02"):
+        if len(d) == 9:
+            return f"02-{d[2:5]}-{d[5:]}"
+        if len(d) == 10:
+            return f"02-{d[2:6]}-{d[6:]}"
+    if len(d) == 10:
+        return f"{d[:3]}-{d[3:6]}-{d[6:]}"
+    if len(d) == 11:
+        return f"{d[:3]}-{d[3:7]}-{d[7:]}"
+    return s
+
+
+def _normalize_text_line(raw: Optional[str]) -> Optional[str]:
+    """한 줄 텍스트 정규화: trim, 연속 공백 1칸. receipt_items store_name/location 등 자산화용."""
+    if raw is None:
+        return None
+    s = (raw if isinstance(raw, str) else str(raw)).strip()
+    if not s:
+        return None
+    s = re.sub(r"\s+", " ", s).strip()
+    return s or None
+
+
+def _normalize_store_name(raw: Optional[str]) -> Optional[str]:
+    """상호명 정규화: _normalize_text_line과 동일."""
+    return _normalize_text_line(raw)
+
+
+def _normalize_location(raw: Optional[str]) -> Optional[str]:
+    """위치/시군 정규화: _normalize_text_line과 동일."""
+    return _normalize_text_line(raw)
+
+
+def _normalize_amount(raw: Optional[Any]) -> Optional[int]:
+    """금액 정규화: 정수만 저장. str이면 쉼표 제거 후 파싱. 음수/DB 상한 초과(타임스탬프 등) → None."""
+    if raw is None:
+        return None
+    if isinstance(raw, int):
+        return _clamp_amount_for_db(raw)
+    s = (raw if isinstance(raw, str) else str(raw)).strip().replace(",", "")
+    digits = re.sub(r"[^0-9]", "", s)
+    if not digits:
+        return None
+    try:
+        n = int(digits)
+        return _clamp_amount_for_db(n)
+    except (ValueError, TypeError):
+        return None
+
+
+def _normalize_pay_date_for_storage(raw: Optional[str]) -> Optional[str]:
+    """결제일자 저장용: YYYY-MM-DD(ISO)로 통일. receipt_items.pay_date 자산화용."""
+    if not raw or not isinstance(raw, str):
+        return None
+    s = raw.strip()
+    if not s:
+        return None
+    s = re.sub(r"[/.\s]+", "-", s)
+    s = re.sub(r"-+", "-", s).strip("- ")
+    if len(s) >= 2 and s[:2] == "26" and (len(s) == 2 or s[2] in "-."):
+        s = "20" + s
+    try:
+        parsed = dateutil_parser.parse(s)
+        return parsed.strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        c = _normalize_pay_date_canonical(raw)
+        if c:
+            return c.replace("/", "-")  # YYYY/MM/DD → YYYY-MM-DD
+        return None
+
+
+def _normalize_address(raw: Optional[str]) -> Optional[str]:
+    """
+    주소 정규화(외부 표시/자산화용):
+    - 양쪽 공백 제거
+    - 중복 공백 1칸으로 축소
+    - '강원도 ...' 표기를 '강원특별자치도 ...'로 통일 (선두 토큰 기준)
     """
-    if depth > 8 or obj is None:
-        return
-    if seen_keys is None:
-        seen_keys = set()
-    if isinstance(obj, dict):
-        # 동일 객체 중복 방지 (참조 기반이 아니므로 id 사용 안 함)
-        text_val = obj.get("text") or obj.get("value")
-        num = _parse_int_from_text(text_val)
-        if num is not None and 1000 <= num <= 99999999:
-            name = (obj.get("name") or obj.get("label") or "").strip()
-            key_match = any(l in name for l in _AMOUNT_LABELS)
-            if key_match:
-                candidates.append(num)
-        for k, v in obj.items():
-            if k in seen_keys:
-                continue
-            _collect_amount_candidates(v, depth + 1, candidates, seen_keys)
-    elif isinstance(obj, list):
-        for item in obj:
-            _collect_amount_candidates(item, depth + 1, candidates, seen_keys)
+    s = (raw or "").strip()
+    if not s:
+        return None
+    s = re.sub(r"\s+", " ", s).strip()
+    s = re.sub(r"^강원도(\s+)", r"강원특별자치도\1", s)
+    return s
 
 
-def _clamp_amount_for_db(value: Optional[int]) -> Optional[int]:
-    """DB 저장 가능 범위(0 ~ MAX_AMOUNT_DB)로 제한. 초과 시 None(타임스탬프 등 오인식 방지)."""
-    if value is None or value < 0:
+def _is_cash_payment(ocr_data: dict) -> bool:
+    """OCR 결과에서 결제 수단이 현금인지 여부."""
+    try:
+        blob = json.dumps(ocr_data, ensure_ascii=False)
+        return "현금" in blob
+    except Exception:
+        return False
+
+
+def _extract_card_num(ocr_data: dict) -> str:
+    """
+    OCR 결과에서 카드번호(last4) 추출.
+    - 결제 수단이 '현금'이면 '0000'
+    - 카드번호 없음/**** 마스킹/미표시면 '1000'
+    - 유효한 숫자 4자리 이상이면 마지막 4자리
+    """
+    try:
+        images = ocr_data.get("images") or []
+        if not images:
+            return CARD_NUM_NO_CARD
+        result = (images[0].get("receipt") or {}).get("result") or {}
+        if _is_cash_payment(ocr_data):
+            return CARD_NUM_CASH
+        card_info = (result.get("paymentInfo") or {}).get("cardInfo") or {}
+        card_num_obj = card_info.get("number") or {}
+        raw_text = card_num_obj.get("text")
+        return _normalize_card_num(raw_text)
+    except Exception:
+        return CARD_NUM_NO_CARD
+
+
+def _extract_confidence_score(ocr_data: dict) -> Optional[int]:
+    """영수증별 신뢰도 스냅샷(0~100): totalPrice.price confidence 우선."""
+    try:
+        images = ocr_data.get("images") or []
+        if not images:
+            return None
+        result = (images[0].get("receipt") or {}).get("result") or {}
+        price = (result.get("totalPrice") or {}).get("price") or {}
+        conf = price.get("confidenceScore")
+        if isinstance(conf, (int, float)):
+            return int(round(float(conf) * 100))
         return None
-    if value > MAX_AMOUNT_DB:
+    except Exception:
         return None
-    return value
 
 
-def _extract_amount_from_result(result: dict) -> Optional[int]:
+def _duplicate_receipt_key(
+    biz_num: Optional[str], pay_date: str, amount: Any, card_num: str
+) -> Optional[Tuple[str, str, int, str]]:
+    """중복 체크 키 (biz_num, pay_date, amount, 정규화 card_num). biz_num 없으면 None(검사 제외)."""
+    if not biz_num or amount is None:
+        return None
+    return (biz_num, pay_date, int(amount), _normalize_card_num(card_num))
+
+
+# 유흥업소 등 부적격 업태 키워드 (BIZ_008)
+FORBIDDEN_BUSINESS_KEYWORDS = ("단란주점", "유흥주점", "유흥주점영업", "무도장", "사교춤장")
+OCR_CONFIDENCE_THRESHOLD = int(os.getenv("OCR_CONFIDENCE_THRESHOLD", "90"))  # >= 이 값이면 OCR 우선 신뢰(사용자 입력 대체 안 함)
+# OCR 금액이 이 값(원) 미만이면 오인식(예: 68000→8) 가능성으로 수동 검증 유도 또는 사용자 입력 금액 사용
+SUSPICIOUS_AMOUNT_THRESHOLD = int(os.getenv("SUSPICIOUS_AMOUNT_THRESHOLD", "10000"))
+# 저신뢰도 또는 핵심 필드(상점명·사업자번호·주소) 누락 시 수동 검수(보정) 유도
+OCR_LOW_CONFIDENCE_REVIEW_THRESHOLD = int(os.getenv("OCR_LOW_CONFIDENCE_REVIEW_THRESHOLD", "70"))
+OCR_KEY_FIELDS_MIN_FILLED = int(os.getenv("OCR_KEY_FIELDS_MIN_FILLED", "2"))  # 3개 중 최소 채워져야 하는 개수
+AMOUNT_MISMATCH_RATIO_THRESHOLD = 0.10  # 10% 이상 차이 시 수동 검증 보류
+
+
+def _should_require_manual_review_for_low_quality(
+    store_name: Optional[str],
+    biz_num: Optional[str],
+    address: Optional[str],
+    confidence: Optional[int],
+) -> bool:
     """
-    result에서 결제/합계 금액 추출. 우선순위:
-    1) totalPrice.price.text
-    2) paymentInfo.totalAmount / totalPrice / amount 등
-    3) 합계금액·결제금액·공급가액·합계·거래금액·받은금액 라벨 매칭
-    4) subTotal 부가세로 추정
-    - 반환값은 MAX_AMOUNT_DB 이하로 제한(타임스탬프 등 오인식 방지).
+    상점명·사업자번호·주소 중 충분히 채워지지 않았고, 컨피던스가 낮으면 수동 검수(보정) 대상.
+    반환 True 시 PENDING_VERIFICATION(OCR_004) 처리하여 관리자가 보정할 수 있게 함.
     """
-    candidates: List[int] = []
-    # 1) totalPrice (기존)
-    price_text = (result.get("totalPrice") or {}).get("price") or {}
-    raw = (price_text.get("text") or price_text.get("value") or "0").strip()
-    n = _parse_int_from_text(raw)
-    if n is not None and 1000 <= n <= MAX_AMOUNT_SANE:
-        return _clamp_amount_for_db(n)
-    if n is not None and n <= MAX_AMOUNT_SANE:
-        candidates.append(n)
-    # 2) paymentInfo.totalAmount, totalAmount, supplyPrice 등 (금액 상한 적용)
-    for key in ("totalAmount", "totalPrice", "paymentAmount", "supplyPrice", "amount", "합계", "결제금액"):
-        node = result.get(key)
-        if isinstance(node, dict):
-            t = node.get("text") or node.get("value")
-            nn = _parse_int_from_text(t)
-            if nn is not None and 1000 <= nn <= MAX_AMOUNT_SANE:
-                candidates.append(nn)
-        elif isinstance(node, list) and node and isinstance(node[0], dict):
-            t = node[0].get("text") or node[0].get("value")
-            nn = _parse_int_from_text(t)
-            if nn is not None and 1000 <= nn <= MAX_AMOUNT_SANE:
-                candidates.append(nn)
-    # 3) 재귀 수집 (라벨 매칭)
-    _collect_amount_candidates(result, 0, candidates)
-    if candidates:
-        best = max(candidates)
-        if best >= 1000:
-            return _clamp_amount_for_db(best)
-    # 4) subTotal 부가세 추정
-    sub_total = result.get("subTotal") or []
-    if isinstance(sub_total, list) and len(sub_total) > 0:
-        first = sub_total[0]
-        tax_prices = (first.get("taxPrice") or []) if isinstance(first, dict) else []
-        if tax_prices and isinstance(tax_prices[0], dict):
-            tax_text = (tax_prices[0].get("text") or "").strip()
-            tax_num = re.sub(r"[^0-9]", "", tax_text)
-            if tax_num:
-                tax_val = int(tax_num)
-                if 100 <= tax_val <= (MAX_AMOUNT_SANE // 10):
-                    return _clamp_amount_for_db(tax_val * 10)
-    return _clamp_amount_for_db(max(candidates)) if candidates else None
+    filled = sum(1 for v in (store_name, biz_num, address) if v and str(v).strip())
+    if filled >= OCR_KEY_FIELDS_MIN_FILLED:
+        return False
+    if confidence is not None and confidence >= OCR_LOW_CONFIDENCE_REVIEW_THRESHOLD:
+        return False
+    return True
 
 
-def _parse_ocr_result(ocr_data: dict) -> tuple[Optional[int], Optional[str], Optional[str], Optional[str], Optional[str]]:
+def _ocr_contains_forbidden_business(ocr_data: dict) -> bool:
+    """OCR 결과 전체 텍스트에서 부적격 업태 키워드 포함 여부. 포함 시 True."""
+    try:
+        text = json.dumps(ocr_data, ensure_ascii=False)
+        return any(kw in text for kw in FORBIDDEN_BUSINESS_KEYWORDS)
+    except Exception:
+        return False
+
+
+def _extract_store_tel(ocr_data: dict) -> Optional[str]:
+    """OCR 결과에서 가맹점 전화번호 추출."""
+    try:
+        images = ocr_data.get("images") or []
+        if not images:
+            return None
+        result = (images[0].get("receipt") or {}).get("result") or {}
+        store_info = result.get("storeInfo") or {}
+        tel_list = store_info.get("tel") or []
+        if isinstance(tel_list, list) and tel_list:
+            tel_text = (tel_list[0].get("text") or "").strip()
+            return _normalize_tel(tel_text) or None
+    except Exception:
+        return None
+    return None
+
+
+def _is_amount_mismatch(user_amount: Optional[int], ocr_amount: Optional[int]) -> bool:
+    """사용자 입력 금액과 OCR 금액 차이가 10% 이상인지 판정."""
+    if user_amount is None or ocr_amount is None:
+        return False
+    base = max(user_amount, 1)
+    ratio = abs(ocr_amount - user_amount) / base
+    return ratio >= AMOUNT_MISMATCH_RATIO_THRESHOLD
+
+
+def _get_user_input_for_document(
+    data: Optional[Union[StayData, TourData, DataWithItems]], doc_index: int
+) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """장 인덱스에 대한 사용자 입력 (amount, pay_date, location). 없으면 (None, None, None)."""
+    if data is None:
+        return None, None, None
+    if isinstance(data, DataWithItems):
+        if doc_index < 0 or doc_index >= len(data.items):
+            return None, None, None
+        it = data.items[doc_index]
+        return it.amount, it.payDate or None, it.location
+    if isinstance(data, StayData) and doc_index == 0:
+        return data.amount, data.payDate or None, data.location
+    if isinstance(data, TourData):
+        return data.amount, data.payDate or None, None
+    return None, None, None
+
+
+def _get_user_total_amount(
+    data: Optional[Union[StayData, TourData, DataWithItems]], doc_count: int
+) -> Optional[int]:
+    """TOUR 시 사용자 입력 합산 금액 (DataWithItems면 items 합산, 아니면 단일 amount)."""
+    if data is None:
+        return None
+    if isinstance(data, DataWithItems):
+        return sum(data.items[i].amount for i in range(min(len(data.items), doc_count)))
+    if isinstance(data, TourData):
+        return data.amount
+    return None
+
+
+def _auto_register_store(
+    db: Session,
+    submission_id: str,
+    store_name: str,
+    address: Optional[str],
+    biz_num: Optional[str],
+    tel: Optional[str],
+    predicted_category: str,
+    category_confidence: float,
+    classifier_type: str,
+) -> bool:
     """
-    Naver OCR JSON 파싱. 반환: (amount, pay_date, store_name, address, location_시군).
-    - 금액: totalPrice 우선, 없거나 작으면 합계금액/결제금액/공급가액/합계/거래금액/받은금액 등 여러 필드 후보 수집 후 최대값 사용, 마지막으로 subTotal 부가세 추정.
+    고신뢰도 자동 분류 시 master_stores + unregistered_stores(AUTO_REGISTERED) 삽입. 이후 동일 상점은 FIT.
+    반환: master_stores 삽입 여부. 상점 인덱스 반영은 호출부가 commit 후(롤백 시 인덱스에 남지 않게).
     """
     try:
-        images = ocr_data.get("images") or []
-        if not images:
-            return (None, None, None, None, None)
-        receipt = images[0].get("receipt") or {}
-        result = receipt.get("result")
-        if not result:
-            return (None, None, None, None, None)
-        amount = _extract_amount_from_result(result)
-        # 결제 날짜
-        payment_info = result.get("paymentInfo") or {}
-        date_obj = payment_info.get("date") or {}
-        pay_date = (date_obj.get("text") or "").strip()
-        pay_date = _normalize_pay_date_canonical(pay_date) or pay_date
-        # 상호명
-        store_info = result.get("storeInfo") or {}
-        store_name = (store_info.get("name") or {}).get("text") or ""
-        store_name = re.sub(r"\s+", " ", store_name).strip()
-        # 주소: address 단일 객체 또는 addresses 배열 (CLOVA 형식)
-        addr_obj = store_info.get("address") or {}
-        address = (addr_obj.get("text") or "").strip()
-        if not address:
-            addrs = store_info.get("addresses") or []
-            if isinstance(addrs, list) and len(addrs) > 0:
-                first_addr = addrs[0] if isinstance(addrs[0], dict) else {}
-                address = (first_addr.get("text") or "").strip()
-        address = _normalize_address(address) or address
-        # 시군: 주소에서 두 번째 단어 (속초시, 춘천시 등)
-        location = ""
-        if address:
-            parts = address.split()
-            location = parts[1] if len(parts) >= 2 else ""
-        return (amount, pay_date, store_name, address, location)
-    except (KeyError, IndexError, TypeError, ValueError):
-        return (None, None, None, None, None)
+        db.execute(
+            sql_text(
+                "INSERT INTO master_stores (store_name, category_large, category_small, road_address) "
+                "VALUES (:store_name, :category_large, :category_small, :road_address)"
+            ),
+            {
+                "store_name": store_name or "",
+                "category_large": predicted_category,
+                "category_small": predicted_category,
+                "road_address": address or "",
+            },
+        )
+    except Exception as e:
+        logger.warning("auto_register_store master_stores insert failed: %s", e)
+        return False
+    now = datetime.utcnow()
+    db.add(
+        UnregisteredStore(
+            store_name=store_name,
+            biz_num=biz_num,
+            address=address,
+            tel=tel,
+            status="AUTO_REGISTERED",
+            source_submission_id=submission_id,
+            occurrence_count=1,
+            first_detected_at=now,
+            recent_receipt_id=submission_id,
+            predicted_category=predicted_category,
+            category_confidence=category_confidence,
+            classifier_type=classifier_type,
+            updated_at=now,
+        )
+    )
+    return True
 
 
-def _extract_business_num(ocr_data: dict) -> Optional[str]:
+def _register_new_candidate_store(
+    db: Session,
+    submission_id: str,
+    parsed: Dict[str, Any],
+    ocr_raw: Optional[Dict[str, Any]],
+    predicted_category: Optional[str] = None,
+    category_confidence: Optional[float] = None,
+    classifier_type: Optional[str] = None,
+) -> None:
     """
-    OCR 결과에서 사업자등록번호(bizNum) 텍스트 추출. 실패 시 None.
+    마스터 미등록 상점을 임시 등록(TEMP_VALID).
+    동일 상점(금액·품목 다른 제출건 포함)은 unregistered_stores로만 처리하고, 중복으로 인해 제출건을 ERROR로 두지 않음.
+    - 동일 요청 내 같은 (biz_num, address, tel): 세션 pending 기준 1건만 두고 occurrence만 증가.
+    - DB 기존 행 있으면 occurrence 증가 후 return.
+    - 신규 시: INSERT ON CONFLICT DO UPDATE(업서트) 사용해 UniqueViolation 방지.
     """
+    biz_num = _normalize_biz_num((parsed.get("businessNum") or "").strip()) if parsed.get("businessNum") else None
+    address = _normalize_address((parsed.get("address") or "").strip()) if parsed.get("address") else None
+    tel = _extract_store_tel(ocr_raw or {}) if ocr_raw else None
+    store_name_raw = (parsed.get("storeName") or "").strip() or None
+    store_name = re.sub(r"\s+", " ", store_name_raw).strip() if store_name_raw else None
+
+    def _key(o: UnregisteredStore) -> tuple:
+        return (getattr(o, "biz_num") or "", getattr(o, "address") or "", getattr(o, "tel") or "")
+
+    want_key = (biz_num or "", address or "", tel or "")
+
+    # 동일 세션에서 아직 flush 안 된 동일 키 후보가 있으면 occurrence만 올리고 return (UniqueViolation 방지)
+    for obj in db.new:
+        if isinstance(obj, UnregisteredStore) and _key(obj) == want_key:
+            obj.occurrence_count = (obj.occurrence_count or 0) + 1
+            obj.recent_receipt_id = submission_id
+            obj.updated_at = datetime.utcnow()
+            if predicted_category is not None:
+                obj.predicted_category = predicted_category
+            if category_confidence is not None:
+                obj.category_confidence = category_confidence
+            if classifier_type is not None:
+                obj.classifier_type = classifier_type
+            return
+
+    q = db.query(UnregisteredStore).filter(UnregisteredStore.status == "TEMP_VALID")
+    if biz_num:
+        q = q.filter(UnregisteredStore.biz_num == biz_num)
+    if address:
+        q = q.filter(UnregisteredStore.address == address)
+    if tel:
+        q = q.filter(UnregisteredStore.tel == tel)
+    exists = q.first()
+    now = datetime.utcnow()
+    if exists:
+        exists.occurrence_count = (exists.occurrence_count or 0) + 1
+        exists.recent_receipt_id = submission_id
+        exists.updated_at = now
+        if predicted_category is not None:
+            exists.predicted_category = predicted_category
+        if category_confidence is not None:
+            exists.category_confidence = category_confidence
+        if classifier_type is not None:
+            exists.classifier_type = classifier_type
+        return
+
+    # 동일 상점(금액·품목 다를 수 있음) 중복 INSERT 시 UniqueViolation 방지: 업서트로 처리해 제출건을 ERROR로 두지 않음
+    store_name_safe = (store_name or "")[:255] if store_name else None
     try:
-        images = ocr_data.get("images") or []
-        if not images:
-            return None
-        receipt = images[0].get("receipt") or {}
-        result = receipt.get("result") or {}
-        store_info = result.get("storeInfo") or {}
-        biz_obj = store_info.get("bizNum") or {}
-        biz = (biz_obj.get("text") or "").strip()
-        return _normalize_biz_num(biz) or None
-    except (KeyError, TypeError, ValueError):
-        return None
+        db.execute(
+            sql_text("""
+            INSERT INTO unregistered_stores (
+                id, store_name, biz_num, address, tel, status, source_submission_id,
+                occurrence_count, first_detected_at, recent_receipt_id,
+                predicted_category, category_confidence, classifier_type, created_at, updated_at
+            ) VALUES (
+                :id, :store_name, :biz_num, :address, :tel, 'TEMP_VALID', :source_submission_id,
+                1, :now, :source_submission_id,
+                :predicted_category, :category_confidence, :classifier_type, :now, :now
+            )
+            ON CONFLICT ( (COALESCE(biz_num, '')), (COALESCE(address, '')), (COALESCE(tel, '')) )
+            DO UPDATE SET
+                occurrence_count = unregistered_stores.occurrence_count + 1,
+                recent_receipt_id = EXCLUDED.recent_receipt_id,
+                updated_at = EXCLUDED.updated_at,
+                predicted_category = COALESCE(EXCLUDED.predicted_category, unregistered_stores.predicted_category),
+                category_confidence = COALESCE(EXCLUDED.category_confidence, unregistered_stores.category_confidence),
+                classifier_type = COALESCE(EXCLUDED.classifier_type, unregistered_stores.classifier_type)
+            """),
+            {
+                "id": str(uuid.uuid4()),
+                "store_name": store_name_safe,
+                "biz_num": biz_num,
+                "address": address,
+                "tel": tel,
+                "source_submission_id": submission_id,
+                "now": now,
+                "predicted_category": predicted_category,
+                "category_confidence": category_confidence,
+                "classifier_type": classifier_type,
+            },
+        )
+    except Exception:
+        # ON CONFLICT 표현식이 인덱스와 안 맞는 등 예외 시: UPDATE로만 처리 후 없으면 INSERT (중복 시 ERROR 방지)
+        upd = db.execute(
+            sql_text("""
+            UPDATE unregistered_stores
+            SET occurrence_count = occurrence_count + 1, recent_receipt_id = :sid, updated_at = :now,
+                predicted_category = COALESCE(:predicted_category, predicted_category),
+                category_confidence = COALESCE(:category_confidence, category_confidence),
+                classifier_type = COALESCE(:classifier_type, classifier_type)
+            WHERE status = 'TEMP_VALID'
+              AND (COALESCE(biz_num, '') = COALESCE(:biz_num, ''))
+              AND (COALESCE(address, '') = COALESCE(:address, ''))
+              AND (COALESCE(tel, '') = COALESCE(:tel, ''))
+            """),
+            {
+                "sid": submission_id,
+                "now": now,
+                "predicted_category": predicted_category,
+                "category_confidence": category_confidence,
+                "classifier_type": classifier_type,
+                "biz_num": biz_num,
+                "address": address,
+                "tel": tel,
+            },
+        )
+        if upd.rowcount and upd.rowcount > 0:
+            return
+        db.add(
+            UnregisteredStore(
+                store_name=store_name_safe,
+                biz_num=biz_num,
+                address=address,
+                tel=tel,
+                status="TEMP_VALID",
+                source_submission_id=submission_id,
+                occurrence_count=1,
+                first_detected_at=now,
+                recent_receipt_id=submission_id,
+                predicted_category=predicted_category,
+                category_confidence=category_confidence,
+                classifier_type=classifier_type,
+                updated_at=now,
+            )
+        )
 
 
-# 카드번호 구분: 현금=0000, 카드번호 없음/마스킹(****)=1000, 유효한 번호=마지막 4자리
-CARD_NUM_CASH = "0000"
-CARD_NUM_NO_CARD = "1000"
+def _fail_message(code: Optional[str]) -> Optional[str]:
+    if not code:
+        return None
+    msg = {
+        "BIZ_001": "BIZ_001 (중복 등록)",
+        "BIZ_002": "BIZ_002 (2026년 결제일 아님)",
+        "BIZ_003": "BIZ_003 (최소 금액 미달)",
+        "BIZ_004": "BIZ_004 (강원특별자치도 외 지역)",
+        "BIZ_005": "BIZ_005 (캠페인 기간 아님)",
+        "BIZ_006": "BIZ_006 (캠페인 대상 지역 아님)",
+        "BIZ_007": "BIZ_007 (입력 금액과 OCR 금액 불일치)",
+        "BIZ_008": "BIZ_008 (유흥업소 등 부적격 업종)",
+        "BIZ_010": "BIZ_010 (문서 구성 요건 불충족)",
+        "BIZ_011": "BIZ_011 (영수증/증빙 금액 불일치)",
+        "OCR_001": "OCR_001 (영수증 판독 불가)",
+        "OCR_002": "OCR_002 (결제일 형식 오류)",
+        "OCR_003": "OCR_003 (마스터 상호 미등록)",
+        "OCR_004": "OCR_004 (인식 불량·수동 검수 보정)",
+        "PENDING_NEW": "PENDING_NEW (신규 상점 검수 대기)",
+        "PENDING_VERIFICATION": "PENDING_VERIFICATION (사용자 입력값- OCR 불일치)",
+        "UNFIT_CATEGORY": "UNFIT_CATEGORY (제외 업종)",
+        "UNFIT_REGION": "UNFIT_REGION (지역 불일치)",
+        "UNFIT_DATE": "UNFIT_DATE (기간/날짜 불일치)",
+        "UNFIT_DUPLICATE": "UNFIT_DUPLICATE (중복 제출)",
+        "ERROR_OCR": "ERROR_OCR (판독 불가)",
+    }
+    return msg.get(code, code)
 
 
-def _normalize_card_num(raw: Optional[str]) -> str:
-    """
-    카드번호 정규화 (§10.3: 앞 4자리 저장·반영).
-    - 4자리만 추출된 경우: 앞 4자리로 해석해 저장 (영수증 마스킹이 앞 4자리 노출인 경우가 많음).
-    - 5자리 이상: 마지막 4자리 저장 (전체 번호에서 뒷 4자리만 노출된 경우).
-    - 비어 있거나 **** 등 마스킹/미표시면 '1000'(카드번호 없음).
-    - 현금 여부는 _extract_card_num에서 OCR 전체로 판별 → '0000'.
-    """
-    text = (raw or "").strip()
-    if not text or re.match(r"^[\s*\-]+$", text):
-        return CARD_NUM_NO_CARD
-    digits = re.sub(r"[^0-9]", "", text)
-    if len(digits) == 4:
-        return digits  # 앞 4자리로 해석
-    if len(digits) > 4:
-        return digits[-4:]
-    return CARD_NUM_NO_CARD
+def _truncate_submission_reason(s: Optional[str], max_len: int = SUBMISSION_FAIL_REASON_MAX_LEN) -> Optional[str]:
+    """fail_reason, global_fail_reason 저장 시 DB varchar 제한 준수."""
+    if not s or len(s) <= max_len:
+        return s
+    return (s[: max_len - 3] + "...") if max_len > 3 else s[:max_len]
 
 
-def _digits_only(raw: Optional[str]) -> str:
-    return re.sub(r"[^0-9]", "", (raw or "").strip())
+def _truncate_submission_audit(s: Optional[str], max_len: int = SUBMISSION_AUDIT_MAX_LEN) -> Optional[str]:
+    """audit_log, audit_trail 저장 시 과도한 길이·DB 오류 방지."""
+    if not s or len(s) <= max_len:
+        return s
+    return (s[: max_len - 3] + "...") if max_len > 3 else s[:max_len]
 
 
-def _normalize_biz_num(raw: Optional[str]) -> Optional[str]:
-    """
-    사업자등록번호 정규화:
-    - 숫자만 추출 후 길이 10이면 000-00-00000 포맷으로 통일
-    - 그 외는 원문/None
-    """
-    s = (raw or "").strip()
-    if not s:
+def _normalize_error_code(code: Optional[str]) -> Optional[str]:
+    """에러 문자열에서 표준 코드 토큰 추출."""
+    if not code:
         return None
-    d = _digits_only(s)
-    if len(d) == 10:
-        return f"{d[:3]}-{d[3:5]}-{d[5:]}"
-    return s
+    m = re.search(
+        r"\b((?:BIZ|OCR)_[0-9]{3}|PENDING_NEW|PENDING_VERIFICATION|UNFIT_CATEGORY|UNFIT_REGION|UNFIT_DATE|UNFIT_DUPLICATE|ERROR_OCR)\b",
+        str(code).strip(),
+    )
+    return m.group(1) if m else None
 
 
-def _normalize_tel(raw: Optional[str]) -> Optional[str]:
+def _resolve_item_status_error(code: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
     """
-    전화번호 정규화:
-    - 숫자만 추출 후 02/지역번호/휴대폰 기준으로 하이픈 포맷
-    - 국제코드 82로 시작하면 0으로 치환
+    코드 하나로 status / error_code / error_message 를 일관되게 결정.
+    반환: (status, normalized_error_code, error_message)
     """
-    s = (raw or "").strip()
-    if not s:
-        return None
-    d = _digits_only(s)
-    if d.startswith("82") and len(d) >= 10:
-        d = "0" + d[2:]
-    if len(d) == 8:
-        return f"{d[:4]}-{d[4:]}"
-    if d.startswith("02"):
-        if len(d) == 9:
-            return f"02-{d[2:5]}-{d[5:]}"
-        if len(d) == 10:
-            return f"02-{d[2:6]}-{d[6:]}"
-    if len(d) == 10:
-        return f"{d[:3]}-{d[3:6]}-{d[6:]}"
-    if len(d) == 11:
-        return f"{d[:3]}-{d[3:7]}-{d[7:]}"
-    return s
+    normalized = _normalize_error_code(code) or code
+    if not normalized:
+        return "FIT", None, None
+    status = _status_for_code(normalized)
+    msg = _fail_message(normalized)
+    return status, normalized, msg
 
 
-def _normalize_text_line(raw: Optional[str]) -> Optional[str]:
-    """한 줄 텍스트 정규화: trim, 연속 공백 1칸. receipt_items store_name/location 등 자산화용."""
-    if raw is None:
-        return None
-    s = (raw if isinstance(raw, str) else str(raw)).strip()
-    if not s:
+def _global_fail_reason(code: Optional[str]) -> Optional[str]:
+    """submission(마스터) 단위 fail reason 표준화. FE/로그용 짧은 문구 반환."""
+    if not code:
         return None
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
-
-
-def _normalize_store_name(raw: Optional[str]) -> Optional[str]:
-    """상호명 정규화: _normalize_text_line과 동일."""
-    return _normalize_text_line(raw)
-
-
-def _normalize_location(raw: Optional[str]) -> Optional[str]:
-    """위치/시군 정규화: _normalize_text_line과 동일."""
-    return _normalize_text_line(raw)
+    mapping = {
+        "BIZ_001": "UNFIT_DUPLICATE (BIZ_001, 중복 제출)",
+        "BIZ_002": "UNFIT_DATE (BIZ_002, 결제일/기간 오류)",
+        "BIZ_003": "UNFIT_TOTAL_AMOUNT (BIZ_003, 합산 금액 미달)",
+        "BIZ_004": "UNFIT_REGION (BIZ_004, 지역 불일치)",
+        "BIZ_008": "UNFIT_CATEGORY (BIZ_008, 부적격 업종)",
+        "BIZ_010": "BIZ_010 (문서 구성 요건 불충족)",
+        "BIZ_011": "UNFIT_STAY_MISMATCH (BIZ_011, 숙박-증빙 불일치)",
+        "OCR_001": "ERROR_OCR (OCR_001, 영수증 판독 불가)",
+        "OCR_003": "OCR_003 (마스터 상호 미등록)",
+        "OCR_004": "PENDING_VERIFICATION (OCR_004, 인식 불량·수동 검수)",
+        "PENDING_NEW": "PENDING_NEW (신규 상점 확인 필요)",
+        "PENDING_VERIFICATION": "PENDING_VERIFICATION (입력값-OCR 불일치)",
+        "UNFIT_CATEGORY": "UNFIT_CATEGORY (제외 업종)",
+        "UNFIT_REGION": "UNFIT_REGION (지역 불일치)",
+        "UNFIT_DATE": "UNFIT_DATE (기간/날짜 불일치)",
+        "UNFIT_DUPLICATE": "UNFIT_DUPLICATE (중복 제출)",
+        "ERROR_OCR": "ERROR_OCR (판독 불가)",
+    }
+    return mapping.get(code, _fail_message(code))
 
 
-def _normalize_amount(raw: Optional[Any]) -> Optional[int]:
-    """금액 정규화: 정수만 저장. str이면 쉼표 제거 후 파싱. 음수/DB 상한 초과(타임스탬프 등) → None."""
-    if raw is None:
-        return None
-    if isinstance(raw, int):
-        return _clamp_amount_for_db(raw)
-    s = (raw if isinstance(raw, str) else str(raw)).strip().replace(",", "")
-    digits = re.sub(r"[^0-9]", "", s)
-    if not digits:
-        return None
-    try:
-        n = int(digits)
-        return _clamp_amount_for_db(n)
-    except (ValueError, TypeError):
-        return None
+# 주요 반려 사유 API: fail_reason(한글/영문) 텍스트 → reason_code, reason_label 매핑 (백엔드_요청사항_정리 §4)
+REJECT_REASON_TO_CODE_LABEL: List[Tuple[str, str, str]] = [
+    ("BIZ_003", "합산 금액 미달", "UNFIT_TOTAL_AMOUNT|BIZ_003|합산 금액 미달"),
+    ("AMOUNT_MISMATCH", "금액 불일치", "금액 불일치|AMOUNT_MISMATCH"),
+    ("ERROR_OCR", "영수증 판독 불가", "ERROR_OCR|OCR_001|판독 불가|영수증 판독"),
+    ("IMAGE_BLUR", "이미지 흐림", "이미지 흐림|IMAGE_BLUR"),
+    ("UNFIT_REGION", "지역 불일치", "UNFIT_REGION|BIZ_004|지역 불일치|지역"),
+    ("UNFIT_DATE", "기간/날짜 불일치", "UNFIT_DATE|BIZ_002|기간|결제일"),
+    ("UNFIT_DUPLICATE", "중복 제출", "UNFIT_DUPLICATE|BIZ_001|중복"),
+    ("DUPLICATE", "중복 제출", "DUPLICATE"),
+    ("UNFIT_CATEGORY", "제외 업종", "UNFIT_CATEGORY|BIZ_008|부적격 업종|제외 업종"),
+    ("BIZ_010", "문서 구성 요건 불충족", "BIZ_010|문서 구성"),
+    ("PENDING_VERIFICATION", "인식 불량·수동 검수", "PENDING_VERIFICATION|OCR_004|인식 불량"),
+    ("PENDING_NEW", "신규 상점 확인 필요", "PENDING_NEW|신규 상점"),
+    ("OUT_OF_PERIOD", "기간 외", "OUT_OF_PERIOD|기간 외"),
+]
 
 
-def _normalize_pay_date_for_storage(raw: Optional[str]) -> Optional[str]:
-    """결제일자 저장용: YYYY-MM-DD(ISO)로 통일. receipt_items.pay_date 자산화용."""
-    if not raw or not isinstance(raw, str):
-        return None
-    s = raw.strip()
-    if not s:
-        return None
-    s = re.sub(r"[/.\s]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("- ")
-    if len(s) >= 2 and s[:2] == "26" and (len(s) == 2 or s[2] in "-."):
-        s = "20" + s
-    try:
-        parsed = dateutil_parser.parse(s)
-        return parsed.strftime("%Y-%m-%d")
-    except (ValueError, TypeError):
-        c = _normalize_pay_date_canonical(raw)
-        if c:
-            return c.replace("/", "-")  # YYYY/MM/DD → YYYY-MM-DD
-        return None
+def _reason_text_to_code_label(reason: str) -> Tuple[str, str]:
+    """DB에 저장된 fail_reason 텍스트를 reason_code, reason_label(한글)로 변환. 주요 반려 사유 API용."""
+    if not reason or not (reason := (reason or "").strip()):
+        return "OTHER", "기타"
+    r = reason.upper()
+    for code, label, patterns in REJECT_REASON_TO_CODE_LABEL:
+        for p in patterns.split("|"):
+            if p.strip().upper() in r or (p.strip() and p.strip() in reason):
+                return code, label
+    return "OTHER", reason[:50] if len(reason) > 50 else reason
 
 
-def _normalize_address(raw: Optional[str]) -> Optional[str]:
-    """
-    주소 정규화(외부 표시/자산화용):
-    - 양쪽 공백 제거
-    - 중복 공백 1칸으로 축소
-    - '강원도 ...' 표기를 '강원특별자치도 ...'로 통일 (선두 토큰 기준)
-    """
-    s = (raw or "").strip()
-    if not s:
-        return None
-    s = re.sub(r"\s+", " ", s).strip()
-    s = re.sub(r"^강원도(\s+)", r"강원특별자치도\1", s)
-    return s
+def _reason_code_for_stats(reason: str) -> str:
+    """롤업(submission_daily_stats) reason_code: fail_reason 텍스트의 표준 사유 코드."""
+    return _reason_text_to_code_label(reason)[0]
 
 
-def _is_cash_payment(ocr_data: dict) -> bool:
-    """OCR 결과에서 결제 수단이 현금인지 여부."""
-    try:
-        blob = json.dumps(ocr_data, ensure_ascii=False)
-        return "현금" in blob
-    except Exception:
-        return False
+def _reject_reason_label(code: str) -> str:
+    """표준 사유 코드 → 한글 라벨 (롤업 사유 코드 집계 응답용)."""
+    for c, label, _ in REJECT_REASON_TO_CODE_LABEL:
+        if c == code:
+            return label
+    return "기타"
 
 
-def _extract_card_num(ocr_data: dict) -> str:
+def _sync_submission_stats(db: Session, submission_ids: List[str]) -> None:
     """
-    OCR 결과에서 카드번호(last4) 추출.
-    - 결제 수단이 '현금'이면 '0000'
-    - 카드번호 없음/**** 마스킹/미표시면 '1000'
-    - 유효한 숫자 4자리 이상이면 마지막 4자리
+    상태 변경 건을 집계 롤업에 반영(commit 전 호출, 같은 트랜잭션).
+    실패해도 판정 저장은 유지: savepoint만 롤백하고 경고. 불일치는 PROJECT/scripts/rebuild_daily_stats.py로 복구.
     """
+    ids = [s for s in submission_ids if s]
+    if not ids:
+        return
     try:
-        images = ocr_data.get("images") or []
-        if not images:
-            return CARD_NUM_NO_CARD
-        result = (images[0].get("receipt") or {}).get("result") or {}
-        if _is_cash_payment(ocr_data):
-            return CARD_NUM_CASH
-        card_info = (result.get("paymentInfo") or {}).get("cardInfo") or {}
-        card_num_obj = card_info.get("number") or {}
-        raw_text = card_num_obj.get("text")
-        return _normalize_card_num(raw_text)
-    except Exception:
-        return CARD_NUM_NO_CARD
+        with db.begin_nested():
+            sync_submission_stats(db, ids, _reason_code_for_stats)
+    except Exception as e:
+        logger.warning("submission stats sync failed (ids=%s): %s", ids[:10], e)
 
 
-def _extract_confidence_score(ocr_data: dict) -> Optional[int]:
-    """영수증별 신뢰도 스냅샷(0~100): totalPrice.price confidence 우선."""
-    try:
-        images = ocr_data.get("images") or []
-        if not images:
-            return None
-        result = (images[0].get("receipt") or {}).get("result") or {}
-        price = (result.get("totalPrice") or {}).get("price") or {}
-        conf = price.get("confidenceScore")
-        if isinstance(conf, (int, float)):
-            return int(round(float(conf) * 100))
-        return None
-    except Exception:
-        return None
+def _status_for_code(code: Optional[str]) -> str:
+    """에러 코드에 대응하는 item/submission 상태명을 반환."""
+    c = _normalize_error_code(code) or code
+    if not c:
+        return "FIT"
+    if c in ("OCR_001", "ERROR_OCR"):
+        return "ERROR_OCR"
+    if c in ("BIZ_004", "UNFIT_REGION"):
+        return "UNFIT_REGION"
+    if c in ("BIZ_002", "OCR_002", "UNFIT_DATE"):
+        return "UNFIT_DATE"
+    if c in ("BIZ_001", "UNFIT_DUPLICATE"):
+        return "UNFIT_DUPLICATE"
+    if c in ("BIZ_008", "UNFIT_CATEGORY"):
+        return "UNFIT_CATEGORY"
+    if c == "PENDING_NEW":
+        return "PENDING_NEW"
+    if c in ("PENDING_VERIFICATION", "OCR_004"):
+        return "PENDING_VERIFICATION"
+    if c.startswith("BIZ_"):
+        return "UNFIT"
+    return "UNFIT"
 
 
-def _check_duplicate_receipt_item(
-    db: Session,
+def map_ocr_to_db(
     submission_id: str,
-    biz_num: Optional[str],
-    pay_date: str,
-    amount: int,
-    card_num: str,
-) -> bool:
+    ocr_assets: List[Dict[str, Any]],
+    documents: List[Dict[str, str]],
+) -> Tuple[List[ReceiptItem], int]:
     """
-    item 단위 중복 체크:
-    biz_num + pay_date + amount + card_num(0000 포함) 조합이 다른 FIT 신청에 존재하면 True.
-    RECEIPT_DATA_CUTOFF_UTC 설정 시, 해당 시각 이후 생성된 submission만 비교(이전 데이터와 중복 처리 방지).
+    OCR 결과를 ReceiptItem 모델에 매핑하고, FIT 항목 합산 금액을 계산.
+    - 카드번호 미인식/비정상: 0000 정규화
+    - amount는 status == FIT 인 항목만 합산
     """
-    if not biz_num:
-        return False
-    q = (
-        db.query(ReceiptItem)
-        .join(Submission, Submission.submission_id == ReceiptItem.submission_id)
-        .filter(ReceiptItem.biz_num == biz_num)
-        .filter(ReceiptItem.pay_date == pay_date)
-        .filter(ReceiptItem.amount == amount)
-        .filter(ReceiptItem.card_num == _normalize_card_num(card_num))
-        .filter(ReceiptItem.submission_id != submission_id)
-        .filter(Submission.status == "FIT")
-    )
-    if RECEIPT_DATA_CUTOFF_UTC is not None:
-        q = q.filter(Submission.created_at >= RECEIPT_DATA_CUTOFF_UTC)
-    return q.first() is not None
+    items: List[ReceiptItem] = []
+    total_fit_amount = 0
+    for idx, asset in enumerate(ocr_assets, start=1):
+        fields = _mapped_item_fields(asset)
+        item = ReceiptItem(
+            submission_id=submission_id,
+            seq_no=idx,
+            doc_type=asset.get("docType", (documents[idx - 1].get("docType") if idx - 1 < len(documents) else "RECEIPT")),
+            image_key=(asset.get("imageKey") or "").strip() or "",
+            ocr_raw=asset.get("ocrRaw"),
+            parsed=asset.get("parsed") or {},
+            thumbnail_key=asset.get("thumbnailKey"),
+            **fields,
+        )
+        if fields["status"] == "FIT" and isinstance(fields["amount"], int):
+            total_fit_amount += fields["amount"]
+        items.append(item)
+    return items, total_fit_amount
 
 
-# 유흥업소 등 부적격 업태 키워드 (BIZ_008)
-FORBIDDEN_BUSINESS_KEYWORDS = ("단란주점", "유흥주점", "유흥주점영업", "무도장", "사교춤장")
-OCR_CONFIDENCE_THRESHOLD = int(os.getenv("OCR_CONFIDENCE_THRESHOLD", "90"))  # >= 이 값이면 OCR 우선 신뢰(사용자 입력 대체 안 함)
-# OCR 금액이 이 값(원) 미만이면 오인식(예: 68000→8) 가능성으로 수동 검증 유도 또는 사용자 입력 금액 사용
-SUSPICIOUS_AMOUNT_THRESHOLD = int(os.getenv("SUSPICIOUS_AMOUNT_THRESHOLD", "10000"))
-# 저신뢰도 또는 핵심 필드(상점명·사업자번호·주소) 누락 시 수동 검수(보정) 유도
-OCR_LOW_CONFIDENCE_REVIEW_THRESHOLD = int(os.getenv("OCR_LOW_CONFIDENCE_REVIEW_THRESHOLD", "70"))
-OCR_KEY_FIELDS_MIN_FILLED = int(os.getenv("OCR_KEY_FIELDS_MIN_FILLED", "2"))  # 3개 중 최소 채워져야 하는 개수
-AMOUNT_MISMATCH_RATIO_THRESHOLD = 0.10  # 10% 이상 차이 시 수동 검증 보류
+def _mapped_item_fields(asset: Dict[str, Any]) -> Dict[str, Any]:
+    """OCR 자산 1장 → 판정 전 장 컬럼 값(정규화). map_ocr_to_db·규칙 시뮬레이션(ORM 미사용) 공용."""
+    p = asset.get("parsed") or {}
+    raw_status = asset.get("status", "PENDING")
+    raw_code = asset.get("error_code")
+    code = _normalize_error_code(raw_code) or raw_code
+    if raw_status == "ERROR_OCR" and not code:
+        code = "OCR_001"
+    if code is None:
+        status = raw_status or "PENDING"
+        normalized_code = None
+        error_msg = None
+    else:
+        status, normalized_code, error_msg = _resolve_item_status_error(code)
+    raw_pay = (p.get("payDate") or "").strip() or None
+    pay_date_stored = _normalize_pay_date_for_storage(raw_pay) if raw_pay else None
+    return {
+        "store_name": _normalize_store_name(p.get("storeName")),
+        "biz_num": _normalize_biz_num((p.get("businessNum") or "").strip()) if p.get("businessNum") else None,
+        "pay_date": pay_date_stored or raw_pay,
+        "amount": _normalize_amount(p.get("amount")),
+        "address": _normalize_address((p.get("address") or "").strip()) if (p.get("address") or "").strip() else None,
+        "location": _normalize_location(p.get("location")),
+        "card_num": _normalize_card_num(p.get("cardNum")),
+        "status": status,
+        "error_code": normalized_code,
+        "error_message": error_msg,
+        "confidence_score": p.get("confidenceScore") if isinstance(p.get("confidenceScore"), int) else None,
+    }
 
 
-def _should_require_manual_review_for_low_quality(
-    store_name: Optional[str],
-    biz_num: Optional[str],
-    address: Optional[str],
-    confidence: Optional[int],
-) -> bool:
+def _final_verdict(
+    total_amount: int,
+    min_criteria: int,
+    fail_code: Optional[str],
+    total_all_amounts: Optional[int] = None,
+    unknown_store_policy: Optional[str] = None,
+) -> Tuple[str, int, Optional[str], bool]:
     """
-    상점명·사업자번호·주소 중 충분히 채워지지 않았고, 컨피던스가 낮으면 수동 검수(보정) 대상.
-    반환 True 시 PENDING_VERIFICATION(OCR_004) 처리하여 관리자가 보정할 수 있게 함.
+    신청 최종 판정 (§10.3). 반환: (status, total_amount, fail_reason, PENDING_NEW 장 FIT 통일 여부).
+    - FIT item 금액 합산으로 total_amount 반영(API 금액 = BE가 반영한 값).
+    - 최대 3장 중 한 장이라도 정상조건(금액·2026 이벤트 기간 내 날짜 등) 충족 시 FIT 판정.
+    - UNFIT_DATE 등 개별 장만의 사유는 합산 기준 충족 시 전체를 UNFIT로 두지 않음.
+    - 장별 금액 합산(total_all_amounts)이 기준 충족인데 BIZ_003만 있으면 FIT 처리(합산 금액 미달 오판 방지).
+    - 금액 충족인데 유일 사유가 PENDING_NEW이고 정책이 자동처리(AUTO_REGISTER)면 FIT 처리(에러 아님).
     """
-    filled = sum(1 for v in (store_name, biz_num, address) if v and str(v).strip())
-    if filled >= OCR_KEY_FIELDS_MIN_FILLED:
-        return False
-    if confidence is not None and confidence >= OCR_LOW_CONFIDENCE_REVIEW_THRESHOLD:
-        return False
-    return True
-
-
-def _ocr_contains_forbidden_business(ocr_data: dict) -> bool:
-    """OCR 결과 전체 텍스트에서 부적격 업태 키워드 포함 여부. 포함 시 True."""
-    try:
-        text = json.dumps(ocr_data, ensure_ascii=False)
-        return any(kw in text for kw in FORBIDDEN_BUSINESS_KEYWORDS)
-    except Exception:
-        return False
+    resolved = _normalize_error_code(fail_code) or fail_code
+    # §10.3: 한 장이라도 정상이면 FIT. UNFIT_DATE(2026 이벤트 기간 내 유효 날짜)는 FIT을 막지 않음.
+    # 장별 금액 합산이 기준 충족 시 "합산 금액 미달"(BIZ_003)로 부적합 처리하지 않음.
+    if total_amount >= min_criteria and resolved in ("UNFIT_CATEGORY", "UNFIT_REGION", "UNFIT_DATE", "BIZ_003"):
+        resolved = None
+    if resolved == "BIZ_003" and total_all_amounts is not None and total_all_amounts >= min_criteria:
+        resolved = None
+        total_amount = total_all_amounts  # API에 기준 충족 금액 반영
+    # 금액 충족 + 신규상점(PENDING_NEW)만 있는 경우, 자동처리 정책이면 FIT으로 판정(에러로 두지 않음)
+    pending_new_upgraded = False
+    if (
+        resolved == "PENDING_NEW"
+        and total_all_amounts is not None
+        and total_all_amounts >= min_criteria
+        and _normalize_unknown_store_policy(unknown_store_policy) == "AUTO_REGISTER"
+    ):
+        resolved = None
+        total_amount = total_all_amounts
+        pending_new_upgraded = True
+    amount_ok = total_amount >= min_criteria or (total_all_amounts is not None and total_all_amounts >= min_criteria)
+    if not resolved and amount_ok:
+        if total_amount < min_criteria and total_all_amounts is not None:
+            total_amount = total_all_amounts
+        return "FIT", total_amount, None, pending_new_upgraded
+    if resolved in ("PENDING_NEW", "PENDING_VERIFICATION"):
+        status = resolved
+    elif resolved in ("UNFIT_CATEGORY", "UNFIT_REGION", "UNFIT_DATE", "UNFIT_DUPLICATE", "ERROR_OCR"):
+        status = resolved
+    else:
+        status = _status_for_code(resolved or "BIZ_003")
+        resolved = resolved or "BIZ_003"
+    return status, total_amount, _truncate_submission_reason(_global_fail_reason(resolved)), False
 
 
-def _extract_store_tel(ocr_data: dict) -> Optional[str]:
-    """OCR 결과에서 가맹점 전화번호 추출."""
-    try:
-        images = ocr_data.get("images") or []
-        if not images:
-            return None
-        result = (images[0].get("receipt") or {}).get("result") or {}
-        store_info = result.get("storeInfo") or {}
-        tel_list = store_info.get("tel") or []
-        if isinstance(tel_list, list) and tel_list:
-            tel_text = (tel_list[0].get("text") or "").strip()
-            return _normalize_tel(tel_text) or None
-    except Exception:
-        return None
-    return None
+def finalize_submission(
+    submission: Submission,
+    total_amount: int,
+    min_criteria: int,
+    fail_code: Optional[str],
+    total_all_amounts: Optional[int] = None,
+    unknown_store_policy: Optional[str] = None,
+    item_rows: Optional[List[Any]] = None,
+) -> None:
+    """
+    submission 최종 판정/감사로그 저장 (§10.3). 판정 기준은 _final_verdict.
+    - 자동처리로 FIT 올릴 때 item_rows의 PENDING_NEW 장도 FIT으로 통일해 FE에서 에러로 안 보이게 함.
+    """
+    status, amount, reason, pending_new_upgraded = _final_verdict(
+        total_amount, min_criteria, fail_code, total_all_amounts, unknown_store_policy
+    )
+    submission.updated_at = datetime.utcnow()
+    submission.total_amount = amount
+    submission.status = status
+    submission.global_fail_reason = reason
+    submission.fail_reason = reason
+    # 자동처리로 PENDING_NEW → FIT 올린 경우, 장(ReceiptItem)도 FIT으로 통일해 FE에서 에러 박스 안 나오게
+    if pending_new_upgraded and item_rows:
+        for it in item_rows:
+            if getattr(it, "status", None) == "PENDING_NEW":
+                it.status = "FIT"
+                it.error_code = None
+                it.error_message = None
 
 
-def _is_amount_mismatch(user_amount: Optional[int], ocr_amount: Optional[int]) -> bool:
-    """사용자 입력 금액과 OCR 금액 차이가 10% 이상인지 판정."""
-    if user_amount is None or ocr_amount is None:
-        return False
-    base = max(user_amount, 1)
-    ratio = abs(ocr_amount - user_amount) / base
-    return ratio >= AMOUNT_MISMATCH_RATIO_THRESHOLD
+def _build_documents_from_request(req: CompleteRequest) -> List[Dict[str, str]]:
+    if req.documents:
+        return [
+            {"imageKey": (d.imageKey or "").strip(), "docType": d.docType}
+            for d in req.documents
+        ]
 
+    # 하위호환: 기존 data 구조를 문서 배열로 변환
+    docs: List[Dict[str, str]] = []
+    if req.type == "STAY" and isinstance(req.data, StayData):
+        docs.append({"imageKey": req.data.receiptImageKey.strip(), "docType": "RECEIPT"})
+        if req.data.isOta and req.data.otaStatementKey:
+            docs.append({"imageKey": req.data.otaStatementKey.strip(), "docType": "OTA_INVOICE"})
+    elif req.type == "TOUR" and isinstance(req.data, TourData):
+        for k in req.data.receiptImageKeys:
+            docs.append({"imageKey": (k or "").strip(), "docType": "RECEIPT"})
+    return docs
 
-def _get_user_input_for_document(
-    data: Optional[Union[StayData, TourData, DataWithItems]], doc_index: int
-) -> Tuple[Optional[int], Optional[str], Optional[str]]:
-    """장 인덱스에 대한 사용자 입력 (amount, pay_date, location). 없으면 (None, None, None)."""
-    if data is None:
-        return None, None, None
-    if isinstance(data, DataWithItems):
-        if doc_index < 0 or doc_index >= len(data.items):
-            return None, None, None
-        it = data.items[doc_index]
-        return it.amount, it.payDate or None, it.location
-    if isinstance(data, StayData) and doc_index == 0:
-        return data.amount, data.payDate or None, data.location
-    if isinstance(data, TourData):
-        return data.amount, data.payDate or None, None
-    return None, None, None
 
+def _parse_ota_invoice_result(ocr_data: dict) -> Dict[str, Optional[Any]]:
+    """
+    OTA 명세서(일반 OCR 결과 포함)에서 핵심 값 추출.
+    - amount: 총액/결제금액 패턴 우선, 없으면 큰 숫자 후보(타임스탬프 제외: MAX_AMOUNT_SANE 이하만)
+    - stayStart/stayEnd: 날짜 1~2개
+    - guestName: 예약자/투숙객 키워드 기반 추출
+    """
+    text_blob = json.dumps(ocr_data, ensure_ascii=False)
+    amount: Optional[int] = None
+    m = re.search(
+        r"(총.?금액|결제.?금액|합계|total)[^0-9]{0,20}([0-9][0-9,]{2,})",
+        text_blob,
+        re.IGNORECASE,
+    )
+    if m:
+        raw = int(re.sub(r"[^0-9]", "", m.group(2)))
+        amount = _clamp_amount_for_db(raw) if raw <= MAX_AMOUNT_SANE else None
+    else:
+        nums = [int(n.replace(",", "")) for n in re.findall(r"[0-9][0-9,]{4,}", text_blob)]
+        sane = [n for n in nums if n <= MAX_AMOUNT_SANE]
+        if sane:
+            amount = _clamp_amount_for_db(max(sane))
 
-def _get_user_total_amount(
-    data: Optional[Union[StayData, TourData, DataWithItems]], doc_count: int
-) -> Optional[int]:
-    """TOUR 시 사용자 입력 합산 금액 (DataWithItems면 items 합산, 아니면 단일 amount)."""
-    if data is None:
-        return None
-    if isinstance(data, DataWithItems):
-        return sum(data.items[i].amount for i in range(min(len(data.items), doc_count)))
-    if isinstance(data, TourData):
-        return data.amount
-    return None
+    dates = re.findall(r"20[0-9]{2}[./-][0-9]{1,2}[./-][0-9]{1,2}", text_blob)
+    stay_start = dates[0] if len(dates) >= 1 else None
+    stay_end = dates[1] if len(dates) >= 2 else None
+    guest = None
+    g = re.search(r"(예약자|투숙객|고객명|name)[^가-힣A-Za-z0-9]{0,8}([가-힣A-Za-z]{2,20})", text_blob, re.IGNORECASE)
+    if g:
+        guest = g.group(2)
 
+    return {
+        "amount": amount,
+        "stayStart": stay_start,
+        "stayEnd": stay_end,
+        "guestName": guest,
+    }
 
-def _auto_register_store(
-    db: Session,
-    submission_id: str,
-    store_name: str,
-    address: Optional[str],
-    biz_num: Optional[str],
-    tel: Optional[str],
-    predicted_category: str,
-    category_confidence: float,
-    classifier_type: str,
-) -> None:
-    """고신뢰도 자동 분류 시 master_stores + unregistered_stores(AUTO_REGISTERED) 삽입. 이후 동일 상점은 FIT."""
-    try:
-        db.execute(
-            sql_text(
-                "INSERT INTO master_stores (store_name, category_large, category_small, road_address) "
-                "VALUES (:store_name, :category_large, :category_small, :road_address)"
-            ),
-            {
-                "store_name": store_name or "",
-                "category_large": predicted_category,
-                "category_small": predicted_category,
-                "road_address": address or "",
-            },
-        )
-    except Exception as e:
-        logger.warning("auto_register_store master_stores insert failed: %s", e)
-        return
-    now = datetime.utcnow()
-    db.add(
-        UnregisteredStore(
-            store_name=store_name,
-            biz_num=biz_num,
-            address=address,
-            tel=tel,
-            status="AUTO_REGISTERED",
-            source_submission_id=submission_id,
-            occurrence_count=1,
-            first_detected_at=now,
-            recent_receipt_id=submission_id,
-            predicted_category=predicted_category,
-            category_confidence=category_confidence,
-            classifier_type=classifier_type,
-            updated_at=now,
-        )
-    )
 
+# OCR 결과 캐시 조회/저장. 캐시 장애는 OCR 흐름에 영향 없도록 경고만 남기고 미스로 처리
+_OCR_RESULT_CACHE_STATS: Dict[str, int] = {"hit": 0, "miss": 0, "store": 0, "error": 0, "evicted": 0}
+_ocr_result_cache_lock = threading.Lock()
+_ocr_result_cache_last_evict = 0.0
 
-def _register_new_candidate_store(
-    db: Session,
-    submission_id: str,
-    parsed: Dict[str, Any],
-    ocr_raw: Optional[Dict[str, Any]],
-    predicted_category: Optional[str] = None,
-    category_confidence: Optional[float] = None,
-    classifier_type: Optional[str] = None,
-) -> None:
-    """
-    마스터 미등록 상점을 임시 등록(TEMP_VALID).
-    동일 상점(금액·품목 다른 제출건 포함)은 unregistered_stores로만 처리하고, 중복으로 인해 제출건을 ERROR로 두지 않음.
-    - 동일 요청 내 같은 (biz_num, address, tel): 세션 pending 기준 1건만 두고 occurrence만 증가.
-    - DB 기존 행 있으면 occurrence 증가 후 return.
-    - 신규 시: INSERT ON CONFLICT DO UPDATE(업서트) 사용해 UniqueViolation 방지.
-    """
-    biz_num = _normalize_biz_num((parsed.get("businessNum") or "").strip()) if parsed.get("businessNum") else None
-    address = _normalize_address((parsed.get("address") or "").strip()) if parsed.get("address") else None
-    tel = _extract_store_tel(ocr_raw or {}) if ocr_raw else None
-    store_name_raw = (parsed.get("storeName") or "").strip() or None
-    store_name = re.sub(r"\s+", " ", store_name_raw).strip() if store_name_raw else None
 
-    def _key(o: UnregisteredStore) -> tuple:
-        return (getattr(o, "biz_num") or "", getattr(o, "address") or "", getattr(o, "tel") or "")
+def _ocr_result_cache_stat_add(key: str, n: int = 1) -> None:
+    with _ocr_result_cache_lock:
+        _OCR_RESULT_CACHE_STATS[key] = _OCR_RESULT_CACHE_STATS.get(key, 0) + n
 
-    want_key = (biz_num or "", address or "", tel or "")
 
-    # 동일 세션에서 아직 flush 안 된 동일 키 후보가 있으면 occurrence만 올리고 return (UniqueViolation 방지)
-    for obj in db.new:
-        if isinstance(obj, UnregisteredStore) and _key(obj) == want_key:
-            obj.occurrence_count = (obj.occurrence_count or 0) + 1
-            obj.recent_receipt_id = submission_id
-            obj.updated_at = datetime.utcnow()
-            if predicted_category is not None:
-                obj.predicted_category = predicted_category
-            if category_confidence is not None:
-                obj.category_confidence = category_confidence
-            if classifier_type is not None:
-                obj.classifier_type = classifier_type
-            return
+def _ocr_result_cache_stats_snapshot() -> Dict[str, Any]:
+    with _ocr_result_cache_lock:
+        out: Dict[str, Any] = dict(_OCR_RESULT_CACHE_STATS)
+    lookups = out["hit"] + out["miss"]
+    out["hit_ratio"] = round(out["hit"] / lookups, 4) if lookups else None
+    out["enabled"] = OCR_RESULT_CACHE_ENABLED
+    return out
 
-    q = db.query(UnregisteredStore).filter(UnregisteredStore.status == "TEMP_VALID")
-    if biz_num:
-        q = q.filter(UnregisteredStore.biz_num == biz_num)
-    if address:
-        q = q.filter(UnregisteredStore.address == address)
-    if tel:
-        q = q.filter(UnregisteredStore.tel == tel)
-    exists = q.first()
-    now = datetime.utcnow()
-    if exists:
-        exists.occurrence_count = (exists.occurrence_count or 0) + 1
-        exists.recent_receipt_id = submission_id
-        exists.updated_at = now
-        if predicted_category is not None:
-            exists.predicted_category = predicted_category
-        if category_confidence is not None:
-            exists.category_confidence = category_confidence
-        if classifier_type is not None:
-            exists.classifier_type = classifier_type
-        return
 
-    # 동일 상점(금액·품목 다를 수 있음) 중복 INSERT 시 UniqueViolation 방지: 업서트로 처리해 제출건을 ERROR로 두지 않음
-    store_name_safe = (store_name or "")[:255] if store_name else None
+def _ocr_result_cache_get(content_hash: str, domain: str) -> Optional[Tuple[dict, Optional[str]]]:
+    """캐시 조회(TTL 이내만). 적중 시 hit_count·last_hit_at 갱신 후 (ocr_raw, first_receipt_id) 반환."""
+    cutoff = datetime.utcnow() - timedelta(days=OCR_RESULT_CACHE_TTL_DAYS)
+    db = SessionLocal()
+    try:
+        row = db.execute(
+            sql_text(
+                "UPDATE ocr_result_cache SET hit_count = hit_count + 1, last_hit_at = :now "
+                "WHERE content_hash = :h AND domain = :d AND created_at >= :cutoff "
+                "RETURNING ocr_raw, first_receipt_id"
+            ),
+            {"h": content_hash, "d": domain, "cutoff": cutoff, "now": datetime.utcnow()},
+        ).first()
+        db.commit()
+        if row is None:
+            return None
+        return row[0], row[1]
+    finally:
+        db.close()
+
+
+def _ocr_result_cache_put(content_hash: str, domain: str, ocr_data: dict, receipt_id: str) -> None:
+    """캐시 저장(동일 키 존재 시 응답·생성 시각 갱신). 주기적으로 TTL·LRU 정리 수행."""
+    db = SessionLocal()
     try:
         db.execute(
-            sql_text("""
-            INSERT INTO unregistered_stores (
-                id, store_name, biz_num, address, tel, status, source_submission_id,
-                occurrence_count, first_detected_at, recent_receipt_id,
-                predicted_category, category_confidence, classifier_type, created_at, updated_at
-            ) VALUES (
-                :id, :store_name, :biz_num, :address, :tel, 'TEMP_VALID', :source_submission_id,
-                1, :now, :source_submission_id,
-                :predicted_category, :category_confidence, :classifier_type, :now, :now
-            )
-            ON CONFLICT ( (COALESCE(biz_num, '')), (COALESCE(address, '')), (COALESCE(tel, '')) )
-            DO UPDATE SET
-                occurrence_count = unregistered_stores.occurrence_count + 1,
-                recent_receipt_id = EXCLUDED.recent_receipt_id,
-                updated_at = EXCLUDED.updated_at,
-                predicted_category = COALESCE(EXCLUDED.predicted_category, unregistered_stores.predicted_category),
-                category_confidence = COALESCE(EXCLUDED.category_confidence, unregistered_stores.category_confidence),
-                classifier_type = COALESCE(EXCLUDED.classifier_type, unregistered_stores.classifier_type)
-            """),
-            {
-                "id": str(uuid.uuid4()),
-                "store_name": store_name_safe,
-                "biz_num": biz_num,
-                "address": address,
-                "tel": tel,
-                "source_submission_id": submission_id,
-                "now": now,
-                "predicted_category": predicted_category,
-                "category_confidence": category_confidence,
-                "classifier_type": classifier_type,
-            },
-        )
-    except Exception:
-        # ON CONFLICT 표현식이 인덱스와 안 맞는 등 예외 시: UPDATE로만 처리 후 없으면 INSERT (중복 시 ERROR 방지)
-        upd = db.execute(
-            sql_text("""
-            UPDATE unregistered_stores
-            SET occurrence_count = occurrence_count + 1, recent_receipt_id = :sid, updated_at = :now,
-                predicted_category = COALESCE(:predicted_category, predicted_category),
-                category_confidence = COALESCE(:category_confidence, category_confidence),
-                classifier_type = COALESCE(:classifier_type, classifier_type)
-            WHERE status = 'TEMP_VALID'
-              AND (COALESCE(biz_num, '') = COALESCE(:biz_num, ''))
-              AND (COALESCE(address, '') = COALESCE(:address, ''))
-              AND (COALESCE(tel, '') = COALESCE(:tel, ''))
-            """),
-            {
-                "sid": submission_id,
-                "now": now,
-                "predicted_category": predicted_category,
-                "category_confidence": category_confidence,
-                "classifier_type": classifier_type,
-                "biz_num": biz_num,
-                "address": address,
-                "tel": tel,
-            },
+            sql_text(
+                "INSERT INTO ocr_result_cache (content_hash, domain, ocr_raw, first_receipt_id, hit_count, created_at) "
+                "VALUES (:h, :d, CAST(:raw AS JSONB), :rid, 0, :now) "
+                "ON CONFLICT (content_hash, domain) DO UPDATE SET ocr_raw = EXCLUDED.ocr_raw, created_at = EXCLUDED.created_at"
+            ),
+            {"h": content_hash, "d": domain, "raw": json.dumps(ocr_data, ensure_ascii=False), "rid": receipt_id, "now": datetime.utcnow()},
         )
-        if upd.rowcount and upd.rowcount > 0:
+        db.commit()
+        _maybe_evict_ocr_result_cache(db)
+    finally:
+        db.close()
+
+
+def _maybe_evict_ocr_result_cache(db: Session) -> None:
+    """TTL 경과 항목 삭제 후 최대 항목 수 초과분을 LRU(마지막 사용, 없으면 생성 시각) 순으로 삭제. 프로세스당 OCR_RESULT_CACHE_EVICT_INTERVAL_SEC마다 1회."""
+    global _ocr_result_cache_last_evict
+    now = time.time()
+    with _ocr_result_cache_lock:
+        if now - _ocr_result_cache_last_evict < OCR_RESULT_CACHE_EVICT_INTERVAL_SEC:
             return
-        db.add(
-            UnregisteredStore(
-                store_name=store_name_safe,
-                biz_num=biz_num,
-                address=address,
-                tel=tel,
-                status="TEMP_VALID",
-                source_submission_id=submission_id,
-                occurrence_count=1,
-                first_detected_at=now,
-                recent_receipt_id=submission_id,
-                predicted_category=predicted_category,
-                category_confidence=category_confidence,
-                classifier_type=classifier_type,
-                updated_at=now,
+        _ocr_result_cache_last_evict = now
+    cutoff = datetime.utcnow() - timedelta(days=OCR_RESULT_CACHE_TTL_DAYS)
+    expired = db.execute(sql_text("DELETE FROM ocr_result_cache WHERE created_at < :cutoff"), {"cutoff": cutoff}).rowcount or 0
+    total = db.execute(sql_text("SELECT COUNT(*) FROM ocr_result_cache")).scalar() or 0
+    overflow = 0
+    if total > OCR_RESULT_CACHE_MAX_ENTRIES:
+        overflow = db.execute(
+            sql_text(
+                "DELETE FROM ocr_result_cache WHERE (content_hash, domain) IN ("
+                "SELECT content_hash, domain FROM ocr_result_cache "
+                "ORDER BY COALESCE(last_hit_at, created_at) ASC LIMIT :n)"
+            ),
+            {"n": int(total - OCR_RESULT_CACHE_MAX_ENTRIES)},
+        ).rowcount or 0
+    db.commit()
+    if expired or overflow:
+        _ocr_result_cache_stat_add("evicted", expired + overflow)
+        logger.info("ocr_result_cache evicted expired=%s lru=%s", expired, overflow)
+
+
+async def _call_naver_ocr_cached(
+    image_bytes: bytes, receipt_id: str, image_format: str, domain_type: str
+) -> Tuple[dict, str, Optional[str]]:
+    """
+    OCR 결과 캐시 경유 호출. 반환: (ocr_data, content_hash, cached_from_receipt_id).
+    cached_from_receipt_id: 캐시 적중 시 최초 OCR한 receiptId(동일 이미지 재업로드 신호), 미스면 None.
+    """
+    content_hash = hashlib.sha256(image_bytes).hexdigest()
+    if OCR_RESULT_CACHE_ENABLED:
+        try:
+            cached = await _run_io(_ocr_result_cache_get, content_hash, domain_type)
+        except Exception as e:
+            _ocr_result_cache_stat_add("error")
+            logger.warning("ocr_result_cache lookup failed (apply migration ocr_result_cache.sql if needed): %s", e)
+            cached = None
+        if cached is not None:
+            _ocr_result_cache_stat_add("hit")
+            ocr_data, first_receipt_id = cached
+            logger.info(
+                "OCR cache hit: receiptId=%s domain=%s sha256=%s firstReceiptId=%s",
+                receipt_id, domain_type, content_hash[:16], first_receipt_id,
             )
-        )
+            return ocr_data, content_hash, (first_receipt_id or "")
+        _ocr_result_cache_stat_add("miss")
+    ocr_data = await _call_naver_ocr_with_retry(
+        image_bytes, receipt_id, image_format, domain_type=domain_type, retries=2
+    )
+    if OCR_RESULT_CACHE_ENABLED:
+        try:
+            await _run_io(_ocr_result_cache_put, content_hash, domain_type, ocr_data, receipt_id)
+            _ocr_result_cache_stat_add("store")
+        except Exception as e:
+            _ocr_result_cache_stat_add("error")
+            logger.warning("ocr_result_cache store failed: %s", e)
+    return ocr_data, content_hash, None
 
 
-def _fail_message(code: Optional[str]) -> Optional[str]:
-    if not code:
-        return None
-    msg = {
-        "BIZ_001": "BIZ_001 (중복 등록)",
-        "BIZ_002": "BIZ_002 (2026년 결제일 아님)",
-        "BIZ_003": "BIZ_003 (최소 금액 미달)",
-        "BIZ_004": "BIZ_004 (강원특별자치도 외 지역)",
-        "BIZ_005": "BIZ_005 (캠페인 기간 아님)",
-        "BIZ_006": "BIZ_006 (캠페인 대상 지역 아님)",
-        "BIZ_007": "BIZ_007 (입력 금액과 OCR 금액 불일치)",
-        "BIZ_008": "BIZ_008 (유흥업소 등 부적격 업종)",
-        "BIZ_010": "BIZ_010 (문서 구성 요건 불충족)",
-        "BIZ_011": "BIZ_011 (영수증/증빙 금액 불일치)",
-        "OCR_001": "OCR_001 (영수증 판독 불가)",
-        "OCR_002": "OCR_002 (결제일 형식 오류)",
-        "OCR_003": "OCR_003 (마스터 상호 미등록)",
-        "OCR_004": "OCR_004 (인식 불량·수동 검수 보정)",
-        "PENDING_NEW": "PENDING_NEW (신규 상점 검수 대기)",
-        "PENDING_VERIFICATION": "PENDING_VERIFICATION (사용자 입력값- OCR 불일치)",
-        "UNFIT_CATEGORY": "UNFIT_CATEGORY (제외 업종)",
-        "UNFIT_REGION": "UNFIT_REGION (지역 불일치)",
-        "UNFIT_DATE": "UNFIT_DATE (기간/날짜 불일치)",
-        "UNFIT_DUPLICATE": "UNFIT_DUPLICATE (중복 제출)",
-        "ERROR_OCR": "ERROR_OCR (판독 불가)",
+def _check_and_register_image_hash(receipt_id: str, image_key: str, dhash: int) -> List[Dict[str, Any]]:
+    """유사 이미지(다른 신청건) 조회 후 현재 이미지 해시 저장. 반환: find_near_duplicate_images 결과."""
+    db = SessionLocal()
+    try:
+        near = find_near_duplicate_images(db, dhash, receipt_id, IMAGE_DEDUP_MAX_DISTANCE)
+        register_image_hash(db, receipt_id, image_key, dhash)
+        db.commit()
+        return near
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _image_near_duplicate_needs_review(asset: Dict[str, Any]) -> bool:
+    """IMAGE_DEDUP_REVIEW=1이고 FIT 처리된 다른 신청건 이미지와 유사하면 True(수동 검증 대상)."""
+    if not IMAGE_DEDUP_REVIEW:
+        return False
+    return any(d.get("status") == "FIT" for d in (asset.get("imageNearDuplicates") or []))
+
+
+async def _run_ocr_for_document(
+    receipt_id: str, image_key: str, doc_type: str, project_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    단일 이미지 OCR 및 파싱.
+    project_type: STAY|TOUR. image_key가 STAY/ 또는 TOUR/ 로 시작하면 경로로 도메인 결정, 아니면 project_type 사용(기본 TOUR).
+    """
+    image_key = (image_key or "").strip()
+    if not image_key:
+        raise ValueError("BIZ_010")
+    domain_type = _resolve_ocr_domain(image_key, project_type)
+    image_bytes, content_type = await _run_io(_get_image_bytes_from_s3, image_key)
+    image_bytes, content_type, dhash, thumb = await _run_image(
+        preprocess_for_ocr_with_thumbnail, image_bytes, content_type
+    )
+    image_format = _image_format_from_content_type(content_type)
+    # 썸네일 업로드 실패는 분석에 영향 없음(프록시 size=thumb 요청 시 지연 생성)
+    thumbnail_key: Optional[str] = None
+    if THUMBNAIL_ENABLED and thumb:
+        try:
+            thumbnail_key = await _run_io(_put_thumbnail_to_s3, image_key, thumb[0], thumb[1])
+        except Exception as e:
+            logger.warning("thumbnail upload failed receiptId=%s imageKey=%s: %s", receipt_id, image_key, e)
+    # OCR 호출 전 유사 이미지(재촬영·재업로드) 조회. 탐지 실패는 OCR 흐름에 영향 없음
+    near_duplicates: List[Dict[str, Any]] = []
+    if IMAGE_DEDUP_ENABLED and dhash is not None:
+        try:
+            near_duplicates = await _run_io(_check_and_register_image_hash, receipt_id, image_key, dhash)
+        except Exception as e:
+            logger.warning("image dedup check failed (apply migration receipt_image_hashes.sql if needed): %s", e)
+        if near_duplicates:
+            logger.info(
+                "near-duplicate image: receiptId=%s imageKey=%s matches=%s",
+                receipt_id, image_key,
+                [(d["submissionId"], d["distance"]) for d in near_duplicates],
+            )
+    # 도메인별 동시 호출 수·RPS 제한은 _call_naver_ocr_with_retry 내부(_OcrDomainLimiter)에서 적용(네이버 rate limit 대응)
+    # 동일 이미지(전처리 후 SHA-256)·도메인은 OCR 결과 캐시에서 재사용
+    ocr_data, content_hash, cached_from = await _call_naver_ocr_cached(
+        image_bytes, receipt_id, image_format, domain_type
+    )
+
+    if doc_type == "RECEIPT":
+        amount, pay_date, store_name, address, location = _parse_ocr_result(ocr_data)
+        parsed = {
+            "amount": amount,
+            "payDate": pay_date,
+            "storeName": store_name,
+            "address": address,
+            "location": location,
+            "businessNum": _extract_business_num(ocr_data),
+            "cardNum": _extract_card_num(ocr_data),
+            "confidenceScore": _extract_confidence_score(ocr_data),
+        }
+    else:
+        parsed = _parse_ota_invoice_result(ocr_data)
+        parsed["cardNum"] = CARD_NUM_NO_CARD
+        parsed["confidenceScore"] = _extract_confidence_score(ocr_data)
+
+    return {
+        "imageKey": image_key,
+        "docType": doc_type,
+        "parsed": parsed,
+        "ocrRaw": ocr_data,
+        "imageSha256": content_hash,
+        "ocrCachedFrom": cached_from,
+        "imageNearDuplicates": near_duplicates,
+        "thumbnailKey": thumbnail_key,
     }
-    return msg.get(code, code)
 
 
-def _truncate_submission_reason(s: Optional[str], max_len: int = SUBMISSION_FAIL_REASON_MAX_LEN) -> Optional[str]:
-    """fail_reason, global_fail_reason 저장 시 DB varchar 제한 준수."""
-    if not s or len(s) <= max_len:
-        return s
-    return (s[: max_len - 3] + "...") if max_len > 3 else s[:max_len]
+def _prepare_analysis(db: Session, req: CompleteRequest, submission: Submission) -> Optional[Tuple[List[Dict[str, str]], Any]]:
+    """
+    analyze_receipt_task 1단계(동기, I/O 스레드 풀에서 실행): 입력 스냅샷 저장, 문서 구성 확인, placeholder item 생성 후 VERIFYING commit.
+    반환: (documents, rule_cfg). 문서 구성 요건 불충족으로 즉시 종료한 경우 None.
+    """
+    # 사용자 입력 스냅샷: Complete 시 전송된 data가 있는데 아직 저장되지 않았으면 태스크에서 저장(관리자 페이지 표시용)
+    if getattr(submission, "user_input_snapshot", None) is None and req.data is not None:
+        submission.user_input_snapshot = req.data.model_dump()
+        db.commit()
+    rule_cfg = _get_judgment_rules(db)
+
+    documents = _build_documents_from_request(req)
+    if not documents:
+        submission.status = "UNFIT"
+        submission.updated_at = datetime.utcnow()
+        submission.total_amount = 0
+        submission.fail_reason = _truncate_submission_reason(_global_fail_reason("BIZ_010"))
+        submission.global_fail_reason = submission.fail_reason
+        submission.audit_log = _truncate_submission_audit("문서 구성 요건 불충족")
+        submission.audit_trail = submission.audit_log
+        _sync_submission_stats(db, [submission.submission_id])
+        db.commit()
+        return None
+
+    submission.project_type = req.type
+    # VERIFYING 전에 placeholder를 먼저 넣고 한 번에 commit → GET이 VERIFYING을 볼 때 항상 items 존재
+    existing_rows = (
+        db.query(ReceiptItem)
+        .filter(ReceiptItem.submission_id == req.receiptId)
+        .order_by(ReceiptItem.seq_no.asc())
+        .all()
+    )
+    if len(existing_rows) != len(documents):
+        db.query(ReceiptItem).filter(ReceiptItem.submission_id == req.receiptId).delete(synchronize_session=False)
+        for idx, d in enumerate(documents, start=1):
+            db.add(
+                ReceiptItem(
+                    submission_id=req.receiptId,
+                    seq_no=idx,
+                    doc_type=d.get("docType", "RECEIPT"),
+                    image_key=(d.get("imageKey") or "").strip(),
+                    card_num=CARD_NUM_NO_CARD,
+                    status="PENDING",
+                )
+            )
+    else:
+        for idx, d in enumerate(documents, start=1):
+            row = existing_rows[idx - 1]
+            row.seq_no = idx
+            row.doc_type = d.get("docType", "RECEIPT")
+            row.image_key = (d.get("imageKey") or "").strip()
+            row.status = "PENDING"
+            row.error_code = None
+            row.error_message = None
+    submission.status = "VERIFYING"
+    submission.updated_at = datetime.utcnow()
+    # 재분석이면 이전 판정을 롤업에서 제외(진행 중 건은 원본에서 집계)
+    _sync_submission_stats(db, [submission.submission_id])
+    db.commit()
+    return documents, rule_cfg
+
 
+def _judge_ocr_results(
+    db: Session,
+    req: CompleteRequest,
+    submission: Submission,
+    documents: List[Dict[str, str]],
+    rule_cfg: Any,
+    results: List[Any],
+) -> Dict[str, Any]:
+    """
+    analyze_receipt_task 3단계(동기, I/O 스레드 풀에서 실행): OCR 결과 매핑·판정·최종 상태 commit.
+    results는 asyncio.gather(return_exceptions=True) 결과. 반환: 콜백 payload.
+    """
+    ocr_assets: List[Dict[str, Any]] = []
+    for i, r in enumerate(results):
+        if isinstance(r, Exception):
+            ocr_assets.append(
+                {
+                    "imageKey": documents[i]["imageKey"],
+                    "docType": documents[i]["docType"],
+                    "parsed": {},
+                    "ocrRaw": None,
+                    "status": "ERROR_OCR",
+                    "error_code": "OCR_001",
+                }
+            )
+        else:
+            r["status"] = "PENDING"
+            r["error_code"] = None
+            ocr_assets.append(r)
 
-def _truncate_submission_audit(s: Optional[str], max_len: int = SUBMISSION_AUDIT_MAX_LEN) -> Optional[str]:
-    """audit_log, audit_trail 저장 시 과도한 길이·DB 오류 방지."""
-    if not s or len(s) <= max_len:
-        return s
-    return (s[: max_len - 3] + "...") if max_len > 3 else s[:max_len]
+    # 2) 자식 테이블 개별 저장 (placeholder row 업데이트)
+    mapped_items, _ = map_ocr_to_db(req.receiptId, ocr_assets, documents)
+    item_rows = (
+        db.query(ReceiptItem)
+        .filter(ReceiptItem.submission_id == req.receiptId)
+        .order_by(ReceiptItem.seq_no.asc())
+        .all()
+    )
+    if len(item_rows) != len(mapped_items):
+        # 이론상 발생하지 않아야 하나, 안전하게 재구성
+        db.query(ReceiptItem).filter(ReceiptItem.submission_id == req.receiptId).delete(synchronize_session=False)
+        for item in mapped_items:
+            db.add(item)
+        item_rows = mapped_items
+    else:
+        _apply_mapped_items(item_rows, mapped_items)
 
+    audit_lines, registered = _judge_items(db, req, submission, rule_cfg, ocr_assets, item_rows)
+    raw_audit = " | ".join(audit_lines) if audit_lines else (submission.fail_reason or "")
+    submission.audit_log = _truncate_submission_audit(raw_audit)
+    submission.audit_trail = submission.audit_log
+    _sync_submission_stats(db, [submission.submission_id])
+    payload = _build_status_payload(submission, item_rows)
+    if CALLBACK_OUTBOX_ENABLED:
+        _enqueue_result_callback(db, submission.submission_id, payload, purpose="auto")
+    db.commit()
+    _register_stores_in_index(registered)
+    return payload
 
-def _normalize_error_code(code: Optional[str]) -> Optional[str]:
-    """에러 문자열에서 표준 코드 토큰 추출."""
-    if not code:
-        return None
-    m = re.search(
-        r"\b((?:BIZ|OCR)_[0-9]{3}|PENDING_NEW|PENDING_VERIFICATION|UNFIT_CATEGORY|UNFIT_REGION|UNFIT_DATE|UNFIT_DUPLICATE|ERROR_OCR)\b",
-        str(code).strip(),
-    )
-    return m.group(1) if m else None
 
+def _apply_mapped_items(item_rows: List[Any], mapped_items: List[ReceiptItem]) -> None:
+    """map_ocr_to_db 결과를 기존 장 행(placeholder 또는 재처리 대상)에 반영."""
+    for i, mapped in enumerate(mapped_items):
+        row = item_rows[i]
+        row.doc_type = mapped.doc_type
+        row.image_key = mapped.image_key
+        row.store_name = mapped.store_name
+        row.biz_num = mapped.biz_num
+        row.pay_date = mapped.pay_date
+        row.amount = mapped.amount
+        row.address = mapped.address
+        row.location = mapped.location
+        row.card_num = mapped.card_num
+        row.status = mapped.status
+        row.error_code = mapped.error_code
+        row.error_message = mapped.error_message
+        row.confidence_score = mapped.confidence_score
+        row.ocr_raw = mapped.ocr_raw
+        row.parsed = mapped.parsed
+        row.thumbnail_key = mapped.thumbnail_key or row.thumbnail_key
+
+
+# 판정 엔진: 사전 조회 컨텍스트(규칙 스냅샷·상점 매칭·중복 키·캠페인 캐시)와 OCR 자산만으로 장별 상태·신청 판정 계산(DB 비의존).
+# 분석(_judge_items)·일괄 재처리·규칙 시뮬레이션이 같은 엔진을 사용. 상점 자동 등록·신규 후보 등록은 결과의 예약 목록으로만 반환.
+ClassifyFn = Callable[[Optional[str], Optional[str], Optional[Dict[str, Any]]], Tuple[Optional[str], float, str]]
+DuplicateKey = Tuple[str, str, int, str]
+
+
+class JudgmentContext:
+    """
+    판정 엔진 입력(_build_judgment_context로 신청 1건 또는 여러 건에 대해 한 번에 조회).
+    - store_matches: (상호명, 시군) → 마스터 매칭 여부
+    - duplicate_keys: 중복 키 → 그 키의 장을 가진 FIT 신청 id 집합. 일괄 모드에서는 판정할 때마다 갱신(_judge_rules_bulk)
+    - campaigns: 적재된 캠페인 캐시(레거시 campaignId 요청이 있을 때만)
+    - registered_stores: 판정 중 자동 등록 예약된 상호명. 같은 컨텍스트의 이후 장·신청에서는 매칭으로 취급
+    """
 
-def _resolve_item_status_error(code: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
+    __slots__ = ("rules", "store_matches", "duplicate_keys", "campaigns", "classify", "registered_stores", "_owned_keys")
+
+    def __init__(
+        self,
+        rules: Any,
+        store_matches: Dict[Tuple[str, str], bool],
+        duplicate_keys: Dict[DuplicateKey, Set[str]],
+        campaigns: Any,
+        classify: ClassifyFn,
+    ) -> None:
+        self.rules = rules
+        self.store_matches = store_matches
+        self.duplicate_keys = duplicate_keys
+        self.campaigns = campaigns
+        self.classify = classify
+        self.registered_stores: Set[str] = set()
+        self._owned_keys: Optional[Dict[str, Set[DuplicateKey]]] = None  # 신청 id → 소유 키(update_owner 첫 호출 시 구성)
+
+    def with_rules(self, rules: Any) -> "JudgmentContext":
+        """
+        같은 사전 조회분을 다른 규칙으로 판정(규칙 시뮬레이션). 자동 등록 예약 상점은 공유하지 않고,
+        중복 키 소유 현황은 복사본 사용(일괄 판정 중 갱신이 원래 컨텍스트에 섞이지 않게).
+        """
+        return JudgmentContext(
+            rules,
+            self.store_matches,
+            {k: set(v) for k, v in self.duplicate_keys.items()},
+            self.campaigns,
+            self.classify,
+        )
+
+    def store_matched(self, store_name: Optional[str], city: Optional[str]) -> bool:
+        name = store_name or ""
+        return bool(self.store_matches.get((name, city or ""))) or name.strip() in self.registered_stores
+
+    def is_duplicate(self, submission_id: str, key: Optional[DuplicateKey]) -> bool:
+        """다른 FIT 신청에 같은 키의 장이 있으면 True."""
+        if key is None:
+            return False
+        return any(owner != submission_id for owner in self.duplicate_keys.get(key, ()))
+
+    def update_owner(self, submission_id: str, keys: List[DuplicateKey], fit: bool) -> None:
+        """
+        판정 결과 반영: 신청을 모든 키의 소유자에서 빼고, FIT이면 이번 판정의 키 소유자로 다시 등록
+        (_duplicate_key_owners와 같은 기준: FIT 신청의 장이 가진 키).
+        """
+        if self._owned_keys is None:
+            self._owned_keys = {}
+            for key, owners in self.duplicate_keys.items():
+                for owner in owners:
+                    self._owned_keys.setdefault(owner, set()).add(key)
+        for key in self._owned_keys.pop(submission_id, ()):
+            self.duplicate_keys[key].discard(submission_id)
+        if fit and keys:
+            for key in keys:
+                self.duplicate_keys.setdefault(key, set()).add(submission_id)
+            self._owned_keys[submission_id] = set(keys)
+
+
+class JudgmentResult:
     """
-    코드 하나로 status / error_code / error_message 를 일관되게 결정.
-    반환: (status, normalized_error_code, error_message)
+    판정 엔진 출력. items: 장별 status/error_code/error_message/amount/pay_date/location, parsed: 장별 parsed(사용자 입력 대체 반영).
+    auto_register: 상점 자동 등록 예약, candidates: 신규 상점 후보 등록 예약(_apply_judgment_side_effects가 반영).
     """
-    normalized = _normalize_error_code(code) or code
-    if not normalized:
-        return "FIT", None, None
-    status = _status_for_code(normalized)
-    msg = _fail_message(normalized)
-    return status, normalized, msg
 
+    __slots__ = (
+        "items", "parsed", "status", "total_amount", "fail_reason", "campaign_id",
+        "audit_lines", "auto_register", "candidates",
+    )
 
-def _global_fail_reason(code: Optional[str]) -> Optional[str]:
-    """submission(마스터) 단위 fail reason 표준화. FE/로그용 짧은 문구 반환."""
-    if not code:
-        return None
-    mapping = {
-        "BIZ_001": "UNFIT_DUPLICATE (BIZ_001, 중복 제출)",
-        "BIZ_002": "UNFIT_DATE (BIZ_002, 결제일/기간 오류)",
-        "BIZ_003": "UNFIT_TOTAL_AMOUNT (BIZ_003, 합산 금액 미달)",
-        "BIZ_004": "UNFIT_REGION (BIZ_004, 지역 불일치)",
-        "BIZ_008": "UNFIT_CATEGORY (BIZ_008, 부적격 업종)",
-        "BIZ_010": "BIZ_010 (문서 구성 요건 불충족)",
-        "BIZ_011": "UNFIT_STAY_MISMATCH (BIZ_011, 숙박-증빙 불일치)",
-        "OCR_001": "ERROR_OCR (OCR_001, 영수증 판독 불가)",
-        "OCR_003": "OCR_003 (마스터 상호 미등록)",
-        "OCR_004": "PENDING_VERIFICATION (OCR_004, 인식 불량·수동 검수)",
-        "PENDING_NEW": "PENDING_NEW (신규 상점 확인 필요)",
-        "PENDING_VERIFICATION": "PENDING_VERIFICATION (입력값-OCR 불일치)",
-        "UNFIT_CATEGORY": "UNFIT_CATEGORY (제외 업종)",
-        "UNFIT_REGION": "UNFIT_REGION (지역 불일치)",
-        "UNFIT_DATE": "UNFIT_DATE (기간/날짜 불일치)",
-        "UNFIT_DUPLICATE": "UNFIT_DUPLICATE (중복 제출)",
-        "ERROR_OCR": "ERROR_OCR (판독 불가)",
+    def __init__(self) -> None:
+        self.items: List[SimpleNamespace] = []
+        self.parsed: List[Dict[str, Any]] = []
+        self.status = "PENDING"
+        self.total_amount = 0
+        self.fail_reason: Optional[str] = None
+        self.campaign_id: Optional[int] = None
+        self.audit_lines: List[str] = []
+        self.auto_register: List[Dict[str, Any]] = []
+        self.candidates: List[Dict[str, Any]] = []
+
+
+def _stay_receipt_fields(req: CompleteRequest, parsed: Dict[str, Any], idx: int) -> Dict[str, Any]:
+    """STAY 영수증 판정 값. OCR 신뢰도가 낮으면 사용자 입력(금액·결제일·지역)으로 대체(고신뢰 OCR은 그대로 우선)."""
+    ocr_amount = parsed.get("amount")
+    amount = ocr_amount
+    pay_date = parsed.get("payDate") or ""
+    location = parsed.get("location") or ""
+    confidence = parsed.get("confidenceScore") if isinstance(parsed.get("confidenceScore"), int) else 0
+    user_amt, user_pd, user_loc = _get_user_input_for_document(req.data, idx)
+    substituted = confidence < OCR_CONFIDENCE_THRESHOLD and user_amt is not None
+    if substituted:
+        amount = user_amt
+        pay_date = user_pd or pay_date
+        location = user_loc or location
+    _, normalized_date = _normalize_and_validate_2026_date(pay_date)
+    return {
+        "ocr_amount": ocr_amount,
+        "amount": amount,
+        "user_amt": user_amt,
+        "substituted": substituted,
+        "pay_date": pay_date,
+        "normalized_date": normalized_date,
+        "pay_date_stored": normalized_date or _normalize_pay_date_canonical(pay_date) or pay_date,
+        "store_name": parsed.get("storeName") or "",
+        "address": parsed.get("address") or "",
+        "location": location,
+        "biz_num": _normalize_biz_num(parsed.get("businessNum")),
+        "card_num": _normalize_card_num(parsed.get("cardNum")),
+        "confidence": confidence,
     }
-    return mapping.get(code, _fail_message(code))
 
 
-# 주요 반려 사유 API: fail_reason(한글/영문) 텍스트 → reason_code, reason_label 매핑 (백엔드_요청사항_정리 §4)
-REJECT_REASON_TO_CODE_LABEL: List[Tuple[str, str, str]] = [
-    ("BIZ_003", "합산 금액 미달", "UNFIT_TOTAL_AMOUNT|BIZ_003|합산 금액 미달"),
-    ("AMOUNT_MISMATCH", "금액 불일치", "금액 불일치|AMOUNT_MISMATCH"),
-    ("ERROR_OCR", "영수증 판독 불가", "ERROR_OCR|OCR_001|판독 불가|영수증 판독"),
-    ("IMAGE_BLUR", "이미지 흐림", "이미지 흐림|IMAGE_BLUR"),
-    ("UNFIT_REGION", "지역 불일치", "UNFIT_REGION|BIZ_004|지역 불일치|지역"),
-    ("UNFIT_DATE", "기간/날짜 불일치", "UNFIT_DATE|BIZ_002|기간|결제일"),
-    ("UNFIT_DUPLICATE", "중복 제출", "UNFIT_DUPLICATE|BIZ_001|중복"),
-    ("DUPLICATE", "중복 제출", "DUPLICATE"),
-    ("UNFIT_CATEGORY", "제외 업종", "UNFIT_CATEGORY|BIZ_008|부적격 업종|제외 업종"),
-    ("BIZ_010", "문서 구성 요건 불충족", "BIZ_010|문서 구성"),
-    ("PENDING_VERIFICATION", "인식 불량·수동 검수", "PENDING_VERIFICATION|OCR_004|인식 불량"),
-    ("PENDING_NEW", "신규 상점 확인 필요", "PENDING_NEW|신규 상점"),
-    ("OUT_OF_PERIOD", "기간 외", "OUT_OF_PERIOD|기간 외"),
-]
+def _tour_receipt_fields(req: CompleteRequest, parsed: Dict[str, Any], idx: int) -> Dict[str, Any]:
+    """TOUR 영수증 판정 값. OCR 금액이 비정상적으로 작을 때(오인식 가능) 사용자 입력 금액 사용."""
+    amount = _normalize_amount(parsed.get("amount"))
+    user_amt, _, _ = _get_user_input_for_document(req.data, idx)
+    substituted = amount is not None and amount < SUSPICIOUS_AMOUNT_THRESHOLD and user_amt is not None
+    if substituted:
+        amount = user_amt
+    pay_date = parsed.get("payDate") or ""
+    is_2026, norm_date = _normalize_and_validate_2026_date(pay_date)
+    canonical = norm_date or _normalize_pay_date_canonical(pay_date) or pay_date
+    return {
+        "amount": amount,
+        "user_amt": user_amt,
+        "substituted": substituted,
+        "pay_date_stored": _normalize_pay_date_for_storage(canonical) or canonical,
+        "store_name": _normalize_store_name(parsed.get("storeName")),
+        "address": _normalize_address((parsed.get("address") or "").strip()) or "",
+        "location": _normalize_location(parsed.get("location")),
+        "biz_num": _normalize_biz_num(parsed.get("businessNum")),
+        "card_num": _normalize_card_num(parsed.get("cardNum")),
+        "is_2026": is_2026,
+    }
 
 
-def _reason_text_to_code_label(reason: str) -> Tuple[str, str]:
-    """DB에 저장된 fail_reason 텍스트를 reason_code, reason_label(한글)로 변환. 주요 반려 사유 API용."""
-    if not reason or not (reason := (reason or "").strip()):
-        return "OTHER", "기타"
-    r = reason.upper()
-    for code, label, patterns in REJECT_REASON_TO_CODE_LABEL:
-        for p in patterns.split("|"):
-            if p.strip().upper() in r or (p.strip() and p.strip() in reason):
-                return code, label
-    return "OTHER", reason[:50] if len(reason) > 50 else reason
+def _asset_forbidden_business(asset: Dict[str, Any]) -> bool:
+    """부적격 업태(BIZ_008) 여부. 자산에 사전 계산된 ocrForbidden(규칙 시뮬레이션의 SQL 추출값)이 있으면 그 값 사용."""
+    flag = asset.get("ocrForbidden")
+    if flag is not None:
+        return bool(flag)
+    return _ocr_contains_forbidden_business(asset.get("ocrRaw"))
 
 
-def _status_for_code(code: Optional[str]) -> str:
-    """에러 코드에 대응하는 item/submission 상태명을 반환."""
-    c = _normalize_error_code(code) or code
-    if not c:
-        return "FIT"
-    if c in ("OCR_001", "ERROR_OCR"):
-        return "ERROR_OCR"
-    if c in ("BIZ_004", "UNFIT_REGION"):
-        return "UNFIT_REGION"
-    if c in ("BIZ_002", "OCR_002", "UNFIT_DATE"):
-        return "UNFIT_DATE"
-    if c in ("BIZ_001", "UNFIT_DUPLICATE"):
-        return "UNFIT_DUPLICATE"
-    if c in ("BIZ_008", "UNFIT_CATEGORY"):
-        return "UNFIT_CATEGORY"
-    if c == "PENDING_NEW":
-        return "PENDING_NEW"
-    if c in ("PENDING_VERIFICATION", "OCR_004"):
-        return "PENDING_VERIFICATION"
-    if c.startswith("BIZ_"):
-        return "UNFIT"
-    return "UNFIT"
+def _judgment_lookups(
+    req: CompleteRequest, ocr_assets: List[Dict[str, Any]]
+) -> List[Tuple[int, Tuple[str, str], Optional[DuplicateKey]]]:
+    """
+    판정 전에 조회할 장별 (장 index, (상호명, 시군) 매칭 질의, 중복 키).
+    _judge_rules가 상점 매칭·중복 검사에 실제로 쓰는 값과 동일하게 계산(해당 검사까지 가지 않는 장은 제외).
+    """
+    out: List[Tuple[int, Tuple[str, str], Optional[DuplicateKey]]] = []
+    receipt_idx = [i for i, a in enumerate(ocr_assets) if a["docType"] == "RECEIPT"]
+    pt = req.type.value if isinstance(req.type, ProjectType) else str(req.type)
+    if pt == "STAY":
+        ota_cnt = sum(1 for a in ocr_assets if a["docType"] == "OTA_INVOICE")
+        if len(receipt_idx) != 1 or ota_cnt > 1 or ocr_assets[receipt_idx[0]]["status"] == "ERROR_OCR":
+            return out
+        ri = receipt_idx[0]
+        f = _stay_receipt_fields(req, ocr_assets[ri]["parsed"], ri)
+        if f["amount"] is not None:
+            key = _duplicate_receipt_key(f["biz_num"], f["pay_date_stored"], f["amount"], f["card_num"])
+            out.append((ri, (f["store_name"], f["location"] or ""), key))
+        return out
+    if len(receipt_idx) < 1 or len(receipt_idx) > 3:
+        return out
+    for i in receipt_idx:
+        if ocr_assets[i]["status"] == "ERROR_OCR":
+            continue
+        f = _tour_receipt_fields(req, ocr_assets[i]["parsed"], i)
+        if f["amount"] is None:
+            continue
+        key = _duplicate_receipt_key(f["biz_num"], f["pay_date_stored"], f["amount"], f["card_num"])
+        out.append((i, (f["store_name"] or "", f["location"] or ""), key))
+    return out
 
 
-def map_ocr_to_db(
-    submission_id: str,
-    ocr_assets: List[Dict[str, Any]],
-    documents: List[Dict[str, str]],
-) -> Tuple[List[ReceiptItem], int]:
+def _duplicate_key_owners(db: Session, keys: Set[DuplicateKey]) -> Dict[DuplicateKey, Set[str]]:
     """
-    OCR 결과를 ReceiptItem 모델에 매핑하고, FIT 항목 합산 금액을 계산.
-    - 카드번호 미인식/비정상: 0000 정규화
-    - amount는 status == FIT 인 항목만 합산
+    중복 키별로 그 키의 장을 가진 FIT 신청 id(일괄 조회, 자기 신청 제외는 JudgmentContext.is_duplicate에서).
+    RECEIPT_DATA_CUTOFF_UTC 설정 시, 해당 시각 이후 생성된 submission만 비교(이전 데이터와 중복 처리 방지).
+    인덱스: idx_receipt_items_dup_key (receipt_items_dup_key_index.sql)
     """
-    items: List[ReceiptItem] = []
-    total_fit_amount = 0
-    for idx, asset in enumerate(ocr_assets, start=1):
-        p = asset.get("parsed") or {}
-        raw_status = asset.get("status", "PENDING")
-        raw_code = asset.get("error_code")
-        code = _normalize_error_code(raw_code) or raw_code
-        if raw_status == "ERROR_OCR" and not code:
-            code = "OCR_001"
-        if code is None:
-            status = raw_status or "PENDING"
-            normalized_code = None
-            error_msg = None
-        else:
-            status, normalized_code, error_msg = _resolve_item_status_error(code)
-        amount = _normalize_amount(p.get("amount"))
-        card_num = _normalize_card_num(p.get("cardNum"))
-        raw_pay = (p.get("payDate") or "").strip() or None
-        pay_date_stored = _normalize_pay_date_for_storage(raw_pay) if raw_pay else None
-        store_name = _normalize_store_name(p.get("storeName"))
-        biz_num = _normalize_biz_num((p.get("businessNum") or "").strip()) if p.get("businessNum") else None
-        address = _normalize_address((p.get("address") or "").strip()) if (p.get("address") or "").strip() else None
-        location = _normalize_location(p.get("location"))
-        item = ReceiptItem(
-            submission_id=submission_id,
-            seq_no=idx,
-            doc_type=asset.get("docType", (documents[idx - 1].get("docType") if idx - 1 < len(documents) else "RECEIPT")),
-            image_key=(asset.get("imageKey") or "").strip() or "",
-            store_name=store_name,
-            biz_num=biz_num,
-            pay_date=pay_date_stored or raw_pay,
-            amount=amount,
-            address=address,
-            location=location,
-            card_num=card_num,
-            status=status,
-            error_code=normalized_code,
-            error_message=error_msg,
-            confidence_score=p.get("confidenceScore") if isinstance(p.get("confidenceScore"), int) else None,
-            ocr_raw=asset.get("ocrRaw"),
-            parsed=p,
+    owners: Dict[DuplicateKey, Set[str]] = {}
+    wanted = sorted(keys)
+    for start in range(0, len(wanted), 1000):
+        batch = wanted[start:start + 1000]
+        q = (
+            db.query(ReceiptItem.biz_num, ReceiptItem.pay_date, ReceiptItem.amount, ReceiptItem.card_num, ReceiptItem.submission_id)
+            .join(Submission, Submission.submission_id == ReceiptItem.submission_id)
+            .filter(tuple_(ReceiptItem.biz_num, ReceiptItem.pay_date, ReceiptItem.amount, ReceiptItem.card_num).in_(batch))
+            .filter(Submission.status == "FIT")
         )
-        if status == "FIT" and isinstance(amount, int):
-            total_fit_amount += amount
-        items.append(item)
-    return items, total_fit_amount
+        if RECEIPT_DATA_CUTOFF_UTC is not None:
+            q = q.filter(Submission.created_at >= RECEIPT_DATA_CUTOFF_UTC)
+        for r in q.distinct().all():
+            key = (r[0], r[1], r[2], r[3])
+            if key in keys:
+                owners.setdefault(key, set()).add(r[4])
+    return owners
 
 
-def finalize_submission(
-    submission: Submission,
-    total_amount: int,
-    min_criteria: int,
-    fail_code: Optional[str],
-    total_all_amounts: Optional[int] = None,
-    unknown_store_policy: Optional[str] = None,
-    item_rows: Optional[List[Any]] = None,
-) -> None:
+def _rules_only_classifier(store_name: Optional[str], address: Optional[str], ocr_raw: Optional[Dict[str, Any]]):
+    return classify_store(store_name, address, ocr_raw, use_gemini=False)
+
+
+def _build_judgment_context(
+    db: Session,
+    rules: Any,
+    batch: List[Tuple[CompleteRequest, List[Dict[str, Any]]]],
+    classify: Optional[ClassifyFn] = None,
+) -> JudgmentContext:
     """
-    submission 최종 판정/감사로그 저장 (§10.3).
-    - FIT item 금액 합산으로 total_amount 반영(API 금액 = BE가 반영한 값).
-    - 최대 3장 중 한 장이라도 정상조건(금액·2026 이벤트 기간 내 날짜 등) 충족 시 FIT 판정.
-    - UNFIT_DATE 등 개별 장만의 사유는 합산 기준 충족 시 전체를 UNFIT로 두지 않음.
-    - 장별 금액 합산(total_all_amounts)이 기준 충족인데 BIZ_003만 있으면 FIT 처리(합산 금액 미달 오판 방지).
-    - 금액 충족인데 유일 사유가 PENDING_NEW이고 정책이 자동처리(AUTO_REGISTER)면 FIT 처리(에러 아님).
-    - 자동처리로 FIT 올릴 때 item_rows의 PENDING_NEW 장도 FIT으로 통일해 FE에서 에러로 안 보이게 함.
+    판정 컨텍스트 사전 조회(일괄 모드: 여러 신청을 한 번에). 상점 매칭은 match_stores_batch 1회(시군 파티션별 cdist),
+    중복 키는 FIT 신청 조회 1회(1,000키 단위), 캠페인은 레거시 campaignId 요청이 있을 때만 캐시 적재.
+    classify 미지정 시 규칙 기반 분류만 사용(Gemini 호출 없음).
     """
-    submission.updated_at = datetime.utcnow()
-    resolved = _normalize_error_code(fail_code) or fail_code
-    # §10.3: 한 장이라도 정상이면 FIT. UNFIT_DATE(2026 이벤트 기간 내 유효 날짜)는 FIT을 막지 않음.
-    # 장별 금액 합산이 기준 충족 시 "합산 금액 미달"(BIZ_003)로 부적합 처리하지 않음.
-    if total_amount >= min_criteria and resolved in ("UNFIT_CATEGORY", "UNFIT_REGION", "UNFIT_DATE", "BIZ_003"):
-        resolved = None
-    if resolved == "BIZ_003" and total_all_amounts is not None and total_all_amounts >= min_criteria:
-        resolved = None
-        total_amount = total_all_amounts  # API에 기준 충족 금액 반영
-    # 금액 충족 + 신규상점(PENDING_NEW)만 있는 경우, 자동처리 정책이면 FIT으로 판정(에러로 두지 않음)
-    pending_new_upgraded = False
-    if (
-        resolved == "PENDING_NEW"
-        and total_all_amounts is not None
-        and total_all_amounts >= min_criteria
-        and _normalize_unknown_store_policy(unknown_store_policy) == "AUTO_REGISTER"
-    ):
-        resolved = None
-        total_amount = total_all_amounts
-        pending_new_upgraded = True
-    amount_ok = total_amount >= min_criteria or (total_all_amounts is not None and total_all_amounts >= min_criteria)
-    submission.total_amount = total_amount
-    if not resolved and amount_ok:
-        if total_amount < min_criteria and total_all_amounts is not None:
-            submission.total_amount = total_all_amounts
-        submission.status = "FIT"
-        submission.global_fail_reason = None
-        submission.fail_reason = None
-        # 자동처리로 PENDING_NEW → FIT 올린 경우, 장(ReceiptItem)도 FIT으로 통일해 FE에서 에러 박스 안 나오게
-        if pending_new_upgraded and item_rows:
-            for it in item_rows:
-                if getattr(it, "status", None) == "PENDING_NEW":
-                    it.status = "FIT"
-                    it.error_code = None
-                    it.error_message = None
-    elif resolved in ("PENDING_NEW", "PENDING_VERIFICATION"):
-        submission.status = resolved
-        reason = _truncate_submission_reason(_global_fail_reason(resolved))
-        submission.global_fail_reason = reason
-        submission.fail_reason = reason
-    elif resolved in ("UNFIT_CATEGORY", "UNFIT_REGION", "UNFIT_DATE", "UNFIT_DUPLICATE", "ERROR_OCR"):
-        submission.status = resolved
-        reason = _truncate_submission_reason(_global_fail_reason(resolved))
-        submission.global_fail_reason = reason
-        submission.fail_reason = reason
-    else:
-        submission.status = _status_for_code(resolved or "BIZ_003")
-        reason = _truncate_submission_reason(_global_fail_reason(resolved or "BIZ_003"))
-        submission.global_fail_reason = reason
-        submission.fail_reason = reason
+    stores: Set[Tuple[str, str]] = set()
+    keys: Set[DuplicateKey] = set()
+    for req, assets in batch:
+        for _, store_query, key in _judgment_lookups(req, assets):
+            stores.add(store_query)
+            if key is not None:
+                keys.add(key)
+    queries = sorted(stores)
+    matches = match_stores_batch(db, queries) if queries else []
+    return JudgmentContext(
+        rules,
+        {q: m[0] is not None for q, m in zip(queries, matches)},
+        _duplicate_key_owners(db, keys) if keys else {},
+        loaded_campaign_cache(db) if any(req.campaignId for req, _ in batch) else None,
+        classify or _rules_only_classifier,
+    )
+
+
+def _judge_rules(
+    ctx: JudgmentContext,
+    req: CompleteRequest,
+    campaign_id: Optional[int],
+    ocr_assets: List[Dict[str, Any]],
+    item_rows: List[Any],
+) -> JudgmentResult:
+    """
+    장별 판정(유형별 검증·상점 매칭·중복·캠페인 규칙)과 신청 최종 판정. 입력(ocr_assets·item_rows)은 변경하지 않음.
+    item_rows는 map_ocr_to_db 반영 후의 장(amount·pay_date·location·status·error_code·error_message만 사용).
+    """
+    rules = ctx.rules
+    unknown_store_policy = _normalize_unknown_store_policy(rules.unknown_store_policy)
+    auto_register_threshold = float(rules.auto_register_threshold or CLASSIFIER_AUTO_THRESHOLD)
+    auto_register_threshold = max(0.0, min(1.0, auto_register_threshold))
+    min_amount_stay = int(rules.min_amount_stay or 60000)
+    min_amount_tour = int(rules.min_amount_tour or 50000)
+    pt = req.type.value if isinstance(req.type, ProjectType) else str(req.type)
+
+    res = JudgmentResult()
+    res.campaign_id = campaign_id
+    assets = [dict(a, parsed=dict(a.get("parsed") or {})) for a in ocr_assets]
+    rows = [
+        SimpleNamespace(
+            status=it.status, error_code=it.error_code, error_message=it.error_message,
+            amount=it.amount, pay_date=it.pay_date, location=it.location,
+        )
+        for it in item_rows
+    ]
+
+    def mark_item(i: int, code: Optional[str]) -> None:
+        """code 기준으로 status / error_code / error_message 를 일관 설정."""
+        status, normalized_code, msg = _resolve_item_status_error(code)
+        assets[i]["status"] = status
+        assets[i]["error_code"] = normalized_code
+        rows[i].status = status
+        rows[i].error_code = normalized_code
+        rows[i].error_message = msg
+
+    def unknown_store(i: int, store_name: Optional[str], address: str, biz_num: Optional[str]) -> Optional[str]:
+        """마스터 미등록 상점: 금지 업종이면 BIZ_008, 자동처리 정책·고신뢰 분류면 등록 예약 후 None(FIT 진행), 아니면 PENDING_NEW."""
+        ocr_raw = assets[i].get("ocrRaw")
+        if _classifier_is_forbidden(store_name, address, ocr_raw):
+            return "BIZ_008"
+        pred_cat, conf, ctype = ctx.classify(store_name, address, ocr_raw)
+        if unknown_store_policy == "AUTO_REGISTER" and bool(pred_cat) and conf >= auto_register_threshold:
+            # 자동 상점추가 후에는 검수 대기 없이 FIT. 이후 장·신청은 등록된 상점으로 매칭
+            res.auto_register.append({
+                "store_name": store_name or "",
+                "address": address,
+                "biz_num": biz_num,
+                "tel": _extract_store_tel(ocr_raw or {}),
+                "category": pred_cat,
+                "confidence": conf,
+                "classifier_type": ctype,
+            })
+            ctx.registered_stores.add((store_name or "").strip())
+            return None
+        res.candidates.append({
+            "parsed": assets[i]["parsed"],
+            "ocr_raw": ocr_raw,
+            "predicted_category": pred_cat or None,
+            "category_confidence": conf if conf else None,
+            "classifier_type": ctype,
+        })
+        return "PENDING_NEW"
+
+    def campaign_fail(location: Optional[str], pay_date_stored: str) -> Optional[str]:
+        """OCR 결과 기반 캠페인 자동 선택(확장) 후 캠페인 규칙 검증."""
+        if not req.campaignId or ctx.campaigns is None:
+            return None
+        selected = _pick_campaign_for_receipt(ctx.campaigns.candidates(pt, location or ""), pay_date_stored)
+        if selected and res.campaign_id != selected:
+            res.campaign_id = selected
+        ok, c_fail = check_campaign_rules(
+            ctx.campaigns, int(res.campaign_id or DEFAULT_CAMPAIGN_ID), location, pay_date_stored
+        )
+        return c_fail if not ok and c_fail else None
+
+    fail_code: Optional[str] = None
+    audit_lines = res.audit_lines
+    total_amount = 0
+
+    # 3) 유형별 합산/검증 (item status/error_code 우선 결정 후 submission 집계)
+    if pt == "STAY":
+        receipt_idx = [i for i, a in enumerate(assets) if a["docType"] == "RECEIPT"]
+        ota_idx = [i for i, a in enumerate(assets) if a["docType"] == "OTA_INVOICE"]
+        if len(receipt_idx) < 1 or len(receipt_idx) > 1 or len(ota_idx) > 1:
+            fail_code = "BIZ_010"
+            for i, a in enumerate(assets):
+                if a["status"] == "PENDING":
+                    mark_item(i, "BIZ_010")
+        else:
+            ri = receipt_idx[0]
+            rp = assets[ri]["parsed"]
+            f = _stay_receipt_fields(req, rp, ri)
+            amount = f["amount"]
+            pay_date = f["pay_date"]
+            store_name = f["store_name"]
+            address = f["address"]
+            location = f["location"]
+            biz_num = f["biz_num"]
+            if f["substituted"]:
+                rp["amount"] = amount
+                rp["payDate"] = pay_date
+                rp["location"] = location
+                rows[ri].amount = _normalize_amount(amount) if _normalize_amount(amount) is not None else 0
+                rows[ri].pay_date = _normalize_pay_date_for_storage(pay_date) or _normalize_pay_date_canonical(pay_date) or pay_date
+                rows[ri].location = _normalize_location(location)
+
+            if assets[ri]["status"] == "ERROR_OCR":
+                fail_code = "ERROR_OCR"
+            elif amount is None:
+                mark_item(ri, "OCR_001")
+                fail_code = "ERROR_OCR"
+            else:
+                pay_date_stored = f["pay_date_stored"]
+                rows[ri].pay_date = _normalize_pay_date_for_storage(pay_date_stored) or pay_date_stored
+                item_fail: Optional[str] = None
+                if _asset_forbidden_business(assets[ri]):
+                    item_fail = "BIZ_008"
+                if not item_fail:
+                    _, fc = check_receipt_rules(
+                        ctx.store_matched(store_name, location),
+                        address,
+                        pay_date,
+                        amount,
+                        amount,
+                        "STAY",
+                        is_2026_date=bool(f["normalized_date"]),
+                        min_amount_stay=min_amount_stay,
+                        min_amount_tour=min_amount_tour,
+                    )
+                    if fc:
+                        item_fail = unknown_store(ri, store_name, address, biz_num) if fc == "OCR_003" else fc
+                        # 금액 오인식(68,000→8 등) 시 기준 미달 반려 대신 수동 검증으로 보내 담당자가 교정 가능하게
+                        if item_fail == "BIZ_003" and amount is not None and amount < SUSPICIOUS_AMOUNT_THRESHOLD:
+                            item_fail = "PENDING_VERIFICATION"
+                if not item_fail and ctx.is_duplicate(
+                    req.receiptId, _duplicate_receipt_key(biz_num, pay_date_stored, amount, f["card_num"])
+                ):
+                    item_fail = "BIZ_001"
+                if not item_fail and _image_near_duplicate_needs_review(assets[ri]):
+                    item_fail = "PENDING_VERIFICATION"
+                if not item_fail:
+                    item_fail = campaign_fail(location, pay_date_stored)
+
+                # 사용자 입력 대비 OCR 금액 10% 이상 차이 시 수동검증 보류
+                if not item_fail and f["user_amt"] is not None:
+                    base_amount = f["ocr_amount"] if isinstance(f["ocr_amount"], int) else amount
+                    if _is_amount_mismatch(f["user_amt"], base_amount):
+                        item_fail = "PENDING_VERIFICATION"
+
+                # 인식 불량(상점명·사업자번호·주소 누락 또는 저신뢰도) → 수동 검수(보정) 유도
+                if not item_fail and _should_require_manual_review_for_low_quality(
+                    store_name, biz_num, address, f["confidence"]
+                ):
+                    item_fail = "OCR_004"
+
+                if item_fail:
+                    mark_item(ri, item_fail)
+                    fail_code = item_fail
+                else:
+                    mark_item(ri, None)
+                    total_amount = amount
+
+            if ota_idx:
+                oi = ota_idx[0]
+                if fail_code and total_amount <= 0:
+                    if assets[oi]["status"] == "PENDING":
+                        mark_item(oi, fail_code)
+                elif assets[oi]["status"] == "ERROR_OCR":
+                    fail_code = fail_code or (assets[oi]["error_code"] or "OCR_001")
+                else:
+                    op = assets[oi]["parsed"]
+                    ota_amount = op.get("amount")
+                    if total_amount and ota_amount is not None and ota_amount != total_amount:
+                        mark_item(oi, "BIZ_011")
+                        fail_code = fail_code or "BIZ_011"
+                    else:
+                        mark_item(oi, None)
+                        audit_lines.append(f"영수증 금액({total_amount}) = 명세서 금액({ota_amount}) 일치")
+
+    else:  # TOUR
+        receipt_idx = [i for i, a in enumerate(assets) if a["docType"] == "RECEIPT"]
+        if len(receipt_idx) < 1 or len(receipt_idx) > 3:
+            fail_code = "BIZ_010"
+            for i, a in enumerate(assets):
+                if a["status"] == "PENDING":
+                    mark_item(i, "BIZ_010")
+        else:
+            total = 0
+            amount_parts: List[str] = []
+            # 동일 제출건 내 중복: 동일 (사업자번호, 결제일, 금액, 카드) 조합은 1매만 FIT, 나머지는 UNFIT_DUPLICATE
+            seen_fit_key: set = set()
+            # 1차: 장별 금액·결제일·사업자번호 등 정규화(판정 키 확정). 2차: 판정
+            prepared: Dict[int, Dict[str, Any]] = {}
+            for i in receipt_idx:
+                a = assets[i]
+                p = a["parsed"]
+                f = _tour_receipt_fields(req, p, i)
+                amount = f["amount"]
+                if f["substituted"]:
+                    p["amount"] = f["user_amt"]
+                    na = _normalize_amount(f["user_amt"])
+                    if na is not None:
+                        rows[i].amount = na
+                # 데이터 교정/최종확정 표시용: OCR 인식 금액을 항상 item에 동기화(0원 오표시 방지)
+                if amount is not None:
+                    rows[i].amount = _normalize_amount(amount) if _normalize_amount(amount) is not None else (int(amount) if isinstance(amount, (int, float)) else 0)
+                if a["status"] == "ERROR_OCR":
+                    continue
+                if amount is None:
+                    mark_item(i, "OCR_001")
+                    continue
+                prepared[i] = f
+
+            for i in receipt_idx:
+                if i not in prepared:
+                    continue
+                a = assets[i]
+                p = a["parsed"]
+                f = prepared[i]
+                amount = f["amount"]
+                pay_date_stored = f["pay_date_stored"]
+                store_name = f["store_name"]
+                address = f["address"]
+                location = f["location"]
+                biz_num = f["biz_num"]
+                card_num = f["card_num"]
+                fit_key = (biz_num or "", pay_date_stored or "", amount or 0, card_num or "")
+                item_fail: Optional[str] = None
+                if not f["is_2026"]:
+                    item_fail = "BIZ_002"
+                elif address and "강원" not in address:
+                    item_fail = "BIZ_004"
+                elif _asset_forbidden_business(a):
+                    item_fail = "BIZ_008"
+                elif not ctx.store_matched(store_name, location):
+                    item_fail = unknown_store(i, store_name, address, biz_num)
+
+                # 타 제출건(FIT 확정 건)과 동일 영수증이면 중복 → 해당 장만 UNFIT (다른 장은 그대로 FIT 가능)
+                if not item_fail and ctx.is_duplicate(
+                    req.receiptId, _duplicate_receipt_key(biz_num, pay_date_stored, amount, card_num)
+                ):
+                    item_fail = "BIZ_001"
+                if not item_fail and _image_near_duplicate_needs_review(a):
+                    item_fail = "PENDING_VERIFICATION"
+                # 동일 제출건 내 중복(A/A/A): 동일 키는 1매만 FIT, 나머지는 UNFIT_DUPLICATE(전체 fail_code에는 반영 안 함)
+                if not item_fail and fit_key in seen_fit_key:
+                    mark_item(i, "BIZ_001")
+                    continue
+                if not item_fail:
+                    item_fail = campaign_fail(location, pay_date_stored)
+
+                # 인식 불량(핵심 필드 누락 또는 저신뢰도) → 수동 검수(보정) 유도
+                if not item_fail:
+                    conf = p.get("confidenceScore") if isinstance(p.get("confidenceScore"), int) else None
+                    if _should_require_manual_review_for_low_quality(store_name, biz_num, address, conf):
+                        item_fail = "OCR_004"
+                # 금액 오인식(68,000→8 등)으로 기준 미달일 때: 반려 대신 수동 검증 유도
+                if not item_fail and amount is not None and amount < min_amount_tour and amount < SUSPICIOUS_AMOUNT_THRESHOLD:
+                    item_fail = "PENDING_VERIFICATION"
+
+                if item_fail:
+                    mark_item(i, item_fail)
+                    continue
+
+                mark_item(i, None)
+                total += amount
+                amount_parts.append(str(amount))
+                seen_fit_key.add(fit_key)
+
+            total_amount = total
+            user_total = _get_user_total_amount(req.data, len(receipt_idx))
+            if user_total is not None and _is_amount_mismatch(user_total, total_amount):
+                for i in receipt_idx:
+                    if assets[i].get("status") == "FIT":
+                        mark_item(i, "PENDING_VERIFICATION")
+                fail_code = fail_code or "PENDING_VERIFICATION"
+            if total_amount < min_amount_tour:
+                fail_code = "BIZ_003"
+            audit_lines.append(
+                f"영수증 {len(receipt_idx)}매 중 적격 합산: "
+                f"{' + '.join(amount_parts) if amount_parts else '0'} = {total_amount}"
+            )
+
+    for i, a in enumerate(assets):
+        near = a.get("imageNearDuplicates") or []
+        if near:
+            audit_lines.append(
+                f"{i + 1}번 이미지 유사 중복 의심: "
+                + ", ".join(f"{d['submissionId']}({d.get('status')}, 거리 {d['distance']})" for d in near[:3])
+            )
+    fit_cnt = sum(1 for a in assets if a.get("status") == "FIT")
+    unfit_cnt = sum(1 for a in assets if str(a.get("status", "")).startswith("UNFIT"))
+    err_cnt = sum(1 for a in assets if a.get("status") in ("ERROR", "ERROR_OCR"))
+    pending_new_cnt = sum(1 for a in assets if a.get("status") == "PENDING_NEW")
+    pending_verification_cnt = sum(1 for a in assets if a.get("status") == "PENDING_VERIFICATION")
+
+    # 4) 부모 상태 (§10.3): total_amount = 장별 FIT 합산(API가 내려줄 금액). 한 장이라도 정상이면 FIT.
+    total_amount = sum(it.amount or 0 for it in rows if it.status == "FIT")
+    min_criteria = min_amount_stay if pt == "STAY" else min_amount_tour
+    # 장별 금액 합산(전체 item 금액 합): 기준 충족 시 "합산 금액 미달"(BIZ_003) 사유 사용 금지. BIZ_003만 있을 때만 FIT로 올림.
+    total_all_amounts = sum(it.amount or 0 for it in rows)
+    if fail_code == "BIZ_003" and total_all_amounts >= min_criteria:
+        other_fail = None
+        for it in rows:
+            ec = (it.error_code or "").strip()
+            if ec and ec not in ("BIZ_003", "PENDING_NEW", "PENDING_VERIFICATION"):
+                other_fail = ec
+                break
+        if other_fail:
+            fail_code = other_fail
+        else:
+            fail_code = "PENDING_NEW" if pending_new_cnt > 0 else ("PENDING_VERIFICATION" if pending_verification_cnt > 0 else None)
+    # 최대 3장 중 한 장이라도 정상조건 충족(금액 기준 이상)이면 FIT 판정.
+    condition_met = fit_cnt >= 1 and total_amount >= min_criteria
+    if not condition_met:
+        if not fail_code and pending_new_cnt > 0:
+            fail_code = "PENDING_NEW"
+        if not fail_code and pending_verification_cnt > 0:
+            fail_code = "PENDING_VERIFICATION"
+    audit_lines.append(
+        f"총 {len(assets)}매 중 적격 {fit_cnt}매, 부적격 {unfit_cnt}매, 오류 {err_cnt}매, "
+        f"신규상점대기 {pending_new_cnt}매, 수동검증대기 {pending_verification_cnt}매"
+    )
 
+    res.status, res.total_amount, res.fail_reason, pending_new_upgraded = _final_verdict(
+        total_amount,
+        min_criteria,
+        fail_code,
+        total_all_amounts=total_all_amounts,
+        unknown_store_policy=rules.unknown_store_policy,
+    )
+    # 자동처리로 PENDING_NEW → FIT 올린 경우, 장도 FIT으로 통일해 FE에서 에러 박스 안 나오게
+    if pending_new_upgraded:
+        for it in rows:
+            if it.status == "PENDING_NEW":
+                it.status = "FIT"
+                it.error_code = None
+                it.error_message = None
+    res.items = rows
+    res.parsed = [a["parsed"] for a in assets]
+    return res
+
+
+def _judge_rules_bulk(
+    ctx: JudgmentContext,
+    inputs: List[Tuple[CompleteRequest, Optional[int], List[Dict[str, Any]], List[Any]]],
+) -> List[Any]:
+    """
+    일괄 모드: 같은 컨텍스트(_build_judgment_context에 같은 inputs로 조회)로 여러 신청 판정.
+    inputs: (req, campaign_id, ocr_assets, item_rows). 한 건의 예외는 해당 위치에 예외 객체로 반환(나머지는 계속).
+    신청마다 판정 직후 중복 키 소유 현황(ctx.duplicate_keys)을 갱신 → 같은 배치 안의 같은 영수증은 먼저 FIT된 1건만 FIT,
+    이미 FIT이던 건끼리는 먼저 판정된 건이 중복으로 빠지면 나머지가 FIT 유지.
+    """
+    out: List[Any] = []
+    for req, campaign_id, assets, rows in inputs:
+        try:
+            result = _judge_rules(ctx, req, campaign_id, assets, rows)
+            keys = [key for _, _, key in _judgment_lookups(req, assets) if key is not None]
+        except Exception as e:
+            out.append(e)
+            continue
+        ctx.update_owner(req.receiptId, keys, result.status == "FIT")
+        out.append(result)
+    return out
 
-def _build_documents_from_request(req: CompleteRequest) -> List[Dict[str, str]]:
-    if req.documents:
-        return [
-            {"imageKey": (d.imageKey or "").strip(), "docType": d.docType}
-            for d in req.documents
-        ]
 
-    # 하위호환: 기존 data 구조를 문서 배열로 변환
-    docs: List[Dict[str, str]] = []
-    if req.type == "STAY" and isinstance(req.data, StayData):
-        docs.append({"imageKey": req.data.receiptImageKey.strip(), "docType": "RECEIPT"})
-        if req.data.isOta and req.data.otaStatementKey:
-            docs.append({"imageKey": req.data.otaStatementKey.strip(), "docType": "OTA_INVOICE"})
-    elif req.type == "TOUR" and isinstance(req.data, TourData):
-        for k in req.data.receiptImageKeys:
-            docs.append({"imageKey": (k or "").strip(), "docType": "RECEIPT"})
-    return docs
+def _apply_judgment_side_effects(
+    db: Session, submission_id: str, result: JudgmentResult, *, register_candidates: bool = True
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    판정 결과의 상점 자동 등록·신규 후보 등록 예약을 DB에 반영. commit은 호출부.
+    반환: 자동 등록된 (상호명, 주소) — 호출부가 commit 후 _register_stores_in_index로 상점 인덱스에 반영.
+    """
+    registered: List[Tuple[str, Optional[str]]] = []
+    for s in result.auto_register:
+        if _auto_register_store(
+            db,
+            submission_id,
+            s["store_name"],
+            s["address"],
+            s["biz_num"],
+            s["tel"],
+            s["category"],
+            s["confidence"],
+            s["classifier_type"],
+        ):
+            registered.append((s["store_name"], s["address"]))
+    if result.auto_register:
+        db.flush()
+    if register_candidates:
+        for c in result.candidates:
+            _register_new_candidate_store(
+                db, submission_id, c["parsed"], c["ocr_raw"],
+                predicted_category=c["predicted_category"],
+                category_confidence=c["category_confidence"],
+                classifier_type=c["classifier_type"],
+            )
+    return registered
+
+
+def _register_stores_in_index(stores: List[Tuple[str, Optional[str]]]) -> None:
+    """commit된 자동 등록 상점을 프로세스 상점 인덱스에 반영(다른 요청의 재매칭에서 DB 재조회 없이 FIT)."""
+    for store_name, address in stores:
+        register_store_in_index(store_name or "", address)
+
+
+def _apply_judgment(submission: Any, item_rows: List[Any], result: JudgmentResult) -> None:
+    """판정 결과를 신청·장 행(ORM 또는 경량 행)에 반영."""
+    for row, it, parsed in zip(item_rows, result.items, result.parsed):
+        row.status = it.status
+        row.error_code = it.error_code
+        row.error_message = it.error_message
+        row.amount = it.amount
+        row.pay_date = it.pay_date
+        row.location = it.location
+        row.parsed = parsed
+    if submission.campaign_id != result.campaign_id:
+        submission.campaign_id = result.campaign_id
+    submission.updated_at = datetime.utcnow()
+    submission.status = result.status
+    submission.total_amount = result.total_amount
+    submission.global_fail_reason = result.fail_reason
+    submission.fail_reason = result.fail_reason
 
 
-def _parse_ota_invoice_result(ocr_data: dict) -> Dict[str, Optional[Any]]:
+def _judge_items(
+    db: Session,
+    req: CompleteRequest,
+    submission: Any,
+    rule_cfg: Any,
+    ocr_assets: List[Dict[str, Any]],
+    item_rows: List[Any],
+) -> Tuple[List[str], List[Tuple[str, Optional[str]]]]:
     """
-    OTA 명세서(일반 OCR 결과 포함)에서 핵심 값 추출.
-    - amount: 총액/결제금액 패턴 우선, 없으면 큰 숫자 후보(타임스탬프 제외: MAX_AMOUNT_SANE 이하만)
-    - stayStart/stayEnd: 날짜 1~2개
-    - guestName: 예약자/투숙객 키워드 기반 추출
+    분석 판정: 신청 1건 컨텍스트 조회 → 판정 엔진(_judge_rules) → 상점 등록 예약·판정 결과 반영.
+    반환: (audit 라인, 자동 등록 상점). commit과 상점 인덱스 반영은 호출부.
     """
-    text_blob = json.dumps(ocr_data, ensure_ascii=False)
-    amount: Optional[int] = None
-    m = re.search(
-        r"(총.?금액|결제.?금액|합계|total)[^0-9]{0,20}([0-9][0-9,]{2,})",
-        text_blob,
-        re.IGNORECASE,
+    classify: Optional[ClassifyFn] = None
+    if rule_cfg.enable_gemini_classifier:
+        classify = partial(classify_store, use_gemini=True)
+    ctx = _build_judgment_context(db, rule_cfg, [(req, ocr_assets)], classify)
+    result = _judge_rules(ctx, req, submission.campaign_id, ocr_assets, item_rows)
+    registered = _apply_judgment_side_effects(db, req.receiptId, result)
+    _apply_judgment(submission, item_rows, result)
+    return result.audit_lines, registered
+
+
+def _mark_analysis_error(db: Session, req: CompleteRequest, submission: Submission, e: Exception) -> Dict[str, Any]:
+    """analyze_receipt_task 예외 시(동기, I/O 스레드 풀에서 실행): submission ERROR 저장 후 콜백 payload 반환."""
+    try:
+        db.rollback()
+    except Exception:
+        pass
+    payload = _set_analysis_error(db, submission, e)
+    db.commit()
+    return payload
+
+
+def _set_analysis_error(db: Session, submission: Submission, e: Exception) -> Dict[str, Any]:
+    """submission ERROR 반영·롤업·(outbox 사용 시) 콜백 적재. commit은 호출부. 반환: 콜백 payload."""
+    submission.status = "ERROR"
+    submission.updated_at = datetime.utcnow()
+    submission.total_amount = 0
+    err_msg = _truncate_submission_reason((str(e) or type(e).__name__).strip())
+    submission.fail_reason = err_msg
+    submission.global_fail_reason = submission.fail_reason
+    submission.audit_log = "complete 처리 중 예외 발생"
+    submission.audit_trail = submission.audit_log
+    _sync_submission_stats(db, [submission.submission_id])
+    item_rows_ex = (
+        db.query(ReceiptItem)
+        .filter(ReceiptItem.submission_id == submission.submission_id)
+        .order_by(ReceiptItem.seq_no.asc())
+        .all()
     )
-    if m:
-        raw = int(re.sub(r"[^0-9]", "", m.group(2)))
-        amount = _clamp_amount_for_db(raw) if raw <= MAX_AMOUNT_SANE else None
-    else:
-        nums = [int(n.replace(",", "")) for n in re.findall(r"[0-9][0-9,]{4,}", text_blob)]
-        sane = [n for n in nums if n <= MAX_AMOUNT_SANE]
-        if sane:
-            amount = _clamp_amount_for_db(max(sane))
+    payload = _build_status_payload(submission, item_rows_ex)
+    if CALLBACK_OUTBOX_ENABLED:
+        _enqueue_result_callback(db, submission.submission_id, payload, purpose="auto")
+    return payload
 
-    dates = re.findall(r"20[0-9]{2}[./-][0-9]{1,2}[./-][0-9]{1,2}", text_blob)
-    stay_start = dates[0] if len(dates) >= 1 else None
-    stay_end = dates[1] if len(dates) >= 2 else None
-    guest = None
-    g = re.search(r"(예약자|투숙객|고객명|name)[^가-힣A-Za-z0-9]{0,8}([가-힣A-Za-z]{2,20})", text_blob, re.IGNORECASE)
-    if g:
-        guest = g.group(2)
 
-    return {
-        "amount": amount,
-        "stayStart": stay_start,
-        "stayEnd": stay_end,
-        "guestName": guest,
-    }
+def _is_transient_analysis_error(e: BaseException) -> bool:
+    """문서 OCR 실패 중 재시도로 회복 가능한 오류(CLOVA/S3 타임아웃·연결 실패, 429·5xx). 이미지·응답 내용 문제는 False."""
+    if isinstance(e, NaverOCRInferError):
+        return False
+    if isinstance(e, httpx.HTTPStatusError):
+        code = e.response.status_code
+        return code == 429 or code >= 500
+    return isinstance(e, (httpx.TransportError, BotoCoreError))
 
 
-async def _run_ocr_for_document(
-    receipt_id: str, image_key: str, doc_type: str, project_type: Optional[str] = None
-) -> Dict[str, Any]:
-    """
-    단일 이미지 OCR 및 파싱.
-    project_type: STAY|TOUR. image_key가 STAY/ 또는 TOUR/ 로 시작하면 경로로 도메인 결정, 아니면 project_type 사용(기본 TOUR).
-    """
-    image_key = (image_key or "").strip()
-    if not image_key:
-        raise ValueError("BIZ_010")
-    domain_type = _resolve_ocr_domain(image_key, project_type)
-    image_bytes, content_type = _get_image_bytes_from_s3(image_key)
-    image_bytes, content_type = _resize_and_compress_for_ocr(image_bytes, content_type)
-    image_format = _image_format_from_content_type(content_type)
-    # 도메인당 동시 1건만 허용(네이버 rate limit 대응)
-    async with _get_ocr_domain_lock(domain_type):
-        ocr_data = await _call_naver_ocr_with_retry(
-            image_bytes, receipt_id, image_format, domain_type=domain_type, retries=2
-        )
+async def _send_error_callback(db: Session, req: CompleteRequest, submission: Submission, e: Exception) -> None:
+    """submission ERROR 저장 + 결과 콜백(outbox 사용 시 적재만)."""
+    payload = await _run_io(_mark_analysis_error, db, req, submission, e)
+    if not CALLBACK_OUTBOX_ENABLED:
+        await _send_result_callback(req.receiptId, payload, purpose="auto", actor="system")
 
-    if doc_type == "RECEIPT":
-        amount, pay_date, store_name, address, location = _parse_ocr_result(ocr_data)
-        parsed = {
-            "amount": amount,
-            "payDate": pay_date,
-            "storeName": store_name,
-            "address": address,
-            "location": location,
-            "businessNum": _extract_business_num(ocr_data),
-            "cardNum": _extract_card_num(ocr_data),
-            "confidenceScore": _extract_confidence_score(ocr_data),
-        }
-    else:
-        parsed = _parse_ota_invoice_result(ocr_data)
-        parsed["cardNum"] = CARD_NUM_NO_CARD
-        parsed["confidenceScore"] = _extract_confidence_score(ocr_data)
 
-    return {
-        "imageKey": image_key,
-        "docType": doc_type,
-        "parsed": parsed,
-        "ocrRaw": ocr_data,
-    }
+class OcrJobLeaseLost(Exception):
+    """분석 중 ocr_jobs 점유(가시성 타임아웃)를 잃어 다른 워커가 재점유함 → 이 워커는 판정 commit 없이 중단."""
+
 
+def _check_lease(lease_lost: Optional[asyncio.Event]) -> None:
+    if lease_lost is not None and lease_lost.is_set():
+        raise OcrJobLeaseLost()
 
-async def analyze_receipt_task(req: CompleteRequest):
+
+async def analyze_receipt_task(
+    req: CompleteRequest, raise_errors: bool = False, lease_lost: Optional[asyncio.Event] = None
+):
     """
     1:N 구조 기준 OCR 분석: submission(parent) + receipt_items(children) 자산화.
     receiptId당 1개만 실행되도록 Complete 단계에서 원자적 PENDING→PROCESSING 전환 사용.
     태스크마다 별도 DB 세션(SessionLocal()) 사용 → 서로 다른 receiptId 간 병렬 처리 시 충돌 없음.
+    블로킹 작업(DB·S3·Pillow)은 이벤트 루프 밖(I/O 스레드 풀·이미지 프로세스 풀)에서 실행 → /status 폴링 등 다른 요청 지연 방지.
+    raise_errors=False(BackgroundTasks): 예외 시 submission ERROR 저장 후 콜백.
+    raise_errors=True(ocr_jobs 워커): 예외와 일시적 문서 OCR 실패를 그대로 올려 작업 재시도. ERROR 전환은 DEAD 시 fail_analysis_job에서.
+    lease_lost(워커): 설정되면 DB 단계 전에 OcrJobLeaseLost로 중단, OCR 단계는 진행 중 호출 취소(같은 건 이중 분석·이중 commit 방지).
     """
     db = SessionLocal()
-    submission = db.query(Submission).filter(Submission.submission_id == req.receiptId).first()
+    try:
+        submission = await _run_io(
+            lambda: db.query(Submission).filter(Submission.submission_id == req.receiptId).first()
+        )
+    except Exception:
+        db.close()
+        raise
     if not submission:
         db.close()
         return
 
     try:
-        # 사용자 입력 스냅샷: Complete 시 전송된 data가 있는데 아직 저장되지 않았으면 태스크에서 저장(관리자 페이지 표시용)
-        if getattr(submission, "user_input_snapshot", None) is None and req.data is not None:
-            submission.user_input_snapshot = req.data.model_dump()
-            db.commit()
-        rule_cfg = _get_judgment_rule_config(db)
-        unknown_store_policy = _normalize_unknown_store_policy(rule_cfg.unknown_store_policy)
-        auto_register_threshold = float(rule_cfg.auto_register_threshold or CLASSIFIER_AUTO_THRESHOLD)
-        auto_register_threshold = max(0.0, min(1.0, auto_register_threshold))
-        use_gemini_classifier = bool(rule_cfg.enable_gemini_classifier)
-        min_amount_stay = int(rule_cfg.min_amount_stay or 60000)
-        min_amount_tour = int(rule_cfg.min_amount_tour or 50000)
-
-        documents = _build_documents_from_request(req)
-        if not documents:
-            submission.status = "UNFIT"
-            submission.updated_at = datetime.utcnow()
-            submission.total_amount = 0
-            submission.fail_reason = _truncate_submission_reason(_global_fail_reason("BIZ_010"))
-            submission.global_fail_reason = submission.fail_reason
-            submission.audit_log = _truncate_submission_audit("문서 구성 요건 불충족")
-            submission.audit_trail = submission.audit_log
-            db.commit()
+        _check_lease(lease_lost)
+        prepared = await _run_io(_prepare_analysis, db, req, submission)
+        if prepared is None:
             return
-
-        submission.project_type = req.type
-        # VERIFYING 전에 placeholder를 먼저 넣고 한 번에 commit → GET이 VERIFYING을 볼 때 항상 items 존재
-        existing_rows = (
-            db.query(ReceiptItem)
-            .filter(ReceiptItem.submission_id == req.receiptId)
-            .order_by(ReceiptItem.seq_no.asc())
-            .all()
-        )
-        if len(existing_rows) != len(documents):
-            db.query(ReceiptItem).filter(ReceiptItem.submission_id == req.receiptId).delete(synchronize_session=False)
-            for idx, d in enumerate(documents, start=1):
-                db.add(
-                    ReceiptItem(
-                        submission_id=req.receiptId,
-                        seq_no=idx,
-                        doc_type=d.get("docType", "RECEIPT"),
-                        image_key=(d.get("imageKey") or "").strip(),
-                        card_num=CARD_NUM_NO_CARD,
-                        status="PENDING",
-                    )
-                )
-        else:
-            for idx, d in enumerate(documents, start=1):
-                row = existing_rows[idx - 1]
-                row.seq_no = idx
-                row.doc_type = d.get("docType", "RECEIPT")
-                row.image_key = (d.get("imageKey") or "").strip()
-                row.status = "PENDING"
-                row.error_code = None
-                row.error_message = None
-        submission.status = "VERIFYING"
-        submission.updated_at = datetime.utcnow()
-        db.commit()
+        documents, rule_cfg = prepared
+        _check_lease(lease_lost)
 
         # 1) 병렬 OCR 수행 (STAY/TOUR 경로 또는 req.type 기반으로 도메인 분기)
         tasks = [
@@ -7295,442 +10810,229 @@ async def analyze_receipt_task(req: CompleteRequest):
             )
             for d in documents
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        ocr_assets: List[Dict[str, Any]] = []
-        for i, r in enumerate(results):
-            if isinstance(r, Exception):
-                ocr_assets.append(
-                    {
-                        "imageKey": documents[i]["imageKey"],
-                        "docType": documents[i]["docType"],
-                        "parsed": {},
-                        "ocrRaw": None,
-                        "status": "ERROR_OCR",
-                        "error_code": "OCR_001",
-                    }
-                )
-            else:
-                r["status"] = "PENDING"
-                r["error_code"] = None
-                ocr_assets.append(r)
-
-        # 2) 자식 테이블 개별 저장 (placeholder row 업데이트)
-        mapped_items, _ = map_ocr_to_db(req.receiptId, ocr_assets, documents)
-        item_rows = (
-            db.query(ReceiptItem)
-            .filter(ReceiptItem.submission_id == req.receiptId)
-            .order_by(ReceiptItem.seq_no.asc())
-            .all()
-        )
-        if len(item_rows) != len(mapped_items):
-            # 이론상 발생하지 않아야 하나, 안전하게 재구성
-            db.query(ReceiptItem).filter(ReceiptItem.submission_id == req.receiptId).delete(synchronize_session=False)
-            for item in mapped_items:
-                db.add(item)
-            item_rows = mapped_items
+        if lease_lost is None:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         else:
-            for i, mapped in enumerate(mapped_items):
-                row = item_rows[i]
-                row.doc_type = mapped.doc_type
-                row.image_key = mapped.image_key
-                row.store_name = mapped.store_name
-                row.biz_num = mapped.biz_num
-                row.pay_date = mapped.pay_date
-                row.amount = mapped.amount
-                row.address = mapped.address
-                row.location = mapped.location
-                row.card_num = mapped.card_num
-                row.status = mapped.status
-                row.error_code = mapped.error_code
-                row.error_message = mapped.error_message
-                row.confidence_score = mapped.confidence_score
-                row.ocr_raw = mapped.ocr_raw
-                row.parsed = mapped.parsed
-
-        def mark_item(i: int, code: Optional[str]) -> None:
-            """code 기준으로 status / error_code / error_message 를 일관 설정."""
-            status, normalized_code, msg = _resolve_item_status_error(code)
-            ocr_assets[i]["status"] = status
-            ocr_assets[i]["error_code"] = normalized_code
-            item_rows[i].status = status
-            item_rows[i].error_code = normalized_code
-            item_rows[i].error_message = msg
-
-        fail_code: Optional[str] = None
-        audit_lines: List[str] = []
-        total_amount = 0
-
-        # 3) 유형별 합산/검증 (item status/error_code 우선 결정 후 submission 집계)
-        if req.type == "STAY":
-            receipt_idx = [i for i, a in enumerate(ocr_assets) if a["docType"] == "RECEIPT"]
-            ota_idx = [i for i, a in enumerate(ocr_assets) if a["docType"] == "OTA_INVOICE"]
-            if len(receipt_idx) < 1 or len(receipt_idx) > 1 or len(ota_idx) > 1:
-                fail_code = "BIZ_010"
-                for i, a in enumerate(ocr_assets):
-                    if a["status"] == "PENDING":
-                        mark_item(i, "BIZ_010")
-            else:
-                ri = receipt_idx[0]
-                rp = ocr_assets[ri]["parsed"]
-                ocr_amount = rp.get("amount")
-                amount = ocr_amount
-                pay_date = rp.get("payDate") or ""
-                store_name = rp.get("storeName") or ""
-                address = rp.get("address") or ""
-                location = rp.get("location") or ""
-                biz_num = _normalize_biz_num(rp.get("businessNum"))
-                card_num = _normalize_card_num(rp.get("cardNum"))
-                confidence = rp.get("confidenceScore") if isinstance(rp.get("confidenceScore"), int) else 0
-
-                # OCR 신뢰도가 낮으면 사용자 입력을 참조값으로 사용 (고신뢰 OCR은 그대로 우선)
-                user_amt, user_pd, user_loc = _get_user_input_for_document(req.data, ri)
-                if confidence < OCR_CONFIDENCE_THRESHOLD and user_amt is not None:
-                    amount = user_amt
-                    pay_date = user_pd or pay_date
-                    location = user_loc or location
-                    rp["amount"] = amount
-                    rp["payDate"] = pay_date
-                    rp["location"] = location
-                    item_rows[ri].amount = _normalize_amount(amount) if _normalize_amount(amount) is not None else 0
-                    item_rows[ri].pay_date = _normalize_pay_date_for_storage(pay_date) or _normalize_pay_date_canonical(pay_date) or pay_date
-                    item_rows[ri].location = _normalize_location(location)
-
-                if ocr_assets[ri]["status"] == "ERROR_OCR":
-                    fail_code = "ERROR_OCR"
-                elif amount is None:
-                    mark_item(ri, "OCR_001")
-                    fail_code = "ERROR_OCR"
-                else:
-                    _, normalized_date = _normalize_and_validate_2026_date(pay_date)
-                    pay_date_stored = normalized_date or _normalize_pay_date_canonical(pay_date) or pay_date
-                    item_rows[ri].pay_date = _normalize_pay_date_for_storage(pay_date_stored) or pay_date_stored
-                    item_fail: Optional[str] = None
-                    if _ocr_contains_forbidden_business(ocr_assets[ri]["ocrRaw"]):
-                        item_fail = "BIZ_008"
-                    if not item_fail:
-                        _, fc = validate_and_match(
-                            db,
-                            store_name,
-                            address,
-                            pay_date,
-                            amount,
-                            location,
-                            amount,
-                            "STAY",
-                            is_2026_date=bool(normalized_date),
-                            min_amount_stay=min_amount_stay,
-                            min_amount_tour=min_amount_tour,
-                        )
-                        if fc:
-                            if fc == "OCR_003":
-                                ocr_raw_ri = ocr_assets[ri].get("ocrRaw")
-                                if _classifier_is_forbidden(store_name, address, ocr_raw_ri):
-                                    item_fail = "BIZ_008"
-                                else:
-                                    pred_cat, conf, ctype = classify_store(
-                                        store_name, address, ocr_raw_ri, use_gemini=use_gemini_classifier
-                                    )
-                                    should_auto_register = (
-                                        unknown_store_policy == "AUTO_REGISTER"
-                                        and bool(pred_cat)
-                                        and conf >= auto_register_threshold
-                                    )
-                                    if should_auto_register:
-                                        _auto_register_store(
-                                            db,
-                                            req.receiptId,
-                                            store_name or "",
-                                            address,
-                                            biz_num,
-                                            _extract_store_tel(ocr_raw_ri or {}),
-                                            pred_cat,
-                                            conf,
-                                            ctype,
-                                        )
-                                        db.flush()  # 동일 트랜잭션에서 재매칭 시 새 상점 반영
-                                        # 자동 상점추가 후에는 검수 대기 없이 FIT. 데이터 자산화(master_stores + unregistered_stores) 완료.
-                                        # item_fail 유지 None → 아래 FIT 처리
-                                    else:
-                                        _register_new_candidate_store(
-                                            db, req.receiptId, rp, ocr_raw_ri,
-                                            predicted_category=pred_cat or None,
-                                            category_confidence=conf if conf else None,
-                                            classifier_type=ctype,
-                                        )
-                                        item_fail = "PENDING_NEW"
-                            else:
-                                item_fail = fc
-                            # 금액 오인식(68,000→8 등) 시 기준 미달 반려 대신 수동 검증으로 보내 담당자가 교정 가능하게
-                            if item_fail == "BIZ_003" and amount is not None and amount < SUSPICIOUS_AMOUNT_THRESHOLD:
-                                item_fail = "PENDING_VERIFICATION"
-                    if not item_fail and _check_duplicate_receipt_item(
-                        db, req.receiptId, biz_num, pay_date_stored, amount, card_num
-                    ):
-                        item_fail = "BIZ_001"
-                    if not item_fail and req.campaignId:
-                        # OCR 결과 기반 캠페인 자동 선택(확장)
-                        selected_campaign_id = _resolve_campaign_id_for_receipt(
-                            db, req.type, location, pay_date_stored
-                        )
-                        if selected_campaign_id and submission.campaign_id != selected_campaign_id:
-                            submission.campaign_id = selected_campaign_id
-                        ok, c_fail = validate_campaign_rules(
-                            db, int(submission.campaign_id or DEFAULT_CAMPAIGN_ID), location, pay_date_stored
-                        )
-                        if not ok and c_fail:
-                            item_fail = c_fail
+            ocr = asyncio.ensure_future(asyncio.gather(*tasks, return_exceptions=True))
+            lost = asyncio.ensure_future(lease_lost.wait())
+            await asyncio.wait({ocr, lost}, return_when=asyncio.FIRST_COMPLETED)
+            lost.cancel()
+            if not ocr.done():
+                ocr.cancel()
+                await asyncio.gather(ocr, return_exceptions=True)
+                raise OcrJobLeaseLost()
+            results = ocr.result()
+        _check_lease(lease_lost)
+        if raise_errors:
+            transient = next((r for r in results if isinstance(r, Exception) and _is_transient_analysis_error(r)), None)
+            if transient is not None:
+                raise transient
+        payload = await _run_io(_judge_ocr_results, db, req, submission, documents, rule_cfg, results)
+        # outbox 사용 시 판정 commit에 콜백이 함께 적재됨 → 디스패처가 전송(수신 서버 지연과 분석 처리량 분리)
+        if not CALLBACK_OUTBOX_ENABLED:
+            await _send_result_callback(req.receiptId, payload, purpose="auto", actor="system")
 
-                    # 사용자 입력 대비 OCR 금액 10% 이상 차이 시 수동검증 보류
-                    if not item_fail and user_amt is not None:
-                        base_amount = ocr_amount if isinstance(ocr_amount, int) else amount
-                        if _is_amount_mismatch(user_amt, base_amount):
-                            item_fail = "PENDING_VERIFICATION"
+    except Exception as e:
+        if raise_errors:
+            await _run_io(db.rollback)
+            raise
+        logger.error("analyze_receipt_task failed: %s", e, exc_info=True)
+        await _send_error_callback(db, req, submission, e)
+    finally:
+        db.close()
 
-                    # 인식 불량(상점명·사업자번호·주소 누락 또는 저신뢰도) → 수동 검수(보정) 유도
-                    if not item_fail and _should_require_manual_review_for_low_quality(
-                        store_name, biz_num, address, confidence
-                    ):
-                        item_fail = "OCR_004"
 
-                    if item_fail:
-                        mark_item(ri, item_fail)
-                        fail_code = item_fail
-                    else:
-                        mark_item(ri, None)
-                        total_amount = amount
-
-                if ota_idx:
-                    oi = ota_idx[0]
-                    if fail_code and total_amount <= 0:
-                        if ocr_assets[oi]["status"] == "PENDING":
-                            mark_item(oi, fail_code)
-                    elif ocr_assets[oi]["status"] == "ERROR_OCR":
-                        fail_code = fail_code or (ocr_assets[oi]["error_code"] or "OCR_001")
-                    else:
-                        op = ocr_assets[oi]["parsed"]
-                        ota_amount = op.get("amount")
-                        if total_amount and ota_amount is not None and ota_amount != total_amount:
-                            mark_item(oi, "BIZ_011")
-                            fail_code = fail_code or "BIZ_011"
-                        else:
-                            mark_item(oi, None)
-                            audit_lines.append(f"영수증 금액({total_amount}) = 명세서 금액({ota_amount}) 일치")
-
-        else:  # TOUR
-            receipt_idx = [i for i, a in enumerate(ocr_assets) if a["docType"] == "RECEIPT"]
-            if len(receipt_idx) < 1 or len(receipt_idx) > 3:
-                fail_code = "BIZ_010"
-                for i, a in enumerate(ocr_assets):
-                    if a["status"] == "PENDING":
-                        mark_item(i, "BIZ_010")
-            else:
-                total = 0
-                amount_parts: List[str] = []
-                # 동일 제출건 내 중복: 동일 (사업자번호, 결제일, 금액, 카드) 조합은 1매만 FIT, 나머지는 UNFIT_DUPLICATE
-                seen_fit_key: set = set()
-                for i in receipt_idx:
-                    a = ocr_assets[i]
-                    p = a["parsed"]
-                    amount = _normalize_amount(p.get("amount"))
-                    # TOUR: OCR 금액이 비정상적으로 작을 때(오인식 가능) 사용자 입력 금액 사용
-                    user_amt, _, _ = _get_user_input_for_document(req.data, i)
-                    if amount is not None and amount < SUSPICIOUS_AMOUNT_THRESHOLD and user_amt is not None:
-                        amount = user_amt
-                        p["amount"] = user_amt
-                        na = _normalize_amount(user_amt)
-                        if na is not None:
-                            item_rows[i].amount = na
-                    # 데이터 교정/최종확정 표시용: OCR 인식 금액을 항상 item에 동기화(0원 오표시 방지)
-                    if amount is not None:
-                        item_rows[i].amount = _normalize_amount(amount) if _normalize_amount(amount) is not None else (int(amount) if isinstance(amount, (int, float)) else 0)
-                    pay_date = p.get("payDate") or ""
-                    store_name = _normalize_store_name(p.get("storeName"))
-                    address = _normalize_address((p.get("address") or "").strip()) or ""
-                    location = _normalize_location(p.get("location"))
-                    biz_num = _normalize_biz_num(p.get("businessNum"))
-                    card_num = _normalize_card_num(p.get("cardNum"))
-                    is_2026, norm_date = _normalize_and_validate_2026_date(pay_date)
-                    pay_date_stored = _normalize_pay_date_for_storage(norm_date or _normalize_pay_date_canonical(pay_date) or pay_date) or (norm_date or _normalize_pay_date_canonical(pay_date) or pay_date)
-
-                    if a["status"] == "ERROR_OCR":
-                        continue
-                    if amount is None:
-                        mark_item(i, "OCR_001")
-                        continue
+# 7. 분석 작업 큐(ocr_jobs) — ocr_worker.py에서 사용
+def _enqueue_ocr_job(db: Session, req: CompleteRequest) -> None:
+    """Complete 요청을 ocr_jobs에 적재(commit은 호출부)."""
+    now = datetime.utcnow()
+    db.add(
+        OcrJob(
+            submission_id=req.receiptId,
+            payload=req.model_dump(mode="json"),
+            status="QUEUED",
+            attempts=0,
+            max_attempts=OCR_JOB_MAX_ATTEMPTS,
+            available_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+    )
 
-                    fit_key = (biz_num or "", pay_date_stored or "", amount or 0, card_num or "")
-                    item_fail: Optional[str] = None
-                    if not is_2026:
-                        item_fail = "BIZ_002"
-                    elif address and "강원" not in address:
-                        item_fail = "BIZ_004"
-                    elif _ocr_contains_forbidden_business(a["ocrRaw"]):
-                        item_fail = "BIZ_008"
-                    else:
-                        matched, _ = match_store_in_master(db, store_name, location)
-                        if not matched:
-                            ocr_raw_a = a.get("ocrRaw")
-                            if _classifier_is_forbidden(store_name, address, ocr_raw_a):
-                                item_fail = "BIZ_008"
-                            else:
-                                pred_cat, conf, ctype = classify_store(
-                                    store_name, address, ocr_raw_a, use_gemini=use_gemini_classifier
-                                )
-                                should_auto_register = (
-                                    unknown_store_policy == "AUTO_REGISTER"
-                                    and bool(pred_cat)
-                                    and conf >= auto_register_threshold
-                                )
-                                if should_auto_register:
-                                    _auto_register_store(
-                                        db,
-                                        req.receiptId,
-                                        store_name or "",
-                                        address,
-                                        biz_num,
-                                        _extract_store_tel(ocr_raw_a or {}),
-                                        pred_cat,
-                                        conf,
-                                        ctype,
-                                    )
-                                    db.flush()  # 동일 트랜잭션에서 재매칭 시 새 상점 반영
-                                    # 자동 상점추가 후에는 검수 대기 없이 FIT. 데이터 자산화(master_stores + unregistered_stores) 완료.
-                                    # item_fail 유지 None → 아래 FIT 처리
-                                else:
-                                    _register_new_candidate_store(
-                                        db, req.receiptId, p, ocr_raw_a,
-                                        predicted_category=pred_cat or None,
-                                        category_confidence=conf if conf else None,
-                                        classifier_type=ctype,
-                                    )
-                                    item_fail = "PENDING_NEW"
-
-                    # 타 제출건(FIT 확정 건)과 동일 영수증이면 중복 → 해당 장만 UNFIT (다른 장은 그대로 FIT 가능)
-                    if not item_fail and _check_duplicate_receipt_item(
-                        db, req.receiptId, biz_num, pay_date_stored, amount, card_num
-                    ):
-                        item_fail = "BIZ_001"
-                    # 동일 제출건 내 중복(A/A/A): 동일 키는 1매만 FIT, 나머지는 UNFIT_DUPLICATE(전체 fail_code에는 반영 안 함)
-                    if not item_fail and fit_key in seen_fit_key:
-                        mark_item(i, "BIZ_001")
-                        continue
-                    if not item_fail and req.campaignId:
-                        selected_campaign_id = _resolve_campaign_id_for_receipt(
-                            db, req.type, location, pay_date_stored
-                        )
-                        if selected_campaign_id and submission.campaign_id != selected_campaign_id:
-                            submission.campaign_id = selected_campaign_id
-                        ok, c_fail = validate_campaign_rules(
-                            db, int(submission.campaign_id or DEFAULT_CAMPAIGN_ID), location, pay_date_stored
-                        )
-                        if not ok and c_fail:
-                            item_fail = c_fail
-
-                    # 인식 불량(핵심 필드 누락 또는 저신뢰도) → 수동 검수(보정) 유도
-                    if not item_fail:
-                        conf = p.get("confidenceScore") if isinstance(p.get("confidenceScore"), int) else None
-                        if _should_require_manual_review_for_low_quality(store_name, biz_num, address, conf):
-                            item_fail = "OCR_004"
-                    # 금액 오인식(68,000→8 등)으로 기준 미달일 때: 반려 대신 수동 검증 유도
-                    if not item_fail and amount is not None and amount < min_amount_tour and amount < SUSPICIOUS_AMOUNT_THRESHOLD:
-                        item_fail = "PENDING_VERIFICATION"
 
-                    if item_fail:
-                        mark_item(i, item_fail)
-                        continue
+def _ocr_job_dict(r: Any) -> Dict[str, Any]:
+    return {"id": int(r[0]), "submission_id": r[1], "payload": r[2], "attempts": int(r[3]), "max_attempts": int(r[4])}
 
-                    mark_item(i, None)
-                    total += amount
-                    amount_parts.append(str(amount))
-                    seen_fit_key.add(fit_key)
-
-                total_amount = total
-                user_total = _get_user_total_amount(req.data, len(receipt_idx))
-                if user_total is not None and _is_amount_mismatch(user_total, total_amount):
-                    for i in receipt_idx:
-                        if ocr_assets[i].get("status") == "FIT":
-                            mark_item(i, "PENDING_VERIFICATION")
-                    fail_code = fail_code or "PENDING_VERIFICATION"
-                if total_amount < min_amount_tour:
-                    fail_code = "BIZ_003"
-                audit_lines.append(
-                    f"영수증 {len(receipt_idx)}매 중 적격 합산: "
-                    f"{' + '.join(amount_parts) if amount_parts else '0'} = {total_amount}"
-                )
 
-        fit_cnt = sum(1 for a in ocr_assets if a.get("status") == "FIT")
-        unfit_cnt = sum(1 for a in ocr_assets if str(a.get("status", "")).startswith("UNFIT"))
-        err_cnt = sum(1 for a in ocr_assets if a.get("status") in ("ERROR", "ERROR_OCR"))
-        pending_new_cnt = sum(1 for a in ocr_assets if a.get("status") == "PENDING_NEW")
-        pending_verification_cnt = sum(1 for a in ocr_assets if a.get("status") == "PENDING_VERIFICATION")
-
-        # 4) 부모 상태 업데이트 (§10.3): total_amount = 장별 FIT 합산(API가 내려줄 금액). 한 장이라도 정상이면 FIT.
-        total_amount = sum(it.amount or 0 for it in item_rows if it.status == "FIT")
-        min_criteria = min_amount_stay if req.type == "STAY" else min_amount_tour
-        # 장별 금액 합산(전체 item 금액 합): 기준 충족 시 "합산 금액 미달"(BIZ_003) 사유 사용 금지. BIZ_003만 있을 때만 FIT로 올림.
-        total_all_amounts = sum(it.amount or 0 for it in item_rows)
-        if fail_code == "BIZ_003" and total_all_amounts >= min_criteria:
-            other_fail = None
-            for it in item_rows:
-                ec = (getattr(it, "error_code", None) or "").strip()
-                if ec and ec not in ("BIZ_003", "PENDING_NEW", "PENDING_VERIFICATION"):
-                    other_fail = ec
-                    break
-            if other_fail:
-                fail_code = other_fail
-            else:
-                fail_code = "PENDING_NEW" if pending_new_cnt > 0 else ("PENDING_VERIFICATION" if pending_verification_cnt > 0 else None)
-        # 최대 3장 중 한 장이라도 정상조건 충족(금액 기준 이상)이면 FIT 판정.
-        condition_met = fit_cnt >= 1 and total_amount >= min_criteria
-        if not condition_met:
-            if not fail_code and pending_new_cnt > 0:
-                fail_code = "PENDING_NEW"
-            if not fail_code and pending_verification_cnt > 0:
-                fail_code = "PENDING_VERIFICATION"
-        audit_lines.append(
-            f"총 {len(ocr_assets)}매 중 적격 {fit_cnt}매, 부적격 {unfit_cnt}매, 오류 {err_cnt}매, "
-            f"신규상점대기 {pending_new_cnt}매, 수동검증대기 {pending_verification_cnt}매"
-        )
+def _dead_letter_submission(db: Session, job: Dict[str, Any], error: str) -> Optional[Dict[str, Any]]:
+    """
+    DEAD 작업의 submission이 아직 분석 중(PROCESSING/VERIFYING)이면 ERROR 반영·롤업·콜백 적재(outbox 사용 시).
+    작업 DEAD 전환과 같은 트랜잭션에서 호출(commit은 호출부). 반환: outbox 미사용 시 commit 후 전송할 콜백 payload.
+    """
+    submission = (
+        db.query(Submission)
+        .filter(Submission.submission_id == job["submission_id"])
+        .with_for_update()
+        .first()
+    )
+    if not submission or (submission.status or "") not in ("PROCESSING", "VERIFYING"):
+        return None
+    reason = f"분석 작업 실패(재시도 {job['attempts']}회 초과): {error}"
+    payload = _set_analysis_error(db, submission, RuntimeError(reason))
+    return None if CALLBACK_OUTBOX_ENABLED else payload
 
-        finalize_submission(
-            submission,
-            total_amount,
-            min_criteria,
-            fail_code,
-            total_all_amounts=total_all_amounts,
-            unknown_store_policy=getattr(rule_cfg, "unknown_store_policy", None),
-            item_rows=item_rows,
-        )
-        raw_audit = " | ".join(audit_lines) if audit_lines else (submission.fail_reason or "")
-        submission.audit_log = _truncate_submission_audit(raw_audit)
-        submission.audit_trail = submission.audit_log
-        db.commit()
-        payload = _build_status_payload(submission, item_rows)
-        await _send_result_callback(req.receiptId, payload, purpose="auto", actor="system")
 
-    except Exception as e:
-        logger.error("analyze_receipt_task failed: %s", e, exc_info=True)
-        try:
-            db.rollback()
-        except Exception:
-            pass
-        submission.status = "ERROR"
-        submission.updated_at = datetime.utcnow()
-        submission.total_amount = 0
-        err_msg = _truncate_submission_reason((str(e) or type(e).__name__).strip())
-        submission.fail_reason = err_msg
-        submission.global_fail_reason = submission.fail_reason
-        submission.audit_log = "complete 처리 중 예외 발생"
-        submission.audit_trail = submission.audit_log
-        db.commit()
-        db.refresh(submission)
-        item_rows_ex = (
-            db.query(ReceiptItem)
-            .filter(ReceiptItem.submission_id == req.receiptId)
-            .order_by(ReceiptItem.seq_no.asc())
-            .all()
+def _claim_ocr_jobs(db: Session, worker_id: str, limit: int) -> Dict[str, Any]:
+    """
+    처리 가능한 작업을 최대 limit건 점유(FOR UPDATE SKIP LOCKED → 워커 여러 대가 같은 건을 잡지 않음).
+    대상: QUEUED이고 available_at 도래, 또는 RUNNING인데 가시성 타임아웃(locked_until) 경과(워커 비정상 종료).
+    가시성 타임아웃이 지났는데 시도 횟수를 다 쓴 작업(OOM·SIGKILL 등으로 매번 워커가 죽는 건)은 재점유 대신
+    같은 트랜잭션에서 DEAD 처리하고 submission ERROR·콜백 적재.
+    반환: {"jobs": 점유 작업, "callbacks": outbox 미사용 시 전송할 [(receiptId, payload)]}.
+    """
+    now = datetime.utcnow()
+    dead = db.execute(
+        sql_text("""
+        UPDATE ocr_jobs
+        SET status = 'DEAD', locked_until = NULL, updated_at = :now,
+            last_error = LEFT('가시성 타임아웃 초과(워커 비정상 종료 추정), 최종 시도 worker=' || COALESCE(locked_by, '-')
+                              || COALESCE(' / ' || last_error, ''), 1000)
+        WHERE id IN (
+            SELECT id FROM ocr_jobs
+            WHERE status = 'RUNNING' AND locked_until < :now AND attempts >= max_attempts
+            ORDER BY id
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
         )
-        payload = _build_status_payload(submission, item_rows_ex)
-        await _send_result_callback(req.receiptId, payload, purpose="auto", actor="system")
+        RETURNING id, submission_id, payload, attempts, max_attempts, last_error
+        """),
+        {"now": now, "limit": max(1, int(limit))},
+    ).fetchall()
+    callbacks: List[Tuple[str, Dict[str, Any]]] = []
+    for r in dead:
+        job = _ocr_job_dict(r)
+        logger.error("ocr job %s -> DEAD (lease expired after %s attempts, receiptId=%s)", job["id"], job["attempts"], job["submission_id"])
+        payload = _dead_letter_submission(db, job, r[5] or "")
+        if payload is not None:
+            callbacks.append((job["submission_id"], payload))
+    rows = db.execute(
+        sql_text("""
+        UPDATE ocr_jobs
+        SET status = 'RUNNING', attempts = attempts + 1, locked_by = :worker,
+            locked_until = :locked_until, updated_at = :now
+        WHERE id IN (
+            SELECT id FROM ocr_jobs
+            WHERE (status = 'QUEUED' AND available_at <= :now)
+               OR (status = 'RUNNING' AND locked_until < :now AND attempts < max_attempts)
+            ORDER BY available_at, id
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id, submission_id, payload, attempts, max_attempts
+        """),
+        {
+            "worker": worker_id[:128],
+            "now": now,
+            "locked_until": now + timedelta(seconds=OCR_JOB_VISIBILITY_TIMEOUT_SEC),
+            "limit": max(1, int(limit)),
+        },
+    ).fetchall()
+    db.commit()
+    return {"jobs": [_ocr_job_dict(r) for r in rows], "callbacks": callbacks}
+
+
+async def claim_ocr_jobs(worker_id: str, limit: int) -> List[Dict[str, Any]]:
+    """_claim_ocr_jobs(별도 세션) 후 DEAD 처리된 건의 콜백 전송(outbox 미사용 시). 반환: 점유 작업."""
+    db = SessionLocal()
+    try:
+        claimed = await _run_io(_claim_ocr_jobs, db, worker_id, limit)
+    finally:
+        db.close()
+    for receipt_id, payload in claimed["callbacks"]:
+        await _send_result_callback(receipt_id, payload, purpose="auto", actor="system")
+    return claimed["jobs"]
+
+
+def _heartbeat_ocr_job(db: Session, job_id: int, worker_id: str) -> bool:
+    """처리 중 작업의 가시성 타임아웃 연장. 다른 워커가 이미 재점유했으면 False."""
+    now = datetime.utcnow()
+    res = db.execute(
+        sql_text(
+            "UPDATE ocr_jobs SET locked_until = :locked_until, updated_at = :now "
+            "WHERE id = :id AND status = 'RUNNING' AND locked_by = :worker"
+        ),
+        {"id": job_id, "worker": worker_id[:128], "now": now, "locked_until": now + timedelta(seconds=OCR_JOB_VISIBILITY_TIMEOUT_SEC)},
+    )
+    db.commit()
+    return bool(res.rowcount)
+
+
+def _complete_ocr_job(db: Session, job_id: int, worker_id: str) -> None:
+    db.execute(
+        sql_text(
+            "UPDATE ocr_jobs SET status = 'DONE', locked_until = NULL, last_error = NULL, updated_at = :now "
+            "WHERE id = :id AND locked_by = :worker"
+        ),
+        {"id": job_id, "worker": worker_id[:128], "now": datetime.utcnow()},
+    )
+    db.commit()
+
+
+def _ocr_job_backoff_sec(attempts: int) -> int:
+    return min(OCR_JOB_BACKOFF_MAX_SEC, OCR_JOB_BACKOFF_BASE_SEC * (2 ** max(0, attempts - 1)))
+
+
+def _fail_ocr_job(db: Session, job: Dict[str, Any], worker_id: str, error: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    실패 처리: 시도 횟수 남으면 백오프 후 QUEUED로 되돌리고, 초과 시 DEAD(dead-letter).
+    DEAD 시 같은 트랜잭션에서 submission ERROR·롤업·콜백 적재(_dead_letter_submission) → 둘 중 하나만 반영되는 일 없음.
+    반환: (새 상태, outbox 미사용 시 commit 후 전송할 콜백 payload 또는 None).
+    """
+    now = datetime.utcnow()
+    err = (error or "")[:1000]
+    if job["attempts"] < job["max_attempts"]:
+        new_status = "QUEUED"
+        available_at = now + timedelta(seconds=_ocr_job_backoff_sec(job["attempts"]))
+    else:
+        new_status = "DEAD"
+        available_at = now
+    res = db.execute(
+        sql_text(
+            "UPDATE ocr_jobs SET status = :status, available_at = :available_at, locked_until = NULL, "
+            "last_error = :err, updated_at = :now WHERE id = :id AND locked_by = :worker"
+        ),
+        {"status": new_status, "available_at": available_at, "err": err, "now": now, "id": job["id"], "worker": worker_id[:128]},
+    )
+    payload = None
+    if new_status == "DEAD" and res.rowcount:
+        payload = _dead_letter_submission(db, job, err)
+    db.commit()
+    return new_status, payload
+
+
+async def fail_analysis_job(job: Dict[str, Any], worker_id: str, error: str) -> str:
+    """작업 실패 처리(_fail_ocr_job, 별도 세션) 후 DEAD 전환으로 ERROR가 된 건의 콜백 전송(outbox 미사용 시). 반환: 새 상태."""
+    db = SessionLocal()
+    try:
+        new_status, payload = await _run_io(_fail_ocr_job, db, job, worker_id, error)
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+    if payload is not None:
+        await _send_result_callback(job["submission_id"], payload, purpose="auto", actor="system")
+    return new_status
+
+
+def _ocr_job_needs_run(db: Session, submission_id: str) -> bool:
+    """재점유된 작업이 이미 판정 완료된 건이면(커밋 후 워커 종료 등) 재분석 생략."""
+    sub = db.query(Submission.status).filter(Submission.submission_id == submission_id).first()
+    return bool(sub) and (sub[0] or "") in ("PROCESSING", "VERIFYING")
+
+
+def _ocr_job_queue_stats(db: Session) -> Dict[str, Any]:
+    rows = db.execute(sql_text("SELECT status, COUNT(*) FROM ocr_jobs GROUP BY status")).fetchall()
+    counts = {str(r[0]): int(r[1]) for r in rows}
+    oldest = db.execute(
+        sql_text("SELECT MIN(available_at) FROM ocr_jobs WHERE status = 'QUEUED'")
+    ).scalar()
+    lag_sec = max(0, int((datetime.utcnow() - oldest).total_seconds())) if oldest else 0
+    return {"enabled": OCR_JOB_QUEUE_ENABLED, "counts": counts, "oldest_queued_lag_sec": lag_sec}
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+영수증 분석 워커 (ocr_jobs DB 큐 소비자).
+OCR_JOB_QUEUE_ENABLED=1인 API 서버가 Complete 시 ocr_jobs에 적재한 작업을 점유(FOR UPDATE SKIP LOCKED)해 analyze_receipt_task 실행.
+여러 대(프로세스/컨테이너) 동시 실행 가능. 워커 종료 시 처리 중 작업은 가시성 타임아웃 후 다른 워커가 재점유.
+CALLBACK_OUTBOX_ENABLED=1이면 결과 콜백 디스패처(callback_outbox 소비)도 함께 실행(--no-callbacks로 끔).
+사용: python ocr_worker.py [--concurrency 4] [--once] [--no-callbacks]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Any, Dict, Set
+
+from main import (
+    CALLBACK_OUTBOX_ENABLED,
+    CompleteRequest,
+    OCR_JOB_VISIBILITY_TIMEOUT_SEC,
+    OcrJobLeaseLost,
+    SessionLocal,
+    analyze_receipt_task,
+    claim_ocr_jobs,
+    fail_analysis_job,
+    _complete_ocr_job,
+    _heartbeat_ocr_job,
+    _ocr_job_needs_run,
+    _close_http_clients,
+    _run_io,
+    _shutdown_executors,
+    run_callback_dispatcher,
+)
+
+logger = logging.getLogger("ocr_worker")
+
+OCR_WORKER_CONCURRENCY = max(1, min(64, int(os.getenv("OCR_WORKER_CONCURRENCY", "4"))))
+OCR_WORKER_POLL_SEC = max(0.2, min(30.0, float(os.getenv("OCR_WORKER_POLL_SEC", "1"))))
+
+
+def _db_call(fn, *args):
+    """작업 큐 조작 1건을 별도 세션에서 실행."""
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+async def _heartbeat(job_id: int, worker_id: str, stop: asyncio.Event, lease_lost: asyncio.Event) -> None:
+    """처리 중 가시성 타임아웃을 주기적으로 연장(타임아웃의 1/3 간격). 점유를 잃으면 lease_lost 설정 → 분석 중단."""
+    interval = max(5, OCR_JOB_VISIBILITY_TIMEOUT_SEC // 3)
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+        try:
+            ok = await _run_io(_db_call, _heartbeat_ocr_job, job_id, worker_id)
+            if not ok:
+                logger.warning("ocr job %s lost lease (worker=%s), aborting analysis", job_id, worker_id)
+                lease_lost.set()
+                return
+        except Exception as e:
+            logger.warning("ocr job %s heartbeat failed: %s", job_id, e)
+
+
+async def _process_job(job: Dict[str, Any], worker_id: str) -> None:
+    job_id = job["id"]
+    stop = asyncio.Event()
+    lease_lost = asyncio.Event()
+    hb = asyncio.create_task(_heartbeat(job_id, worker_id, stop, lease_lost))
+    try:
+        needs_run = await _run_io(_db_call, _ocr_job_needs_run, job["submission_id"])
+        if needs_run:
+            req = CompleteRequest.model_validate(job["payload"])
+            await analyze_receipt_task(req, raise_errors=True, lease_lost=lease_lost)
+        await _run_io(_db_call, _complete_ocr_job, job_id, worker_id)
+        logger.info("ocr job %s done (receiptId=%s attempt=%s)", job_id, job["submission_id"], job["attempts"])
+    except OcrJobLeaseLost:
+        # 재점유한 워커가 처리·상태 갱신(이 워커는 작업 행을 건드리지 않음)
+        logger.warning("ocr job %s abandoned after lease loss (receiptId=%s)", job_id, job["submission_id"])
+    except Exception as e:
+        logger.error("ocr job %s failed (receiptId=%s attempt=%s): %s", job_id, job["submission_id"], job["attempts"], e, exc_info=True)
+        try:
+            new_status = await fail_analysis_job(job, worker_id, str(e) or type(e).__name__)
+            logger.info("ocr job %s -> %s", job_id, new_status)
+        except Exception as e2:
+            # 상태 갱신 실패 시에도 가시성 타임아웃 후 재점유됨
+            logger.error("ocr job %s fail-mark failed: %s", job_id, e2)
+    finally:
+        stop.set()
+        await hb
+
+
+async def run_worker(concurrency: int, once: bool = False, callbacks: bool = True) -> None:
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    logger.info("ocr worker start id=%s concurrency=%s", worker_id, concurrency)
+    running: Set[asyncio.Task] = set()
+    shutdown = asyncio.Event()
+    dispatcher = None
+    if callbacks and CALLBACK_OUTBOX_ENABLED and not once:
+        dispatcher = asyncio.create_task(run_callback_dispatcher(shutdown, worker_id=f"callback:{worker_id}"))
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown.set)
+        except NotImplementedError:
+            pass
+
+    while not shutdown.is_set():
+        free = concurrency - len(running)
+        jobs = []
+        if free > 0:
+            try:
+                jobs = await claim_ocr_jobs(worker_id, free)
+            except Exception as e:
+                logger.warning("ocr job claim failed: %s", e)
+        for job in jobs:
+            t = asyncio.create_task(_process_job(job, worker_id))
+            running.add(t)
+            t.add_done_callback(running.discard)
+        if once and not jobs and not running:
+            break
+        if not jobs:
+            try:
+                await asyncio.wait_for(shutdown.wait(), timeout=OCR_WORKER_POLL_SEC)
+            except asyncio.TimeoutError:
+                pass
+        elif len(running) >= concurrency:
+            await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+    if running:
+        logger.info("ocr worker draining %s running job(s)", len(running))
+        await asyncio.gather(*running, return_exceptions=True)
+    if dispatcher is not None:
+        await asyncio.gather(dispatcher, return_exceptions=True)
+    await _close_http_clients()
+    _shutdown_executors()
+    logger.info("ocr worker stopped id=%s", worker_id)
+
+
+def _parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="GEMS OCR 분석 워커 (ocr_jobs 큐)")
+    ap.add_argument("--concurrency", type=int, default=OCR_WORKER_CONCURRENCY, help="동시 처리 작업 수")
+    ap.add_argument("--once", action="store_true", help="대기 작업을 모두 처리하면 종료(배치/테스트용)")
+    ap.add_argument("--no-callbacks", action="store_true", help="결과 콜백 디스패처를 실행하지 않음(API 프로세스에서만 전송)")
+    return ap.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    asyncio.run(run_worker(max(1, args.concurrency), once=args.once, callbacks=not args.no_callbacks))
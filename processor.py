@@ -1,13 +1,19 @@
 """
 GEMS OCR 후처리 및 상점 매칭 서비스.
 시군구 필터링 → 상호명 유사도(token_sort_ratio) → 비즈니스 로직 검증 → 캠페인 필터(지역·기간). DB 조회 최소화.
+상점 매칭은 프로세스 공용 인메모리 인덱스(_StoreIndex) 사용: 최초 1회 master_stores 적재 후 증분 갱신.
+캠페인 조회·라우팅은 프로세스 공용 캐시(_CampaignCache) 사용: project_type·시군별 사전 색인.
 """
+import logging
+import os
 import re
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 # 에러 코드 (PRD)
 ERR_DATE = "BIZ_002"  # 2026년 아님
@@ -20,6 +26,12 @@ ERR_INVALID_DATE = "OCR_002"  # 결제일 형식 오류
 
 # 상호명 유사도 임계값 (오타·표기 차이 대비)
 FUZZY_MATCH_THRESHOLD = 85
+# 상점 인덱스 전체 재적재 주기(초). 다른 워커 프로세스에서 추가된 상점·롤백된 증분 반영용. 0이면 재적재 안 함.
+STORE_INDEX_TTL_SEC = max(0, int(os.getenv("STORE_INDEX_TTL_SEC", "600")))
+# 캠페인 캐시 재적재 주기(초). 관리자 수정 시 해당 프로세스는 즉시 무효화, 다른 워커 프로세스는 이 주기 내 반영.
+CAMPAIGN_CACHE_TTL_SEC = max(0, min(3600, int(os.getenv("CAMPAIGN_CACHE_TTL_SEC", "30"))))
+
+logger = logging.getLogger(__name__)
 
 
 def extract_ocr_fields(ocr_data: dict) -> Optional[dict]:
@@ -70,42 +82,202 @@ def _normalize_store_name_for_match(name: str) -> List[str]:
     return candidates
 
 
+def _city_from_road_address(road_address: Optional[str]) -> str:
+    """도로명 주소 → 시군. master_stores 트리거(string_to_array(road_address, ' '))[2]와 동일 규칙."""
+    parts = (road_address or "").strip().split(" ")
+    return parts[1].strip() if len(parts) >= 2 else ""
+
+
+class _StoreIndex:
+    """
+    master_stores 인메모리 인덱스 (프로세스 공용).
+    - 시군(city_county)별 파티션: 상호명 목록(유사도 비교용) + 정규화 후보 → 마스터 상호명 맵(정확 일치 해시 조회용).
+    - 전체 목록/맵은 시군 미상일 때 사용.
+    - 최초 조회 시 1회 적재, 이후 add()로 증분 반영. STORE_INDEX_TTL_SEC 경과 시 전체 재적재.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._names_by_city: Dict[str, List[str]] = {}
+        self._exact_by_city: Dict[str, Dict[str, str]] = {}
+        self._all_names: List[str] = []
+        self._all_exact: Dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+
+    def _needs_load(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return STORE_INDEX_TTL_SEC > 0 and (time.monotonic() - self._loaded_at) >= STORE_INDEX_TTL_SEC
+
+    @staticmethod
+    def _add_into(
+        names_by_city: Dict[str, List[str]],
+        exact_by_city: Dict[str, Dict[str, str]],
+        all_names: List[str],
+        all_exact: Dict[str, str],
+        store_name: str,
+        city_county: str,
+    ) -> None:
+        name = (store_name or "").strip()
+        if not name:
+            return
+        variants = _normalize_store_name_for_match(name)
+        city = (city_county or "").strip()
+        exact = exact_by_city.setdefault(city, {})
+        if exact.get(name) != name:
+            names_by_city.setdefault(city, []).append(name)
+        if all_exact.get(name) != name:
+            all_names.append(name)
+        # 변형(접두사 제거) 키는 먼저 등록된 마스터 상호명 유지, 원 상호명 키는 항상 자기 자신
+        for v in variants:
+            exact.setdefault(v, name)
+            all_exact.setdefault(v, name)
+        exact[name] = name
+        all_exact[name] = name
+
+    def ensure_loaded(self, db: Session) -> None:
+        """미적재 또는 TTL 만료 시 master_stores 전체를 읽어 인덱스 재구성."""
+        if not self._needs_load():
+            return
+        rows = db.execute(text("SELECT store_name, city_county FROM master_stores")).fetchall()
+        names_by_city: Dict[str, List[str]] = {}
+        exact_by_city: Dict[str, Dict[str, str]] = {}
+        all_names: List[str] = []
+        all_exact: Dict[str, str] = {}
+        for s_name, city in rows:
+            self._add_into(names_by_city, exact_by_city, all_names, all_exact, s_name or "", city or "")
+        with self._lock:
+            self._names_by_city = names_by_city
+            self._exact_by_city = exact_by_city
+            self._all_names = all_names
+            self._all_exact = all_exact
+            self._loaded_at = time.monotonic()
+        logger.info("store index loaded: stores=%s cities=%s", len(all_names), len(names_by_city))
+
+    def add(self, store_name: str, city_county: str) -> None:
+        """상점 1건 증분 반영. 미적재 상태면 다음 ensure_loaded에서 DB 전체를 읽으므로 생략."""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._add_into(
+                self._names_by_city, self._exact_by_city, self._all_names, self._all_exact,
+                store_name, city_county,
+            )
+
+    def partition(self, city_county: str) -> Tuple[List[str], Dict[str, str]]:
+        """시군 파티션(상호명 목록, 정규화 후보 → 마스터 상호명 맵). 시군이 비면 전체."""
+        with self._lock:
+            if city_county:
+                return (
+                    self._names_by_city.get(city_county, []),
+                    self._exact_by_city.get(city_county, {}),
+                )
+            return self._all_names, self._all_exact
+
+
+_store_index = _StoreIndex()
+
+
+def register_store_in_index(store_name: str, road_address: Optional[str]) -> None:
+    """master_stores INSERT 직후 호출해 인덱스에 즉시 반영 (시군은 트리거와 같은 규칙으로 주소에서 추출)."""
+    _store_index.add(store_name, _city_from_road_address(road_address))
+
+
+# 상점 매칭 결과: (매칭된 마스터 상호명 또는 None, 점수 0~100)
+StoreMatch = Tuple[Optional[str], float]
+
+
+def _best_match_in_partition(
+    name_candidates: List[str], names: List[str], exact: Dict[str, str]
+) -> StoreMatch:
+    """후보 상호명들 중 파티션 내 최고 점수 1건. 정확 일치면 (마스터 상호명, 100), 아니면 extractOne(score_cutoff)."""
+    for cand in name_candidates:
+        master = exact.get(cand)
+        if master is not None:
+            return master, 100.0
+    best: StoreMatch = (None, 0.0)
+    if not names:
+        return best
+    for cand in name_candidates:
+        hit = process.extractOne(
+            cand, names, scorer=fuzz.token_sort_ratio, score_cutoff=max(FUZZY_MATCH_THRESHOLD, best[1])
+        )
+        if hit and hit[1] > best[1]:
+            best = (hit[0], float(hit[1]))
+    return best
+
+
+def match_stores_batch(db: Session, queries: List[Tuple[str, str]]) -> List[StoreMatch]:
+    """
+    여러 영수증의 (상호명, 시군)을 한 번에 매칭. 제출건 내 여러 장·일괄 재판정용.
+    시군 파티션별로 모든 후보 상호명을 모아 process.cdist(workers=-1) 1회로 점수 행렬 계산,
+    영수증별 최고 점수 매칭을 반환(임계값 미만이면 (None, 0.0)). 정확 일치는 해시로 먼저 처리.
+    """
+    results: List[StoreMatch] = [(None, 0.0)] * len(queries)
+    try:
+        _store_index.ensure_loaded(db)
+    except Exception as e:
+        logger.warning("match_stores_batch index load failed: %s", e)
+        return results
+    # 시군별로 (쿼리 인덱스, 후보 상호명) 수집
+    pending: Dict[str, List[Tuple[int, str]]] = {}
+    for qi, (store_name, city_county) in enumerate(queries):
+        if not (store_name or "").strip():
+            continue
+        city = (city_county or "").strip()
+        names, exact = _store_index.partition(city)
+        name_candidates = _normalize_store_name_for_match(store_name)
+        hit = next((exact[c] for c in name_candidates if c in exact), None)
+        if hit is not None:
+            results[qi] = (hit, 100.0)
+            continue
+        if names:
+            pending.setdefault(city, []).extend((qi, c) for c in name_candidates)
+    for city, rows in pending.items():
+        names, _ = _store_index.partition(city)
+        try:
+            scores = process.cdist(
+                [c for _, c in rows],
+                names,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=FUZZY_MATCH_THRESHOLD,
+                workers=-1,
+            )
+        except Exception as e:
+            logger.warning("match_stores_batch cdist failed (city=%s): %s", city, e)
+            continue
+        for row_no, (qi, _) in enumerate(rows):
+            col = int(scores[row_no].argmax())
+            score = float(scores[row_no][col])
+            if score >= FUZZY_MATCH_THRESHOLD and score > results[qi][1]:
+                results[qi] = (names[col], score)
+    return results
+
+
+def find_best_store_match(db: Session, store_name: str, city_county: str) -> StoreMatch:
+    """단건 최고 점수 매칭. 임계값 이상 후보가 없으면 (None, 0.0)."""
+    if not (store_name or "").strip():
+        return None, 0.0
+    try:
+        _store_index.ensure_loaded(db)
+        names, exact = _store_index.partition((city_county or "").strip())
+        return _best_match_in_partition(_normalize_store_name_for_match(store_name), names, exact)
+    except Exception as e:
+        logger.warning("find_best_store_match failed: %s", e)
+        return None, 0.0
+
+
 def match_store_in_master(
     db: Session, store_name: str, city_county: str
 ) -> Tuple[bool, Optional[int]]:
     """
     시군구 1차 필터 후 상호명 유사도(token_sort_ratio)로 매칭.
     상호명은 '주식회사 ', '(주)' 등 접두사 제거한 후보로도 매칭 시도.
+    인메모리 인덱스 사용: 정확 일치(해시) 우선, 없을 때만 시군 파티션 내 extractOne 최고 점수 비교. DB 왕복 없음.
     반환: (매칭 여부, matched store_id 또는 None). store_id는 master_stores에 id 컬럼 있을 때만.
     """
-    if not (store_name or "").strip():
-        return False, None
-    city_county = (city_county or "").strip()
-    try:
-        if city_county:
-            rows = db.execute(
-                text(
-                    "SELECT store_name FROM master_stores WHERE city_county = :city"
-                ),
-                {"city": city_county},
-            ).fetchall()
-        else:
-            rows = db.execute(
-                text("SELECT store_name FROM master_stores")
-            ).fetchall()
-        name_candidates = _normalize_store_name_for_match(store_name)
-        for (s_name,) in rows:
-            if not s_name:
-                continue
-            s_name = s_name.strip()
-            for cand in name_candidates:
-                if cand == s_name:
-                    return True, None
-                if fuzz.token_sort_ratio(cand, s_name) >= FUZZY_MATCH_THRESHOLD:
-                    return True, None
-        return False, None
-    except Exception:
-        return False, None
+    matched_name, _ = find_best_store_match(db, store_name, city_county)
+    return matched_name is not None, None
 
 
 def validate_and_match(
@@ -126,6 +298,25 @@ def validate_and_match(
     순서: 날짜(2026) → 금액(최소+입력일치) → 지역(강원) → 상점 매칭(시군+유사도 85%).
     반환: (status, fail_reason). status는 "FIT" 또는 "UNFIT".
     """
+    matched, _ = match_store_in_master(db, store_name, city_county)
+    return check_receipt_rules(
+        matched, full_address, pay_date, ocr_amount, user_amount, campaign_type, is_2026_date,
+        min_amount_stay=min_amount_stay, min_amount_tour=min_amount_tour,
+    )
+
+
+def check_receipt_rules(
+    store_matched: bool,
+    full_address: str,
+    pay_date: str,
+    ocr_amount: int,
+    user_amount: int,
+    campaign_type: str,
+    is_2026_date: bool,
+    min_amount_stay: int = 60000,
+    min_amount_tour: int = 50000,
+) -> Tuple[str, Optional[str]]:
+    """validate_and_match의 검증 순서를 상점 매칭 결과(사전 조회)로 적용. DB 비의존(판정 엔진·일괄 재판정용)."""
     # (1) 날짜: 2026년 영수증인지
     if not is_2026_date or not re.search(r"2026|26", pay_date or ""):
         return "UNFIT", ERR_DATE
@@ -142,13 +333,196 @@ def validate_and_match(
         return "UNFIT", ERR_LOCATION
 
     # (4) 상점 매칭: 시군 필터 → token_sort_ratio 85% 이상
-    matched, _ = match_store_in_master(db, store_name, city_county)
-    if not matched:
+    if not store_matched:
         return "UNFIT", ERR_STORE
 
     return "FIT", None
 
 
+def city_matches_target(store_city: str, target_city: str) -> bool:
+    """
+    상점 시군과 캠페인 대상 시군 매칭. target 없으면(강원 전체) 항상 True.
+    정확 일치 → 상호 포함 → 핵심 키워드(시/군 제거) 포함 순 유연 매칭 (예: "속초시" vs "속초").
+    """
+    store_city = (store_city or "").strip()
+    target_city = (target_city or "").strip()
+    if not target_city:
+        return True
+    if store_city == target_city:
+        return True
+    if target_city in store_city or store_city in target_city:
+        return True
+    target_key = target_city.replace("시", "").replace("군", "").strip()
+    if target_key and (target_key in store_city or store_city.startswith(target_key)):
+        return True
+    return False
+
+
+_CAMPAIGN_COLUMNS_FULL = (
+    "SELECT campaign_id, campaign_name, is_active, target_city_county, start_date, end_date, created_at, "
+    "COALESCE(priority, 100) AS priority, project_type FROM campaigns"
+)
+_CAMPAIGN_COLUMNS_BASE = (
+    "SELECT campaign_id, campaign_name, is_active, target_city_county, start_date, end_date, created_at FROM campaigns"
+)
+
+
+class _CampaignCache:
+    """
+    campaigns 인메모리 캐시 (프로세스 공용, 행 dict는 읽기 전용으로 공유).
+    - 전체 캠페인(id별) + 활성 캠페인을 project_type별로 사전 분류(project_type NULL은 모든 유형에 포함).
+    - 유형별로 지역 무제한(target 없음) 목록과 대상 시군별 목록을 분리. 시군 → 매칭 대상 시군 목록은 메모이즈.
+    - 확장 컬럼(priority, project_type) 없는 스키마는 기본 컬럼으로 적재(priority=100, project_type=None).
+    - invalidate() 또는 CAMPAIGN_CACHE_TTL_SEC 경과 시 재적재. 조회 실패 시 available=False(캠페인 필터 스킵).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._active: List[Dict[str, Any]] = []
+        self._untargeted_by_pt: Dict[str, List[Dict[str, Any]]] = {}
+        self._targeted_by_pt: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._city_targets: Dict[str, List[str]] = {}
+        self._available = False
+        self._loaded_at: Optional[float] = None
+
+    def _needs_load(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return CAMPAIGN_CACHE_TTL_SEC > 0 and (time.monotonic() - self._loaded_at) >= CAMPAIGN_CACHE_TTL_SEC
+
+    @staticmethod
+    def _fetch_rows(db: Session) -> Optional[List[Dict[str, Any]]]:
+        # 확장 컬럼 조회 실패가 트랜잭션 전체를 중단시키지 않도록 savepoint 안에서 시도
+        for sql in (_CAMPAIGN_COLUMNS_FULL, _CAMPAIGN_COLUMNS_BASE):
+            try:
+                with db.begin_nested():
+                    rows = db.execute(text(sql)).mappings().all()
+            except Exception:
+                continue
+            items: List[Dict[str, Any]] = []
+            for r in rows:
+                d = dict(r)
+                d.setdefault("priority", 100)
+                d.setdefault("project_type", None)
+                items.append(d)
+            return items
+        return None
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self._needs_load():
+            return
+        rows = self._fetch_rows(db)
+        by_id: Dict[int, Dict[str, Any]] = {}
+        active: List[Dict[str, Any]] = []
+        for d in rows or []:
+            by_id[int(d["campaign_id"])] = d
+            if d.get("is_active"):
+                active.append(d)
+        active.sort(key=lambda x: (int(x.get("priority") or 100), int(x.get("campaign_id") or 0)))
+        project_types = {"STAY", "TOUR"} | {
+            str(c["project_type"]).strip() for c in active if c.get("project_type")
+        }
+        untargeted_by_pt: Dict[str, List[Dict[str, Any]]] = {}
+        targeted_by_pt: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for pt in project_types:
+            untargeted: List[Dict[str, Any]] = []
+            targeted: Dict[str, List[Dict[str, Any]]] = {}
+            for c in active:
+                if c.get("project_type") and str(c.get("project_type")).strip() != pt:
+                    continue
+                target = (c.get("target_city_county") or "").strip()
+                if target:
+                    targeted.setdefault(target, []).append(c)
+                else:
+                    untargeted.append(c)
+            untargeted_by_pt[pt] = untargeted
+            targeted_by_pt[pt] = targeted
+        with self._lock:
+            self._by_id = by_id
+            self._active = active
+            self._untargeted_by_pt = untargeted_by_pt
+            self._targeted_by_pt = targeted_by_pt
+            self._city_targets = {}
+            self._available = rows is not None
+            self._loaded_at = time.monotonic()
+        logger.info("campaign cache loaded: campaigns=%s active=%s", len(by_id), len(active))
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def available(self) -> bool:
+        return self._available
+
+    def get(self, campaign_id: int) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(int(campaign_id))
+
+    def active(self) -> List[Dict[str, Any]]:
+        return list(self._active)
+
+    def _targets_for_city(self, store_city: str) -> List[str]:
+        key = (store_city or "").strip()
+        with self._lock:
+            cached = self._city_targets.get(key)
+            if cached is None:
+                all_targets = {t for targeted in self._targeted_by_pt.values() for t in targeted}
+                cached = [t for t in all_targets if city_matches_target(key, t)]
+                self._city_targets[key] = cached
+            return cached
+
+    def candidates(self, project_type: str, store_city: Optional[str]) -> List[Dict[str, Any]]:
+        """활성 캠페인 중 유형 일치(또는 NULL) + (store_city None이면 지역 무제한만, 아니면 무제한 + 시군 매칭) 목록."""
+        pt = (project_type or "").strip()
+        if pt not in self._untargeted_by_pt:
+            # 사전 분류에 없는 유형: project_type NULL 캠페인만 해당
+            base = [c for c in self._active if not c.get("project_type")]
+            untargeted = [c for c in base if not (c.get("target_city_county") or "").strip()]
+            if store_city is None:
+                return untargeted
+            return untargeted + [
+                c for c in base
+                if (c.get("target_city_county") or "").strip()
+                and city_matches_target(store_city, c.get("target_city_county") or "")
+            ]
+        out = list(self._untargeted_by_pt.get(pt) or [])
+        if store_city is None:
+            return out
+        targeted = self._targeted_by_pt.get(pt) or {}
+        for target in self._targets_for_city(store_city):
+            out.extend(targeted.get(target) or [])
+        return out
+
+
+_campaign_cache = _CampaignCache()
+
+
+def invalidate_campaign_cache() -> None:
+    """캠페인 생성·수정 commit 후 호출. 다음 조회에서 재적재."""
+    _campaign_cache.invalidate()
+
+
+def active_campaign_rows(db: Session) -> List[Dict[str, Any]]:
+    """활성 캠페인 목록(priority, campaign_id 순). 컬럼 확장(priority, project_type) 유무와 무관하게 동일 키 제공."""
+    _campaign_cache.ensure_loaded(db)
+    return _campaign_cache.active()
+
+
+def loaded_campaign_cache(db: Session) -> _CampaignCache:
+    """적재된 캠페인 캐시(판정 엔진 컨텍스트용). candidates()·get()·available()은 DB 조회 없음."""
+    _campaign_cache.ensure_loaded(db)
+    return _campaign_cache
+
+
+def campaign_candidates(db: Session, project_type: str, store_city: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    캠페인 라우팅 후보(기간 검사 전). store_city None: 지역 무제한 캠페인만(Presigned 단계),
+    문자열: 지역 무제한 + 대상 시군 매칭 캠페인(OCR 이후 단계).
+    """
+    _campaign_cache.ensure_loaded(db)
+    return _campaign_cache.candidates(project_type, store_city)
+
+
 def validate_campaign_rules(
     db: Session,
     campaign_id: int,
@@ -156,31 +530,35 @@ def validate_campaign_rules(
     pay_date_str: str,
 ) -> Tuple[bool, Optional[str]]:
     """
-    영수증이 해당 캠페인의 조건(지역, 기간, 활성)에 맞는지 검증.
+    영수증이 해당 캠페인의 조건(지역, 기간, 활성)에 맞는지 검증. 캠페인은 _CampaignCache에서 조회.
     store_city: OCR에서 추출한 시군(예: 춘천시, 속초시).
     pay_date_str: 정규화된 결제일 "YYYY-MM-DD".
     반환: (통과 여부, 실패 시 에러 코드 또는 메시지).
     """
-    try:
-        row = db.execute(
-            text(
-                "SELECT is_active, target_city_county, start_date, end_date FROM campaigns WHERE campaign_id = :cid"
-            ),
-            {"cid": campaign_id},
-        ).fetchone()
-    except Exception:
+    return check_campaign_rules(loaded_campaign_cache(db), campaign_id, store_city, pay_date_str)
+
+
+def check_campaign_rules(
+    campaigns: _CampaignCache,
+    campaign_id: int,
+    store_city: str,
+    pay_date_str: str,
+) -> Tuple[bool, Optional[str]]:
+    """validate_campaign_rules의 검증을 적재된 캠페인 캐시로 적용. DB 비의존."""
+    if not campaigns.available():
         return True, None  # campaigns 테이블 없거나 조회 실패 시 필터 스킵(기존 동작 유지)
+    row = campaigns.get(campaign_id)
 
     if not row:
         return True, None  # 캠페인 없으면 제한 없음
 
-    is_active = getattr(row, "is_active", True)
+    is_active = row.get("is_active", True)
     if is_active is False:
         return False, "BIZ_005 (비활성 캠페인)"
 
     # 기간 검증 (start_date, end_date 둘 다 있으면만 검사)
-    start_date = getattr(row, "start_date", None)
-    end_date = getattr(row, "end_date", None)
+    start_date = row.get("start_date")
+    end_date = row.get("end_date")
     if start_date is not None and end_date is not None and pay_date_str:
         try:
             s = pay_date_str.strip()[:10].replace("/", "-")
@@ -190,20 +568,8 @@ def validate_campaign_rules(
         except ValueError:
             return False, ERR_INVALID_DATE
 
-    # 지역 검증: target_city_county가 있으면 상점 시군과 일치(또는 유연 매칭)
-    target = (getattr(row, "target_city_county", None) or "").strip()
-    if not target:
-        return True, None  # NULL = 강원 전체
-
-    store_city = (store_city or "").strip()
-    # 정확 일치 또는 유연 매칭 (예: target "속초시", store_city "속초시" / "속초" 등)
-    if store_city == target:
-        return True, None
-    if target in store_city or store_city in target:
-        return True, None
-    # 핵심 키워드만 포함해도 통과 (예: "속초시" vs "속초")
-    target_key = target.replace("시", "").replace("군", "").strip()
-    if target_key and (target_key in store_city or store_city.startswith(target_key)):
+    # 지역 검증: target_city_county가 있으면 상점 시군과 일치(또는 유연 매칭). NULL = 강원 전체
+    if city_matches_target(store_city, row.get("target_city_county") or ""):
         return True, None
 
     return False, ERR_REGION_MISMATCH
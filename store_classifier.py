@@ -14,6 +14,7 @@ import os
 import re
 import json
 import logging
+import threading
 from typing import Tuple, Optional
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,10 @@ if "1.5-flash" in (GEMINI_MODEL or ""):
 # 404 시 시도할 폴백 모델 순서. env가 2.0-flash여도 2.5-flash를 먼저 시도하도록 구성.
 GEMINI_FALLBACK_MODELS = ("gemini-2.5-flash", "gemini-2.0-flash")
 GEMINI_TIMEOUT_SEC = float(os.getenv("GEMINI_TIMEOUT_SEC", "12"))
+# Gemini 호출용 공유 httpx.Client(keep-alive 연결 재사용). 최초 호출 시 생성, 앱 종료 시 close_http_client()
+GEMINI_HTTP_MAX_CONNECTIONS = max(1, min(100, int(os.getenv("GEMINI_HTTP_MAX_CONNECTIONS", "10"))))
+_http_client = None
+_http_client_lock = threading.Lock()
 
 
 def _gemini_models_to_try() -> list:
@@ -127,9 +132,36 @@ def is_gemini_available() -> Tuple[bool, str]:
     return True, "ok"
 
 
+def _get_http_client():
+    """Gemini 호출용 공유 클라이언트. 분류는 스레드 풀에서도 호출되므로 생성은 락으로 보호."""
+    global _http_client
+    import httpx
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(
+                timeout=GEMINI_TIMEOUT_SEC,
+                limits=httpx.Limits(
+                    max_connections=GEMINI_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=GEMINI_HTTP_MAX_CONNECTIONS,
+                ),
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    """공유 Gemini 클라이언트 종료(앱·워커 종료 시)."""
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning("Gemini http client close failed: %s", e)
+
+
 def _call_gemini_generate_content(model: str, prompt: str, timeout: float) -> Optional[dict]:
     """단일 모델로 generateContent 호출. 성공 시 응답 dict, 실패 시 None."""
-    import httpx
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={GEMINI_API_KEY}"
     payload = {
         "contents": [{"parts": [{"text": prompt}]}],
@@ -138,11 +170,10 @@ def _call_gemini_generate_content(model: str, prompt: str, timeout: float) -> Op
             "maxOutputTokens": min(256, max(8, GEMINI_MAX_OUTPUT_TOKENS)),
         },
     }
-    with httpx.Client(timeout=timeout) as client:
-        r = client.post(url, json=payload)
-        if r.status_code == 404:
-            return None
-        r.raise_for_status()
+    r = _get_http_client().post(url, json=payload, timeout=timeout)
+    if r.status_code == 404:
+        return None
+    r.raise_for_status()
     return r.json()
 
 
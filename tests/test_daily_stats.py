@@ -0,0 +1,126 @@
+"""
+신청 집계 롤업 증분 반영(daily_stats.sync_submission_stats) 테스트.
+SQL 문을 구분해 submissions·members·롤업을 메모리 dict로 흉내 내는 가짜 세션으로 델타 계산만 검사.
+"""
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+import daily_stats
+from daily_stats import ROLLUP_KEY_COLUMNS, sync_submission_stats
+
+
+class _Result:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = rows
+
+    def mappings(self) -> "_Result":
+        return self
+
+    def all(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+
+class FakeDb:
+    def __init__(self) -> None:
+        self.submissions: Dict[str, Dict[str, Any]] = {}
+        self.members: Dict[str, Dict[str, Any]] = {}
+        self.rollup: Dict[Tuple, List[int]] = {}
+        self.delta_calls = 0
+
+    def put(self, sid: str, status: str, amount: int = 60000, reason: Any = None, hour: int = 9) -> None:
+        self.submissions[sid] = {
+            "submission_id": sid, "stat_date": date(2026, 3, 1), "stat_hour": hour, "campaign_id": 1,
+            "project_type": "TOUR", "status": status, "sido": "강원특별자치도", "sigungu": "춘천시",
+            "reason": reason, "total_amount": amount,
+        }
+
+    def execute(self, stmt: Any, params: Any = None) -> _Result:
+        sql = str(stmt).strip()
+        if sql.startswith("SELECT"):
+            return _Result([dict(self.submissions[i]) for i in params["ids"] if i in self.submissions])
+        if sql.startswith("DELETE FROM submission_daily_stats_members"):
+            return _Result([self.members.pop(i) for i in params["ids"] if i in self.members])
+        if sql.startswith("INSERT INTO submission_daily_stats_members"):
+            for m in params:
+                self.members[m["submission_id"]] = dict(m)
+            return _Result([])
+        if sql.startswith("INSERT INTO submission_daily_stats"):
+            self.delta_calls += 1
+            for c in params:
+                b = self.rollup.setdefault(tuple(c[k] for k in ROLLUP_KEY_COLUMNS), [0, 0])
+                b[0] += c["n"]
+                b[1] += c["amount"]
+            return _Result([])
+        if sql.startswith("DELETE FROM submission_daily_stats WHERE"):
+            self.rollup = {k: v for k, v in self.rollup.items() if v[0] > 0 or k[0] not in params["dates"]}
+            return _Result([])
+        raise AssertionError(f"unexpected SQL: {sql[:60]}")
+
+    def buckets(self) -> Dict[Tuple[str, str], List[int]]:
+        """(status, reason_code) → [건수, 금액]."""
+        return {(k[4], k[7]): v for k, v in self.rollup.items()}
+
+
+def _reason_code(text: str) -> str:
+    return "BIZ_001" if "중복" in text else ""
+
+
+def test_status_change_moves_submission_between_keys():
+    db = FakeDb()
+    db.put("A", "FIT")
+    db.put("B", "FIT", amount=40000)
+    assert sync_submission_stats(db, ["A", "B"], _reason_code) == 2
+    assert db.buckets() == {("FIT", ""): [2, 100000]}
+
+    db.put("A", "UNFIT", reason="중복 영수증")
+    assert sync_submission_stats(db, ["A"], _reason_code) == 1
+    assert db.buckets() == {("FIT", ""): [1, 40000], ("UNFIT", "BIZ_001"): [1, 60000]}
+    assert db.members["A"]["reason_code"] == "BIZ_001"
+
+
+def test_resync_without_change_applies_no_delta():
+    db = FakeDb()
+    db.put("A", "FIT")
+    sync_submission_stats(db, ["A"], _reason_code)
+    calls = db.delta_calls
+    assert sync_submission_stats(db, ["A", "A", None], _reason_code) == 1
+    assert db.delta_calls == calls
+    assert db.buckets() == {("FIT", ""): [1, 60000]}
+
+
+def test_amount_change_in_same_key_updates_amount_only():
+    db = FakeDb()
+    db.put("A", "FIT", amount=60000)
+    sync_submission_stats(db, ["A"], _reason_code)
+    db.put("A", "FIT", amount=75000)
+    sync_submission_stats(db, ["A"], _reason_code)
+    assert db.buckets() == {("FIT", ""): [1, 75000]}
+
+
+def test_back_to_in_flight_removes_member_and_empty_bucket():
+    db = FakeDb()
+    db.put("A", "FIT")
+    db.put("B", "UNFIT", reason="중복 영수증")
+    sync_submission_stats(db, ["A", "B"], _reason_code)
+
+    db.put("A", "PROCESSING")
+    assert sync_submission_stats(db, ["A"], _reason_code) == 0
+    assert "A" not in db.members
+    assert db.buckets() == {("UNFIT", "BIZ_001"): [1, 60000]}
+
+
+def test_in_flight_submission_is_never_counted():
+    db = FakeDb()
+    for i, status in enumerate(daily_stats.IN_FLIGHT_STATUSES):
+        db.put(f"P{i}", status)
+    assert sync_submission_stats(db, list(db.submissions), _reason_code) == 0
+    assert db.members == {}
+    assert db.rollup == {}
+    assert sync_submission_stats(db, [], _reason_code) == 0
+
+
+def test_unknown_reason_falls_back_to_other():
+    db = FakeDb()
+    db.put("A", "ERROR", reason=None)
+    sync_submission_stats(db, ["A"], _reason_code)
+    assert db.buckets() == {("ERROR", "OTHER"): [1, 60000]}
@@ -0,0 +1,48 @@
+"""증빙 팩 ZIP 스트리밍 작성(EvidenceZipWriter) 테스트. 청크를 이어 붙인 결과를 zipfile로 다시 읽어 확인."""
+import io
+import json
+import zipfile
+from datetime import datetime
+
+from evidence_zip import EvidenceZipWriter
+
+
+def _build(entries):
+    w = EvidenceZipWriter()
+    chunks = []
+    for name, value in entries:
+        if isinstance(value, bytes):
+            w.add_bytes(name, value)
+        else:
+            w.add_json(name, value)
+        chunks.append(w.drain())
+    chunks.append(w.close())
+    return chunks
+
+
+def test_round_trip_through_zipfile():
+    image = bytes(range(256)) * 40
+    meta = {"receiptId": "R-1", "status": "FIT", "storeName": "강원상회", "createdAt": datetime(2026, 3, 1, 9, 30)}
+    chunks = _build([("R-1/01.jpg", image), ("R-1/submission.json", meta)])
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["R-1/01.jpg", "R-1/submission.json"]
+        assert zf.getinfo("R-1/01.jpg").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("R-1/submission.json").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("R-1/01.jpg") == image
+        loaded = json.loads(zf.read("R-1/submission.json").decode("utf-8"))
+    assert loaded == {**meta, "createdAt": "2026-03-01T09:30:00"}
+
+
+def test_each_entry_is_drained_as_it_is_added():
+    chunks = _build([("a.bin", b"x" * 1000), ("b.bin", b"y" * 1000)])
+    # 항목마다 완성된 바이트가 바로 나오고, 중앙 디렉터리는 close()에서만 기록
+    assert all(len(c) >= 1000 for c in chunks[:2])
+    assert b"PK\x05\x06" not in b"".join(chunks[:2])
+    assert b"PK\x05\x06" in chunks[2]
+
+
+def test_empty_pack_is_valid_zip():
+    with zipfile.ZipFile(io.BytesIO(b"".join(_build([])))) as zf:
+        assert zf.namelist() == []
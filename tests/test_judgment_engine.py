@@ -0,0 +1,162 @@
+"""판정 엔진(_judge_rules / _judge_rules_bulk) 단위 테스트. 컨텍스트를 직접 구성해 DB 없이 판정."""
+from types import SimpleNamespace
+
+import pytest
+
+STORE = "강원상회"
+CITY = "춘천시"
+RULES = SimpleNamespace(
+    unknown_store_policy="PENDING_NEW",
+    auto_register_threshold=0.9,
+    min_amount_stay=60000,
+    min_amount_tour=50000,
+)
+
+
+def _parsed(amount=60000, pay_date="2026-03-01", store=STORE, card="1234"):
+    return {
+        "amount": amount,
+        "payDate": pay_date,
+        "storeName": store,
+        "address": "강원특별자치도 춘천시 중앙로 1",
+        "location": CITY,
+        "businessNum": "123-45-67890",
+        "cardNum": card,
+        "confidenceScore": 99,
+    }
+
+
+def _tour_input(main, receipt_id, *parsed_list):
+    req = main.CompleteRequest.model_construct(
+        receiptId=receipt_id, userUuid="user-1", type="TOUR", campaignId=None, data=None, documents=None,
+    )
+    assets = [
+        {"imageKey": f"TOUR/{receipt_id}/{i}.jpg", "docType": "RECEIPT", "parsed": p, "ocrRaw": {},
+         "status": "PENDING", "error_code": None}
+        for i, p in enumerate(parsed_list)
+    ]
+    rows = [
+        SimpleNamespace(status="PENDING", error_code=None, error_message=None,
+                        amount=p["amount"], pay_date=p["payDate"], location=p["location"])
+        for p in parsed_list
+    ]
+    return req, None, assets, rows
+
+
+def _ctx(main, owners=None, matched=True):
+    return main.JudgmentContext(
+        RULES,
+        {(STORE, CITY): matched},
+        owners if owners is not None else {},
+        None,
+        lambda name, address, raw: (None, 0.0, "rule"),
+    )
+
+
+def _key(main, parsed):
+    return main._duplicate_receipt_key(
+        parsed["businessNum"], parsed["payDate"], parsed["amount"], parsed["cardNum"]
+    )
+
+
+def test_single_receipt_fit(main_module):
+    res = main_module._judge_rules(_ctx(main_module), *_tour_input(main_module, "A", _parsed()))
+    assert res.status == "FIT"
+    assert res.total_amount == 60000
+    assert [it.status for it in res.items] == ["FIT"]
+
+
+def test_unknown_store_goes_pending_new_with_candidate(main_module):
+    res = main_module._judge_rules(_ctx(main_module, matched=False), *_tour_input(main_module, "A", _parsed()))
+    assert res.items[0].status == "PENDING_NEW"
+    assert res.status != "FIT"
+    assert len(res.candidates) == 1
+    assert res.auto_register == []
+
+
+def test_duplicate_of_other_fit_submission(main_module):
+    p = _parsed()
+    ctx = _ctx(main_module, owners={_key(main_module, p): {"OTHER"}})
+    res = main_module._judge_rules(ctx, *_tour_input(main_module, "A", p))
+    assert res.items[0].error_code == "BIZ_001"
+    assert res.status != "FIT"
+
+
+def test_own_key_is_not_duplicate(main_module):
+    p = _parsed()
+    ctx = _ctx(main_module, owners={_key(main_module, p): {"A"}})
+    res = main_module._judge_rules(ctx, *_tour_input(main_module, "A", p))
+    assert res.status == "FIT"
+
+
+def test_same_receipt_twice_in_one_submission(main_module):
+    p = _parsed()
+    res = main_module._judge_rules(_ctx(main_module), *_tour_input(main_module, "A", p, dict(p)))
+    assert res.items[0].status == "FIT"
+    assert res.items[1].error_code == "BIZ_001"
+    assert res.total_amount == 60000
+
+
+def test_judge_rules_does_not_mutate_inputs(main_module):
+    req, cid, assets, rows = _tour_input(main_module, "A", _parsed(amount=100))
+    main_module._judge_rules(_ctx(main_module), req, cid, assets, rows)
+    assert assets[0]["status"] == "PENDING"
+    assert rows[0].status == "PENDING"
+
+
+def test_bulk_new_duplicates_only_first_fit(main_module):
+    p = _parsed()
+    ctx = _ctx(main_module)
+    results = main_module._judge_rules_bulk(
+        ctx, [_tour_input(main_module, "A", p), _tour_input(main_module, "B", dict(p))]
+    )
+    assert results[0].status == "FIT"
+    assert results[1].items[0].error_code == "BIZ_001"
+    assert results[1].status != "FIT"
+    assert ctx.duplicate_keys[_key(main_module, p)] == {"A"}
+
+
+def test_bulk_existing_fit_duplicates_keep_one(main_module):
+    p = _parsed()
+    ctx = _ctx(main_module, owners={_key(main_module, p): {"A", "B"}})
+    results = main_module._judge_rules_bulk(
+        ctx, [_tour_input(main_module, "A", p), _tour_input(main_module, "B", dict(p))]
+    )
+    statuses = [r.status for r in results]
+    assert statuses.count("FIT") == 1
+    assert ctx.duplicate_keys[_key(main_module, p)] == {"B"}
+
+
+def test_bulk_dropping_out_of_fit_releases_key(main_module):
+    p = _parsed()
+    ctx = _ctx(main_module, owners={_key(main_module, p): {"A"}})
+    wrong_year = dict(p, payDate="2025-03-01")
+    results = main_module._judge_rules_bulk(
+        ctx, [_tour_input(main_module, "A", wrong_year), _tour_input(main_module, "B", p)]
+    )
+    assert results[0].status != "FIT"
+    assert results[1].status == "FIT"
+
+
+def test_bulk_isolates_exceptions(main_module):
+    bad = _tour_input(main_module, "A", _parsed())
+    bad[2][0]["parsed"] = 123
+    results = main_module._judge_rules_bulk(_ctx(main_module), [bad, _tour_input(main_module, "B", _parsed())])
+    assert isinstance(results[0], Exception)
+    assert results[1].status == "FIT"
+
+
+def test_with_rules_copies_duplicate_owners(main_module):
+    p = _parsed()
+    ctx = _ctx(main_module)
+    other = ctx.with_rules(RULES)
+    main_module._judge_rules_bulk(ctx, [_tour_input(main_module, "A", p)])
+    assert other.duplicate_keys == {}
+    res = main_module._judge_rules_bulk(other, [_tour_input(main_module, "B", dict(p))])
+    assert res[0].status == "FIT"
+
+
+@pytest.mark.parametrize("amount, expected", [(60000, "FIT"), (40000, "UNFIT")])
+def test_min_amount_from_rules(main_module, amount, expected):
+    res = main_module._judge_rules(_ctx(main_module), *_tour_input(main_module, "A", _parsed(amount=amount)))
+    assert res.status.startswith(expected)
@@ -0,0 +1,45 @@
+"""관리자 신청 목록 keyset cursor(_encode_list_cursor / _decode_list_cursor / _list_cursor_filter) 테스트."""
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+
+def _sql(expr):
+    return str(expr.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize("value", [datetime(2026, 3, 1, 9, 30, 15, 123456), None])
+def test_cursor_round_trip(main_module, value):
+    cursor = main_module._encode_list_cursor("updated_at", value, "R-0001")
+    assert "=" not in cursor
+    assert main_module._decode_list_cursor(cursor, "updated_at") == (value, "R-0001")
+
+
+def test_cursor_from_other_date_field_is_rejected(main_module):
+    cursor = main_module._encode_list_cursor("created_at", datetime(2026, 3, 1), "R-0001")
+    with pytest.raises(HTTPException) as exc:
+        main_module._decode_list_cursor(cursor, "updated_at")
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", ""])
+def test_malformed_cursor_is_rejected(main_module, cursor):
+    with pytest.raises(HTTPException) as exc:
+        main_module._decode_list_cursor(cursor, "created_at")
+    assert exc.value.status_code == 400
+
+
+def test_filter_with_date_compares_tuple(main_module):
+    sub = main_module.Submission
+    sql = _sql(main_module._list_cursor_filter(sub.created_at, datetime(2026, 3, 1), "R-0001"))
+    assert "(submissions.created_at, submissions.submission_id) < (" in sql
+    assert "IS NULL" not in sql
+
+
+def test_filter_with_null_date_continues_into_dated_rows(main_module):
+    sub = main_module.Submission
+    sql = _sql(main_module._list_cursor_filter(sub.created_at, None, "R-0001"))
+    assert "submissions.created_at IS NOT NULL OR submissions.created_at IS NULL" in sql
+    assert "submissions.submission_id < 'R-0001'" in sql
@@ -0,0 +1,29 @@
+"""OCR 도메인 호출 제한 설정(_ocr_domain_limit_config) 테스트."""
+import pytest
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in ("CONCURRENCY", "RPS", "BURST"):
+        for prefix in ("OCR_DOMAIN_", "OCR_TOUR_", "OCR_STAY_"):
+            monkeypatch.delenv(prefix + name, raising=False)
+    return monkeypatch
+
+
+def test_unset_concurrency_keeps_per_process_limit(main_module, clean_env):
+    clean_env.setattr(main_module, "OCR_RATE_LIMIT_SHARED", True)
+    assert main_module._ocr_domain_limit_config("TOUR") == (1, 0.0, 1, False)
+
+
+def test_explicit_concurrency_is_shared(main_module, clean_env):
+    clean_env.setattr(main_module, "OCR_RATE_LIMIT_SHARED", True)
+    clean_env.setenv("OCR_TOUR_CONCURRENCY", "3")
+    assert main_module._ocr_domain_limit_config("TOUR")[0] == 3
+    assert main_module._ocr_domain_limit_config("TOUR")[3] is True
+    assert main_module._ocr_domain_limit_config("STAY")[3] is False
+
+
+def test_shared_mode_off_never_uses_shared_slots(main_module, clean_env):
+    clean_env.setattr(main_module, "OCR_RATE_LIMIT_SHARED", False)
+    clean_env.setenv("OCR_DOMAIN_CONCURRENCY", "2")
+    assert main_module._ocr_domain_limit_config("STAY") == (2, 0.0, 1, False)